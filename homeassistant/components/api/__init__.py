@@ -21,10 +21,8 @@ from homeassistant.components.http import (
 )
 from homeassistant.const import (
     CONTENT_TYPE_JSON,
-    EVENT_HOMEASSISTANT_STOP,
     EVENT_STATE_CHANGED,
     KEY_DATA_LOGGING as DATA_LOGGING,
-    MATCH_ALL,
     URL_API,
     URL_API_COMPONENTS,
     URL_API_CONFIG,
@@ -46,12 +44,23 @@ from homeassistant.exceptions import (
     Unauthorized,
 )
 from homeassistant.helpers import config_validation as cv, recorder, template
-from homeassistant.helpers.json import json_dumps, json_fragment
+from homeassistant.helpers.http import (
+    STREAM_MIN_ITEMS,
+    JSONStreamResponse,
+    accepts_ndjson,
+)
+from homeassistant.helpers.json import json_fragment
 from homeassistant.helpers.service import async_get_all_descriptions
 from homeassistant.helpers.typing import ConfigType
-from homeassistant.util.event_type import EventType
 from homeassistant.util.json import json_loads
 
+from .event_stream import (
+    POLICY_QUEUE,
+    STREAM_POLICIES,
+    EventStream,
+    async_get_event_stream_hub,
+)
+
 _LOGGER = logging.getLogger(__name__)
 
 ATTR_BASE_URL = "base_url"
@@ -65,8 +74,10 @@ ATTR_VERSION = "version"
 
 DOMAIN = "api"
 STREAM_PING_PAYLOAD = "ping"
+STREAM_PING_MESSAGE = f"data: {STREAM_PING_PAYLOAD}\n\n".encode()
 STREAM_PING_INTERVAL = 50  # seconds
 SERVICE_WAIT_TIMEOUT = 10
+URL_API_STREAM_METRICS = f"{URL_API_STREAM}/metrics"
 
 CONFIG_SCHEMA = cv.empty_config_schema(DOMAIN)
 
@@ -76,6 +87,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     hass.http.register_view(APIStatusView)
     hass.http.register_view(APICoreStateView)
     hass.http.register_view(APIEventStream)
+    hass.http.register_view(APIEventStreamMetricsView)
     hass.http.register_view(APIConfigView)
     hass.http.register_view(APIStatesView)
     hass.http.register_view(APIEntityStateView)
@@ -133,65 +145,82 @@ class APIEventStream(HomeAssistantView):
 
     @require_admin
     async def get(self, request: web.Request) -> web.StreamResponse:
-        """Provide a streaming interface for the event bus."""
-        hass = request.app[KEY_HASS]
-        stop_obj = object()
-        to_write: asyncio.Queue[object | str] = asyncio.Queue()
-
-        restrict: list[EventType[Any] | str] | None = None
-        if restrict_str := request.query.get("restrict"):
-            restrict = [*restrict_str.split(","), EVENT_HOMEASSISTANT_STOP]
-
-        async def forward_events(event: Event) -> None:
-            """Forward events to the open request."""
-            if restrict and event.event_type not in restrict:
-                return
-
-            _LOGGER.debug("STREAM %s FORWARDING %s", id(stop_obj), event)
-
-            if event.event_type == EVENT_HOMEASSISTANT_STOP:
-                data = stop_obj
-            else:
-                data = json_dumps(event)
+        """Provide a streaming interface for the event bus.
 
-            await to_write.put(data)
+        Events can be filtered by event type, entity_id and domain. By
+        default every event is written. The drop and merge policies bound
+        the queue of a stream that falls behind by dropping the oldest
+        events or merging the state changes of an entity.
+        """
+        hass = request.app[KEY_HASS]
+        query = request.query
+        if (policy := query.get("policy", POLICY_QUEUE)) not in STREAM_POLICIES:
+            return self.json_message("Invalid policy", HTTPStatus.BAD_REQUEST)
+        stream = EventStream(
+            _split_query(query.get("restrict")),
+            _split_query(query.get("entity_id")),
+            _split_query(query.get("domain")),
+            policy,
+        )
 
         response = web.StreamResponse()
         response.content_type = "text/event-stream"
         await response.prepare(request)
 
-        unsub_stream = hass.bus.async_listen(MATCH_ALL, forward_events)
+        remove_stream = async_get_event_stream_hub(hass).async_add(stream)
 
         try:
-            _LOGGER.debug("STREAM %s ATTACHED", id(stop_obj))
+            _LOGGER.debug("STREAM %s ATTACHED", id(stream))
 
             # Fire off one message so browsers fire open event right away
-            await to_write.put(STREAM_PING_PAYLOAD)
+            await response.write(STREAM_PING_MESSAGE)
 
             while True:
                 try:
                     async with timeout(STREAM_PING_INTERVAL):
-                        payload = await to_write.get()
-
-                    if payload is stop_obj:
-                        break
-
-                    msg = f"data: {payload}\n\n"
-                    _LOGGER.debug("STREAM %s WRITING %s", id(stop_obj), msg.strip())
-                    await response.write(msg.encode("UTF-8"))
+                        await stream.wakeup.wait()
                 except TimeoutError:
-                    await to_write.put(STREAM_PING_PAYLOAD)
+                    await response.write(STREAM_PING_MESSAGE)
+                    continue
+
+                if payloads := stream.async_take():
+                    _LOGGER.debug(
+                        "STREAM %s WRITING %s EVENTS", id(stream), len(payloads)
+                    )
+                    await response.write(b"".join(payloads))
+                if stream.closed:
+                    break
 
         except asyncio.CancelledError:
-            _LOGGER.debug("STREAM %s ABORT", id(stop_obj))
+            _LOGGER.debug("STREAM %s ABORT", id(stream))
 
         finally:
-            _LOGGER.debug("STREAM %s RESPONSE CLOSED", id(stop_obj))
-            unsub_stream()
+            _LOGGER.debug("STREAM %s RESPONSE CLOSED", id(stream))
+            remove_stream()
 
         return response
 
 
+class APIEventStreamMetricsView(HomeAssistantView):
+    """View to handle EventStream metrics requests."""
+
+    url = URL_API_STREAM_METRICS
+    name = "api:stream:metrics"
+
+    @require_admin
+    async def get(self, request: web.Request) -> web.Response:
+        """Return the open event streams and how far they are behind."""
+        hub = async_get_event_stream_hub(request.app[KEY_HASS])
+        return self.json([stream.as_dict() for stream in hub.streams])
+
+
+def _split_query(value: str | None) -> set[str] | None:
+    """Return the comma separated values of a query parameter."""
+    if not value:
+        return None
+    return set(value.split(","))
+
+
 class APIConfigView(HomeAssistantView):
     """View to handle Configuration requests."""
 
@@ -210,27 +239,35 @@ class APIStatesView(HomeAssistantView):
     url = URL_API_STATES
     name = "api:states"
 
-    @ha.callback
-    def get(self, request: web.Request) -> web.Response:
-        """Get current states."""
+    async def get(self, request: web.Request) -> web.StreamResponse:
+        """Get current states.
+
+        Large responses and clients accepting NDJSON are streamed.
+        """
         user: User = request[KEY_HASS_USER]
         hass = request.app[KEY_HASS]
         if user.is_admin:
-            states = (state.as_dict_json for state in hass.states.async_all())
+            states = [state.as_dict_json for state in hass.states.async_all()]
         else:
             entity_perm = user.permissions.check_entity
-            states = (
+            states = [
                 state.as_dict_json
                 for state in hass.states.async_all()
                 if entity_perm(state.entity_id, "read")
+            ]
+        if not (ndjson := accepts_ndjson(request)) and len(states) <= STREAM_MIN_ITEMS:
+            response = web.Response(
+                body=b"".join((b"[", b",".join(states), b"]")),
+                content_type=CONTENT_TYPE_JSON,
+                zlib_executor_size=32768,
             )
-        response = web.Response(
-            body=b"".join((b"[", b",".join(states), b"]")),
-            content_type=CONTENT_TYPE_JSON,
-            zlib_executor_size=32768,
-        )
-        response.enable_compression()
-        return response
+            response.enable_compression()
+            return response
+        stream = JSONStreamResponse(ndjson)
+        await stream.prepare(request)
+        await stream.write_items(states)
+        await stream.write_eof()
+        return stream
 
 
 class APIEntityStateView(HomeAssistantView):
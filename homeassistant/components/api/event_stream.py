@@ -0,0 +1,200 @@
+"""Forward events to the /api/stream event streams."""
+
+from __future__ import annotations
+
+import asyncio
+from itertools import count
+from time import monotonic
+from typing import Any, Final
+
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP, EVENT_STATE_CHANGED, MATCH_ALL
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers.json import json_bytes
+from homeassistant.util.hass_dict import HassKey
+
+DATA_EVENT_STREAM_HUB: HassKey[EventStreamHub] = HassKey("api_event_stream_hub")
+
+STREAM_MAX_QUEUE: Final = 1024
+POLICY_QUEUE: Final = "queue"
+POLICY_DROP: Final = "drop"
+POLICY_MERGE: Final = "merge"
+STREAM_POLICIES: Final = (POLICY_QUEUE, POLICY_DROP, POLICY_MERGE)
+
+
+class EventStream:
+    """The events waiting to be written to an /api/stream request.
+
+    With the queue policy every event is kept until it is written. With the
+    drop and merge policies at most max_queue events are kept, when the queue
+    is full the oldest event is dropped. With the merge policy a state change
+    also replaces the waiting state change of the same entity.
+    """
+
+    __slots__ = (
+        "event_types",
+        "entity_ids",
+        "domains",
+        "policy",
+        "merge",
+        "max_queue",
+        "pending",
+        "wakeup",
+        "closed",
+        "sent",
+        "dropped",
+        "merged",
+    )
+
+    def __init__(
+        self,
+        event_types: set[str] | None,
+        entity_ids: set[str] | None,
+        domains: set[str] | None,
+        policy: str,
+        max_queue: int = STREAM_MAX_QUEUE,
+    ) -> None:
+        """Initialize the stream.
+
+        If entity_ids or domains are set, only events with a matching
+        entity_id in their data are forwarded.
+        """
+        self.event_types = event_types
+        self.entity_ids = entity_ids
+        self.domains = domains
+        self.policy = policy
+        self.merge = policy == POLICY_MERGE
+        self.max_queue = None if policy == POLICY_QUEUE else max_queue
+        # The serialized events and the time they were queued
+        self.pending: dict[object, tuple[bytes, float]] = {}
+        self.wakeup = asyncio.Event()
+        self.closed = False
+        self.sent = 0
+        self.dropped = 0
+        self.merged = 0
+
+    def wants(self, event: Event) -> bool:
+        """Return if the event passes the filters of the stream."""
+        if self.event_types is not None and event.event_type not in self.event_types:
+            return False
+        if self.entity_ids is None and self.domains is None:
+            return True
+        if not isinstance(entity_id := event.data.get("entity_id"), str):
+            return False
+        return (self.entity_ids is not None and entity_id in self.entity_ids) or (
+            self.domains is not None and entity_id.partition(".")[0] in self.domains
+        )
+
+    @callback
+    def async_put(self, key: object, payload: bytes) -> None:
+        """Queue a serialized event, replacing the event with the same key.
+
+        A replaced event is moved to the end of the queue so events are
+        still written in the order they happened.
+        """
+        pending = self.pending
+        if pending.pop(key, None) is not None:
+            pending[key] = (payload, monotonic())
+            self.merged += 1
+            return
+        if self.max_queue is not None and len(pending) >= self.max_queue:
+            del pending[next(iter(pending))]
+            self.dropped += 1
+        pending[key] = (payload, monotonic())
+        self.wakeup.set()
+
+    @callback
+    def async_take(self) -> list[bytes]:
+        """Return and clear the queued events."""
+        pending = self.pending
+        self.pending = {}
+        self.wakeup.clear()
+        self.sent += len(pending)
+        return [payload for payload, _ in pending.values()]
+
+    @callback
+    def async_close(self) -> None:
+        """Stop the stream after the queued events are written."""
+        self.closed = True
+        self.wakeup.set()
+
+    @property
+    def lag(self) -> float:
+        """Return how long the oldest queued event has been waiting."""
+        if not self.pending:
+            return 0.0
+        return monotonic() - next(iter(self.pending.values()))[1]
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the filters and statistics of the stream."""
+        return {
+            "event_types": sorted(self.event_types) if self.event_types else None,
+            "entity_ids": sorted(self.entity_ids) if self.entity_ids else None,
+            "domains": sorted(self.domains) if self.domains else None,
+            "policy": self.policy,
+            "queue_size": len(self.pending),
+            "lag": self.lag,
+            "sent": self.sent,
+            "dropped": self.dropped,
+            "merged": self.merged,
+        }
+
+
+class EventStreamHub:
+    """Forward events to all event streams.
+
+    A single listener is shared by the streams and each event is serialized
+    once for all streams that want it.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the hub."""
+        self.hass = hass
+        self.streams: dict[EventStream, None] = {}
+        self._sequence = count()
+        self._unsub: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_add(self, stream: EventStream) -> CALLBACK_TYPE:
+        """Add a stream and return a callback to remove it."""
+        if self._unsub is None:
+            self._unsub = self.hass.bus.async_listen(
+                MATCH_ALL, self._async_forward_event
+            )
+        self.streams[stream] = None
+
+        @callback
+        def _async_remove() -> None:
+            """Remove the stream."""
+            del self.streams[stream]
+            if not self.streams and self._unsub is not None:
+                self._unsub()
+                self._unsub = None
+
+        return _async_remove
+
+    @callback
+    def _async_forward_event(self, event: Event) -> None:
+        """Queue an event in the streams that want it."""
+        if event.event_type == EVENT_HOMEASSISTANT_STOP:
+            for stream in self.streams:
+                stream.async_close()
+            return
+        payload: bytes | None = None
+        key = next(self._sequence)
+        for stream in self.streams:
+            if not stream.wants(event):
+                continue
+            if payload is None:
+                payload = b"".join((b"data: ", json_bytes(event), b"\n\n"))
+            if stream.merge and event.event_type == EVENT_STATE_CHANGED:
+                stream.async_put(event.data["entity_id"], payload)
+            else:
+                stream.async_put(key, payload)
+
+
+@callback
+def async_get_event_stream_hub(hass: HomeAssistant) -> EventStreamHub:
+    """Return the hub for the event streams."""
+    if (hub := hass.data.get(DATA_EVENT_STREAM_HUB)) is None:
+        hub = hass.data[DATA_EVENT_STREAM_HUB] = EventStreamHub(hass)
+    return hub
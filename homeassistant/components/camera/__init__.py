@@ -13,7 +13,6 @@ from functools import cached_property, partial
 import logging
 import os
 from random import SystemRandom
-import time
 from typing import Any, Final, cast, final
 
 from aiohttp import hdrs, web
@@ -21,7 +20,7 @@ import attr
 import voluptuous as vol
 
 from homeassistant.components import websocket_api
-from homeassistant.components.http import KEY_AUTHENTICATED, HomeAssistantView
+from homeassistant.components.http import KEY_AUTHENTICATED, KEY_HASS, HomeAssistantView
 from homeassistant.components.media_player import (
     ATTR_MEDIA_CONTENT_ID,
     ATTR_MEDIA_CONTENT_TYPE,
@@ -80,6 +79,7 @@ from .const import (  # noqa: F401
 )
 from .img_util import scale_jpeg_camera_image
 from .prefs import CameraPreferences, DynamicStreamSettings  # noqa: F401
+from .still_stream import DATA_STILL_STREAMS, async_get_still_stream_broadcaster
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -264,51 +264,34 @@ async def async_get_still_stream(
 ) -> web.StreamResponse:
     """Generate an HTTP MJPEG stream from camera images.
 
+    The viewers of the same image_cb, content type and interval share the
+    fetched images and frames, a slow viewer skips frames.
+
     This method must be run in the event loop.
     """
     response = web.StreamResponse()
     response.content_type = CONTENT_TYPE_MULTIPART.format("--frameboundary")
     await response.prepare(request)
 
-    async def write_to_mjpeg_stream(img_bytes: bytes) -> None:
-        """Write image to stream."""
-        await response.write(
-            bytes(
-                "--frameboundary\r\n"
-                f"Content-Type: {content_type}\r\n"
-                f"Content-Length: {len(img_bytes)}\r\n\r\n",
-                "utf-8",
-            )
-            + img_bytes
-            + b"\r\n"
-        )
-
-    last_image = None
-
-    while True:
-        last_fetch = time.monotonic()
-        img_bytes = await image_cb()
-        if not img_bytes:
-            break
-
-        if img_bytes != last_image:
-            await write_to_mjpeg_stream(img_bytes)
-
-            # Chrome always shows the n-1 frame:
-            # https://issues.chromium.org/issues/41199053
-            # https://issues.chromium.org/issues/40791855
-            # We send the first frame twice to ensure it shows
-            # Subsequent frames are not a concern at reasonable frame rates
-            # (even 1/10 FPS is about the latency of HLS)
-            if last_image is None:
-                await write_to_mjpeg_stream(img_bytes)
-            last_image = img_bytes
-
-        next_fetch = last_fetch + interval
-        now = time.monotonic()
-        if next_fetch > now:
-            sleep_time = next_fetch - now
-            await asyncio.sleep(sleep_time)
+    broadcaster = async_get_still_stream_broadcaster(
+        request.app[KEY_HASS], image_cb, content_type, interval
+    )
+    viewer = broadcaster.async_add_viewer()
+    try:
+        if (frame := await viewer.async_next_frame()) is None:
+            return response
+        # Chrome always shows the n-1 frame:
+        # https://issues.chromium.org/issues/41199053
+        # https://issues.chromium.org/issues/40791855
+        # We send the first frame twice to ensure it shows
+        # Subsequent frames are not a concern at reasonable frame rates
+        # (even 1/10 FPS is about the latency of HLS)
+        await response.write(frame)
+        while frame is not None:
+            await response.write(frame)
+            frame = await viewer.async_next_frame()
+    finally:
+        broadcaster.async_remove_viewer(viewer)
 
     return response
 
@@ -395,6 +378,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     websocket_api.async_register_command(hass, ws_camera_web_rtc_offer)
     websocket_api.async_register_command(hass, websocket_get_prefs)
     websocket_api.async_register_command(hass, websocket_update_prefs)
+    websocket_api.async_register_command(hass, websocket_still_streams)
 
     await component.async_setup(config)
 
@@ -986,6 +970,22 @@ async def websocket_update_prefs(
         connection.send_result(msg["id"], entity_prefs)
 
 
+@websocket_api.require_admin
+@websocket_api.websocket_command({vol.Required("type"): "camera/still_streams"})
+@callback
+def websocket_still_streams(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle request for the viewers and dropped frames of the MJPEG streams."""
+    connection.send_result(
+        msg["id"],
+        [
+            broadcaster.as_dict()
+            for broadcaster in hass.data.get(DATA_STILL_STREAMS, {}).values()
+        ],
+    )
+
+
 async def async_handle_snapshot_service(
     camera: Camera, service_call: ServiceCall
 ) -> None:
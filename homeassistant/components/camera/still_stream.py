@@ -0,0 +1,190 @@
+"""Broadcast camera images as MJPEG frames to all viewers of a still stream."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+import logging
+import time
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util.hass_dict import HassKey
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_STILL_STREAMS: HassKey[dict[Hashable, StillStreamBroadcaster]] = HassKey(
+    "camera_still_streams"
+)
+
+
+class StillStreamViewer:
+    """A viewer of a still stream.
+
+    Only the latest frame is kept for the viewer, frames that arrive while
+    the viewer is still writing the previous frame are skipped.
+    """
+
+    __slots__ = ("_frame", "_wakeup", "_closed", "sent", "dropped")
+
+    def __init__(self) -> None:
+        """Initialize the viewer."""
+        self._frame: bytes | None = None
+        self._wakeup = asyncio.Event()
+        self._closed = False
+        self.sent = 0
+        self.dropped = 0
+
+    @callback
+    def async_send(self, frame: bytes) -> None:
+        """Hand a frame to the viewer."""
+        if self._frame is not None:
+            self.dropped += 1
+        self._frame = frame
+        self._wakeup.set()
+
+    @callback
+    def async_close(self) -> None:
+        """End the stream of the viewer after the pending frame."""
+        self._closed = True
+        self._wakeup.set()
+
+    async def async_next_frame(self) -> bytes | None:
+        """Wait for the next frame or return None when the stream ended."""
+        while (frame := self._frame) is None:
+            if self._closed:
+                return None
+            await self._wakeup.wait()
+            self._wakeup.clear()
+        self._frame = None
+        self.sent += 1
+        return frame
+
+
+class StillStreamBroadcaster:
+    """Fetch the images of a still stream once for all its viewers.
+
+    Each image is built into a multipart frame once and the same frame is
+    handed to every viewer. The images are fetched while there are viewers.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        key: Hashable,
+        image_cb: Callable[[], Awaitable[bytes | None]],
+        content_type: str,
+        interval: float,
+    ) -> None:
+        """Initialize the broadcaster."""
+        self.hass = hass
+        self.key = key
+        self.image_cb = image_cb
+        self.content_type = content_type
+        self.interval = interval
+        self.viewers: dict[StillStreamViewer, None] = {}
+        self.frames = 0
+        # Frames sent to and dropped by the viewers that left
+        self._sent = 0
+        self._dropped = 0
+        self._frame: bytes | None = None
+        self._task: asyncio.Task[None] | None = None
+
+    @callback
+    def async_add_viewer(self) -> StillStreamViewer:
+        """Add a viewer and start fetching images for it."""
+        viewer = StillStreamViewer()
+        self.viewers[viewer] = None
+        if self._frame is not None:
+            viewer.async_send(self._frame)
+        if self._task is None:
+            self._task = self.hass.async_create_background_task(
+                self._async_fetch_images(), f"camera still stream {self.key}"
+            )
+        return viewer
+
+    @callback
+    def async_remove_viewer(self, viewer: StillStreamViewer) -> None:
+        """Remove a viewer and stop once there are no viewers left."""
+        if self.viewers.pop(viewer, False) is None:
+            self._sent += viewer.sent
+            self._dropped += viewer.dropped
+        if self.viewers:
+            return
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        self._async_forget()
+
+    @callback
+    def _async_forget(self) -> None:
+        """Stop sharing the broadcaster with new viewers."""
+        broadcasters = self.hass.data[DATA_STILL_STREAMS]
+        if broadcasters.get(self.key) is self:
+            del broadcasters[self.key]
+
+    async def _async_fetch_images(self) -> None:
+        """Fetch images and hand the changed ones to the viewers."""
+        last_image: bytes | None = None
+        try:
+            while True:
+                last_fetch = time.monotonic()
+                if not (img_bytes := await self.image_cb()):
+                    break
+
+                if img_bytes != last_image:
+                    self._frame = b"".join(
+                        (
+                            b"--frameboundary\r\nContent-Type: ",
+                            self.content_type.encode(),
+                            b"\r\nContent-Length: %d\r\n\r\n" % len(img_bytes),
+                            img_bytes,
+                            b"\r\n",
+                        )
+                    )
+                    self.frames += 1
+                    for viewer in self.viewers:
+                        viewer.async_send(self._frame)
+                    last_image = img_bytes
+
+                next_fetch = last_fetch + self.interval
+                now = time.monotonic()
+                if next_fetch > now:
+                    await asyncio.sleep(next_fetch - now)
+        except Exception:
+            _LOGGER.exception("Error fetching images for the still stream")
+        self._task = None
+        self._async_forget()
+        for viewer in self.viewers:
+            viewer.async_close()
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the viewer and frame statistics."""
+        viewers = self.viewers
+        # The images are usually fetched by a method of the camera entity
+        entity = getattr(self.image_cb, "__self__", None)
+        return {
+            "entity_id": getattr(entity, "entity_id", None),
+            "interval": self.interval,
+            "viewers": len(viewers),
+            "frames": self.frames,
+            "sent": self._sent + sum(viewer.sent for viewer in viewers),
+            "dropped": self._dropped + sum(viewer.dropped for viewer in viewers),
+        }
+
+
+@callback
+def async_get_still_stream_broadcaster(
+    hass: HomeAssistant,
+    image_cb: Callable[[], Awaitable[bytes | None]],
+    content_type: str,
+    interval: float,
+) -> StillStreamBroadcaster:
+    """Return the broadcaster shared by the viewers of the same images."""
+    broadcasters = hass.data.setdefault(DATA_STILL_STREAMS, {})
+    key = (image_cb, content_type, interval)
+    if (broadcaster := broadcasters.get(key)) is None:
+        broadcaster = broadcasters[key] = StillStreamBroadcaster(
+            hass, key, image_cb, content_type, interval
+        )
+    return broadcaster
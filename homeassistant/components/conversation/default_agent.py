@@ -13,7 +13,13 @@ import time
 from typing import IO, Any, cast
 
 from hassil.expression import Expression, ListReference, Sequence
-from hassil.intents import Intents, SlotList, TextSlotList, WildcardSlotList
+from hassil.intents import (
+    Intents,
+    SlotList,
+    TextSlotList,
+    TextSlotValue,
+    WildcardSlotList,
+)
 from hassil.recognize import (
     MISSING_ENTITY,
     RecognizeResult,
@@ -46,6 +52,7 @@ from homeassistant.util.json import JsonObjectType, json_loads_object
 
 from .const import DEFAULT_EXPOSED_ATTRIBUTES, DOMAIN, ConversationEntityFeature
 from .entity import ConversationEntity
+from .intent_index import IntentIndex
 from .models import ConversationInput, ConversationResult
 from .trace import ConversationTraceEventType, async_conversation_trace_append
 
@@ -84,6 +91,7 @@ class LanguageIntents:
     intent_responses: dict[str, Any]
     error_responses: dict[str, Any]
     language_variant: str | None
+    intent_index: IntentIndex
 
 
 @dataclass(slots=True)
@@ -161,11 +169,15 @@ class DefaultAgent(ConversationEntity):
         # intent -> [sentences]
         self._config_intents: dict[str, Any] = config_intents
         self._slot_lists: dict[str, SlotList] | None = None
+        # entity_id -> names and aliases of the exposed entities
+        self._entity_slot_values: dict[str, list[TextSlotValue]] | None = None
+        # Entities whose names are created again when the slot list is needed
+        self._stale_entity_ids: set[str] = set()
 
         # Sentences that will trigger a callback (skipping intent recognition)
         self._trigger_sentences: list[TriggerData] = []
-        self._trigger_intents: Intents | None = None
-        self._unsub_clear_slot_list: list[Callable[[], None]] | None = None
+        self._trigger_index: IntentIndex | None = None
+        self._unsub_slot_list_changes: list[Callable[[], None]] | None = None
         self._load_intents_lock = asyncio.Lock()
 
     @property
@@ -188,30 +200,32 @@ class DefaultAgent(ConversationEntity):
         return not event_data["old_state"] or not event_data["new_state"]
 
     @core.callback
-    def _listen_clear_slot_list(self) -> None:
+    def _listen_slot_list_changes(self) -> None:
         """Listen for changes that can invalidate slot list."""
-        assert self._unsub_clear_slot_list is None
+        assert self._unsub_slot_list_changes is None
 
-        self._unsub_clear_slot_list = [
+        self._unsub_slot_list_changes = [
             self.hass.bus.async_listen(
                 ar.EVENT_AREA_REGISTRY_UPDATED,
-                self._async_clear_slot_list,
+                self._async_clear_area_slot_list,
             ),
             self.hass.bus.async_listen(
                 fr.EVENT_FLOOR_REGISTRY_UPDATED,
-                self._async_clear_slot_list,
+                self._async_clear_floor_slot_list,
             ),
             self.hass.bus.async_listen(
                 er.EVENT_ENTITY_REGISTRY_UPDATED,
-                self._async_clear_slot_list,
+                self._async_update_entity_slot_values,
                 event_filter=self._filter_entity_registry_changes,
             ),
             self.hass.bus.async_listen(
                 EVENT_STATE_CHANGED,
-                self._async_clear_slot_list,
+                self._async_update_entity_slot_values,
                 event_filter=self._filter_state_changes,
             ),
-            async_listen_entity_updates(self.hass, DOMAIN, self._async_clear_slot_list),
+            async_listen_entity_updates(
+                self.hass, DOMAIN, self._async_clear_entity_slot_values
+            ),
         ]
 
     async def async_recognize(
@@ -440,9 +454,11 @@ class DefaultAgent(ConversationEntity):
         name_result: RecognizeResult | None = None
         best_results: list[RecognizeResult] = []
         best_text_chunks_matched: int | None = None
+        # Only the intents with the literal words of the text can match
+        intents = lang_intents.intent_index.candidates(user_input.text)
         for result in recognize_all(
             user_input.text,
-            lang_intents.intents,
+            intents,
             slot_lists=slot_lists,
             intent_context=intent_context,
             language=language,
@@ -501,7 +517,7 @@ class DefaultAgent(ConversationEntity):
         maybe_result: RecognizeResult | None = None
         for result in recognize_all(
             user_input.text,
-            lang_intents.intents,
+            intents,
             slot_lists=slot_lists,
             intent_context=intent_context,
             allow_unmatched_entities=True,
@@ -800,72 +816,127 @@ class DefaultAgent(ConversationEntity):
             intent_responses,
             error_responses,
             language_variant,
+            IntentIndex(intents),
         )
 
     @core.callback
-    def _async_clear_slot_list(self, event: core.Event[Any] | None = None) -> None:
-        """Clear slot lists when a registry has changed."""
-        # Two subscribers can be scheduled at same time
-        _LOGGER.debug("Clearing slot lists")
-        if self._unsub_clear_slot_list is None:
+    def _async_clear_slot_list(self, name: str) -> None:
+        """Clear a slot list so it is created again when it is needed."""
+        if self._slot_lists is None or name not in self._slot_lists:
             return
-        self._slot_lists = None
-        for unsub in self._unsub_clear_slot_list:
-            unsub()
-        self._unsub_clear_slot_list = None
+        _LOGGER.debug("Clearing %s slot list", name)
+        # The slot lists can be in use by a recognizer in the executor
+        self._slot_lists = {
+            list_name: slot_list
+            for list_name, slot_list in self._slot_lists.items()
+            if list_name != name
+        }
 
     @core.callback
-    def _make_slot_lists(self) -> dict[str, SlotList]:
-        """Create slot lists with areas and entity names/aliases."""
-        if self._slot_lists is not None:
-            return self._slot_lists
+    def _async_clear_area_slot_list(self, event: core.Event[Any]) -> None:
+        """Clear the area slot list when the area registry has changed."""
+        self._async_clear_slot_list("area")
 
-        start = time.monotonic()
+    @core.callback
+    def _async_clear_floor_slot_list(self, event: core.Event[Any]) -> None:
+        """Clear the floor slot list when the floor registry has changed."""
+        self._async_clear_slot_list("floor")
 
-        entity_registry = er.async_get(self.hass)
-        states = [
-            state
-            for state in self.hass.states.async_all()
-            if async_should_expose(self.hass, DOMAIN, state.entity_id)
-        ]
+    @core.callback
+    def _async_clear_entity_slot_values(self) -> None:
+        """Clear the names of all entities when the exposed entities changed."""
+        self._entity_slot_values = None
+        self._stale_entity_ids.clear()
+        self._async_clear_slot_list("name")
 
-        # Gather exposed entity names.
-        #
-        # NOTE: We do not pass entity ids in here because multiple entities may
-        # have the same name. The intent matcher doesn't gather all matching
-        # values for a list, just the first. So we will need to match by name no
-        # matter what.
-        entity_names = []
-        for state in states:
-            # Checked against "requires_context" and "excludes_context" in hassil
-            context = {"domain": state.domain}
-            if state.attributes:
-                # Include some attributes
-                for attr in DEFAULT_EXPOSED_ATTRIBUTES:
-                    if attr not in state.attributes:
-                        continue
-                    context[attr] = state.attributes[attr]
+    @core.callback
+    def _async_update_entity_slot_values(
+        self,
+        event: core.Event[er.EventEntityRegistryUpdatedData]
+        | core.Event[core.EventStateChangedData],
+    ) -> None:
+        """Mark the names of an entity that was added, removed or renamed as stale.
 
-            entity = entity_registry.async_get(state.entity_id)
+        The names are created again when the slot list is needed, since a
+        renamed entity usually writes its new friendly name after the entity
+        registry has been updated.
+        """
+        if self._entity_slot_values is None:
+            return
+        self._stale_entity_ids.add(event.data["entity_id"])
+        self._async_clear_slot_list("name")
+
+    @staticmethod
+    def _make_entity_slot_values(
+        entity_registry: er.EntityRegistry, state: core.State
+    ) -> list[TextSlotValue]:
+        """Create the slot values with the name and aliases of an entity."""
+        # Checked against "requires_context" and "excludes_context" in hassil
+        context = {"domain": state.domain}
+        if state.attributes:
+            # Include some attributes
+            for attr in DEFAULT_EXPOSED_ATTRIBUTES:
+                if attr not in state.attributes:
+                    continue
+                context[attr] = state.attributes[attr]
 
-            if not entity:
-                # Default name
-                entity_names.append((state.name, state.name, context))
-                continue
+        entity_names = []
+        entity = entity_registry.async_get(state.entity_id)
+        if entity and entity.aliases:
+            for alias in entity.aliases:
+                if not alias.strip():
+                    continue
 
-            if entity.aliases:
-                for alias in entity.aliases:
-                    if not alias.strip():
-                        continue
+                entity_names.append((alias, alias, context))
 
-                    entity_names.append((alias, alias, context))
+        # Default name
+        entity_names.append((state.name, state.name, context))
 
-            # Default name
-            entity_names.append((state.name, state.name, context))
+        return [
+            TextSlotValue.from_tuple(entity_name, allow_template=False)
+            for entity_name in entity_names
+        ]
 
-        _LOGGER.debug("Exposed entities: %s", entity_names)
+    @core.callback
+    def _make_entity_slot_list(self) -> TextSlotList:
+        """Create the slot list with the names and aliases of exposed entities."""
+        if self._entity_slot_values is None:
+            entity_registry = er.async_get(self.hass)
+            self._entity_slot_values = {
+                state.entity_id: self._make_entity_slot_values(entity_registry, state)
+                for state in self.hass.states.async_all()
+                if async_should_expose(self.hass, DOMAIN, state.entity_id)
+            }
+        elif self._stale_entity_ids:
+            entity_registry = er.async_get(self.hass)
+            for entity_id in self._stale_entity_ids:
+                state = self.hass.states.get(entity_id)
+                if state is not None and async_should_expose(
+                    self.hass, DOMAIN, entity_id
+                ):
+                    self._entity_slot_values[entity_id] = self._make_entity_slot_values(
+                        entity_registry, state
+                    )
+                else:
+                    self._entity_slot_values.pop(entity_id, None)
+        self._stale_entity_ids.clear()
 
-        # Expose all areas.
+        # NOTE: We do not pass entity ids in here because multiple entities may
+        # have the same name. The intent matcher doesn't gather all matching
+        # values for a list, just the first. So we will need to match by name no
+        # matter what.
+        return TextSlotList(
+            name=None,
+            values=[
+                value
+                for values in self._entity_slot_values.values()
+                for value in values
+            ],
+        )
+
+    @core.callback
+    def _make_area_slot_list(self) -> TextSlotList:
+        """Create the slot list with the names and aliases of all areas."""
         areas = ar.async_get(self.hass)
         area_names = []
         for area in areas.async_list_areas():
@@ -880,7 +951,11 @@ class DefaultAgent(ConversationEntity):
 
                 area_names.append((alias, alias))
 
-        # Expose all floors.
+        return TextSlotList.from_tuples(area_names, allow_template=False)
+
+    @core.callback
+    def _make_floor_slot_list(self) -> TextSlotList:
+        """Create the slot list with the names and aliases of all floors."""
         floors = fr.async_get(self.hass)
         floor_names = []
         for floor in floors.async_list_floors():
@@ -895,20 +970,40 @@ class DefaultAgent(ConversationEntity):
 
                 floor_names.append((alias, floor.name))
 
-        self._slot_lists = {
-            "area": TextSlotList.from_tuples(area_names, allow_template=False),
-            "name": TextSlotList.from_tuples(entity_names, allow_template=False),
-            "floor": TextSlotList.from_tuples(floor_names, allow_template=False),
-        }
+        return TextSlotList.from_tuples(floor_names, allow_template=False)
+
+    @core.callback
+    def _make_slot_lists(self) -> dict[str, SlotList]:
+        """Create slot lists with areas and entity names/aliases.
+
+        The slot lists are kept up to date from registry and state changes,
+        only the slot lists that were cleared by a change are created again.
+        """
+        slot_lists = self._slot_lists or {}
+        if len(slot_lists) == 3:
+            return slot_lists
+
+        start = time.monotonic()
+
+        slot_lists = dict(slot_lists)
+        if "area" not in slot_lists:
+            slot_lists["area"] = self._make_area_slot_list()
+        if "name" not in slot_lists:
+            slot_lists["name"] = self._make_entity_slot_list()
+            _LOGGER.debug("Exposed entities: %s", self._entity_slot_values)
+        if "floor" not in slot_lists:
+            slot_lists["floor"] = self._make_floor_slot_list()
+        self._slot_lists = slot_lists
 
-        self._listen_clear_slot_list()
+        if self._unsub_slot_list_changes is None:
+            self._listen_slot_list_changes()
 
         _LOGGER.debug(
             "Created slot lists in %.2f seconds",
             time.monotonic() - start,
         )
 
-        return self._slot_lists
+        return slot_lists
 
     def _make_intent_context(
         self, user_input: ConversationInput
@@ -962,7 +1057,7 @@ class DefaultAgent(ConversationEntity):
         self._trigger_sentences.append(trigger_data)
 
         # Force rebuild on next use
-        self._trigger_intents = None
+        self._trigger_index = None
 
         return functools.partial(self._unregister_trigger, trigger_data)
 
@@ -992,7 +1087,7 @@ class DefaultAgent(ConversationEntity):
         for wildcard_name in wildcard_names:
             trigger_intents.slot_lists[wildcard_name] = WildcardSlotList(wildcard_name)
 
-        self._trigger_intents = trigger_intents
+        self._trigger_index = IntentIndex(trigger_intents)
 
         _LOGGER.debug("Rebuilt trigger intents: %s", intents_dict)
 
@@ -1002,7 +1097,7 @@ class DefaultAgent(ConversationEntity):
         self._trigger_sentences.remove(trigger_data)
 
         # Force rebuild on next use
-        self._trigger_intents = None
+        self._trigger_index = None
 
     async def _match_triggers(self, sentence: str) -> SentenceTriggerResult | None:
         """Try to match sentence against registered trigger sentences.
@@ -1014,15 +1109,15 @@ class DefaultAgent(ConversationEntity):
             # No triggers registered
             return None
 
-        if self._trigger_intents is None:
+        if self._trigger_index is None:
             # Need to rebuild intents before matching
             self._rebuild_trigger_intents()
 
-        assert self._trigger_intents is not None
+        assert self._trigger_index is not None
 
         matched_triggers: dict[int, RecognizeResult] = {}
         matched_template: str | None = None
-        for result in recognize_all(sentence, self._trigger_intents):
+        for result in recognize_all(sentence, self._trigger_index.candidates(sentence)):
             if result.intent_sentence is not None:
                 matched_template = result.intent_sentence.text
 
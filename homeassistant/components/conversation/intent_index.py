@@ -0,0 +1,157 @@
+"""Index of the literal words required by sentence templates."""
+
+from __future__ import annotations
+
+from dataclasses import replace
+
+from hassil.expression import (
+    Expression,
+    RuleReference,
+    Sentence,
+    Sequence,
+    SequenceType,
+    TextChunk,
+)
+from hassil.intents import Intent, IntentData, Intents
+from hassil.recognize import BREAK_WORDS_TABLE, PUNCTUATION
+from hassil.util import normalize_text
+
+
+class IntentIndex:
+    """Filter the intent data that can match a sentence by their literal words.
+
+    A sentence template only matches text that contains the words of its
+    text chunks outside of optional parts, for alternatives one of the words
+    of each alternative. The templates are indexed by one of these words, so
+    only the templates with an indexed word that occurs in the text are
+    checked before hassil runs the full matcher on the remaining intent data.
+    """
+
+    def __init__(self, intents: Intents) -> None:
+        """Initialize the index, this parses all sentence templates."""
+        self.intents = intents
+        self._data: list[tuple[Intent, IntentData]] = []
+        # word -> [(data index, other required clauses)]
+        self._index: dict[str, list[tuple[int, tuple[frozenset[str], ...]]]] = {}
+        # Intent data with a template that does not require any words
+        self._always: set[int] = set()
+        # Skip words are removed before matching, they can join words when
+        # whitespace is ignored
+        self._skip_words = [
+            normalize_text(skip_word)
+            for skip_word in sorted(intents.skip_words, key=len, reverse=True)
+        ]
+
+        for intent in intents.intents.values():
+            for intent_data in intent.data:
+                data_idx = len(self._data)
+                self._data.append((intent, intent_data))
+                rules = {**intents.expansion_rules, **intent_data.expansion_rules}
+                templates: set[tuple[frozenset[str], frozenset[frozenset[str]]]]
+                templates = set()
+                for sentence in intent_data.sentences:
+                    if not (clauses := _required_clauses(sentence, rules, frozenset())):
+                        self._always.add(data_idx)
+                        break
+                    key = _best_clause(clauses)
+                    templates.add((key, frozenset(clauses) - {key}))
+                else:
+                    for key, other_clauses in templates:
+                        for word in key:
+                            self._index.setdefault(word, []).append(
+                                (data_idx, tuple(other_clauses))
+                            )
+
+    def _haystack(self, text: str) -> str:
+        """Return the variants of the text that text chunks are matched with."""
+        text = normalize_text(text).strip()
+        # The matcher retries a text chunk without punctuation and with words
+        # broken apart on "-" and "_"
+        no_punctuation = PUNCTUATION.sub("", text)
+        variants = [
+            text,
+            no_punctuation,
+            no_punctuation.translate(BREAK_WORDS_TABLE),
+        ]
+        if self.intents.settings.ignore_whitespace:
+            for skip_word in self._skip_words:
+                variants = [variant.replace(skip_word, "") for variant in variants]
+            variants = ["".join(variant.split()) for variant in variants]
+        return "\n".join(variants)
+
+    def candidates(self, text: str) -> Intents:
+        """Return the intents with the intent data that can match the text."""
+        haystack = self._haystack(text)
+        candidates = set(self._always)
+        for word, templates in self._index.items():
+            if word not in haystack:
+                continue
+            for data_idx, other_clauses in templates:
+                if data_idx not in candidates and all(
+                    any(other_word in haystack for other_word in clause)
+                    for clause in other_clauses
+                ):
+                    candidates.add(data_idx)
+
+        if len(candidates) == len(self._data):
+            return self.intents
+
+        # Keep the order of the intents, the first of equal results is used
+        intents: dict[str, Intent] = {}
+        for data_idx in sorted(candidates):
+            intent, intent_data = self._data[data_idx]
+            if (candidate := intents.get(intent.name)) is None:
+                candidate = intents[intent.name] = Intent(intent.name)
+            candidate.data.append(intent_data)
+
+        return replace(self.intents, intents=intents)
+
+
+def _best_clause(clauses: list[frozenset[str]]) -> frozenset[str]:
+    """Return the clause with the fewest and longest words."""
+    return min(
+        clauses,
+        key=lambda clause: (len(clause), -min(map(len, clause)), sorted(clause)),
+    )
+
+
+def _required_clauses(
+    expression: Expression, rules: dict[str, Sentence], rule_names: frozenset[str]
+) -> list[frozenset[str]]:
+    """Return the clauses of words that text must contain to match an expression.
+
+    The text contains at least one word of each clause.
+    """
+    if isinstance(expression, TextChunk):
+        return [frozenset((word,)) for word in expression.text.split()]
+
+    if isinstance(expression, Sequence):
+        if expression.type != SequenceType.ALTERNATIVE:
+            clauses: list[frozenset[str]] = []
+            for item in expression.items:
+                for clause in _required_clauses(item, rules, rule_names):
+                    if clause not in clauses:
+                        clauses.append(clause)
+            return clauses
+
+        items = [
+            _required_clauses(item, rules, rule_names) for item in expression.items
+        ]
+        if not items or not all(items):
+            # Optional
+            return []
+        # Words required by all alternatives
+        if common := set.intersection(*(set(item) for item in items)):
+            return sorted(common, key=sorted)
+        # One of the alternatives
+        return [frozenset().union(*(_best_clause(item) for item in items))]
+
+    if (
+        isinstance(expression, RuleReference)
+        and expression.rule_name not in rule_names
+        and (rule := rules.get(expression.rule_name)) is not None
+    ):
+        return _required_clauses(rule, rules, rule_names | {expression.rule_name})
+
+    # List references match text of the slot lists
+    return []
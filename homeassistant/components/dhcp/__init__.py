@@ -7,7 +7,6 @@ from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import timedelta
 from fnmatch import translate
-from functools import lru_cache
 import itertools
 import logging
 import re
@@ -68,11 +67,17 @@ HOSTNAME: Final = "hostname"
 MAC_ADDRESS: Final = "macaddress"
 IP_ADDRESS: Final = "ip"
 REGISTERED_DEVICES: Final = "registered_devices"
+OUI_LENGTH: Final = 6
+# Hostname patterns are indexed by their first characters, the shortest
+# literal prefix of the hostname patterns of the integrations is four
+HOSTNAME_INDEX_LENGTH: Final = 4
 SCAN_INTERVAL = timedelta(minutes=60)
 
 
 _LOGGER = logging.getLogger(__name__)
 
+_WILDCARD = re.compile(r"[*?[]")
+
 
 @dataclass(slots=True)
 class DhcpServiceInfo(BaseServiceInfo):
@@ -83,48 +88,122 @@ class DhcpServiceInfo(BaseServiceInfo):
     macaddress: str
 
 
-@dataclass(slots=True)
+type _PatternMatcher = Callable[[str], re.Match[str] | None]
+
+
 class DhcpMatchers:
-    """Prepared info from dhcp entries."""
+    """Index of the dhcp integration matchers.
 
-    registered_devices_domains: set[str]
-    no_oui_matchers: dict[str, list[DHCPMatcher]]
-    oui_matchers: dict[str, list[DHCPMatcher]]
+    Matchers with a MAC address are put in a bucket by OUI and matchers
+    with only a hostname by the first HOSTNAME_INDEX_LENGTH characters of
+    the hostname pattern. Patterns with a wildcard before that, like
+    *-tv, can match any client and are checked for every client.
 
+    The patterns are compiled when the matchers are indexed so a client
+    is only checked against the compiled patterns of its buckets.
+    """
 
-def async_index_integration_matchers(
-    integration_matchers: list[DHCPMatcher],
-) -> DhcpMatchers:
-    """Index the integration matchers.
+    __slots__ = (
+        "registered_devices_domains",
+        "oui",
+        "hostname",
+        "fallback",
+    )
 
-    We have three types of matchers:
+    def __init__(self) -> None:
+        """Initialize the matcher index."""
+        self.registered_devices_domains: set[str] = set()
+        self.oui: dict[str, list[_CompiledMatcher]] = {}
+        self.hostname: dict[str, list[_CompiledMatcher]] = {}
+        self.fallback: list[_CompiledMatcher] = []
 
-    1. Registered devices
-    2. Devices with no OUI - index by first char of lower() hostname
-    3. Devices with OUI - index by OUI
-    """
-    registered_devices_domains: set[str] = set()
-    no_oui_matchers: dict[str, list[DHCPMatcher]] = {}
-    oui_matchers: dict[str, list[DHCPMatcher]] = {}
-    for matcher in integration_matchers:
-        domain = matcher["domain"]
+    def add(self, matcher: DHCPMatcher) -> None:
+        """Add a matcher to the index."""
         if REGISTERED_DEVICES in matcher:
-            registered_devices_domains.add(domain)
-            continue
+            self.registered_devices_domains.add(matcher["domain"])
+            return
 
-        if mac_address := matcher.get(MAC_ADDRESS):
-            oui_matchers.setdefault(mac_address[:6], []).append(matcher)
-            continue
+        mac_address = matcher.get(MAC_ADDRESS)
+        hostname = matcher.get(HOSTNAME)
+        if mac_address is None and hostname is None:
+            return
+        compiled = _CompiledMatcher(matcher, mac_address, hostname)
+        if mac_address is not None:
+            if _literal_prefix_length(mac_address) >= OUI_LENGTH:
+                self.oui.setdefault(mac_address[:OUI_LENGTH], []).append(compiled)
+                return
+        elif hostname is not None and (
+            _literal_prefix_length(hostname) >= HOSTNAME_INDEX_LENGTH
+        ):
+            self.hostname.setdefault(hostname[:HOSTNAME_INDEX_LENGTH], []).append(
+                compiled
+            )
+            return
+        self.fallback.append(compiled)
+
+    def match(self, uppercase_mac: str, lowercase_hostname: str) -> list[DHCPMatcher]:
+        """Return the matchers that match a client."""
+        return [
+            compiled.matcher
+            for compiled in itertools.chain(
+                self.oui.get(uppercase_mac[:OUI_LENGTH], ()),
+                self.hostname.get(lowercase_hostname[:HOSTNAME_INDEX_LENGTH], ()),
+                self.fallback,
+            )
+            if compiled.matches(uppercase_mac, lowercase_hostname)
+        ]
 
-        if hostname := matcher.get(HOSTNAME):
-            first_char = hostname[0].lower()
-            no_oui_matchers.setdefault(first_char, []).append(matcher)
 
-    return DhcpMatchers(
-        registered_devices_domains=registered_devices_domains,
-        no_oui_matchers=no_oui_matchers,
-        oui_matchers=oui_matchers,
-    )
+class _CompiledMatcher:
+    """A dhcp matcher with compiled patterns."""
+
+    __slots__ = ("matcher", "match_mac", "match_hostname")
+
+    def __init__(
+        self, matcher: DHCPMatcher, mac_address: str | None, hostname: str | None
+    ) -> None:
+        """Compile the patterns of the matcher."""
+        self.matcher = matcher
+        # A pattern of only an OUI is fully checked by its bucket
+        self.match_mac: _PatternMatcher | None = (
+            None
+            if mac_address is None or _is_oui_pattern(mac_address)
+            else _compile_fnmatch(mac_address)
+        )
+        self.match_hostname: _PatternMatcher | None = (
+            None if hostname is None else _compile_fnmatch(hostname)
+        )
+
+    def matches(self, uppercase_mac: str, lowercase_hostname: str) -> bool:
+        """Return if a client matches."""
+        return (
+            self.match_mac is None or self.match_mac(uppercase_mac) is not None
+        ) and (
+            self.match_hostname is None
+            or self.match_hostname(lowercase_hostname) is not None
+        )
+
+
+def _literal_prefix_length(pattern: str) -> int:
+    """Return the length of a pattern before the first wildcard."""
+    if match := _WILDCARD.search(pattern):
+        return match.start()
+    return len(pattern)
+
+
+def _is_oui_pattern(pattern: str) -> bool:
+    """Return if a pattern matches all MAC addresses of an OUI."""
+    return _literal_prefix_length(pattern) == OUI_LENGTH and pattern[OUI_LENGTH:] == "*"
+
+
+def async_index_integration_matchers(
+    integration_matchers: list[DHCPMatcher],
+) -> DhcpMatchers:
+    """Index the integration matchers."""
+    index = DhcpMatchers()
+    for matcher in integration_matchers:
+        index.add(matcher)
+    return index
 
 
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
@@ -252,22 +331,8 @@ class WatcherBase:
                 ) and entry.domain in registered_devices_domains:
                     matched_domains.add(entry.domain)
 
-        oui = uppercase_mac[:6]
-        lowercase_hostname_first_char = (
-            lowercase_hostname[0] if len(lowercase_hostname) else ""
-        )
-        for matcher in itertools.chain(
-            matchers.no_oui_matchers.get(lowercase_hostname_first_char, ()),
-            matchers.oui_matchers.get(oui, ()),
-        ):
+        for matcher in matchers.match(uppercase_mac, lowercase_hostname):
             domain = matcher["domain"]
-            if (
-                matcher_hostname := matcher.get(HOSTNAME)
-            ) is not None and not _memorized_fnmatch(
-                lowercase_hostname, matcher_hostname
-            ):
-                continue
-
             _LOGGER.debug("Matched %s against %s", data, matcher)
             matched_domains.add(domain)
 
@@ -414,22 +479,6 @@ class DHCPWatcher(WatcherBase):
         self._unsub = await aiodhcpwatcher.async_start(self._async_process_dhcp_request)
 
 
-@lru_cache(maxsize=4096, typed=True)
-def _compile_fnmatch(pattern: str) -> re.Pattern:
+def _compile_fnmatch(pattern: str) -> _PatternMatcher:
     """Compile a fnmatch pattern."""
-    return re.compile(translate(pattern))
-
-
-@lru_cache(maxsize=1024, typed=True)
-def _memorized_fnmatch(name: str, pattern: str) -> bool:
-    """Memorized version of fnmatch that has a larger lru_cache.
-
-    The default version of fnmatch only has a lru_cache of 256 entries.
-    With many devices we quickly reach that limit and end up compiling
-    the same pattern over and over again.
-
-    DHCP has its own memorized fnmatch with its own lru_cache
-    since the data is going to be relatively the same
-    since the devices will not change frequently
-    """
-    return bool(_compile_fnmatch(pattern).match(name))
+    return re.compile(translate(pattern)).match
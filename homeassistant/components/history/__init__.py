@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from datetime import datetime as dt, timedelta
 from http import HTTPStatus
-from typing import cast
+from typing import Any
 
 from aiohttp import web
 import voluptuous as vol
@@ -14,9 +14,15 @@ from homeassistant.components.http import KEY_HASS, HomeAssistantView
 from homeassistant.components.recorder import get_instance, history
 from homeassistant.components.recorder.util import session_scope
 from homeassistant.const import CONF_EXCLUDE, CONF_INCLUDE
-from homeassistant.core import HomeAssistant, valid_entity_id
+from homeassistant.core import HomeAssistant, State, valid_entity_id
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entityfilter import INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA
+from homeassistant.helpers.http import (
+    STREAM_MIN_ITEMS,
+    JSONStreamResponse,
+    accepts_ndjson,
+)
+from homeassistant.helpers.json import json_bytes
 from homeassistant.helpers.typing import ConfigType
 import homeassistant.util.dt as dt_util
 
@@ -60,8 +66,12 @@ class HistoryPeriodView(HomeAssistantView):
 
     async def get(
         self, request: web.Request, datetime: str | None = None
-    ) -> web.Response:
-        """Return history over a period of time."""
+    ) -> web.StreamResponse:
+        """Return history over a period of time.
+
+        Large responses and clients accepting NDJSON are streamed with
+        one line or array item per entity.
+        """
         datetime_ = None
         query = request.query
 
@@ -116,20 +126,29 @@ class HistoryPeriodView(HomeAssistantView):
         ):
             return self.json([])
 
-        return cast(
-            web.Response,
-            await get_instance(hass).async_add_executor_job(
-                self._sorted_significant_states_json,
-                hass,
-                start_time,
-                end_time,
-                entity_ids,
-                include_start_time_state,
-                significant_changes_only,
-                minimal_response,
-                no_attributes,
-            ),
+        ndjson = accepts_ndjson(request)
+        result = await get_instance(hass).async_add_executor_job(
+            self._sorted_significant_states_json,
+            hass,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            ndjson,
         )
+        if isinstance(result, web.Response):
+            return result
+        response = JSONStreamResponse(ndjson)
+        await response.prepare(request)
+        for entity_states in result:
+            await response.write_items(
+                (await hass.async_add_executor_job(json_bytes, entity_states),)
+            )
+        await response.write_eof()
+        return response
 
     def _sorted_significant_states_json(
         self,
@@ -141,22 +160,28 @@ class HistoryPeriodView(HomeAssistantView):
         significant_changes_only: bool,
         minimal_response: bool,
         no_attributes: bool,
-    ) -> web.Response:
-        """Fetch significant stats from the database as json."""
+        stream: bool,
+    ) -> web.Response | list[list[State | dict[str, Any]]]:
+        """Fetch significant stats from the database as json.
+
+        The states are returned without serializing them if the response
+        should be streamed.
+        """
         with session_scope(hass=hass, read_only=True) as session:
-            return self.json(
-                list(
-                    history.get_significant_states_with_session(
-                        hass,
-                        session,
-                        start_time,
-                        end_time,
-                        entity_ids,
-                        None,
-                        include_start_time_state,
-                        significant_changes_only,
-                        minimal_response,
-                        no_attributes,
-                    ).values()
-                )
+            states = list(
+                history.get_significant_states_with_session(
+                    hass,
+                    session,
+                    start_time,
+                    end_time,
+                    entity_ids,
+                    None,
+                    include_start_time_state,
+                    significant_changes_only,
+                    minimal_response,
+                    no_attributes,
+                ).values()
             )
+        if stream or sum(map(len, states)) > STREAM_MIN_ITEMS:
+            return states
+        return self.json(states)
@@ -246,6 +246,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             # Initial setup
             websocket_api.async_register_command(hass, websocket_subscribe)
             websocket_api.async_register_command(hass, websocket_mqtt_info)
+            websocket_api.async_register_command(hass, websocket_mqtt_metrics)
             hass.data[DATA_MQTT] = mqtt_data = MqttData(config=mqtt_yaml, client=client)
         await client.async_start(mqtt_data)
 
@@ -470,6 +471,16 @@ def websocket_mqtt_info(
     connection.send_result(msg["id"], mqtt_info)
 
 
+@websocket_api.require_admin
+@websocket_api.websocket_command({vol.Required("type"): "mqtt/metrics"})
+@callback
+def websocket_mqtt_metrics(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Get metrics of the inbound MQTT messages."""
+    connection.send_result(msg["id"], debug_info.info_for_message_metrics(hass))
+
+
 @websocket_api.websocket_command(
     {
         vol.Required("type"): "mqtt/subscribe",
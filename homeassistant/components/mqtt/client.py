@@ -78,10 +78,12 @@ from .const import (
 from .models import (
     DATA_MQTT,
     MessageCallbackType,
+    MessageMetrics,
     MqttData,
     PublishMessage,
     PublishPayloadType,
     ReceiveMessage,
+    SubscriptionMetrics,
 )
 from .util import EnsureJobAfterCooldown, get_file_path, mqtt_config_entry_enabled
 
@@ -110,6 +112,8 @@ SUBSCRIBE_COOLDOWN = 0.1
 UNSUBSCRIBE_COOLDOWN = 0.1
 TIMEOUT_ACK = 10
 RECONNECT_INTERVAL_SECONDS = 10
+# Measure the latencies of one in METRICS_SAMPLE_INTERVAL messages
+METRICS_SAMPLE_INTERVAL = 16
 
 MAX_SUBSCRIBES_PER_CALL = 500
 MAX_UNSUBSCRIBES_PER_CALL = 500
@@ -266,12 +270,91 @@ class Subscription:
 
     topic: str
     is_simple_match: bool
-    complex_matcher: Callable[[str], bool] | None
     job: HassJob[[ReceiveMessage], Coroutine[Any, Any, None] | None]
     qos: int = 0
     encoding: str | None = "utf-8"
 
 
+class _TopicNode:
+    """A level of the topic filters in the SubscriptionTrie."""
+
+    __slots__ = ("children", "subscriptions")
+
+    def __init__(self) -> None:
+        """Initialize the node."""
+        self.children: dict[str, _TopicNode] = {}
+        # The subscriptions with a topic filter ending at this level
+        self.subscriptions: set[Subscription] = set()
+
+
+class SubscriptionTrie:
+    """Match topics against the topic filters of wildcard subscriptions.
+
+    The topic filters are split in levels, the `+` and `#` wildcards
+    are children of a level like any other level. Matching a topic
+    only visits the levels of the topic, the `+` and the `#` branches.
+    """
+
+    __slots__ = ("_root",)
+
+    def __init__(self) -> None:
+        """Initialize the trie."""
+        self._root = _TopicNode()
+
+    def add(self, subscription: Subscription) -> None:
+        """Add a subscription."""
+        node = self._root
+        for level in subscription.topic.split("/"):
+            if (child := node.children.get(level)) is None:
+                child = node.children[level] = _TopicNode()
+            node = child
+        node.subscriptions.add(subscription)
+
+    def remove(self, subscription: Subscription) -> None:
+        """Remove a subscription and the levels that are no longer used.
+
+        Raises KeyError if the subscription was not added.
+        """
+        path: list[tuple[_TopicNode, str]] = []
+        node = self._root
+        for level in subscription.topic.split("/"):
+            path.append((node, level))
+            node = node.children[level]
+        node.subscriptions.remove(subscription)
+        for parent, level in reversed(path):
+            if node.subscriptions or node.children:
+                break
+            del parent.children[level]
+            node = parent
+
+    def match(self, topic: str) -> list[Subscription]:
+        """Return the subscriptions with a topic filter matching the topic.
+
+        Wildcards at the first level do not match topics starting with `$`.
+        """
+        levels = topic.split("/")
+        last = len(levels)
+        is_system_topic = topic[:1] == "$"
+        matches: list[Subscription] = []
+        # Nodes to visit with the index of the next level of the topic
+        stack: list[tuple[_TopicNode, int]] = [(self._root, 0)]
+        while stack:
+            node, index = stack.pop()
+            children = node.children
+            wildcards = index or not is_system_topic
+            # `#` also matches the parent level
+            if wildcards and (multi_level := children.get("#")) is not None:
+                matches.extend(multi_level.subscriptions)
+            if index == last:
+                matches.extend(node.subscriptions)
+                continue
+            if (child := children.get(levels[index])) is not None:
+                stack.append((child, index + 1))
+            if wildcards and (single_level := children.get("+")) is not None:
+                stack.append((single_level, index + 1))
+        return matches
+
+
 class MqttClientSetup:
     """Helper class to setup the paho mqtt client from config."""
 
@@ -376,11 +459,13 @@ class MQTT:
             set
         )
         self._wildcard_subscriptions: set[Subscription] = set()
+        self._wildcard_trie = SubscriptionTrie()
         # _retained_topics prevents a Subscription from receiving a
         # retained message more than once per topic. This prevents flooding
         # already active subscribers when new subscribers subscribe to a topic
         # which has subscribed messages.
         self._retained_topics: defaultdict[Subscription, set[str]] = defaultdict(set)
+        self.metrics = MessageMetrics()
         self.connected = False
         self._ha_started = asyncio.Event()
         self._cleanup_on_unload: list[Callable[[], None]] = []
@@ -754,6 +839,7 @@ class MQTT:
             self._simple_subscriptions[subscription.topic].add(subscription)
         else:
             self._wildcard_subscriptions.add(subscription)
+            self._wildcard_trie.add(subscription)
 
     @callback
     def _async_untrack_subscription(self, subscription: Subscription) -> None:
@@ -772,6 +858,7 @@ class MQTT:
                     del simple_subscriptions[topic]
             else:
                 self._wildcard_subscriptions.remove(subscription)
+                self._wildcard_trie.remove(subscription)
         except (KeyError, ValueError) as exc:
             raise HomeAssistantError("Can't remove subscription twice") from exc
 
@@ -834,9 +921,8 @@ class MQTT:
 
         job = HassJob(msg_callback, job_type=job_type)
         is_simple_match = not ("+" in topic or "#" in topic)
-        matcher = None if is_simple_match else _matcher_for_topic(topic)
 
-        subscription = Subscription(topic, is_simple_match, matcher, job, qos, encoding)
+        subscription = Subscription(topic, is_simple_match, job, qos, encoding)
         self._async_track_subscription(subscription)
         self._matching_subscriptions.cache_clear()
 
@@ -869,6 +955,7 @@ class MQTT:
             return
         if topic in self._max_qos:
             del self._max_qos[topic]
+        self.metrics.subscriptions.pop(topic, None)
         if topic in self._pending_subscriptions:
             # Avoid any pending subscription to be executed
             del self._pending_subscriptions[topic]
@@ -1035,13 +1122,7 @@ class MQTT:
         subscriptions: list[Subscription] = []
         if topic in self._simple_subscriptions:
             subscriptions.extend(self._simple_subscriptions[topic])
-        subscriptions.extend(
-            subscription
-            for subscription in self._wildcard_subscriptions
-            # mypy doesn't know that complex_matcher is always set when
-            # is_simple_match is False
-            if subscription.complex_matcher(topic)  # type: ignore[misc]
-        )
+        subscriptions.extend(self._wildcard_trie.match(topic))
         return subscriptions
 
     @callback
@@ -1072,6 +1153,11 @@ class MQTT:
         )
         subscriptions = self._matching_subscriptions(topic)
         msg_cache_by_subscription_topic: dict[str, ReceiveMessage] = {}
+        metrics = self.metrics
+        if not metrics.messages % METRICS_SAMPLE_INTERVAL:
+            metrics.dispatch_lag.record(time.monotonic() - msg.timestamp)
+        metrics.messages += 1
+        metrics_by_topic = metrics.subscriptions
 
         for subscription in subscriptions:
             if msg.retain:
@@ -1082,11 +1168,22 @@ class MQTT:
                 # Remember the subscription had an initial retained message
                 self._retained_topics[subscription].add(topic)
 
+            subscription_topic = subscription.topic
+            if (topic_metrics := metrics_by_topic.get(subscription_topic)) is None:
+                topic_metrics = metrics_by_topic[subscription_topic] = (
+                    SubscriptionMetrics()
+                )
+            # The first message and every METRICS_SAMPLE_INTERVAL messages
+            # of a topic are sampled
+            sampled = not topic_metrics.messages % METRICS_SAMPLE_INTERVAL
+            topic_metrics.messages += 1
+
             payload: SubscribePayloadType = msg.payload
             if subscription.encoding is not None:
                 try:
                     payload = msg.payload.decode(subscription.encoding)
                 except (AttributeError, UnicodeDecodeError):
+                    topic_metrics.decode_failures += 1
                     _LOGGER.warning(
                         "Can't decode payload %s on %s with encoding %s (for %s)",
                         msg.payload[0:8192],
@@ -1095,7 +1192,6 @@ class MQTT:
                         subscription.job,
                     )
                     continue
-            subscription_topic = subscription.topic
             if subscription_topic not in msg_cache_by_subscription_topic:
                 # Only make one copy of the message
                 # per topic so we avoid storing a separate
@@ -1117,7 +1213,12 @@ class MQTT:
                 # We do not wrap Callback jobs in catch_log_exception since
                 # its expensive and we have to do it 2x for every entity
                 try:
-                    job.target(receive_msg)
+                    if sampled:
+                        start = time.perf_counter()
+                        job.target(receive_msg)
+                        topic_metrics.callback_time.record(time.perf_counter() - start)
+                    else:
+                        job.target(receive_msg)
                 except Exception:  # noqa: BLE001
                     log_exception(
                         partial(self._exception_message, job.target, receive_msg)
@@ -1233,13 +1334,3 @@ class MQTT:
                 now if self._pending_subscriptions else self._last_subscribe
             )
             wait_until = max(last_discovery, last_subscribe) + DISCOVERY_COOLDOWN
-
-
-def _matcher_for_topic(subscription: str) -> Callable[[str], bool]:
-    # pylint: disable-next=import-outside-toplevel
-    from paho.mqtt.matcher import MQTTMatcher
-
-    matcher = MQTTMatcher()
-    matcher[subscription] = True
-
-    return lambda topic: next(matcher.iter_match(topic), False)
@@ -250,3 +250,9 @@ def info_for_device(hass: HomeAssistant, device_id: str) -> dict[str, list[Any]]
     )
 
     return mqtt_info
+
+
+def info_for_message_metrics(hass: HomeAssistant) -> dict[str, Any]:
+    """Get metrics of the inbound messages by subscribed topic."""
+
+    return hass.data[DATA_MQTT].client.metrics.as_dict()
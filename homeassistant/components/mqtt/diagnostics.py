@@ -69,6 +69,7 @@ def _async_get_diagnostics(
                 )
             ],
             mqtt_debug_info=debug_info.info_for_config_entry(hass),
+            mqtt_message_metrics=debug_info.info_for_message_metrics(hass),
         )
 
     return data
@@ -19,7 +19,7 @@ from homeassistant.helpers.dispatcher import (
     async_dispatcher_connect,
     async_dispatcher_send,
 )
-from homeassistant.helpers.service_info.mqtt import MqttServiceInfo
+from homeassistant.helpers.service_info.mqtt import MqttServiceInfo, ReceivePayloadType
 from homeassistant.helpers.typing import DiscoveryInfoType
 from homeassistant.loader import async_get_mqtt
 from homeassistant.util.json import json_loads_object
@@ -55,7 +55,7 @@ TOPIC_MATCHER = re.compile(
 MQTT_DISCOVERY_UPDATED: SignalTypeFormat[MQTTDiscoveryPayload] = SignalTypeFormat(
     "mqtt_discovery_updated_{}_{}"
 )
-MQTT_DISCOVERY_NEW: SignalTypeFormat[MQTTDiscoveryPayload] = SignalTypeFormat(
+MQTT_DISCOVERY_NEW: SignalTypeFormat[list[MQTTDiscoveryPayload]] = SignalTypeFormat(
     "mqtt_discovery_new_{}_{}"
 )
 MQTT_DISCOVERY_DONE: SignalTypeFormat[Any] = SignalTypeFormat(
@@ -191,21 +191,29 @@ async def async_start(  # noqa: C901
     """Start MQTT Discovery."""
     mqtt_data = hass.data[DATA_MQTT]
     platform_setup_lock: dict[str, asyncio.Lock] = {}
+    # Messages received in the current iteration of the event loop
+    discovery_batch: list[ReceiveMessage] = []
+    # New components by platform which are added together
+    new_components: dict[str, list[MQTTDiscoveryPayload]] = {}
+    # The last processed payload by discovery topic
+    discovery_payloads: dict[str, ReceivePayloadType] = {}
 
     @callback
-    def _async_add_component(discovery_payload: MQTTDiscoveryPayload) -> None:
-        """Add a component from a discovery message."""
-        discovery_hash = discovery_payload.discovery_data[ATTR_DISCOVERY_HASH]
-        component, discovery_id = discovery_hash
-        message = f"Found new component: {component} {discovery_id}"
-        async_log_discovery_origin_info(message, discovery_payload)
-        mqtt_data.discovery_already_discovered.add(discovery_hash)
+    def _async_add_components(
+        component: str, discovery_payloads: list[MQTTDiscoveryPayload]
+    ) -> None:
+        """Add the components from discovery messages."""
+        for discovery_payload in discovery_payloads:
+            discovery_hash = discovery_payload.discovery_data[ATTR_DISCOVERY_HASH]
+            message = f"Found new component: {component} {discovery_hash[1]}"
+            async_log_discovery_origin_info(message, discovery_payload)
+            mqtt_data.discovery_already_discovered.add(discovery_hash)
         async_dispatcher_send(
-            hass, MQTT_DISCOVERY_NEW.format(component, "mqtt"), discovery_payload
+            hass, MQTT_DISCOVERY_NEW.format(component, "mqtt"), discovery_payloads
         )
 
     async def _async_component_setup(
-        component: str, discovery_payload: MQTTDiscoveryPayload
+        component: str, discovery_payloads: list[MQTTDiscoveryPayload]
     ) -> None:
         """Perform component set up."""
         async with platform_setup_lock.setdefault(component, asyncio.Lock()):
@@ -213,12 +221,50 @@ async def async_start(  # noqa: C901
                 await async_forward_entry_setup_and_setup_discovery(
                     hass, config_entry, {component}
                 )
-        _async_add_component(discovery_payload)
+        _async_add_components(component, discovery_payloads)
 
     @callback
-    def async_discovery_message_received(msg: ReceiveMessage) -> None:  # noqa: C901
-        """Process the received message."""
+    def _async_send_new_components() -> None:
+        """Set up the new components per platform."""
+        components = new_components.copy()
+        new_components.clear()
+        for component, discovery_payloads in components.items():
+            if component not in mqtt_data.platforms_loaded:
+                # Load component first
+                config_entry.async_create_task(
+                    hass, _async_component_setup(component, discovery_payloads)
+                )
+            else:
+                _async_add_components(component, discovery_payloads)
+
+    @callback
+    def async_discovery_message_received(msg: ReceiveMessage) -> None:
+        """Queue the received message.
+
+        The retained discovery messages are delivered in bursts when
+        (re)connecting to the broker, the messages received in the same
+        iteration of the event loop are processed together.
+        """
         mqtt_data.last_discovery = msg.timestamp
+        if not discovery_batch:
+            hass.loop.call_soon(_async_process_discovery_batch)
+        discovery_batch.append(msg)
+
+    @callback
+    def _async_process_discovery_batch() -> None:
+        """Process the queued messages."""
+        messages = discovery_batch.copy()
+        discovery_batch.clear()
+        if not mqtt_data.discovery_unsubscribe:
+            # Discovery was stopped
+            return
+        for msg in messages:
+            _async_process_discovery_message(msg)
+        _async_send_new_components()
+
+    @callback
+    def _async_process_discovery_message(msg: ReceiveMessage) -> None:  # noqa: C901
+        """Process a received message."""
         payload = msg.payload
         topic = msg.topic
         topic_trimmed = topic.replace(f"{discovery_topic}/", "", 1)
@@ -242,6 +288,28 @@ async def async_start(  # noqa: C901
             _LOGGER.warning("Integration %s is not supported", component)
             return
 
+        # If present, the node_id will be included in the discovered object id
+        discovery_id = f"{node_id} {object_id}" if node_id else object_id
+        discovery_hash = (component, discovery_id)
+
+        # The retained messages are sent again on reconnect, unchanged payloads
+        # of discovered components are dropped before parsing them
+        if (
+            discovery_payloads.get(topic) == payload
+            and discovery_hash in mqtt_data.discovery_already_discovered
+            and discovery_hash not in mqtt_data.discovery_pending_discovered
+        ):
+            _LOGGER.debug(
+                "Ignoring unchanged discovery payload for %s %s",
+                component,
+                discovery_id,
+            )
+            return
+        if payload:
+            discovery_payloads[topic] = payload
+        else:
+            discovery_payloads.pop(topic, None)
+
         if payload:
             try:
                 discovery_payload = MQTTDiscoveryPayload(json_loads_object(payload))
@@ -256,10 +324,6 @@ async def async_start(  # noqa: C901
         else:
             discovery_payload = MQTTDiscoveryPayload({})
 
-        # If present, the node_id will be included in the discovered object id
-        discovery_id = f"{node_id} {object_id}" if node_id else object_id
-        discovery_hash = (component, discovery_id)
-
         if discovery_payload:
             # Attach MQTT topic to the payload, used for debug prints
             setattr(
@@ -313,6 +377,7 @@ async def async_start(  # noqa: C901
                 else:
                     payload = pending.pop()
                     async_process_discovery_payload(component, discovery_id, payload)
+                    _async_send_new_components()
 
             discovery_pending_discovered[discovery_hash] = {
                 "unsub": async_dispatcher_connect(
@@ -323,11 +388,11 @@ async def async_start(  # noqa: C901
                 "pending": deque([]),
             }
 
-        if component not in mqtt_data.platforms_loaded and payload:
-            # Load component first
-            config_entry.async_create_task(
-                hass, _async_component_setup(component, payload)
-            )
+        if payload and (
+            component not in mqtt_data.platforms_loaded or not already_discovered
+        ):
+            # The platform is loaded first if needed
+            new_components.setdefault(component, []).append(payload)
         elif already_discovered:
             # Dispatch update
             message = f"Component has already been discovered: {component} {discovery_id}, sending update"
@@ -335,8 +400,6 @@ async def async_start(  # noqa: C901
             async_dispatcher_send(
                 hass, MQTT_DISCOVERY_UPDATED.format(*discovery_hash), payload
             )
-        elif payload:
-            _async_add_component(payload)
         else:
             # Unhandled discovery message
             async_dispatcher_send(
@@ -215,22 +215,25 @@ def async_setup_non_entity_entry_helper(
     mqtt_data = hass.data[DATA_MQTT]
 
     async def _async_setup_non_entity_entry_from_discovery(
-        discovery_payload: MQTTDiscoveryPayload,
+        discovery_payloads: list[MQTTDiscoveryPayload],
     ) -> None:
-        """Set up an MQTT entity, automation or tag from discovery."""
-        if not _verify_mqtt_config_entry_enabled_for_discovery(
-            hass, domain, discovery_payload
-        ):
-            return
-        try:
-            config: ConfigType = discovery_schema(discovery_payload)
-            await async_setup(config, discovery_data=discovery_payload.discovery_data)
-        except vol.Invalid as err:
-            _handle_discovery_failure(hass, discovery_payload)
-            async_handle_schema_error(discovery_payload, err)
-        except Exception:
-            _handle_discovery_failure(hass, discovery_payload)
-            raise
+        """Set up MQTT automations or tags from discovery."""
+        for discovery_payload in discovery_payloads:
+            if not _verify_mqtt_config_entry_enabled_for_discovery(
+                hass, domain, discovery_payload
+            ):
+                continue
+            try:
+                config: ConfigType = discovery_schema(discovery_payload)
+                await async_setup(
+                    config, discovery_data=discovery_payload.discovery_data
+                )
+            except vol.Invalid as err:
+                _handle_discovery_failure(hass, discovery_payload)
+                async_handle_schema_error(discovery_payload, err)
+            except Exception:
+                _handle_discovery_failure(hass, discovery_payload)
+                _LOGGER.exception("Error setting up MQTT %s from discovery", domain)
 
     mqtt_data.reload_dispatchers.append(
         async_dispatcher_connect(
@@ -257,29 +260,36 @@ def async_setup_entity_entry_helper(
 
     @callback
     def _async_setup_entity_entry_from_discovery(
-        discovery_payload: MQTTDiscoveryPayload,
+        discovery_payloads: list[MQTTDiscoveryPayload],
     ) -> None:
-        """Set up an MQTT entity from discovery."""
+        """Set up MQTT entities from discovery.
+
+        The payloads are validated together and the entities are added
+        to the platform with a single call.
+        """
         nonlocal entity_class
-        if not _verify_mqtt_config_entry_enabled_for_discovery(
-            hass, domain, discovery_payload
-        ):
-            return
-        try:
-            config: DiscoveryInfoType = discovery_schema(discovery_payload)
-            if schema_class_mapping is not None:
-                entity_class = schema_class_mapping[config[CONF_SCHEMA]]
-            if TYPE_CHECKING:
-                assert entity_class is not None
-            async_add_entities(
-                [entity_class(hass, config, entry, discovery_payload.discovery_data)]
-            )
-        except vol.Invalid as err:
-            _handle_discovery_failure(hass, discovery_payload)
-            async_handle_schema_error(discovery_payload, err)
-        except Exception:
-            _handle_discovery_failure(hass, discovery_payload)
-            raise
+        entities: list[Entity] = []
+        for discovery_payload in discovery_payloads:
+            if not _verify_mqtt_config_entry_enabled_for_discovery(
+                hass, domain, discovery_payload
+            ):
+                continue
+            try:
+                config: DiscoveryInfoType = discovery_schema(discovery_payload)
+                if schema_class_mapping is not None:
+                    entity_class = schema_class_mapping[config[CONF_SCHEMA]]
+                if TYPE_CHECKING:
+                    assert entity_class is not None
+                entities.append(
+                    entity_class(hass, config, entry, discovery_payload.discovery_data)
+                )
+            except vol.Invalid as err:
+                _handle_discovery_failure(hass, discovery_payload)
+                async_handle_schema_error(discovery_payload, err)
+            except Exception:
+                _handle_discovery_failure(hass, discovery_payload)
+                _LOGGER.exception("Error setting up MQTT %s from discovery", domain)
+        async_add_entities(entities)
 
     mqtt_data.reload_dispatchers.append(
         async_dispatcher_connect(
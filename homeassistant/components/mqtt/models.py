@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from ast import literal_eval
 import asyncio
+from bisect import bisect_left
 from collections import deque
 from collections.abc import Callable
 from dataclasses import dataclass, field
@@ -79,6 +80,92 @@ class ReceiveMessage:
 type MessageCallbackType = Callable[[ReceiveMessage], None]
 
 
+# Upper bounds in seconds of the buckets of the latency histograms
+LATENCY_BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0)
+
+
+class LatencyHistogram:
+    """Histogram of latencies in seconds."""
+
+    __slots__ = ("counts", "total", "max")
+
+    def __init__(self) -> None:
+        """Initialize the histogram."""
+        # The last bucket counts the latencies above the largest bound
+        self.counts = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, latency: float) -> None:
+        """Record a latency."""
+        self.counts[bisect_left(LATENCY_BUCKETS, latency)] += 1
+        self.total += latency
+        if latency > self.max:
+            self.max = latency
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the histogram as a dictionary."""
+        count = sum(self.counts)
+        return {
+            "count": count,
+            "mean": self.total / count if count else None,
+            "max": self.max,
+            "buckets": {
+                **dict(zip(map(str, LATENCY_BUCKETS), self.counts, strict=False)),
+                "inf": self.counts[-1],
+            },
+        }
+
+
+class SubscriptionMetrics:
+    """Metrics of the messages received by the subscriptions of a topic."""
+
+    __slots__ = ("messages", "decode_failures", "callback_time")
+
+    def __init__(self) -> None:
+        """Initialize the metrics."""
+        self.messages = 0
+        self.decode_failures = 0
+        self.callback_time = LatencyHistogram()
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the metrics as a dictionary."""
+        return {
+            "messages": self.messages,
+            "decode_failures": self.decode_failures,
+            "callback_time": self.callback_time.as_dict(),
+        }
+
+
+class MessageMetrics:
+    """Metrics of the inbound message pipeline.
+
+    Messages and decode failures are always counted. The lag between
+    receiving and dispatching a message and the execution time of the
+    callbacks are only measured for a sample of the messages. Coroutine
+    subscribers run in tasks and are not timed.
+    """
+
+    __slots__ = ("messages", "dispatch_lag", "subscriptions")
+
+    def __init__(self) -> None:
+        """Initialize the metrics."""
+        self.messages = 0
+        self.dispatch_lag = LatencyHistogram()
+        self.subscriptions: dict[str, SubscriptionMetrics] = {}
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the metrics as a dictionary."""
+        return {
+            "messages": self.messages,
+            "dispatch_lag": self.dispatch_lag.as_dict(),
+            "subscriptions": {
+                topic: metrics.as_dict()
+                for topic, metrics in self.subscriptions.items()
+            },
+        }
+
+
 class SubscriptionDebugInfo(TypedDict):
     """Class for holding subscription debug info."""
 
@@ -45,6 +45,7 @@ _LRU_CACHE_WRAPPER_OBJECT = _lru_cache_wrapper.__name__
 _SQLALCHEMY_LRU_OBJECT = "LRUCache"
 
 _KNOWN_LRU_CLASSES = (
+    "CompiledTemplateCache",
     "EventDataManager",
     "EventTypeManager",
     "StatesMetaManager",
@@ -31,6 +31,9 @@ from homeassistant.util.event_type import EventType
 from . import entity_registry, websocket_api
 from .const import (  # noqa: F401
     CONF_DB_INTEGRITY_CHECK,
+    CONF_HOT_TIER_MAX_AGE,
+    CONF_HOT_TIER_MEMORY_LIMIT,
+    DEFAULT_HOT_TIER_MEMORY_LIMIT_MIB,
     DOMAIN,
     INTEGRATION_PLATFORM_COMPILE_STATISTICS,
     INTEGRATION_PLATFORM_METHODS,
@@ -113,6 +116,11 @@ CONFIG_SCHEMA = vol.Schema(
                     vol.Optional(
                         CONF_DB_INTEGRITY_CHECK, default=DEFAULT_DB_INTEGRITY_CHECK
                     ): cv.boolean,
+                    vol.Optional(CONF_HOT_TIER_MAX_AGE): cv.positive_time_period,
+                    vol.Optional(
+                        CONF_HOT_TIER_MEMORY_LIMIT,
+                        default=DEFAULT_HOT_TIER_MEMORY_LIMIT_MIB,
+                    ): cv.positive_int,
                 }
             ),
         )
@@ -142,6 +150,8 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     commit_interval = conf[CONF_COMMIT_INTERVAL]
     db_max_retries = conf[CONF_DB_MAX_RETRIES]
     db_retry_wait = conf[CONF_DB_RETRY_WAIT]
+    hot_tier_max_age = conf.get(CONF_HOT_TIER_MAX_AGE)
+    hot_tier_memory_limit = conf[CONF_HOT_TIER_MEMORY_LIMIT] * 1024**2
     db_url = conf.get(CONF_DB_URL) or DEFAULT_URL.format(
         hass_config_path=hass.config.path(DEFAULT_DB_FILE)
     )
@@ -163,6 +173,8 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         db_retry_wait=db_retry_wait,
         entity_filter=entity_filter,
         exclude_event_types=exclude_event_types,
+        hot_tier_max_age=hot_tier_max_age,
+        hot_tier_memory_limit=hot_tier_memory_limit,
     )
     get_instance.cache_clear()
     instance.async_initialize()
@@ -53,4 +53,6 @@ def ws_info(
         "recording": recording,
         "thread_running": is_running,
     }
+    if instance and (hot_tier := instance.states_hot_tier):
+        recorder_info["hot_tier"] = hot_tier.get_stats()
     connection.send_result(msg["id"], recorder_info)
@@ -27,6 +27,13 @@ DOMAIN = "recorder"
 
 CONF_DB_INTEGRITY_CHECK = "db_integrity_check"
 
+CONF_HOT_TIER_MAX_AGE = "hot_tier_max_age"
+CONF_HOT_TIER_MEMORY_LIMIT = "hot_tier_memory_limit"
+
+# The default memory limit of the states hot tier in MiB
+DEFAULT_HOT_TIER_MEMORY_LIMIT_MIB = 64
+DEFAULT_HOT_TIER_MEMORY_LIMIT = DEFAULT_HOT_TIER_MEMORY_LIMIT_MIB * 1024**2
+
 MAX_QUEUE_BACKLOG_MIN_VALUE = 65000
 MIN_AVAILABLE_MEMORY_FOR_QUEUE_BACKLOG = 256 * 1024**2
 
@@ -54,6 +61,11 @@ ATTR_APPLY_FILTER = "apply_filter"
 
 KEEPALIVE_TIME = 30
 
+# The resume cursor of an unfinished purge
+PURGE_STORAGE_KEY = f"{DOMAIN}.purge"
+PURGE_STORAGE_VERSION = 1
+PURGE_STORAGE_SAVE_DELAY = 10
+
 STATISTICS_ROWS_SCHEMA_VERSION = 23
 CONTEXT_ID_AS_BINARY_SCHEMA_VERSION = 36
 EVENT_TYPE_IDS_SCHEMA_VERSION = 37
@@ -65,11 +77,13 @@ LEGACY_STATES_EVENT_ID_INDEX_SCHEMA_VERSION = 28
 INTEGRATION_PLATFORM_COMPILE_STATISTICS = "compile_statistics"
 INTEGRATION_PLATFORM_VALIDATE_STATISTICS = "validate_statistics"
 INTEGRATION_PLATFORM_LIST_STATISTIC_IDS = "list_statistic_ids"
+INTEGRATION_PLATFORM_RECORD_STATE_CHANGED = "record_state_changed"
 
 INTEGRATION_PLATFORM_METHODS = {
     INTEGRATION_PLATFORM_COMPILE_STATISTICS,
     INTEGRATION_PLATFORM_VALIDATE_STATISTICS,
     INTEGRATION_PLATFORM_LIST_STATISTIC_IDS,
+    INTEGRATION_PLATFORM_RECORD_STATE_CHANGED,
 }
 
 
@@ -44,6 +44,7 @@ from homeassistant.helpers.event import (
     async_track_utc_time_change,
 )
 from homeassistant.helpers.start import async_at_started
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.typing import UNDEFINED, UndefinedType
 import homeassistant.util.dt as dt_util
 from homeassistant.util.enum import try_parse_enum
@@ -52,6 +53,7 @@ from homeassistant.util.event_type import EventType
 from . import migration, statistics
 from .const import (
     DB_WORKER_PREFIX,
+    DEFAULT_HOT_TIER_MEMORY_LIMIT,
     DOMAIN,
     KEEPALIVE_TIME,
     LAST_REPORTED_SCHEMA_VERSION,
@@ -61,6 +63,9 @@ from .const import (
     MIN_AVAILABLE_MEMORY_FOR_QUEUE_BACKLOG,
     MYSQLDB_PYMYSQL_URL_PREFIX,
     MYSQLDB_URL_PREFIX,
+    PURGE_STORAGE_KEY,
+    PURGE_STORAGE_SAVE_DELAY,
+    PURGE_STORAGE_VERSION,
     SQLITE_MAX_BIND_VARS,
     SQLITE_URL_PREFIX,
     STATISTICS_ROWS_SCHEMA_VERSION,
@@ -88,12 +93,19 @@ from .migration import (
 )
 from .models import DatabaseEngine, StatisticData, StatisticMetaData, UnsupportedDialect
 from .pool import POOL_SIZE, MutexPool, RecorderPool
+from .purge import DEFAULT_EVENTS_BATCHES_PER_PURGE, DEFAULT_STATES_BATCHES_PER_PURGE
+from .purge_planner import PurgePlanner, PurgeProgress
 from .queries import get_migration_changes
 from .table_managers.event_data import EventDataManager
 from .table_managers.event_types import EventTypeManager
 from .table_managers.recorder_runs import RecorderRunsManager
 from .table_managers.state_attributes import StateAttributesManager
 from .table_managers.states import StatesManager
+from .table_managers.states_bulk_insert import (
+    StatesBulkInsertManager,
+    dialect_supports_bulk_insert,
+)
+from .table_managers.states_hot_tier import StatesHotTier
 from .table_managers.states_meta import StatesMetaManager
 from .table_managers.statistics_meta import StatisticsMetaManager
 from .tasks import (
@@ -104,6 +116,7 @@ from .tasks import (
     CommitTask,
     CompileMissingStatisticsTask,
     DatabaseLockTask,
+    EventListenerStartedTask,
     ImportStatisticsTask,
     KeepAliveTask,
     PerodicCleanupTask,
@@ -141,6 +154,7 @@ EXPIRE_AFTER_COMMITS = 120
 SHUTDOWN_TASK = object()
 
 COMMIT_TASK = CommitTask()
+EVENT_LISTENER_STARTED_TASK = EventListenerStartedTask()
 KEEP_ALIVE_TASK = KeepAliveTask()
 WAIT_TASK = WaitTask()
 ADJUST_LRU_SIZE_TASK = AdjustLRUSizeTask()
@@ -174,6 +188,8 @@ class Recorder(threading.Thread):
         db_retry_wait: int,
         entity_filter: Callable[[str], bool] | None,
         exclude_event_types: set[EventType[Any] | str],
+        hot_tier_max_age: timedelta | None = None,
+        hot_tier_memory_limit: int = DEFAULT_HOT_TIER_MEMORY_LIMIT,
     ) -> None:
         """Initialize the recorder."""
         threading.Thread.__init__(self, name="Recorder")
@@ -221,6 +237,18 @@ class Recorder(threading.Thread):
         self.states_meta_manager = StatesMetaManager(self)
         self.state_attributes_manager = StateAttributesManager(self)
         self.statistics_meta_manager = StatisticsMetaManager(self)
+        self.states_bulk_insert_manager: StatesBulkInsertManager | None = None
+        self.states_hot_tier: StatesHotTier | None = None
+        if hot_tier_max_age:
+            self.states_hot_tier = StatesHotTier(
+                hot_tier_max_age.total_seconds(), hot_tier_memory_limit
+            )
+        self.purge_planner = PurgePlanner(
+            DEFAULT_STATES_BATCHES_PER_PURGE, DEFAULT_EVENTS_BATCHES_PER_PURGE
+        )
+        self._purge_store: Store[dict[str, Any]] = Store(
+            hass, PURGE_STORAGE_VERSION, PURGE_STORAGE_KEY
+        )
 
         self.event_session: Session | None = None
         self._get_session: Callable[[], Session] | None = None
@@ -240,6 +268,12 @@ class Recorder(threading.Thread):
         self._nightly_listener: CALLBACK_TYPE | None = None
         self._dialect_name: SupportedDialect | None = None
         self.enabled = True
+        # The timestamp since when every event that passed the filters
+        # has been processed or None if events may have been missed
+        self.events_complete_since: float | None = None
+        self.record_state_changed_platforms: dict[
+            str, Callable[[HomeAssistant, Event[EventStateChangedData]], None]
+        ] = {}
 
         # For safety we default to the lowest value for max_bind_vars
         # of all the DB types (SQLITE_MAX_BIND_VARS).
@@ -333,6 +367,7 @@ class Recorder(threading.Thread):
             # Unknown what it is.
             queue_put(event)
 
+        queue_put(EVENT_LISTENER_STARTED_TASK)
         self._event_listener = self.hass.bus.async_listen(
             MATCH_ALL,
             _event_listener,
@@ -523,6 +558,43 @@ class Recorder(threading.Thread):
         """
         self._async_setup_periodic_tasks()
         self.async_recorder_ready.set()
+        self.hass.async_create_background_task(
+            self._async_resume_purge(), "recorder resume purge"
+        )
+
+    async def _async_resume_purge(self) -> None:
+        """Resume a purge which did not finish before the last shutdown."""
+        if not (data := await self._purge_store.async_load()):
+            return
+        if (progress := PurgeProgress.from_dict(data)) is None:
+            await self._purge_store.async_remove()
+            return
+        _LOGGER.info("Resuming purge of data before %s", progress.purge_before)
+        self.queue_task(
+            PurgeTask(
+                progress.purge_before,
+                progress.repack,
+                progress.apply_filter,
+                resume=progress,
+            )
+        )
+
+    def save_purge_progress(self, progress: PurgeProgress) -> None:
+        """Store the resume cursor of a purge or remove it when it finished.
+
+        The cursor is written from the event loop, so a purge
+        is resumed from its last stored chunk after a restart.
+        """
+        data = None if progress.finished else progress.as_dict()
+        self.hass.add_job(self._async_save_purge_progress, data)
+
+    @callback
+    def _async_save_purge_progress(self, data: dict[str, Any] | None) -> None:
+        """Store or remove the resume cursor of a purge."""
+        if data is None:
+            self.hass.async_create_task(self._purge_store.async_remove())
+            return
+        self._purge_store.async_delay_save(lambda: data, PURGE_STORAGE_SAVE_DELAY)
 
     @callback
     def async_nightly_tasks(self, now: datetime) -> None:
@@ -705,6 +777,16 @@ class Recorder(threading.Thread):
         self._event_session_has_pending_writes = True
         session.add(obj)
 
+    def _add_states_row_to_session(
+        self, session: Session, obj: States | StateAttributes | StatesMeta
+    ) -> None:
+        """Add a row for the states tables to the session or the bulk insert."""
+        if (bulk_insert_manager := self.states_bulk_insert_manager) is None:
+            self._add_to_session(session, obj)
+            return
+        self._event_session_has_pending_writes = True
+        bulk_insert_manager.add(obj)
+
     def _notify_migration_failed(self) -> None:
         """Notify the user schema migration failed."""
         persistent_notification.create(
@@ -789,6 +871,10 @@ class Recorder(threading.Thread):
             self._dismiss_migration_in_progress()
             self._setup_run()
 
+        # Once all migrations are done, the states tables can be
+        # written with multi-row inserts if the database supports it
+        self._setup_states_bulk_insert()
+
         # Catch up with missed statistics
         self._schedule_compile_missing_statistics()
         _LOGGER.debug("Recorder processing the queue")
@@ -824,6 +910,8 @@ class Recorder(threading.Thread):
                 migrator = migrator_cls(schema_status.start_version, migration_changes)
                 migrator.do_migrate(self, session)
 
+        self._start_states_hot_tier()
+
         # We must only set the db ready after we have set the table managers
         # to active if there is no data to migrate.
         #
@@ -831,6 +919,31 @@ class Recorder(threading.Thread):
         # and not the old ones as soon as the API is available.
         self.hass.add_job(self.async_set_db_ready)
 
+    def _setup_states_bulk_insert(self) -> None:
+        """Use multi-row inserts for the states tables if possible.
+
+        The dialect must be able to return the ids of the inserted rows
+        in order so they can be linked to the rows that reference them.
+        """
+        assert self.engine is not None
+        if (
+            self.schema_version == SCHEMA_VERSION
+            and self.states_meta_manager.active
+            and dialect_supports_bulk_insert(self.engine.dialect)
+        ):
+            self.states_bulk_insert_manager = StatesBulkInsertManager()
+        else:
+            self.states_bulk_insert_manager = None
+
+    def _start_states_hot_tier(self) -> None:
+        """Start the states hot tier if the states_meta table is in use.
+
+        The hot tier is keyed by metadata_id so it can only cover history
+        that was recorded after the entity_id migration finished.
+        """
+        if (hot_tier := self.states_hot_tier) and self.states_meta_manager.active:
+            hot_tier.start(self.recorder_runs_manager.recording_start.timestamp())
+
     def _run_event_loop(self) -> None:
         """Run the event loop for the recorder."""
         # Use a session for the event read loop
@@ -1038,9 +1151,14 @@ class Recorder(threading.Thread):
 
     def _process_one_event(self, event: Event[Any]) -> None:
         if not self.enabled:
+            self.events_complete_since = None
             return
+        if self.events_complete_since is None:
+            self.events_complete_since = event.time_fired_timestamp
         if event.event_type == EVENT_STATE_CHANGED:
             self._process_state_changed_event_into_session(event)
+            for record_state_changed in self.record_state_changed_platforms.values():
+                record_state_changed(self.hass, event)
         else:
             self._process_non_state_changed_event_into_session(event)
         # Commit if the commit interval is zero
@@ -1117,7 +1235,9 @@ class Recorder(threading.Thread):
             dbstate.old_state_id = old_state_id
             if old_state:
                 states_manager.update_pending_last_reported(
-                    old_state_id, old_state.last_reported_timestamp
+                    old_state_id,
+                    old_state.last_reported_timestamp,
+                    old_state.last_updated_timestamp,
                 )
         if entity_removed:
             dbstate.state = None
@@ -1146,7 +1266,7 @@ class Recorder(threading.Thread):
         else:
             states_meta = StatesMeta(entity_id=entity_id)
             states_meta_manager.add_pending(states_meta)
-            self._add_to_session(session, states_meta)
+            self._add_states_row_to_session(session, states_meta)
             dbstate.states_meta_rel = states_meta
 
         # Map the event data to the StateAttributes table
@@ -1171,10 +1291,12 @@ class Recorder(threading.Thread):
             # No matching attributes found, save them in the DB
             dbstate_attributes = StateAttributes(shared_attrs=shared_attrs, hash=hash_)
             state_attributes_manager.add_pending(dbstate_attributes)
-            self._add_to_session(session, dbstate_attributes)
+            self._add_states_row_to_session(session, dbstate_attributes)
             dbstate.state_attributes = dbstate_attributes
 
-        self._add_to_session(session, dbstate)
+        if self.states_hot_tier:
+            self.states_hot_tier.add_pending(dbstate, shared_attrs)
+        self._add_states_row_to_session(session, dbstate)
 
     def _handle_database_error(self, err: Exception, *, setup_run: bool) -> bool:
         """Handle a database error that may result in moving away the corrupt db."""
@@ -1222,6 +1344,9 @@ class Recorder(threading.Thread):
         session = self.event_session
         self._commits_without_expire += 1
 
+        if self.states_bulk_insert_manager:
+            with session.no_autoflush:
+                self.states_bulk_insert_manager.insert_pending(session)
         if (
             pending_last_reported
             := self.states_manager.get_pending_last_reported_timestamp()
@@ -1240,6 +1365,8 @@ class Recorder(threading.Thread):
         session.commit()
 
         self._event_session_has_pending_writes = False
+        if self.states_bulk_insert_manager:
+            self.states_bulk_insert_manager.post_commit_pending()
         # We just committed the state attributes to the database
         # and we now know the attributes_ids.  We can save
         # many selects for matching attributes by loading them
@@ -1249,6 +1376,8 @@ class Recorder(threading.Thread):
         self.event_data_manager.post_commit_pending()
         self.event_type_manager.post_commit_pending()
         self.states_meta_manager.post_commit_pending()
+        if self.states_hot_tier:
+            self.states_hot_tier.post_commit_pending()
 
         # Expire is an expensive operation (frequently more expensive
         # than the flush and commit itself) so we only
@@ -1265,6 +1394,9 @@ class Recorder(threading.Thread):
             self._close_connection()
         move_away_broken_database(dburl_to_path(self.db_url))
         self.recorder_runs_manager.reset()
+        if self.states_hot_tier:
+            self.states_hot_tier.reset()
+            self._start_states_hot_tier()
         self._setup_recorder()
         if setup_run:
             self._setup_run()
@@ -1277,6 +1409,10 @@ class Recorder(threading.Thread):
         self.event_type_manager.reset()
         self.states_meta_manager.reset()
         self.statistics_meta_manager.reset()
+        if self.states_bulk_insert_manager:
+            self.states_bulk_insert_manager.reset()
+        if self.states_hot_tier:
+            self.states_hot_tier.reset_pending()
 
         if not self.event_session:
             return
@@ -37,6 +37,7 @@ from .queries import (
     find_legacy_detached_states_and_attributes_to_purge,
     find_legacy_event_state_and_attributes_and_data_ids_to_purge,
     find_legacy_row,
+    find_oldest_state_ts,
     find_short_term_statistics_to_purge,
     find_states_to_purge,
     find_statistics_runs_to_purge,
@@ -46,6 +47,7 @@ from .util import retryable_database_job, session_scope
 
 if TYPE_CHECKING:
     from . import Recorder
+    from .purge_planner import PurgeProgress
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -62,16 +64,24 @@ def purge_old_data(
     apply_filter: bool = False,
     events_batch_size: int = DEFAULT_EVENTS_BATCHES_PER_PURGE,
     states_batch_size: int = DEFAULT_STATES_BATCHES_PER_PURGE,
+    progress: PurgeProgress | None = None,
 ) -> bool:
     """Purge events and states older than purge_before.
 
     Cleans up an timeframe of an hour, based on the oldest record.
+    If progress is passed, the deleted rows are counted in it.
     """
     _LOGGER.debug(
         "Purging states and events before target %s",
         purge_before.isoformat(sep=" ", timespec="seconds"),
     )
+    # Evict from the hot tier first so history never sees rows
+    # in memory that have already been deleted from the database
+    if instance.states_hot_tier:
+        instance.states_hot_tier.evict_purged(purge_before.timestamp())
     with session_scope(session=instance.get_session()) as session:
+        if progress and progress.first_oldest_ts is None:
+            progress.first_oldest_ts = session.execute(find_oldest_state_ts()).scalar()
         # Purge a max of max_bind_vars, based on the oldest states or events record
         has_more_to_purge = False
         if instance.use_legacy_events_index and _purging_legacy_format(session):
@@ -87,10 +97,10 @@ def purge_old_data(
             )
             # Once we are done purging legacy rows, we use the new method
             has_more_to_purge |= _purge_states_and_attributes_ids(
-                instance, session, states_batch_size, purge_before
+                instance, session, states_batch_size, purge_before, progress
             )
             has_more_to_purge |= _purge_events_and_data_ids(
-                instance, session, events_batch_size, purge_before
+                instance, session, events_batch_size, purge_before, progress
             )
 
         statistics_runs = _select_statistics_runs_to_purge(
@@ -105,6 +115,11 @@ def purge_old_data(
         if short_term_statistics:
             _purge_short_term_statistics(session, short_term_statistics)
 
+        if progress:
+            progress.add_deleted("statistics_runs", len(statistics_runs))
+            progress.add_deleted("statistics_short_term", len(short_term_statistics))
+            progress.oldest_ts = session.execute(find_oldest_state_ts()).scalar()
+
         if has_more_to_purge or statistics_runs or short_term_statistics:
             # Return false, as we might not be done yet.
             _LOGGER.debug("Purging hasn't fully completed yet")
@@ -178,6 +193,7 @@ def _purge_states_and_attributes_ids(
     session: Session,
     states_batch_size: int,
     purge_before: datetime,
+    progress: PurgeProgress | None = None,
 ) -> bool:
     """Purge states and linked attributes id in a batch.
 
@@ -201,8 +217,14 @@ def _purge_states_and_attributes_ids(
             break
         _purge_state_ids(instance, session, state_ids)
         attributes_ids_batch = attributes_ids_batch | attributes_ids
+        if progress:
+            progress.add_deleted("states", len(state_ids))
 
-    _purge_unused_attributes_ids(instance, session, attributes_ids_batch)
+    purged_attributes_ids = _purge_unused_attributes_ids(
+        instance, session, attributes_ids_batch
+    )
+    if progress:
+        progress.add_deleted("state_attributes", purged_attributes_ids)
     _LOGGER.debug(
         "After purging states and attributes_ids remaining=%s",
         has_remaining_state_ids_to_purge,
@@ -215,6 +237,7 @@ def _purge_events_and_data_ids(
     session: Session,
     events_batch_size: int,
     purge_before: datetime,
+    progress: PurgeProgress | None = None,
 ) -> bool:
     """Purge states and linked attributes id in a batch.
 
@@ -236,8 +259,12 @@ def _purge_events_and_data_ids(
             break
         _purge_event_ids(session, event_ids)
         data_ids_batch = data_ids_batch | data_ids
+        if progress:
+            progress.add_deleted("events", len(event_ids))
 
-    _purge_unused_data_ids(instance, session, data_ids_batch)
+    purged_data_ids = _purge_unused_data_ids(instance, session, data_ids_batch)
+    if progress:
+        progress.add_deleted("event_data", purged_data_ids)
     _LOGGER.debug(
         "After purging event and data_ids remaining=%s",
         has_remaining_event_ids_to_purge,
@@ -365,14 +392,18 @@ def _purge_unused_attributes_ids(
     instance: Recorder,
     session: Session,
     attributes_ids_batch: set[int],
-) -> None:
-    """Purge unused attributes ids."""
+) -> int:
+    """Purge unused attributes ids.
+
+    Returns the number of purged attributes ids.
+    """
     database_engine = instance.database_engine
     assert database_engine is not None
     if unused_attribute_ids_set := _select_unused_attributes_ids(
         instance, session, attributes_ids_batch, database_engine
     ):
         _purge_batch_attributes_ids(instance, session, unused_attribute_ids_set)
+    return len(unused_attribute_ids_set)
 
 
 def _select_unused_event_data_ids(
@@ -413,13 +444,18 @@ def _select_unused_event_data_ids(
 
 def _purge_unused_data_ids(
     instance: Recorder, session: Session, data_ids_batch: set[int]
-) -> None:
+) -> int:
+    """Purge unused event data ids.
+
+    Returns the number of purged data ids.
+    """
     database_engine = instance.database_engine
     assert database_engine is not None
     if unused_data_ids_set := _select_unused_event_data_ids(
         instance, session, data_ids_batch, database_engine
     ):
         _purge_batch_data_ids(instance, session, unused_data_ids_set)
+    return len(unused_data_ids_set)
 
 
 def _select_statistics_runs_to_purge(
@@ -696,6 +732,10 @@ def _purge_filtered_states(
     )
     if not to_purge:
         return True
+    if instance.states_hot_tier:
+        instance.states_hot_tier.evict_purged_metadata_ids(
+            metadata_ids_to_purge  # type: ignore[arg-type]
+        )
     state_ids, attributes_ids, event_ids = zip(*to_purge, strict=False)
     filtered_event_ids = {id_ for id_ in event_ids if id_ is not None}
     _LOGGER.debug(
@@ -0,0 +1,190 @@
+"""Plan purge chunks and keep track of the progress of a purge."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import datetime
+import logging
+from typing import Any
+
+from homeassistant.util import dt as dt_util
+
+_LOGGER = logging.getLogger(__name__)
+
+# The time each purge chunk should take before the recorder
+# goes back to processing the events that queued up meanwhile
+PURGE_CHUNK_TARGET_SECONDS = 2.0
+
+MIN_BATCHES_PER_CHUNK = 1
+MAX_BATCHES_PER_CHUNK = 200
+
+# The number of batches changes at most by this factor after each chunk
+MAX_BATCHES_SCALE = 2.0
+
+# The tables are purged in this order, attributes and data are
+# only deleted once no states or events reference them anymore
+PURGE_TABLES = (
+    "states",
+    "state_attributes",
+    "events",
+    "event_data",
+    "statistics_short_term",
+    "statistics_runs",
+)
+
+
+@dataclass(slots=True)
+class PurgeProgress:
+    """Progress of a purge which can be resumed after a restart."""
+
+    purge_before: datetime
+    repack: bool
+    apply_filter: bool
+    started: float
+    rows_deleted: dict[str, int] = field(
+        default_factory=lambda: dict.fromkeys(PURGE_TABLES, 0)
+    )
+    chunks: int = 0
+    # The time spent purging, excluding the time between chunks
+    active_seconds: float = 0.0
+    # The timestamp of the oldest state when the purge started
+    # and after the last chunk used to estimate the remaining time
+    first_oldest_ts: float | None = None
+    oldest_ts: float | None = None
+    finished: float | None = None
+
+    def add_deleted(self, table: str, rows: int) -> None:
+        """Count deleted rows."""
+        self.rows_deleted[table] += rows
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the resume cursor to store."""
+        return {
+            "purge_before": self.purge_before.isoformat(),
+            "repack": self.repack,
+            "apply_filter": self.apply_filter,
+            "started": self.started,
+            "rows_deleted": dict(self.rows_deleted),
+            "chunks": self.chunks,
+            "active_seconds": self.active_seconds,
+            "first_oldest_ts": self.first_oldest_ts,
+            "oldest_ts": self.oldest_ts,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> PurgeProgress | None:
+        """Return the progress from a stored resume cursor."""
+        try:
+            return cls(
+                purge_before=dt_util.parse_datetime(
+                    data["purge_before"], raise_on_error=True
+                ),
+                repack=bool(data["repack"]),
+                apply_filter=bool(data["apply_filter"]),
+                started=float(data["started"]),
+                rows_deleted={
+                    table: int(data["rows_deleted"].get(table, 0))
+                    for table in PURGE_TABLES
+                },
+                chunks=int(data["chunks"]),
+                active_seconds=float(data["active_seconds"]),
+                first_oldest_ts=data["first_oldest_ts"],
+                oldest_ts=data["oldest_ts"],
+            )
+        except (AttributeError, KeyError, TypeError, ValueError) as err:
+            _LOGGER.warning("Ignoring invalid purge resume data %s: %s", data, err)
+            return None
+
+    def summary(self) -> dict[str, Any]:
+        """Return the progress with the deletion rate and estimated time remaining."""
+        total = sum(self.rows_deleted.values())
+        elapsed = self.active_seconds
+        eta: float | None = None
+        if self.finished:
+            eta = 0.0
+        elif (
+            self.first_oldest_ts is not None
+            and self.oldest_ts is not None
+            and (span := self.purge_before.timestamp() - self.first_oldest_ts) > 0
+            and (done := (self.oldest_ts - self.first_oldest_ts) / span) > 0
+        ):
+            eta = elapsed * (1 - min(done, 1.0)) / done
+        return {
+            "purge_before": self.purge_before.isoformat(),
+            "started": self.started,
+            "finished": self.finished,
+            "chunks": self.chunks,
+            "rows_deleted": dict(self.rows_deleted),
+            "total_rows_deleted": total,
+            "rate": total / elapsed if elapsed > 0 else 0.0,
+            "eta": eta,
+        }
+
+
+class PurgePlanner:
+    """Size purge chunks so each chunk takes about the same time.
+
+    A chunk is a single run of the purge task. After each chunk the
+    task is queued again behind the events that arrived meanwhile,
+    so the size of the chunk determines how long recording is blocked.
+    """
+
+    def __init__(
+        self,
+        states_batches: int,
+        events_batches: int,
+        target_seconds: float = PURGE_CHUNK_TARGET_SECONDS,
+    ) -> None:
+        """Initialize the planner."""
+        self.states_batches = states_batches
+        self.events_batches = events_batches
+        self.target_seconds = target_seconds
+        self.progress: PurgeProgress | None = None
+
+    def start_chunk(
+        self,
+        purge_before: datetime,
+        repack: bool,
+        apply_filter: bool,
+        resume: PurgeProgress | None,
+    ) -> PurgeProgress:
+        """Return the progress to update for the next chunk of a purge."""
+        if (
+            (progress := self.progress)
+            and not progress.finished
+            and progress.purge_before == purge_before
+        ):
+            return progress
+        if resume and resume.purge_before == purge_before:
+            self.progress = resume
+        else:
+            self.progress = PurgeProgress(
+                purge_before, repack, apply_filter, dt_util.utcnow().timestamp()
+            )
+        return self.progress
+
+    def finish_chunk(self, elapsed: float, finished: bool) -> None:
+        """Record how long a chunk took and size the next chunk."""
+        assert self.progress is not None
+        self.progress.chunks += 1
+        self.progress.active_seconds += elapsed
+        if finished:
+            self.progress.finished = dt_util.utcnow().timestamp()
+            return
+        scale = self.target_seconds / max(elapsed, 0.001)
+        scale = min(max(scale, 1 / MAX_BATCHES_SCALE), MAX_BATCHES_SCALE)
+        self.states_batches = self._scale_batches(self.states_batches, scale)
+        self.events_batches = self._scale_batches(self.events_batches, scale)
+        _LOGGER.debug(
+            "Purge chunk took %.3fs, next chunk %s states and %s events batches",
+            elapsed,
+            self.states_batches,
+            self.events_batches,
+        )
+
+    @staticmethod
+    def _scale_batches(batches: int, scale: float) -> int:
+        """Scale the number of batches within the limits."""
+        return min(
+            max(round(batches * scale), MIN_BATCHES_PER_CHUNK), MAX_BATCHES_PER_CHUNK
+        )
@@ -7,13 +7,26 @@ from collections.abc import Callable, Iterable, Sequence
 import dataclasses
 from datetime import datetime, timedelta
 from functools import lru_cache, partial
+from importlib.util import find_spec
 from itertools import chain, groupby
 import logging
+import math
 from operator import itemgetter
 import re
 from typing import TYPE_CHECKING, Any, Literal, TypedDict, cast
 
-from sqlalchemy import Select, and_, bindparam, func, lambda_stmt, select, text
+from sqlalchemy import (
+    Select,
+    and_,
+    bindparam,
+    case,
+    func,
+    lambda_stmt,
+    literal,
+    literal_column,
+    select,
+    text,
+)
 from sqlalchemy.engine.row import Row
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm.session import Session
@@ -80,6 +93,8 @@ from .util import (
 )
 
 if TYPE_CHECKING:
+    import numpy as np
+
     from . import Recorder
 
 QUERY_STATISTICS = (
@@ -150,6 +165,13 @@ STATISTIC_UNIT_TO_UNIT_CONVERTER: dict[str | None, type[BaseUnitConverter]] = {
 
 DATA_SHORT_TERM_STATISTICS_RUN_CACHE = "recorder_short_term_statistics_run_cache"
 
+# Below this number of rows reducing statistics in Python is faster
+NUMPY_REDUCE_MIN_ROWS = 100
+
+# Statistics are only reduced in the database if the number of periods
+# is at most this, each period adds a condition to the query
+MAX_DATABASE_REDUCE_PERIODS = 400
+
 
 def mean(values: list[float]) -> float | None:
     """Return the mean of the values.
@@ -948,6 +970,113 @@ def _reduce_statistics(
     return result
 
 
+def _period_bounds(
+    first_ts: float,
+    last_ts: float,
+    period_start_end: Callable[[float], tuple[float, float]],
+) -> list[float]:
+    """Return the boundaries of the periods from first_ts until after last_ts."""
+    start, end = period_start_end(first_ts)
+    bounds = [start, end]
+    while end <= last_ts:
+        end = period_start_end(end)[1]
+        bounds.append(end)
+    return bounds
+
+
+def _nan_to_none(values: np.ndarray) -> list[float | None]:
+    """Return the values as floats, NaN values are returned as None."""
+    return [None if math.isnan(value) else value for value in values.tolist()]
+
+
+def _reduce_statistics_numpy(
+    stats: dict[str, list[StatisticsRow]],
+    period_start_end: Callable[[float], tuple[float, float]],
+    types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
+) -> dict[str, list[StatisticsRow]]:
+    """Reduce hourly statistics to daily, weekly or monthly statistics.
+
+    This gives the same result as _reduce_statistics, but the rows are
+    turned into columns and each column is reduced to the periods at once.
+    The period boundaries are calculated in local time for the whole time
+    span of the statistics, each row is then placed in its period by a
+    binary search for its start among the boundaries.
+    """
+    import numpy as np  # pylint: disable=import-outside-toplevel
+
+    result: dict[str, list[StatisticsRow]] = {}
+    bounds = np.array(
+        _period_bounds(
+            min(stat_list[0]["start"] for stat_list in stats.values()),
+            max(stat_list[-1]["start"] for stat_list in stats.values()),
+            period_start_end,
+        )
+    )
+    for statistic_id, stat_list in stats.items():
+        starts = np.array([row["start"] for row in stat_list])
+        periods = np.searchsorted(bounds, starts, side="right") - 1
+        # The rows are sorted, a period starts when the period of a row changes
+        firsts = np.flatnonzero(np.diff(periods, prepend=-1))
+        lasts = np.append(firsts[1:] - 1, len(stat_list) - 1).tolist()
+        columns: dict[str, list[Any]] = {
+            "start": bounds[periods[firsts]].tolist(),
+            "end": bounds[periods[firsts] + 1].tolist(),
+        }
+        if "mean" in types:
+            values = np.array([row.get("mean") for row in stat_list], dtype=float)
+            valid = ~np.isnan(values)
+            counts = np.add.reduceat(valid, firsts, dtype=np.int64)
+            sums = np.add.reduceat(np.where(valid, values, 0.0), firsts)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                columns["mean"] = _nan_to_none(sums / counts)
+        if "min" in types:
+            values = np.array([row.get("min") for row in stat_list], dtype=float)
+            columns["min"] = _nan_to_none(np.fmin.reduceat(values, firsts))
+        if "max" in types:
+            values = np.array([row.get("max") for row in stat_list], dtype=float)
+            columns["max"] = _nan_to_none(np.fmax.reduceat(values, firsts))
+        # The last row of the period has the values at the end of the period
+        last_rows = [stat_list[idx] for idx in lasts]
+        if "last_reset" in types:
+            columns["last_reset"] = [row.get("last_reset") for row in last_rows]
+        if "state" in types:
+            columns["state"] = [row.get("state") for row in last_rows]
+        if "sum" in types:
+            columns["sum"] = [row["sum"] for row in last_rows]
+        result[statistic_id] = [
+            cast(StatisticsRow, dict(zip(columns, row, strict=True)))
+            for row in zip(*columns.values(), strict=True)
+        ]
+
+    return result
+
+
+def _reduce_statistics_per_period(
+    stats: dict[str, list[StatisticsRow]],
+    same_period: Callable[[float, float], bool],
+    period_start_end: Callable[[float], tuple[float, float]],
+    period: timedelta,
+    types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
+) -> dict[str, list[StatisticsRow]]:
+    """Reduce hourly statistics with NumPy unless there are only a few rows.
+
+    This is the fallback for statistics which are not reduced in the
+    database, NumPy is only imported when it is installed and needed.
+    """
+    if (
+        sum(len(stat_list) for stat_list in stats.values()) < NUMPY_REDUCE_MIN_ROWS
+        or not _numpy_installed()
+    ):
+        return _reduce_statistics(stats, same_period, period_start_end, period, types)
+    return _reduce_statistics_numpy(stats, period_start_end, types)
+
+
+@lru_cache(maxsize=1)
+def _numpy_installed() -> bool:
+    """Return if NumPy can be imported."""
+    return find_spec("numpy") is not None
+
+
 def reduce_day_ts_factory() -> (
     tuple[
         Callable[[float, float], bool],
@@ -992,7 +1121,7 @@ def _reduce_statistics_per_day(
 ) -> dict[str, list[StatisticsRow]]:
     """Reduce hourly statistics to daily statistics."""
     _same_day_ts, _day_start_end_ts = reduce_day_ts_factory()
-    return _reduce_statistics(
+    return _reduce_statistics_per_period(
         stats, _same_day_ts, _day_start_end_ts, timedelta(days=1), types
     )
 
@@ -1042,7 +1171,7 @@ def _reduce_statistics_per_week(
 ) -> dict[str, list[StatisticsRow]]:
     """Reduce hourly statistics to weekly statistics."""
     _same_week_ts, _week_start_end_ts = reduce_week_ts_factory()
-    return _reduce_statistics(
+    return _reduce_statistics_per_period(
         stats, _same_week_ts, _week_start_end_ts, timedelta(days=7), types
     )
 
@@ -1097,7 +1226,7 @@ def _reduce_statistics_per_month(
 ) -> dict[str, list[StatisticsRow]]:
     """Reduce hourly statistics to monthly statistics."""
     _same_month_ts, _month_start_end_ts = reduce_month_ts_factory()
-    return _reduce_statistics(
+    return _reduce_statistics_per_period(
         stats, _same_month_ts, _month_start_end_ts, timedelta(days=31), types
     )
 
@@ -1125,6 +1254,141 @@ def _generate_statistics_during_period_stmt(
     return stmt
 
 
+def _generate_statistics_during_period_reduced_stmt(
+    bounds: list[float],
+    metadata_ids: list[int] | None,
+    types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
+) -> Select:
+    """Prepare a database query for statistics reduced to periods.
+
+    The rows are grouped by the period their start is in, the periods are
+    numbered in the order of bounds and returned as start_ts. The values
+    at the end of the period are taken from the last row in the period.
+    """
+    if len(bounds) > 2:
+        period = case(
+            *(
+                (Statistics.start_ts < bound, idx)
+                for idx, bound in enumerate(bounds[1:-1])
+            ),
+            else_=len(bounds) - 2,
+        )
+    else:
+        period = literal(0)
+    columns = [Statistics.metadata_id.label("metadata_id"), period.label("period")]
+    if "mean" in types:
+        columns.append(func.avg(Statistics.mean).label("mean"))
+    if "min" in types:
+        columns.append(func.min(Statistics.min).label("min"))
+    if "max" in types:
+        columns.append(func.max(Statistics.max).label("max"))
+    last_columns = [
+        getattr(Statistics, _type_column_mapping[key])
+        for key in ("last_reset", "state", "sum")
+        if key in types
+    ]
+    if last_columns:
+        columns.append(func.max(Statistics.start_ts).label("last_start_ts"))
+    subquery = select(*columns).filter(
+        Statistics.start_ts >= bounds[0], Statistics.start_ts < bounds[-1]
+    )
+    if metadata_ids:
+        subquery = subquery.filter(Statistics.metadata_id.in_(metadata_ids))
+    periods = subquery.group_by(
+        Statistics.metadata_id, literal_column("period")
+    ).subquery()
+
+    stmt = select(
+        periods.c.metadata_id,
+        periods.c.period.label("start_ts"),
+        *(periods.c[key] for key in ("mean", "min", "max") if key in types),
+        *last_columns,
+    )
+    if last_columns:
+        stmt = stmt.join_from(
+            periods,
+            Statistics,
+            and_(
+                Statistics.metadata_id == periods.c.metadata_id,
+                Statistics.start_ts == periods.c.last_start_ts,
+            ),
+        )
+    return stmt.order_by(periods.c.metadata_id, periods.c.period)
+
+
+def _database_reduce_period_bounds(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None,
+    period: Literal["day", "week", "month"],
+    metadata: dict[str, tuple[int, StatisticMetaData]],
+    types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
+) -> list[float] | None:
+    """Return the period bounds to reduce statistics in the database.
+
+    The bounds are calculated in local time here since the databases
+    can not be relied on to know the time zone, this makes grouping by
+    period in the database correct around DST changes.
+
+    None is returned if the statistics must be reduced in Python.
+    """
+    if end_time is None or get_instance(hass).dialect_name not in (
+        SupportedDialect.MYSQL,
+        SupportedDialect.POSTGRESQL,
+        SupportedDialect.SQLITE,
+    ):
+        return None
+    # The mean of converted values is only the converted mean
+    # if the conversion is linear, which is not true for Beaufort
+    if "mean" in types and any(
+        STATISTIC_UNIT_TO_UNIT_CONVERTER.get(meta["unit_of_measurement"])
+        is SpeedConverter
+        for _, meta in metadata.values()
+    ):
+        return None
+    if period == "day":
+        _, period_start_end = reduce_day_ts_factory()
+    elif period == "week":
+        _, period_start_end = reduce_week_ts_factory()
+    else:
+        _, period_start_end = reduce_month_ts_factory()
+    start_ts = start_time.timestamp()
+    end_ts = end_time.timestamp()
+    if (end_ts - start_ts) / 86400 > MAX_DATABASE_REDUCE_PERIODS:
+        # Avoid calculating the bounds, there are too many days
+        # for the number of weeks or months to matter
+        return None
+    bounds = _period_bounds(start_ts, end_ts, period_start_end)
+    if len(bounds) > 2 and bounds[-2] >= end_ts:
+        # end_ts is the start of the last period
+        bounds.pop()
+    if len(bounds) - 1 > MAX_DATABASE_REDUCE_PERIODS:
+        return None
+    return bounds
+
+
+def _reduced_statistics_to_dict(
+    hass: HomeAssistant,
+    stats: Sequence[Row[Any]],
+    bounds: list[float],
+    statistic_ids: set[str] | None,
+    metadata: dict[str, tuple[int, StatisticMetaData]],
+    units: dict[str, str] | None,
+    types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
+) -> dict[str, list[StatisticsRow]]:
+    """Convert statistics reduced in the database into JSON friendly data."""
+    result = _sorted_statistics_to_dict(
+        hass, stats, statistic_ids, metadata, True, Statistics, units, types
+    )
+    # The start of the rows is the number of the period
+    for rows in result.values():
+        for row in rows:
+            period_idx = int(row["start"])
+            row["start"] = bounds[period_idx]
+            row["end"] = bounds[period_idx + 1]
+    return result
+
+
 def _generate_max_mean_min_statistic_in_sub_period_stmt(
     columns: Select,
     start_time: datetime | None,
@@ -1754,6 +2018,25 @@ def _statistics_during_period_with_session(
         if end_time is not None:
             end_time = _find_month_end_time(dt_util.as_local(end_time))
 
+    if period in ("day", "week", "month") and (
+        bounds := _database_reduce_period_bounds(
+            hass, start_time, end_time, period, metadata, types
+        )
+    ):
+        reduced_stmt = _generate_statistics_during_period_reduced_stmt(
+            bounds, metadata_ids, types
+        )
+        if not (reduced_stats := session.connection().execute(reduced_stmt).all()):
+            return {}
+        result = _reduced_statistics_to_dict(
+            hass, reduced_stats, bounds, statistic_ids, metadata, units, types
+        )
+        if "change" in _types:
+            _augment_result_with_change(
+                hass, session, start_time, units, _types, Statistics, metadata, result
+            )
+        return result
+
     table: type[Statistics | StatisticsShortTerm] = (
         Statistics if period != "5minute" else StatisticsShortTerm
     )
@@ -46,9 +46,22 @@ class StatesManager:
         self._pending[entity_id] = state
 
     def update_pending_last_reported(
-        self, state_id: int, last_reported_timestamp: float
+        self,
+        state_id: int,
+        last_reported_timestamp: float,
+        last_updated_timestamp: float,
     ) -> None:
-        """Update the last reported timestamp for a state."""
+        """Update the last reported timestamp for a state.
+
+        Nothing needs to be written if the state was not reported since
+        it was last updated. Coalesced reports are already skipped by the
+        state machine, they never update last_reported.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        if last_reported_timestamp == last_updated_timestamp:
+            return
         self._last_reported[state_id] = last_reported_timestamp
 
     def get_pending_last_reported_timestamp(self) -> dict[int, float]:
@@ -0,0 +1,173 @@
+"""Support inserting States with multi-row INSERT statements."""
+
+from __future__ import annotations
+
+from typing import Any, cast
+
+from sqlalchemy import Table, insert
+from sqlalchemy.engine import Dialect
+from sqlalchemy.orm.session import Session
+
+from ..db_schema import StateAttributes, States, StatesMeta
+
+# We need to cast __table__ to Table, explanation in
+# https://github.com/sqlalchemy/sqlalchemy/issues/9130
+_STATES_TABLE = cast(Table, States.__table__)
+_STATE_ATTRIBUTES_TABLE = cast(Table, StateAttributes.__table__)
+_STATES_META_TABLE = cast(Table, StatesMeta.__table__)
+
+_INSERT_STATES_META = insert(_STATES_META_TABLE).returning(
+    _STATES_META_TABLE.c.metadata_id, sort_by_parameter_order=True
+)
+_INSERT_STATE_ATTRIBUTES = insert(_STATE_ATTRIBUTES_TABLE).returning(
+    _STATE_ATTRIBUTES_TABLE.c.attributes_id, sort_by_parameter_order=True
+)
+_INSERT_STATES = insert(_STATES_TABLE).returning(
+    _STATES_TABLE.c.state_id, sort_by_parameter_order=True
+)
+
+
+def dialect_supports_bulk_insert(dialect: Dialect) -> bool:
+    """Return if the dialect can return the ids of a multi-row INSERT in order."""
+    return bool(dialect.insert_executemany_returning_sort_by_parameter_order)
+
+
+def _state_params(dbstate: States) -> dict[str, Any]:
+    """Return the INSERT parameters for a States object.
+
+    The relationships are resolved to ids since the related
+    rows have already been inserted when this is called.
+    """
+    if (states_meta := dbstate.states_meta_rel) is not None:
+        dbstate.metadata_id = states_meta.metadata_id
+    if (state_attributes := dbstate.state_attributes) is not None:
+        dbstate.attributes_id = state_attributes.attributes_id
+    if (old_state := dbstate.old_state) is not None:
+        dbstate.old_state_id = old_state.state_id
+    return {
+        "entity_id": dbstate.entity_id,
+        "state": dbstate.state,
+        "last_changed_ts": dbstate.last_changed_ts,
+        "last_reported_ts": dbstate.last_reported_ts,
+        "last_updated_ts": dbstate.last_updated_ts,
+        "old_state_id": dbstate.old_state_id,
+        "attributes_id": dbstate.attributes_id,
+        "context_id_bin": dbstate.context_id_bin,
+        "context_user_id_bin": dbstate.context_user_id_bin,
+        "context_parent_id_bin": dbstate.context_parent_id_bin,
+        "origin_idx": dbstate.origin_idx,
+        "metadata_id": dbstate.metadata_id,
+    }
+
+
+class StatesBulkInsertManager:
+    """Insert States, StateAttributes and StatesMeta without the unit of work.
+
+    The objects are never added to the session. They are only used to
+    carry the data and relationships until they are inserted with Core
+    multi-row INSERT ... RETURNING statements when the session is
+    committed. The returned ids are written back to the objects so the
+    pending and committed bookkeeping of the other table managers works
+    the same way it does after an ORM flush.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the bulk insert manager."""
+        self._states_meta: list[StatesMeta] = []
+        self._state_attributes: list[StateAttributes] = []
+        self._states: list[States] = []
+
+    def add(self, obj: States | StateAttributes | StatesMeta) -> None:
+        """Add an object to be inserted when the session is committed.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        # The objects are never subclassed so we can use a fast type check
+        if type(obj) is States:
+            self._states.append(obj)
+        elif type(obj) is StateAttributes:
+            self._state_attributes.append(obj)
+        else:
+            assert type(obj) is StatesMeta
+            self._states_meta.append(obj)
+
+    def insert_pending(self, session: Session) -> None:
+        """Insert the pending rows in the current transaction.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        if states_meta := self._states_meta:
+            for db_states_meta, metadata_id in zip(
+                states_meta,
+                session.execute(
+                    _INSERT_STATES_META,
+                    [{"entity_id": obj.entity_id} for obj in states_meta],
+                ).scalars(),
+                strict=True,
+            ):
+                db_states_meta.metadata_id = metadata_id
+
+        if state_attributes := self._state_attributes:
+            for db_state_attributes, attributes_id in zip(
+                state_attributes,
+                session.execute(
+                    _INSERT_STATE_ATTRIBUTES,
+                    [
+                        {"hash": obj.hash, "shared_attrs": obj.shared_attrs}
+                        for obj in state_attributes
+                    ],
+                ).scalars(),
+                strict=True,
+            ):
+                db_state_attributes.attributes_id = attributes_id
+
+        if not self._states:
+            return
+
+        # When an entity changes more than once between commits, its
+        # old_state_id links to a state in the same batch. We insert the
+        # states in generations so the state_id of the old state is
+        # always known before the state that links to it is inserted.
+        generation_by_state: dict[int, int] = {}
+        generations: list[list[States]] = []
+        for dbstate in self._states:
+            generation = 0
+            if (old_state := dbstate.old_state) is not None and (
+                old_generation := generation_by_state.get(id(old_state))
+            ) is not None:
+                generation = old_generation + 1
+            generation_by_state[id(dbstate)] = generation
+            if generation == len(generations):
+                generations.append([])
+            generations[generation].append(dbstate)
+
+        for generation_states in generations:
+            for dbstate, state_id in zip(
+                generation_states,
+                session.execute(
+                    _INSERT_STATES,
+                    [_state_params(dbstate) for dbstate in generation_states],
+                ).scalars(),
+                strict=True,
+            ):
+                dbstate.state_id = state_id
+
+    def post_commit_pending(self) -> None:
+        """Call after commit to forget the inserted objects.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self._states_meta.clear()
+        self._state_attributes.clear()
+        self._states.clear()
+
+    def reset(self) -> None:
+        """Reset after the database has been reset or changed.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self.post_commit_pending()
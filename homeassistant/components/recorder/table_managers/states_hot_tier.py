@@ -0,0 +1,446 @@
+"""Keep recently committed states in memory to serve history queries."""
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable
+import logging
+import sys
+import threading
+import time
+from typing import Any, NamedTuple
+
+from ..db_schema import States
+
+_LOGGER = logging.getLogger(__name__)
+
+# Bytes used per row by the four columns
+# (two float64 timestamps and two uint32 intern indexes)
+ROW_SIZE_BYTES = 24
+
+# How often the recorder thread evicts rows that are older than max_age
+EVICT_INTERVAL = 60
+
+# Fraction of the remaining window that is dropped each time
+# the memory limit is exceeded
+MEMORY_EVICT_FRACTION = 0.25
+
+
+class HotTierRow(NamedTuple):
+    """A row shaped like the rows returned by the history queries."""
+
+    metadata_id: int
+    state: str | None
+    last_updated_ts: float
+    last_changed_ts: float | None
+    attributes: str | None
+
+
+class _InternTable:
+    """Intern strings and count the rows that reference them.
+
+    Index 0 is reserved for None.
+    """
+
+    __slots__ = ("_free", "_index", "_refs", "size_bytes", "values")
+
+    def __init__(self) -> None:
+        """Initialize the intern table."""
+        self._index: dict[str, int] = {}
+        self._refs: list[int] = [0]
+        self._free: list[int] = []
+        self.values: list[str | None] = [None]
+        self.size_bytes = 0
+
+    def add(self, value: str | None) -> int:
+        """Intern a value and return its index."""
+        if value is None:
+            return 0
+        if (idx := self._index.get(value)) is None:
+            if self._free:
+                idx = self._free.pop()
+                self.values[idx] = value
+            else:
+                idx = len(self.values)
+                self.values.append(value)
+                self._refs.append(0)
+            self._index[value] = idx
+            self.size_bytes += sys.getsizeof(value)
+        self._refs[idx] += 1
+        return idx
+
+    def release(self, indexes: Iterable[int]) -> None:
+        """Release one reference for each index."""
+        refs = self._refs
+        for idx in indexes:
+            if not idx:
+                continue
+            refs[idx] -= 1
+            if refs[idx]:
+                continue
+            value = self.values[idx]
+            assert value is not None
+            del self._index[value]
+            self.values[idx] = None
+            self._free.append(idx)
+            self.size_bytes -= sys.getsizeof(value)
+
+
+class _StateColumns:
+    """Array backed columns for the states of a single metadata_id.
+
+    Rows are kept sorted by last_updated_ts. A last_changed_ts of 0.0
+    means last_changed is the same as last_updated, which matches how
+    the states table stores it as NULL.
+    """
+
+    __slots__ = ("attributes_idx", "last_changed_ts", "last_updated_ts", "state_idx")
+
+    def __init__(self) -> None:
+        """Initialize the columns."""
+        self.last_updated_ts = array("d")
+        self.last_changed_ts = array("d")
+        self.state_idx = array("I")
+        self.attributes_idx = array("I")
+
+    def __len__(self) -> int:
+        """Return the number of rows."""
+        return len(self.last_updated_ts)
+
+    def append(
+        self,
+        last_updated_ts: float,
+        last_changed_ts: float,
+        state_idx: int,
+        attributes_idx: int,
+    ) -> None:
+        """Add a row, keeping the rows sorted by last_updated_ts."""
+        last_updated = self.last_updated_ts
+        if not last_updated or last_updated[-1] <= last_updated_ts:
+            last_updated.append(last_updated_ts)
+            self.last_changed_ts.append(last_changed_ts)
+            self.state_idx.append(state_idx)
+            self.attributes_idx.append(attributes_idx)
+            return
+        idx = bisect_right(last_updated, last_updated_ts)
+        last_updated.insert(idx, last_updated_ts)
+        self.last_changed_ts.insert(idx, last_changed_ts)
+        self.state_idx.insert(idx, state_idx)
+        self.attributes_idx.insert(idx, attributes_idx)
+
+    def delete_before(self, count: int, interned: _InternTable) -> None:
+        """Delete the first count rows."""
+        interned.release(self.state_idx[:count])
+        interned.release(self.attributes_idx[:count])
+        del self.last_updated_ts[:count]
+        del self.last_changed_ts[:count]
+        del self.state_idx[:count]
+        del self.attributes_idx[:count]
+
+
+class StatesHotTier:
+    """Keep the recent history of states in memory.
+
+    The recorder thread adds states once they have been committed to the
+    database so the rows held here are always a subset of what the states
+    table holds. History queries that fall entirely inside the window the
+    tier covers are answered from memory; everything else falls back to SQL.
+
+    The tier is written from the recorder thread and read from the
+    database executor threads, so all access is guarded by a lock.
+    """
+
+    def __init__(self, max_age: float, memory_limit: int) -> None:
+        """Initialize the hot tier.
+
+        max_age is the number of seconds of history to keep and
+        memory_limit is the approximate number of bytes the tier may use.
+        """
+        self.max_age = max_age
+        self.memory_limit = memory_limit
+        self._lock = threading.Lock()
+        self._pending: list[tuple[States, str | None]] = []
+        self._columns: dict[int, _StateColumns] = {}
+        self._interned = _InternTable()
+        self._rows = 0
+        # The tier does not cover anything until started
+        self._covered_since = float("inf")
+        self._metadata_id_covered_since: dict[int, float] = {}
+        self._last_evict = 0.0
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def active(self) -> bool:
+        """Return if the tier has been started."""
+        return self._covered_since != float("inf")
+
+    @property
+    def memory_usage(self) -> int:
+        """Return the approximate number of bytes used by the tier."""
+        return self._rows * ROW_SIZE_BYTES + self._interned.size_bytes
+
+    def start(self, covered_since: float) -> None:
+        """Start covering history from covered_since.
+
+        Every state committed after covered_since must be added to
+        the tier from this point on.
+
+        This call must be called from the recorder thread.
+        """
+        with self._lock:
+            self._covered_since = covered_since
+            self._last_evict = time.time()
+
+    def add_pending(self, dbstate: States, shared_attrs: str | None) -> None:
+        """Add a state that is in the session but not yet committed.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self._pending.append((dbstate, shared_attrs))
+
+    def post_commit_pending(self) -> None:
+        """Move the states that were just committed into the tier.
+
+        This call must be called from the recorder thread.
+        """
+        if not self._pending:
+            return
+        pending = self._pending
+        self._pending = []
+        if not self.active:
+            return
+        columns = self._columns
+        with self._lock:
+            intern = self._interned.add
+            for dbstate, shared_attrs in pending:
+                if (metadata_id := dbstate.metadata_id) is None:
+                    continue
+                self._rows += 1
+                if (entity_columns := columns.get(metadata_id)) is None:
+                    entity_columns = columns[metadata_id] = _StateColumns()
+                entity_columns.append(
+                    dbstate.last_updated_ts,  # type: ignore[arg-type]
+                    dbstate.last_changed_ts or 0.0,
+                    intern(dbstate.state),
+                    intern(shared_attrs),
+                )
+        now = time.time()
+        if (
+            now - self._last_evict >= EVICT_INTERVAL
+            or self.memory_usage > self.memory_limit
+        ):
+            self.evict_expired(now)
+
+    def evict_expired(self, now: float) -> None:
+        """Evict rows older than max_age and enforce the memory limit.
+
+        The newest row before the horizon is kept for every metadata_id
+        so the state at the start of the covered window is still known.
+
+        This call must be called from the recorder thread.
+        """
+        self._last_evict = now
+        horizon = now - self.max_age
+        with self._lock:
+            self._evict_before(horizon, keep_start_state=True)
+            while self.memory_usage > self.memory_limit and self._rows:
+                horizon += (now - horizon) * MEMORY_EVICT_FRACTION
+                if now - horizon < 1:
+                    _LOGGER.debug("Hot tier memory limit reached, clearing all rows")
+                    self._clear()
+                    self._covered_since = now
+                    break
+                self._evict_before(horizon, keep_start_state=True)
+
+    def evict_purged(self, purge_before: float) -> None:
+        """Evict rows that were purged from the states table.
+
+        This call must be called from the recorder thread.
+        """
+        with self._lock:
+            if purge_before > self._covered_since:
+                self._evict_before(purge_before, keep_start_state=False)
+
+    def evict_purged_metadata_ids(self, metadata_ids: Iterable[int]) -> None:
+        """Evict all rows for metadata_ids that had states purged.
+
+        This call must be called from the recorder thread.
+        """
+        now = time.time()
+        with self._lock:
+            for metadata_id in metadata_ids:
+                self._metadata_id_covered_since[metadata_id] = now
+                if entity_columns := self._columns.pop(metadata_id, None):
+                    self._rows -= len(entity_columns)
+                    entity_columns.delete_before(len(entity_columns), self._interned)
+
+    def reset(self) -> None:
+        """Reset after the database has been reset or changed.
+
+        This call must be called from the recorder thread.
+        """
+        with self._lock:
+            self._pending.clear()
+            self._clear()
+            self._covered_since = float("inf")
+
+    def reset_pending(self) -> None:
+        """Forget the states that were not committed.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self._pending.clear()
+
+    def _clear(self) -> None:
+        """Remove all rows, the lock must be held."""
+        self._columns.clear()
+        self._metadata_id_covered_since.clear()
+        self._interned = _InternTable()
+        self._rows = 0
+
+    def _evict_before(self, horizon: float, keep_start_state: bool) -> None:
+        """Evict rows before horizon, the lock must be held."""
+        interned = self._interned
+        for metadata_id, entity_columns in list(self._columns.items()):
+            count = bisect_left(entity_columns.last_updated_ts, horizon)
+            if keep_start_state and count:
+                count -= 1
+            if not count:
+                continue
+            entity_columns.delete_before(count, interned)
+            self._rows -= count
+            if not entity_columns:
+                del self._columns[metadata_id]
+        self._covered_since = max(self._covered_since, horizon)
+
+    def get_significant_states_rows(
+        self,
+        metadata_ids: list[int],
+        metadata_ids_in_significant_domains: list[int],
+        start_time_ts: float,
+        end_time_ts: float | None,
+        run_start_ts: float | None,
+        significant_changes_only: bool,
+        include_start_time_state: bool,
+        no_attributes: bool,
+    ) -> list[HotTierRow] | None:
+        """Return rows matching the significant states query.
+
+        The rows are ordered by metadata_id and last_updated_ts in the
+        same way as the SQL query. Returns None if the tier does not
+        cover the requested window and the database must be queried.
+        """
+        with self._lock:
+            rows = self._get_significant_states_rows(
+                metadata_ids,
+                set(metadata_ids_in_significant_domains),
+                start_time_ts,
+                end_time_ts,
+                run_start_ts,
+                significant_changes_only,
+                include_start_time_state,
+                no_attributes,
+            )
+            if rows is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return rows
+
+    def _get_significant_states_rows(
+        self,
+        metadata_ids: list[int],
+        significant_domain_metadata_ids: set[int],
+        start_time_ts: float,
+        end_time_ts: float | None,
+        run_start_ts: float | None,
+        significant_changes_only: bool,
+        include_start_time_state: bool,
+        no_attributes: bool,
+    ) -> list[HotTierRow] | None:
+        """Return rows matching the significant states query, the lock must be held."""
+        if start_time_ts <= self._covered_since or (
+            include_start_time_state and run_start_ts is None
+        ):
+            return None
+        metadata_id_covered_since = self._metadata_id_covered_since
+        for metadata_id in metadata_ids:
+            if start_time_ts <= metadata_id_covered_since.get(metadata_id, 0):
+                return None
+
+        # The database looks up the start state for a single entity without
+        # regard to the recorder run so we can only answer from memory if we
+        # hold a state from before the start time.
+        single_metadata_id = len(metadata_ids) == 1
+        values = self._interned.values
+        include_last_changed = not significant_changes_only
+        rows: list[HotTierRow] = []
+        for metadata_id in sorted(metadata_ids):
+            if (entity_columns := self._columns.get(metadata_id)) is None:
+                if include_start_time_state and single_metadata_id:
+                    return None
+                continue
+            last_updated = entity_columns.last_updated_ts
+            last_changed = entity_columns.last_changed_ts
+            state_idx = entity_columns.state_idx
+            attributes_idx = entity_columns.attributes_idx
+            start = bisect_right(last_updated, start_time_ts)
+            end = (
+                bisect_left(last_updated, end_time_ts, start)
+                if end_time_ts
+                else len(last_updated)
+            )
+            if include_start_time_state:
+                start_state_idx = bisect_left(last_updated, start_time_ts) - 1
+                if start_state_idx >= 0 and (
+                    single_metadata_id or last_updated[start_state_idx] >= run_start_ts  # type: ignore[operator]
+                ):
+                    rows.append(
+                        HotTierRow(
+                            metadata_id,
+                            values[state_idx[start_state_idx]],
+                            0,
+                            None,
+                            None
+                            if no_attributes
+                            else values[attributes_idx[start_state_idx]],
+                        )
+                    )
+                elif single_metadata_id:
+                    return None
+            significant_domain = metadata_id in significant_domain_metadata_ids
+            for idx in range(start, end):
+                last_changed_ts = last_changed[idx]
+                if (
+                    significant_changes_only
+                    and not significant_domain
+                    and last_changed_ts
+                    and last_changed_ts != last_updated[idx]
+                ):
+                    continue
+                rows.append(
+                    HotTierRow(
+                        metadata_id,
+                        values[state_idx[idx]],
+                        last_updated[idx],
+                        (last_changed_ts or None) if include_last_changed else None,
+                        None if no_attributes else values[attributes_idx[idx]],
+                    )
+                )
+        return rows
+
+    def get_stats(self) -> dict[str, Any]:
+        """Return the hit/miss counters and size of the tier."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "entities": len(self._columns),
+                "rows": self._rows,
+                "memory_usage": self.memory_usage,
+                "covered_since": self._covered_since if self.active else None,
+            }
@@ -9,13 +9,14 @@ from dataclasses import dataclass
 from datetime import datetime
 import logging
 import threading
+import time
 from typing import TYPE_CHECKING, Any
 
 from homeassistant.helpers.typing import UndefinedType
 from homeassistant.util.event_type import EventType
 
 from . import entity_registry, purge, statistics
-from .const import DOMAIN
+from .const import DOMAIN, INTEGRATION_PLATFORM_RECORD_STATE_CHANGED
 from .db_schema import Statistics, StatisticsShortTerm
 from .models import StatisticData, StatisticMetaData
 from .util import periodic_db_cleanups, session_scope
@@ -25,6 +26,7 @@ _LOGGER = logging.getLogger(__name__)
 
 if TYPE_CHECKING:
     from .core import Recorder
+    from .purge_planner import PurgeProgress
 
 
 @dataclass(slots=True)
@@ -108,12 +110,27 @@ class PurgeTask(RecorderTask):
     purge_before: datetime
     repack: bool
     apply_filter: bool
+    resume: PurgeProgress | None = None
 
     def run(self, instance: Recorder) -> None:
         """Purge the database."""
-        if purge.purge_old_data(
-            instance, self.purge_before, self.repack, self.apply_filter
-        ):
+        planner = instance.purge_planner
+        progress = planner.start_chunk(
+            self.purge_before, self.repack, self.apply_filter, self.resume
+        )
+        start = time.monotonic()
+        finished = purge.purge_old_data(
+            instance,
+            self.purge_before,
+            self.repack,
+            self.apply_filter,
+            events_batch_size=planner.events_batches,
+            states_batch_size=planner.states_batches,
+            progress=progress,
+        )
+        planner.finish_chunk(time.monotonic() - start, finished)
+        instance.save_purge_progress(progress)
+        if finished:
             with instance.get_session() as session:
                 instance.recorder_runs_manager.load_from_db(session)
             # We always need to do the db cleanups after a purge
@@ -121,7 +138,8 @@ class PurgeTask(RecorderTask):
             # tasks happen after a vacuum.
             periodic_db_cleanups(instance)
             return
-        # Schedule a new purge task if this one didn't finish
+        # Schedule a new purge task if this one didn't finish, events
+        # which were queued meanwhile are processed before it runs
         instance.queue_task(
             PurgeTask(self.purge_before, self.repack, self.apply_filter)
         )
@@ -291,6 +309,17 @@ class CommitTask(RecorderTask):
         instance._commit_event_session_or_retry()  # noqa: SLF001
 
 
+@dataclass(slots=True)
+class EventListenerStartedTask(RecorderTask):
+    """Mark that events may have been missed before the event listener started."""
+
+    commit_before = False
+
+    def run(self, instance: Recorder) -> None:
+        """Handle the task."""
+        instance.events_complete_since = None
+
+
 @dataclass(slots=True)
 class AddRecorderPlatformTask(RecorderTask):
     """Add a recorder platform."""
@@ -306,6 +335,10 @@ class AddRecorderPlatformTask(RecorderTask):
         platform = self.platform
         platforms: dict[str, Any] = hass.data[DOMAIN].recorder_platforms
         platforms[domain] = platform
+        if record_state_changed := getattr(
+            platform, INTEGRATION_PLATFORM_RECORD_STATE_CHANGED, None
+        ):
+            instance.record_state_changed_platforms[domain] = record_state_changed
 
 
 @dataclass(slots=True)
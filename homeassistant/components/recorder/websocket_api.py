@@ -78,6 +78,7 @@ def async_setup(hass: HomeAssistant) -> None:
     websocket_api.async_register_command(hass, ws_get_statistics_during_period)
     websocket_api.async_register_command(hass, ws_get_statistics_metadata)
     websocket_api.async_register_command(hass, ws_list_statistic_ids)
+    websocket_api.async_register_command(hass, ws_purge_progress)
     websocket_api.async_register_command(hass, ws_import_statistics)
     websocket_api.async_register_command(hass, ws_update_statistics_metadata)
     websocket_api.async_register_command(hass, ws_validate_statistics)
@@ -291,6 +292,21 @@ async def ws_validate_statistics(
     connection.send_result(msg["id"], statistic_ids)
 
 
+@websocket_api.require_admin
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "recorder/purge_progress",
+    }
+)
+@callback
+def ws_purge_progress(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Return the progress of the current or last purge."""
+    progress = get_instance(hass).purge_planner.progress
+    connection.send_result(msg["id"], progress.summary() if progress else None)
+
+
 @websocket_api.require_admin
 @websocket_api.websocket_command(
     {
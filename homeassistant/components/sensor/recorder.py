@@ -30,12 +30,19 @@ from homeassistant.const import (
     UnitOfSoundPressure,
     UnitOfVolume,
 )
-from homeassistant.core import HomeAssistant, State, split_entity_id
+from homeassistant.core import (
+    Event,
+    EventStateChangedData,
+    HomeAssistant,
+    State,
+    split_entity_id,
+)
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity import entity_sources
 from homeassistant.loader import async_suggest_report_issue
 from homeassistant.util import dt as dt_util
 from homeassistant.util.enum import try_parse_enum
+from homeassistant.util.hass_dict import HassKey
 
 from .const import (
     ATTR_LAST_RESET,
@@ -44,6 +51,7 @@ from .const import (
     SensorStateClass,
     UnitOfVolumeFlowRate,
 )
+from .statistics_accumulator import StatisticsAccumulator, WindowStatistics
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -73,6 +81,10 @@ WARN_UNSTABLE_UNIT = "sensor_warn_unstable_unit"
 # Link to dev statistics where issues around LTS can be fixed
 LINK_DEV_STATISTICS = "https://my.home-assistant.io/redirect/developer_statistics"
 
+DATA_STATISTICS_ACCUMULATOR: HassKey[StatisticsAccumulator] = HassKey(
+    "sensor_statistics_accumulator"
+)
+
 
 def _get_sensor_states(hass: HomeAssistant) -> list[State]:
     """Get the current state of all sensors for which to compile statistics."""
@@ -93,6 +105,39 @@ def _get_sensor_states(hass: HomeAssistant) -> list[State]:
     ]
 
 
+def _get_statistics_accumulator(hass: HomeAssistant) -> StatisticsAccumulator | None:
+    """Return the statistics accumulator if it has seen all recorded events."""
+    if (
+        accumulator := hass.data.get(DATA_STATISTICS_ACCUMULATOR)
+    ) and accumulator.complete_since == get_instance(hass).events_complete_since:
+        return accumulator
+    return None
+
+
+def record_state_changed(
+    hass: HomeAssistant, event: Event[EventStateChangedData]
+) -> None:
+    """Add a changed sensor state to the statistics accumulator."""
+    if (new_state := event.data["new_state"]) is None or new_state.domain != DOMAIN:
+        return
+    if not (accumulator := _get_statistics_accumulator(hass)):
+        # The accumulator is recreated when the recorder may have missed events
+        instance = get_instance(hass)
+        assert instance.events_complete_since is not None
+        entity_filter = instance.entity_filter
+        accumulator = StatisticsAccumulator(
+            instance.events_complete_since,
+            dt_util.utcnow().timestamp(),
+            [
+                state
+                for state in hass.states.all(DOMAIN)
+                if not entity_filter or entity_filter(state.entity_id)
+            ],
+        )
+        hass.data[DATA_STATISTICS_ACCUMULATOR] = accumulator
+    accumulator.add(new_state)
+
+
 def _time_weighted_average(
     fstates: list[tuple[float, State]], start: datetime.datetime, end: datetime.datetime
 ) -> float:
@@ -399,9 +444,52 @@ def compile_statistics(  # noqa: C901
 
     sensor_states = _get_sensor_states(hass)
     wanted_statistics = _wanted_statistics(sensor_states)
+
+    # Use the states accumulated on the recorder thread when they cover
+    # the whole window, the history is only fetched for the other sensors
+    accumulated: dict[str, WindowStatistics] = {}
+    if (accumulator := _get_statistics_accumulator(hass)) and (
+        window := accumulator.pop_window(
+            start.timestamp(), dt_util.utcnow().timestamp()
+        )
+    ):
+        for _state in sensor_states:
+            if window_statistics := window.get(
+                _state.entity_id, _state.attributes[ATTR_STATE_CLASS]
+            ):
+                accumulated[_state.entity_id] = window_statistics
+
+    # The running mean, min and max can only be used as is when the
+    # unit did not change and matches the unit of the statistics
+    accumulated_metadatas = statistics.get_metadata_with_session(
+        get_instance(hass),
+        session,
+        statistic_ids={
+            entity_id
+            for entity_id, window_statistics in accumulated.items()
+            if window_statistics.float_states is None and window_statistics.count
+        },
+    )
+    accumulated_units: dict[str, str | None] = {}
+    for entity_id, window_statistics in list(accumulated.items()):
+        if window_statistics.float_states is not None or not window_statistics.count:
+            continue
+        statistics_unit = window_statistics.unit
+        if entity_id in accumulated_metadatas:
+            statistics_unit = accumulated_metadatas[entity_id][1]["unit_of_measurement"]
+        if window_statistics.unit_stable and (
+            window_statistics.unit == statistics_unit
+            or statistics_unit not in statistics.STATISTIC_UNIT_TO_UNIT_CONVERTER
+        ):
+            accumulated_units[entity_id] = window_statistics.unit
+        else:
+            del accumulated[entity_id]
+
     # Get history between start and end
     entities_full_history = [
-        i.entity_id for i in sensor_states if "sum" in wanted_statistics[i.entity_id]
+        i.entity_id
+        for i in sensor_states
+        if "sum" in wanted_statistics[i.entity_id] and i.entity_id not in accumulated
     ]
     history_list: dict[str, list[State]] = {}
     if entities_full_history:
@@ -417,6 +505,7 @@ def compile_statistics(  # noqa: C901
         i.entity_id
         for i in sensor_states
         if "sum" not in wanted_statistics[i.entity_id]
+        and i.entity_id not in accumulated
     ]
     if entities_significant_history:
         _history_list = history.get_full_significant_states_with_session(
@@ -431,6 +520,10 @@ def compile_statistics(  # noqa: C901
     entities_with_float_states: dict[str, list[tuple[float, State]]] = {}
     for _state in sensor_states:
         entity_id = _state.entity_id
+        if window_statistics := accumulated.get(entity_id):
+            if window_statistics.float_states:
+                entities_with_float_states[entity_id] = window_statistics.float_states
+            continue
         # If there are no recent state changes, the sensor's state may already be pruned
         # from the recorder. Get the state from the state machine instead.
         if not (entity_history := history_list.get(entity_id, [_state])):
@@ -446,10 +539,30 @@ def compile_statistics(  # noqa: C901
     old_metadatas = statistics.get_metadata_with_session(
         get_instance(hass), session, statistic_ids=set(entities_with_float_states)
     )
-    to_process: list[tuple[str, str | None, str, list[tuple[float, State]]]] = []
+    old_metadatas.update(accumulated_metadatas)
+    to_process: list[
+        tuple[
+            str,
+            str | None,
+            str,
+            list[tuple[float, State]],
+            WindowStatistics | None,
+        ]
+    ] = []
     to_query: set[str] = set()
     for _state in sensor_states:
         entity_id = _state.entity_id
+        if entity_id in accumulated_units:
+            to_process.append(
+                (
+                    entity_id,
+                    accumulated_units[entity_id],
+                    _state.attributes[ATTR_STATE_CLASS],
+                    [],
+                    accumulated[entity_id],
+                )
+            )
+            continue
         if not (maybe_float_states := entities_with_float_states.get(entity_id)):
             continue
         statistics_unit, valid_float_states = _normalize_states(
@@ -461,7 +574,9 @@ def compile_statistics(  # noqa: C901
         if not valid_float_states:
             continue
         state_class: str = _state.attributes[ATTR_STATE_CLASS]
-        to_process.append((entity_id, statistics_unit, state_class, valid_float_states))
+        to_process.append(
+            (entity_id, statistics_unit, state_class, valid_float_states, None)
+        )
         if "sum" in wanted_statistics[entity_id]:
             to_query.add(entity_id)
 
@@ -473,6 +588,7 @@ def compile_statistics(  # noqa: C901
         statistics_unit,
         state_class,
         valid_float_states,
+        window_statistics,
     ) in to_process:
         # Check metadata
         if old_metadata := old_metadatas.get(entity_id):
@@ -511,6 +627,15 @@ def compile_statistics(  # noqa: C901
 
         # Make calculations
         stat: StatisticData = {"start": start}
+        if window_statistics is not None:
+            # Only sensors with state class measurement are accumulated
+            # with a running mean, min and max
+            stat["max"] = window_statistics.max
+            stat["min"] = window_statistics.min
+            stat["mean"] = window_statistics.mean(end.timestamp())
+            result.append({"meta": meta, "stat": stat})
+            continue
+
         if "max" in wanted_statistics[entity_id]:
             stat["max"] = max(
                 *itertools.islice(zip(*valid_float_states, strict=False), 1)
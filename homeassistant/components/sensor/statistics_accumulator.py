@@ -0,0 +1,264 @@
+"""Accumulate sensor states for compiling short term statistics."""
+
+from __future__ import annotations
+
+import math
+
+from homeassistant.const import ATTR_UNIT_OF_MEASUREMENT
+from homeassistant.core import State
+
+from .const import ATTR_STATE_CLASS, SensorStateClass
+
+# The length of a short term statistics window in seconds
+WINDOW_SECONDS = 300
+
+# Closed windows are kept until the statistics for them have been
+# compiled, if compiling is delayed the database is used instead
+MAX_CLOSED_WINDOWS = 3
+
+
+def _window_start(timestamp: float) -> float:
+    """Return the start of the window which contains timestamp."""
+    return timestamp - timestamp % WINDOW_SECONDS
+
+
+def _float_or_none(state: State) -> float | None:
+    """Return the state as a finite float or None."""
+    try:
+        value = float(state.state)
+    except (ValueError, TypeError):
+        return None
+    return value if math.isfinite(value) else None
+
+
+class WindowStatistics:
+    """Statistics of a sensor accumulated during a short term statistics window.
+
+    The state from before the window is added first, it is
+    counted as if it was set at the start of the window.
+
+    Sensors with state class measurement keep a running time weighted
+    mean, min and max. Other sensors keep the float states since the
+    sum is calculated together with the previously compiled statistics.
+    """
+
+    __slots__ = (
+        "complete",
+        "count",
+        "first_ts",
+        "float_states",
+        "integral",
+        "last_ts",
+        "last_value",
+        "max",
+        "min",
+        "start_ts",
+        "state_class",
+        "unit",
+        "unit_stable",
+    )
+
+    def __init__(
+        self, state_class: str, start_ts: float, start_state: State | None
+    ) -> None:
+        """Initialize the window statistics."""
+        self.state_class = state_class
+        self.start_ts = start_ts
+        # False if a state was missed or arrived out of order
+        self.complete = True
+        self.count = 0
+        self.unit: str | None = None
+        self.unit_stable = True
+        self.float_states: list[tuple[float, State]] | None = (
+            None if state_class == SensorStateClass.MEASUREMENT else []
+        )
+        self.first_ts: float | None = None
+        self.last_ts = 0.0
+        self.last_value = 0.0
+        self.integral = 0.0
+        self.min = 0.0
+        self.max = 0.0
+        if start_state is not None:
+            self.add(start_state)
+
+    def add(self, state: State) -> None:
+        """Add a state to the window."""
+        if (value := _float_or_none(state)) is None:
+            return
+        unit = state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
+        if not self.count:
+            self.unit = unit
+        elif unit != self.unit:
+            self.unit_stable = False
+        self.count += 1
+
+        if self.float_states is not None:
+            self.float_states.append((value, state))
+            return
+
+        timestamp = max(state.last_updated_timestamp, self.start_ts)
+        if self.first_ts is None:
+            self.first_ts = timestamp
+            self.min = self.max = value
+        else:
+            # Accumulate the value, weighted by duration until this state change
+            self.integral += self.last_value * (timestamp - self.last_ts)
+            if value < self.min:
+                self.min = value
+            elif value > self.max:
+                self.max = value
+        self.last_value = value
+        self.last_ts = timestamp
+
+    def mean(self, end_ts: float) -> float:
+        """Return the time weighted average until end_ts.
+
+        This matches the calculation of the average from the database,
+        there's no interpolation of values between state changes.
+        """
+        assert self.first_ts is not None
+        if not (period_seconds := end_ts - self.first_ts):
+            return 0.0
+        integral = self.integral + self.last_value * (end_ts - self.last_ts)
+        return integral / period_seconds
+
+
+class ClosedWindow:
+    """A short term statistics window which can no longer change."""
+
+    __slots__ = ("_invalid", "_last_states", "_windows", "start_ts")
+
+    def __init__(
+        self,
+        start_ts: float,
+        windows: dict[str, WindowStatistics],
+        last_states: dict[str, State],
+    ) -> None:
+        """Initialize the closed window."""
+        self.start_ts = start_ts
+        self._windows = windows
+        self._last_states = last_states
+        # Entities which had a state added after the window was closed
+        self._invalid: set[str] = set()
+
+    def invalidate(self, entity_id: str) -> None:
+        """Mark the statistics of an entity as not known."""
+        self._invalid.add(entity_id)
+
+    def get(self, entity_id: str, state_class: str) -> WindowStatistics | None:
+        """Return the statistics for an entity or None if they are not known."""
+        if entity_id in self._invalid:
+            return None
+        if (window := self._windows.get(entity_id)) is None:
+            # The sensor did not change during the window
+            if (last_state := self._last_states.get(entity_id)) is None:
+                return None
+            window = WindowStatistics(state_class, self.start_ts, last_state)
+        if not window.complete or window.state_class != state_class:
+            return None
+        return window
+
+
+class StatisticsAccumulator:
+    """Accumulate sensor states on the recorder thread.
+
+    The accumulator is seeded with the current state of all recorded
+    sensors and must be fed every state change after that, windows which
+    started before it was created must be compiled from the database.
+    """
+
+    def __init__(
+        self, complete_since: float, created: float, sensor_states: list[State]
+    ) -> None:
+        """Initialize the accumulator with the current sensor states."""
+        self.complete_since = complete_since
+        self.created = created
+        self._window_start_ts = _window_start(created)
+        self._window_end_ts = self._window_start_ts + WINDOW_SECONDS
+        self._windows: dict[str, WindowStatistics] = {}
+        self._closed: dict[float, ClosedWindow] = {}
+        self._last_states: dict[str, State] = {
+            state.entity_id: state for state in sensor_states
+        }
+
+    def add(self, state: State) -> None:
+        """Add a state.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        timestamp = state.last_updated_timestamp
+        if timestamp >= self._window_end_ts:
+            self._close_window(timestamp)
+        entity_id = state.entity_id
+        last_state = self._last_states.get(entity_id)
+        # Events which were queued before the accumulator was
+        # created may be older than the state it was seeded with
+        if last_state is None or timestamp >= last_state.last_updated_timestamp:
+            self._last_states[entity_id] = state
+        if timestamp < self._window_start_ts:
+            # The state arrived late, windows which have already been
+            # closed since the state was set can't be used for the entity
+            window_start_ts = _window_start(timestamp)
+            for start_ts, closed_window in self._closed.items():
+                if start_ts >= window_start_ts:
+                    closed_window.invalidate(entity_id)
+
+        if not (state_class := state.attributes.get(ATTR_STATE_CLASS)):
+            if window := self._windows.get(entity_id):
+                window.complete = False
+            return
+        if (window := self._windows.get(entity_id)) is None:
+            window = WindowStatistics(state_class, self._window_start_ts, last_state)
+            self._windows[entity_id] = window
+            if (
+                last_state is not None
+                and last_state.last_updated_timestamp >= self._window_start_ts
+            ):
+                # The sensor had no state class earlier in the window
+                window.complete = False
+        elif window.state_class != state_class:
+            window.complete = False
+        if timestamp < self._window_start_ts:
+            window.complete = False
+
+        # Only significant changes are used for the mean, min and max
+        if window.float_states is not None or state.last_changed_timestamp == timestamp:
+            window.add(state)
+
+    def _close_window(self, timestamp: float) -> None:
+        """Close the current window and start the window containing timestamp."""
+        window_start_ts = self._window_start_ts
+        last_states = dict(self._last_states)
+        new_window_start_ts = _window_start(timestamp)
+        windows = self._windows
+        if (
+            oldest_ts := new_window_start_ts - MAX_CLOSED_WINDOWS * WINDOW_SECONDS
+        ) > window_start_ts:
+            window_start_ts = oldest_ts
+            windows = {}
+        # Nothing changed during windows skipped without any states
+        while window_start_ts < new_window_start_ts:
+            self._closed[window_start_ts] = ClosedWindow(
+                window_start_ts, windows, last_states
+            )
+            window_start_ts += WINDOW_SECONDS
+            windows = {}
+        while len(self._closed) > MAX_CLOSED_WINDOWS:
+            del self._closed[next(iter(self._closed))]
+        self._windows = {}
+        self._window_start_ts = new_window_start_ts
+        self._window_end_ts = new_window_start_ts + WINDOW_SECONDS
+
+    def pop_window(self, start_ts: float, now_ts: float) -> ClosedWindow | None:
+        """Return the closed window starting at start_ts or None if it is not known.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        if start_ts < self.created:
+            return None
+        if start_ts == self._window_start_ts and now_ts >= self._window_end_ts:
+            # No states have been added since the window ended
+            self._close_window(now_ts)
+        return self._closed.pop(start_ts, None)
@@ -27,7 +27,7 @@ from .const import (
 )
 
 if TYPE_CHECKING:
-    from av import CodecContext, Packet
+    from av import CodecContext, Packet, VideoFrame
 
     from homeassistant.components.camera import DynamicStreamSettings
 
@@ -102,6 +102,8 @@ class Segment:
     hls_num_parts_rendered: int = 0
     # Set to true when all the parts are rendered
     hls_playlist_complete: bool = False
+    # The joined data of the parts once the Segment is complete
+    _data: bytes | None = None
 
     def __post_init__(self) -> None:
         """Run after init."""
@@ -139,8 +141,16 @@ class Segment:
             output.part_put()
 
     def get_data(self) -> bytes:
-        """Return reconstructed data for all parts as bytes, without init."""
-        return b"".join([part.data for part in self.parts])
+        """Return reconstructed data for all parts as bytes, without init.
+
+        The data of a complete Segment is joined once and reused.
+        """
+        if self._data is not None:
+            return self._data
+        data = b"".join([part.data for part in self.parts])
+        if self.complete:
+            self._data = data
+        return data
 
     def _render_hls_template(self, last_stream_id: int, render_parts: bool) -> str:
         """Render the HLS playlist section for the Segment.
@@ -427,6 +437,8 @@ class KeyFrameConverter:
         _generate_image will clear the packet, so there will only be one attempt per packet
     If successful, self._image will be updated and returned by get_image
     If unsuccessful, get_image will return the previous image
+    The decoded frame of the keyframe is kept to scale it to other sizes and the
+    encoded images are cached per size until the next keyframe is decoded.
     """
 
     def __init__(
@@ -446,6 +458,9 @@ class KeyFrameConverter:
         self._event: asyncio.Event = asyncio.Event()
         self._hass = hass
         self._image: bytes | None = None
+        self._frame: VideoFrame | None = None
+        # Encoded images of the frame by width, height and orientation
+        self._images: dict[tuple[int | None, int | None, int], bytes] = {}
         self._turbojpeg = TurboJPEGSingleton.instance()
         self._lock = asyncio.Lock()
         self._codec_context: CodecContext | None = None
@@ -484,7 +499,7 @@ class KeyFrameConverter:
         """Transform image to a given orientation."""
         return TRANSFORM_IMAGE_FUNCTION[orientation](image)
 
-    def _generate_image(self, width: int | None, height: int | None) -> None:
+    def _generate_image(self, width: int | None, height: int | None) -> bytes | None:
         """Generate the keyframe image.
 
         This is run in an executor thread, but since it is called within an
@@ -492,8 +507,33 @@ class KeyFrameConverter:
         at a time per instance.
         """
 
-        if not (self._turbojpeg and self._packet and self._codec_context):
-            return
+        if not (self._turbojpeg and self._codec_context):
+            return self._image
+        if self._packet:
+            self._decode_packet()
+        if (frame := self._frame) is None:
+            return self._image
+        if not (width and height):
+            width = height = None
+        orientation = self._dynamic_stream_settings.orientation
+        if (image := self._images.get((width, height, orientation))) is None:
+            if width and height:
+                if orientation >= 5:
+                    frame = frame.reformat(width=height, height=width)
+                else:
+                    frame = frame.reformat(width=width, height=height)
+            bgr_array = self.transform_image(
+                frame.to_ndarray(format="bgr24"), orientation
+            )
+            image = self._images[width, height, orientation] = bytes(
+                self._turbojpeg.encode(bgr_array)
+            )
+        self._image = image
+        return image
+
+    def _decode_packet(self) -> None:
+        """Decode the stashed keyframe and drop the images of the previous one."""
+        assert self._codec_context
         packet = self._packet
         self._packet = None
         for _ in range(2):  # Retry once if codec context needs to be flushed
@@ -513,17 +553,8 @@ class KeyFrameConverter:
             _LOGGER.debug("Unable to decode keyframe")
             return
         if frames:
-            frame = frames[0]
-            if width and height:
-                if self._dynamic_stream_settings.orientation >= 5:
-                    frame = frame.reformat(width=height, height=width)
-                else:
-                    frame = frame.reformat(width=width, height=height)
-            bgr_array = self.transform_image(
-                frame.to_ndarray(format="bgr24"),
-                self._dynamic_stream_settings.orientation,
-            )
-            self._image = bytes(self._turbojpeg.encode(bgr_array))
+            self._frame = frames[0]
+            self._images = {}
 
     async def async_get_image(
         self,
@@ -538,5 +569,6 @@ class KeyFrameConverter:
             self._event.clear()
             await self._event.wait()
         async with self._lock:
-            await self._hass.async_add_executor_job(self._generate_image, width, height)
-        return self._image
+            return await self._hass.async_add_executor_job(
+                self._generate_image, width, height
+            )
@@ -64,6 +64,9 @@ class HlsStreamOutput(StreamOutput):
             deque_maxlen=MAX_SEGMENTS,
         )
         self._target_duration = stream_settings.min_segment_duration
+        # The last rendered playlist keyed by the sequence, number of parts
+        # and duration of the last segment
+        self.playlist_cache: tuple[tuple[int, int, float], bytes] | None = None
 
     @property
     def name(self) -> str:
@@ -89,6 +92,7 @@ class HlsStreamOutput(StreamOutput):
         their GOPs periodically so we need to account for this change.
         """
         super()._async_put(segment)
+        self.playlist_cache = None
         self._target_duration = (
             max((s.duration for s in self._segments), default=segment.duration)
             or self.stream_settings.min_segment_duration
@@ -102,6 +106,7 @@ class HlsStreamOutput(StreamOutput):
     def _async_discontinuity(self) -> None:
         """Fix incomplete segment at end of deque in event loop."""
         # Fill in the segment duration or delete the segment if empty
+        self.playlist_cache = None
         if self._segments:
             if (last_segment := self._segments[-1]).parts:
                 last_segment.duration = sum(
@@ -232,6 +237,20 @@ class HlsPlaylistView(StreamView):
 
         return "\n".join(playlist) + "\n"
 
+    @classmethod
+    def render_cached(cls, track: HlsStreamOutput) -> bytes:
+        """Return the encoded HLS playlist, rendering it only if it changed.
+
+        Clients blocking on the same part are answered with the same playlist.
+        """
+        last_segment = cast(Segment, track.last_segment)
+        key = (last_segment.sequence, len(last_segment.parts), last_segment.duration)
+        if (cached := track.playlist_cache) is not None and cached[0] == key:
+            return cached[1]
+        playlist = cls.render(track).encode("utf-8")
+        track.playlist_cache = (key, playlist)
+        return playlist
+
     @staticmethod
     def bad_request(blocking: bool, target_duration: float) -> web.Response:
         """Return a HTTP Bad Request response."""
@@ -325,7 +344,7 @@ class HlsPlaylistView(StreamView):
                 return self.not_found(blocking_request, track.target_duration)
 
         response = web.Response(
-            body=self.render(track).encode("utf-8"),
+            body=self.render_cached(track),
             headers={
                 "Content-Type": FORMAT_CONTENT_TYPE[HLS_PROVIDER],
             },
@@ -4,8 +4,9 @@ from __future__ import annotations
 
 from typing import Final, cast
 
+import voluptuous as vol
+
 from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.typing import ConfigType, VolSchemaType
 from homeassistant.loader import bind_hass
 
@@ -44,7 +45,22 @@ DOMAIN: Final = const.DOMAIN
 
 DEPENDENCIES: Final[tuple[str]] = ("http",)
 
-CONFIG_SCHEMA = cv.empty_config_schema(DOMAIN)
+CONFIG_SCHEMA = vol.Schema(
+    {
+        vol.Optional(DOMAIN): vol.Any(
+            None,
+            vol.Schema(
+                {
+                    # 0 disables permessage-deflate
+                    vol.Optional(const.CONF_COMPRESSION_LEVEL): vol.All(
+                        vol.Coerce(int), vol.Range(min=0, max=9)
+                    ),
+                }
+            ),
+        )
+    },
+    extra=vol.ALLOW_EXTRA,
+)
 
 
 @bind_hass
@@ -69,6 +85,10 @@ def async_register_command(
 
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Initialize the websocket API."""
+    if (conf := config.get(DOMAIN)) and (
+        level := conf.get(const.CONF_COMPRESSION_LEVEL)
+    ) is not None:
+        hass.data[const.DATA_COMPRESSION_LEVEL] = level
     hass.http.register_view(http.WebsocketAPIView())
     commands.async_register_commands(hass, async_register_command)
     return True
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from collections.abc import Callable
+from dataclasses import asdict
 from functools import lru_cache, partial
 import json
 import logging
@@ -39,6 +40,7 @@ from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.event import (
     TrackTemplate,
     TrackTemplateResult,
+    async_get_template_render_stats,
     async_track_template_result,
 )
 from homeassistant.helpers.json import (
@@ -59,13 +61,29 @@ from homeassistant.setup import async_get_loaded_integrations, async_get_setup_t
 from homeassistant.util.json import format_unserializable_data
 
 from . import const, decorators, messages
+from .compression import snapshot_message
 from .connection import ActiveConnection
+from .entities_hub import async_get_entities_hub
 from .messages import construct_result_message
+from .msgpack import msgpack_bytes, msgpack_map_header
 
 ALL_SERVICE_DESCRIPTIONS_JSON_CACHE = "websocket_api_all_service_descriptions_json"
 
 _LOGGER = logging.getLogger(__name__)
 
+# {"type": "event", "event": {"a": ... followed by the added states and the id
+_MSGPACK_ENTITIES_INIT_PREFIX = b"".join(
+    (
+        msgpack_map_header(3),
+        msgpack_bytes("type"),
+        msgpack_bytes("event"),
+        msgpack_bytes("event"),
+        msgpack_map_header(1),
+        msgpack_bytes(messages.ENTITY_EVENT_ADD),
+    )
+)
+_MSGPACK_ID_KEY = msgpack_bytes("id")
+
 
 @callback
 def async_register_commands(
@@ -74,6 +92,7 @@ def async_register_commands(
 ) -> None:
     """Register commands."""
     async_reg(hass, handle_call_service)
+    async_reg(hass, handle_connection_stats)
     async_reg(hass, handle_entity_source)
     async_reg(hass, handle_execute_script)
     async_reg(hass, handle_fire_event)
@@ -93,6 +112,7 @@ def async_register_commands(
     async_reg(hass, handle_validate_config)
     async_reg(hass, handle_subscribe_entities)
     async_reg(hass, handle_supported_features)
+    async_reg(hass, handle_template_render_stats)
     async_reg(hass, handle_integration_descriptions)
 
 
@@ -106,6 +126,7 @@ def _forward_events_check_permissions(
     send_message: Callable[[bytes | str | dict[str, Any]], None],
     user: User,
     message_id_as_bytes: bytes,
+    cached_message: Callable[[bytes, Event], bytes],
     event: Event,
 ) -> None:
     """Forward state changed events to websocket."""
@@ -118,17 +139,18 @@ def _forward_events_check_permissions(
         and not permissions.check_entity(event.data["entity_id"], POLICY_READ)
     ):
         return
-    send_message(messages.cached_event_message(message_id_as_bytes, event))
+    send_message(cached_message(message_id_as_bytes, event))
 
 
 @callback
 def _forward_events_unconditional(
     send_message: Callable[[bytes | str | dict[str, Any]], None],
     message_id_as_bytes: bytes,
+    cached_message: Callable[[bytes, Event], bytes],
     event: Event,
 ) -> None:
     """Forward events to websocket."""
-    send_message(messages.cached_event_message(message_id_as_bytes, event))
+    send_message(cached_message(message_id_as_bytes, event))
 
 
 @callback
@@ -152,7 +174,12 @@ def handle_subscribe_events(
         )
         raise Unauthorized(user_id=connection.user.id)
 
-    message_id_as_bytes = str(msg["id"]).encode()
+    if connection.msgpack:
+        message_id_as_bytes = msgpack_bytes(msg["id"])
+        cached_message = messages.cached_event_msgpack_message
+    else:
+        message_id_as_bytes = str(msg["id"]).encode()
+        cached_message = messages.cached_event_message
 
     if event_type == EVENT_STATE_CHANGED:
         forward_events = partial(
@@ -160,10 +187,14 @@ def handle_subscribe_events(
             connection.send_message,
             connection.user,
             message_id_as_bytes,
+            cached_message,
         )
     else:
         forward_events = partial(
-            _forward_events_unconditional, connection.send_message, message_id_as_bytes
+            _forward_events_unconditional,
+            connection.send_message,
+            message_id_as_bytes,
+            cached_message,
         )
 
     connection.subscriptions[msg["id"]] = hass.bus.async_listen(
@@ -355,43 +386,34 @@ def handle_get_states(
 def _send_handle_get_states_response(
     connection: ActiveConnection, msg_id: int, serialized_states: list[bytes]
 ) -> None:
-    """Send handle get states response."""
+    """Send handle get states response.
+
+    The id is sent last so the states can be compressed once for the
+    connections that request them together.
+    """
     connection.send_message(
-        construct_result_message(
-            msg_id, b"".join((b"[", b",".join(serialized_states), b"]"))
+        snapshot_message(
+            b"".join(
+                (
+                    b'{"type":"result","success":true,"result":[',
+                    b",".join(serialized_states),
+                    b"]",
+                )
+            ),
+            b"".join((b',"id":', str(msg_id).encode(), b"}")),
         )
     )
 
 
-@callback
-def _forward_entity_changes(
-    send_message: Callable[[str | bytes | dict[str, Any]], None],
-    entity_ids: set[str],
-    user: User,
-    message_id_as_bytes: bytes,
-    event: Event[EventStateChangedData],
-) -> None:
-    """Forward entity state changed events to websocket."""
-    entity_id = event.data["entity_id"]
-    if entity_ids and entity_id not in entity_ids:
-        return
-    # We have to lookup the permissions again because the user might have
-    # changed since the subscription was created.
-    permissions = user.permissions
-    if (
-        not user.is_admin
-        and not permissions.access_all_entities(POLICY_READ)
-        and not permissions.check_entity(event.data["entity_id"], POLICY_READ)
-    ):
-        return
-    send_message(messages.cached_state_diff_message(message_id_as_bytes, event))
-
-
 @callback
 @decorators.websocket_command(
     {
         vol.Required("type"): "subscribe_entities",
         vol.Optional("entity_ids"): cv.entity_ids,
+        vol.Optional("merge_diffs", default=False): cv.boolean,
+        vol.Optional("max_latency", default=const.MERGE_MAX_LATENCY): vol.All(
+            vol.Coerce(float), vol.Range(min=0, max=const.PENDING_MSG_PEAK_TIME)
+        ),
     }
 )
 def handle_subscribe_entities(
@@ -403,19 +425,24 @@ def handle_subscribe_entities(
     # state changed events or we will introduce a race condition
     # where some states are missed
     states = _async_get_allowed_states(hass, connection)
-    message_id_as_bytes = str(msg["id"]).encode()
-    connection.subscriptions[msg["id"]] = hass.bus.async_listen(
-        EVENT_STATE_CHANGED,
-        partial(
-            _forward_entity_changes,
-            connection.send_message,
-            entity_ids,
-            connection.user,
-            message_id_as_bytes,
-        ),
+    use_msgpack = connection.msgpack
+    connection.subscriptions[msg["id"]] = async_get_entities_hub(hass).async_subscribe(
+        connection.send_message,
+        connection.user,
+        msgpack_bytes(msg["id"]) if use_msgpack else str(msg["id"]).encode(),
+        entity_ids,
+        connection if msg["merge_diffs"] else None,
+        msg["max_latency"],
+        use_msgpack,
     )
     connection.send_result(msg["id"])
 
+    if use_msgpack:
+        _send_handle_entities_init_msgpack_response(
+            connection, msg["id"], states, entity_ids
+        )
+        return
+
     # JSON serialize here so we can recover if it blows up due to the
     # state machine containing unserializable data. This command is required
     # to succeed for the UI to show.
@@ -449,16 +476,59 @@ def handle_subscribe_entities(
 def _send_handle_entities_init_response(
     connection: ActiveConnection, msg_id: int, serialized_states: list[bytes]
 ) -> None:
-    """Send handle entities init response."""
+    """Send handle entities init response.
+
+    The id is sent last so the states can be compressed once for the
+    connections that subscribe together.
+    """
     connection.send_message(
-        b"".join(
-            (
-                b'{"id":',
-                str(msg_id).encode(),
-                b',"type":"event","event":{"a":{',
-                b",".join(serialized_states),
-                b"}}}",
+        snapshot_message(
+            b"".join(
+                (
+                    b'{"type":"event","event":{"a":{',
+                    b",".join(serialized_states),
+                    b"}}",
+                )
+            ),
+            b"".join((b',"id":', str(msg_id).encode(), b"}")),
+        )
+    )
+
+
+def _send_handle_entities_init_msgpack_response(
+    connection: ActiveConnection,
+    msg_id: int,
+    states: list[State],
+    entity_ids: set[str],
+) -> None:
+    """Send handle entities init response as MessagePack.
+
+    The map of the added states is joined from the cached packed key
+    value pairs of the states.
+    """
+    serialized_states: list[bytes] = []
+    for state in states:
+        if entity_ids and state.entity_id not in entity_ids:
+            continue
+        try:
+            serialized_states.append(messages.compressed_state_msgpack(state))
+        except (ValueError, TypeError):
+            connection.logger.error(
+                "Unable to serialize to MessagePack. Bad data found at %s",
+                format_unserializable_data(
+                    find_paths_unserializable_data(state, dump=JSON_DUMP)
+                ),
             )
+    connection.send_message(
+        snapshot_message(
+            b"".join(
+                (
+                    _MSGPACK_ENTITIES_INIT_PREFIX,
+                    msgpack_map_header(len(serialized_states)),
+                    *serialized_states,
+                )
+            ),
+            _MSGPACK_ID_KEY + msgpack_bytes(msg_id),
         )
     )
 
@@ -547,6 +617,24 @@ def handle_integration_setup_info(
     )
 
 
+@callback
+@decorators.websocket_command({vol.Required("type"): "connection_stats"})
+def handle_connection_stats(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle connection stats command."""
+    connection.send_result(
+        msg["id"],
+        {
+            "queue_size": connection.queue_size(),
+            "merged_diffs": connection.merged_diffs,
+            "compression": (
+                compressor.stats if (compressor := connection.compressor) else None
+            ),
+        },
+    )
+
+
 @callback
 @decorators.websocket_command({vol.Required("type"): "ping"})
 def handle_ping(
@@ -660,6 +748,30 @@ async def handle_render_template(
     hass.loop.call_soon_threadsafe(info.async_refresh)
 
 
+@callback
+@decorators.websocket_command({vol.Required("type"): "template/render_stats"})
+@decorators.require_admin
+def handle_template_render_stats(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle template render stats command.
+
+    The tracked templates are sorted by their total render time, the
+    most expensive first.
+    """
+    connection.send_result(
+        msg["id"],
+        sorted(
+            (
+                {"template": template_str, **asdict(stats)}
+                for template_str, stats in async_get_template_render_stats(hass).items()
+            ),
+            key=lambda stats: stats["total_time"],
+            reverse=True,
+        ),
+    )
+
+
 def _serialize_entity_sources(
     entity_infos: dict[str, entity.EntityInfo],
 ) -> dict[str, Any]:
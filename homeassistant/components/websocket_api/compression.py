@@ -0,0 +1,211 @@
+"""Compress websocket messages with permessage-deflate."""
+
+from __future__ import annotations
+
+import struct
+from time import thread_time
+from typing import Any, Final
+import zlib
+
+from aiohttp import WSMsgType, __version__ as aiohttp_version
+from aiohttp.http_websocket import WebSocketWriter
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util.hass_dict import HassKey
+
+from .const import COMPRESS_MIN_SIZE, COMPRESS_SHARED_TIME
+
+DATA_SHARED_COMPRESSOR: HassKey[SharedCompressor] = HassKey(
+    "websocket_api_shared_compressor"
+)
+
+# send_compressed_frame writes to the internals of the aiohttp
+# WebSocketWriter, they have been checked for these aiohttp versions.
+# With any other version the stock writer compresses the messages.
+_COMPRESSED_FRAME_AIOHTTP_VERSIONS: Final = frozenset({"3.10.5"})
+
+SEND_COMPRESSED_FRAME_SUPPORTED: Final = (
+    aiohttp_version in _COMPRESSED_FRAME_AIOHTTP_VERSIONS
+)
+
+# Every compressed chunk ends with an empty stored block which is
+# removed from the end of a message as required by RFC 7692
+_DEFLATE_TRAILER: Final = b"\x00\x00\xff\xff"
+
+_FIN_RSV1: Final = 0x80 | 0x40
+_PACK_LEN1 = struct.Struct("!BB").pack
+_PACK_LEN2 = struct.Struct("!BBH").pack
+_PACK_LEN3 = struct.Struct("!BBQ").pack
+
+
+class SnapshotMessage(bytes):
+    """A message that starts with a snapshot shared by many connections.
+
+    Only the bytes after shared_length, like the message id, differ
+    between the connections.
+    """
+
+    shared_length: int
+
+
+def snapshot_message(shared: bytes, suffix: bytes) -> SnapshotMessage:
+    """Return a message made of a shared snapshot and a per connection suffix."""
+    message = SnapshotMessage(shared + suffix)
+    message.shared_length = len(shared)
+    return message
+
+
+class SharedCompressor:
+    """Compress snapshots once for the connections that request them together.
+
+    The compressed snapshots are kept for COMPRESS_SHARED_TIME seconds.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the shared compressor."""
+        self._loop = hass.loop
+        self._compressed: dict[tuple[int, int, bytes], bytes] = {}
+
+    def compress(self, level: int, wbits: int, data: bytes) -> tuple[bytes, bool]:
+        """Return the compressed data and if it was compressed before."""
+        key = (level, wbits, data)
+        if (compressed := self._compressed.get(key)) is not None:
+            return compressed, True
+        compressobj = zlib.compressobj(level, zlib.DEFLATED, -wbits)
+        compressed = compressobj.compress(data) + compressobj.flush(zlib.Z_SYNC_FLUSH)
+        self._compressed[key] = compressed
+        self._loop.call_later(COMPRESS_SHARED_TIME, self._compressed.pop, key, None)
+        return compressed, False
+
+
+class WebSocketCompressor:
+    """Compress the messages of a connection.
+
+    Snapshots compressed by the SharedCompressor are inserted in the deflate
+    stream of the connection. Since the client keeps the snapshot in its
+    window, the compression context continues with the end of the snapshot
+    as preset dictionary.
+    """
+
+    __slots__ = (
+        "level",
+        "wbits",
+        "_flush_mode",
+        "_shared",
+        "_compressobj",
+        "bytes_in",
+        "bytes_out",
+        "cpu_time",
+        "shared_hits",
+    )
+
+    def __init__(
+        self, hass: HomeAssistant, level: int, wbits: int, notakeover: bool
+    ) -> None:
+        """Initialize the compressor.
+
+        If the client asked for no context takeover, each message is
+        compressed without references to earlier messages.
+        """
+        self.level = level
+        self.wbits = wbits
+        self._flush_mode = zlib.Z_FULL_FLUSH if notakeover else zlib.Z_SYNC_FLUSH
+        self._shared = async_get_shared_compressor(hass)
+        self._compressobj = zlib.compressobj(level, zlib.DEFLATED, -wbits)
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.cpu_time = 0.0
+        self.shared_hits = 0
+
+    def compress(self, parts: list[bytes]) -> bytes | None:
+        """Compress the message made of parts or return None if it is too small."""
+        if (size := sum(map(len, parts))) < COMPRESS_MIN_SIZE:
+            return None
+        start = thread_time()
+        chunks: list[bytes] = []
+        pending: list[bytes] = []
+        for part in parts:
+            if type(part) is not SnapshotMessage:
+                pending.append(part)
+                continue
+            if pending:
+                chunks.append(self._compress(b"".join(pending)))
+            shared_length = part.shared_length
+            compressed, cached = self._shared.compress(
+                self.level, self.wbits, part[:shared_length]
+            )
+            chunks.append(compressed)
+            self.shared_hits += cached
+            self._continue_after(part, shared_length)
+            pending = [part[shared_length:]]
+        if pending:
+            chunks.append(self._compress(b"".join(pending)))
+        payload = b"".join(chunks)[: -len(_DEFLATE_TRAILER)]
+        self.cpu_time += thread_time() - start
+        self.bytes_in += size
+        self.bytes_out += len(payload)
+        return payload
+
+    def _compress(self, data: bytes) -> bytes:
+        """Compress data and flush it to a byte boundary."""
+        compressobj = self._compressobj
+        return compressobj.compress(data) + compressobj.flush(self._flush_mode)
+
+    def _continue_after(self, snapshot: bytes, shared_length: int) -> None:
+        """Continue the compression context after an inserted snapshot."""
+        if self._flush_mode == zlib.Z_FULL_FLUSH:
+            self._compressobj = zlib.compressobj(self.level, zlib.DEFLATED, -self.wbits)
+            return
+        window_start = max(0, shared_length - (1 << self.wbits))
+        self._compressobj = zlib.compressobj(
+            self.level,
+            zlib.DEFLATED,
+            -self.wbits,
+            zdict=snapshot[window_start:shared_length],
+        )
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Return the compression statistics."""
+        return {
+            "level": self.level,
+            "bytes_in": self.bytes_in,
+            "bytes_out": self.bytes_out,
+            "bytes_saved": self.bytes_in - self.bytes_out,
+            "cpu_time": self.cpu_time,
+            "shared_hits": self.shared_hits,
+        }
+
+
+async def send_compressed_frame(
+    writer: WebSocketWriter, payload: bytes, binary: bool
+) -> None:
+    """Send a frame with a payload compressed by WebSocketCompressor.
+
+    aiohttp compresses all frames with the same compressor so the frame
+    is written like WebSocketWriter._send_frame with the RSV1 bit set.
+    It must only be used when SEND_COMPRESSED_FRAME_SUPPORTED is set.
+    """
+    if writer._closing:  # noqa: SLF001
+        raise ConnectionResetError("Cannot write to closing transport")
+    first_byte = _FIN_RSV1 | (WSMsgType.BINARY if binary else WSMsgType.TEXT)
+    length = len(payload)
+    if length < 126:
+        header = _PACK_LEN1(first_byte, length)
+    elif length < 1 << 16:
+        header = _PACK_LEN2(first_byte, 126, length)
+    else:
+        header = _PACK_LEN3(first_byte, 127, length)
+    writer._write(header + payload)  # noqa: SLF001
+    writer._output_size += len(header) + length  # noqa: SLF001
+    if writer._output_size > writer._limit:  # noqa: SLF001
+        writer._output_size = 0  # noqa: SLF001
+        await writer.protocol._drain_helper()  # noqa: SLF001
+
+
+@callback
+def async_get_shared_compressor(hass: HomeAssistant) -> SharedCompressor:
+    """Return the compressor for snapshots shared between connections."""
+    if (shared := hass.data.get(DATA_SHARED_COMPRESSOR)) is None:
+        shared = hass.data[DATA_SHARED_COMPRESSOR] = SharedCompressor(hass)
+    return shared
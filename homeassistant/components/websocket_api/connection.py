@@ -19,6 +19,7 @@ from . import const, messages
 from .util import describe_request
 
 if TYPE_CHECKING:
+    from .compression import WebSocketCompressor
     from .http import WebSocketAdapter
 
 
@@ -30,6 +31,11 @@ type MessageHandler = Callable[[HomeAssistant, ActiveConnection, dict[str, Any]]
 type BinaryHandler = Callable[[HomeAssistant, ActiveConnection, bytes], None]
 
 
+def _no_queue() -> int:
+    """Return the queue size of a connection without a message queue."""
+    return 0
+
+
 class ActiveConnection:
     """Handle an active websocket client connection."""
 
@@ -42,9 +48,13 @@ class ActiveConnection:
         "subscriptions",
         "last_id",
         "can_coalesce",
+        "msgpack",
         "supported_features",
         "handlers",
         "binary_handlers",
+        "queue_size",
+        "merged_diffs",
+        "compressor",
     )
 
     def __init__(
@@ -64,11 +74,19 @@ class ActiveConnection:
         self.subscriptions: dict[Hashable, Callable[[], Any]] = {}
         self.last_id = 0
         self.can_coalesce = False
+        # Messages are sent as binary MessagePack frames instead of JSON
+        self.msgpack = False
         self.supported_features: dict[str, float] = {}
         self.handlers: dict[str, tuple[MessageHandler, vol.Schema | Literal[False]]] = (
             self.hass.data[const.DOMAIN]
         )
         self.binary_handlers: list[BinaryHandler | None] = []
+        # Return the number of messages waiting to be written to the client
+        self.queue_size: Callable[[], int] = _no_queue
+        # The number of state diffs dropped because a later diff replaced them
+        self.merged_diffs = 0
+        # Set if the messages are compressed with permessage-deflate
+        self.compressor: WebSocketCompressor | None = None
         current_connection.set(self)
 
     def __repr__(self) -> str:
@@ -79,6 +97,7 @@ class ActiveConnection:
         """Set supported features."""
         self.supported_features = features
         self.can_coalesce = const.FEATURE_COALESCE_MESSAGES in features
+        self.msgpack = const.FEATURE_MSGPACK in features
 
     def get_description(self, request: web.Request | None) -> str:
         """Return a description of the connection."""
@@ -34,6 +34,18 @@ MAX_PENDING_MSG: Final = 4096
 # resolve the ready future.
 PENDING_MSG_MAX_FORCE_READY: Final = 256
 
+# Number of pending messages from which subscriptions that merge state
+# diffs only send the latest state of each entity.
+PENDING_MSG_MERGE: Final = 64
+# Default time in seconds a merged state diff can be held back.
+MERGE_MAX_LATENCY: Final = 1.0
+
+CONF_COMPRESSION_LEVEL: Final = "compression_level"
+# Messages smaller than this are sent without compression.
+COMPRESS_MIN_SIZE: Final = 128
+# Time in seconds a compressed snapshot is reused for other connections.
+COMPRESS_SHARED_TIME: Final = 1.0
+
 ERR_ID_REUSE: Final = "id_reuse"
 ERR_INVALID_FORMAT: Final = "invalid_format"
 ERR_NOT_ALLOWED: Final = "not_allowed"
@@ -56,5 +68,8 @@ SIGNAL_WEBSOCKET_DISCONNECTED: Final = "websocket_disconnected"
 
 # Data used to store the current connection list
 DATA_CONNECTIONS: Final = f"{DOMAIN}.connections"
+# Data used to store the configured compression level
+DATA_COMPRESSION_LEVEL: Final = f"{DOMAIN}.compression_level"
 
 FEATURE_COALESCE_MESSAGES = "coalesce_messages"
+FEATURE_MSGPACK = "msgpack"
@@ -0,0 +1,324 @@
+"""Fan out state changes to the subscribe_entities subscriptions."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable, Hashable
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.auth import EVENT_USER_ADDED, EVENT_USER_REMOVED, EVENT_USER_UPDATED
+from homeassistant.auth.models import User
+from homeassistant.auth.permissions.const import POLICY_READ
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Event,
+    EventStateChangedData,
+    HomeAssistant,
+    State,
+    callback,
+)
+from homeassistant.helpers import device_registry as dr, entity_registry as er
+from homeassistant.util.hass_dict import HassKey
+
+from . import messages
+from .const import MERGE_MAX_LATENCY, PENDING_MSG_MERGE
+
+if TYPE_CHECKING:
+    from .connection import ActiveConnection
+
+DATA_ENTITIES_HUB: HassKey[EntitiesHub] = HassKey("websocket_api_entities_hub")
+
+# The permission key of users that can read all entities
+_READ_ALL = "read_all"
+
+_INVALIDATE_EVENTS = (
+    EVENT_USER_ADDED,
+    EVENT_USER_REMOVED,
+    EVENT_USER_UPDATED,
+    er.EVENT_ENTITY_REGISTRY_UPDATED,
+    dr.EVENT_DEVICE_REGISTRY_UPDATED,
+)
+
+
+class _EntitiesSubscription:
+    """A subscribe_entities subscription of a connection."""
+
+    __slots__ = (
+        "send_message",
+        "user",
+        "message_id_as_bytes",
+        "use_msgpack",
+        "permission_key",
+    )
+
+    def __init__(
+        self,
+        send_message: Callable[[str | bytes | dict[str, Any]], None],
+        user: User,
+        message_id_as_bytes: bytes,
+        use_msgpack: bool,
+    ) -> None:
+        """Initialize the subscription."""
+        self.send_message = send_message
+        self.user = user
+        # The message id serialized in the encoding of the connection
+        self.message_id_as_bytes = message_id_as_bytes
+        self.use_msgpack = use_msgpack
+        self.permission_key = _permission_key(user)
+
+    @callback
+    def async_send(self, event: Event[EventStateChangedData]) -> None:
+        """Send the diff of a state change.
+
+        The diff is serialized once per event for each encoding.
+        """
+        if self.use_msgpack:
+            self.send_message(
+                messages.cached_state_diff_msgpack_message(
+                    self.message_id_as_bytes, event
+                )
+            )
+            return
+        self.send_message(
+            messages.cached_state_diff_message(self.message_id_as_bytes, event)
+        )
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop the subscription."""
+
+
+class _MergingEntitiesSubscription(_EntitiesSubscription):
+    """A subscription that merges the diffs of an entity while backlogged.
+
+    Once the connection has PENDING_MSG_MERGE messages waiting, the changes
+    are held back and only the latest state of each entity is kept. The
+    merged changes are sent when the queue has drained or max_latency has
+    passed, whichever comes first.
+    """
+
+    __slots__ = ("connection", "max_latency", "pending", "_flush_handle")
+
+    def __init__(
+        self,
+        connection: ActiveConnection,
+        message_id_as_bytes: bytes,
+        use_msgpack: bool,
+        max_latency: float,
+    ) -> None:
+        """Initialize the subscription."""
+        super().__init__(
+            connection.send_message, connection.user, message_id_as_bytes, use_msgpack
+        )
+        self.connection = connection
+        self.max_latency = max_latency
+        # The state the client last received and the latest state by entity id
+        self.pending: dict[str, tuple[State | None, State | None]] = {}
+        self._flush_handle: asyncio.TimerHandle | None = None
+
+    @callback
+    def async_send(self, event: Event[EventStateChangedData]) -> None:
+        """Send the diff of a state change or merge it while backlogged."""
+        connection = self.connection
+        if connection.queue_size() < PENDING_MSG_MERGE:
+            if self.pending:
+                self._async_flush()
+            super().async_send(event)
+            return
+        data = event.data
+        entity_id = data["entity_id"]
+        if (pending := self.pending.get(entity_id)) is not None:
+            self.pending[entity_id] = (pending[0], data["new_state"])
+            connection.merged_diffs += 1
+            return
+        self.pending[entity_id] = (data["old_state"], data["new_state"])
+        if self._flush_handle is None:
+            self._flush_handle = connection.hass.loop.call_later(
+                self.max_latency, self._async_flush
+            )
+
+    @callback
+    def _async_flush(self) -> None:
+        """Send the merged changes.
+
+        Each entity is queued as a message so the connection is only
+        disconnected if even the merged changes exceed MAX_PENDING_MSG.
+        """
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        pending = self.pending
+        self.pending = {}
+        for entity_id, (old_state, new_state) in pending.items():
+            if message := messages.merged_state_diff_message(
+                self.message_id_as_bytes,
+                entity_id,
+                old_state,
+                new_state,
+                self.use_msgpack,
+            ):
+                self.send_message(message)
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop the subscription."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        self.pending.clear()
+
+
+def _permission_key(user: User) -> Hashable:
+    """Return the key of the users that have the same entity permissions.
+
+    The permissions of a user only depend on the groups the user is in,
+    the users in the same groups share the permission cache.
+    """
+    if user.is_admin or user.permissions.access_all_entities(POLICY_READ):
+        return _READ_ALL
+    return frozenset(group.id for group in user.groups)
+
+
+class EntitiesHub:
+    """Forward state changes to all subscribe_entities subscriptions.
+
+    A single state changed listener is shared by all subscriptions. The
+    subscriptions are indexed by the entity ids they are interested in and
+    read permissions are cached per group of users with the same permissions
+    until the users, entity registry or device registry change.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the hub."""
+        self.hass = hass
+        self._all_entities: dict[_EntitiesSubscription, None] = {}
+        self._by_entity_id: dict[str, dict[_EntitiesSubscription, None]] = {}
+        self._allowed: dict[Hashable, dict[str, bool]] = {}
+        self._unsubs: list[CALLBACK_TYPE] = []
+
+    @callback
+    def async_subscribe(
+        self,
+        send_message: Callable[[str | bytes | dict[str, Any]], None],
+        user: User,
+        message_id_as_bytes: bytes,
+        entity_ids: set[str],
+        merge_connection: ActiveConnection | None = None,
+        max_latency: float = MERGE_MAX_LATENCY,
+        use_msgpack: bool = False,
+    ) -> CALLBACK_TYPE:
+        """Subscribe to state changes of entity_ids or all entities if empty.
+
+        If merge_connection is passed, the changes of an entity are merged
+        while the connection is backlogged. If use_msgpack is set, the
+        changes are sent as MessagePack and message_id_as_bytes must be
+        the packed message id.
+        """
+        subscription = (
+            _MergingEntitiesSubscription(
+                merge_connection, message_id_as_bytes, use_msgpack, max_latency
+            )
+            if merge_connection
+            else _EntitiesSubscription(
+                send_message, user, message_id_as_bytes, use_msgpack
+            )
+        )
+        if not self._unsubs:
+            self._async_start()
+        if entity_ids:
+            for entity_id in entity_ids:
+                self._by_entity_id.setdefault(entity_id, {})[subscription] = None
+        else:
+            self._all_entities[subscription] = None
+
+        @callback
+        def _async_unsubscribe() -> None:
+            """Remove the subscription."""
+            subscription.async_stop()
+            if entity_ids:
+                for entity_id in entity_ids:
+                    subscriptions = self._by_entity_id[entity_id]
+                    del subscriptions[subscription]
+                    if not subscriptions:
+                        del self._by_entity_id[entity_id]
+            else:
+                del self._all_entities[subscription]
+            if not self._all_entities and not self._by_entity_id:
+                self._async_stop()
+
+        return _async_unsubscribe
+
+    @property
+    def subscription_count(self) -> int:
+        """Return the number of subscriptions."""
+        subscriptions = set(self._all_entities)
+        for entity_subscriptions in self._by_entity_id.values():
+            subscriptions.update(entity_subscriptions)
+        return len(subscriptions)
+
+    @callback
+    def _async_start(self) -> None:
+        """Start listening for state changes and permission changes."""
+        bus = self.hass.bus
+        self._unsubs.append(
+            bus.async_listen(EVENT_STATE_CHANGED, self._async_state_changed)
+        )
+        self._unsubs.extend(
+            bus.async_listen(event_type, self._async_invalidate_permissions)
+            for event_type in _INVALIDATE_EVENTS
+        )
+
+    @callback
+    def _async_stop(self) -> None:
+        """Stop listening once there are no subscriptions left."""
+        for unsub in self._unsubs:
+            unsub()
+        self._unsubs.clear()
+        self._allowed.clear()
+
+    @callback
+    def _async_invalidate_permissions(self, event: Event) -> None:
+        """Drop the cached permissions when the users or registries change."""
+        self._allowed.clear()
+        if event.event_type not in (EVENT_USER_ADDED, EVENT_USER_UPDATED):
+            return
+        for subscription in self._all_entities:
+            subscription.permission_key = _permission_key(subscription.user)
+        for subscriptions in self._by_entity_id.values():
+            for subscription in subscriptions:
+                subscription.permission_key = _permission_key(subscription.user)
+
+    def _is_allowed(self, subscription: _EntitiesSubscription, entity_id: str) -> bool:
+        """Return if the user of the subscription can read the entity."""
+        if (key := subscription.permission_key) is _READ_ALL:
+            return True
+        if (allowed := self._allowed.get(key)) is None:
+            allowed = self._allowed[key] = {}
+        if (entity_allowed := allowed.get(entity_id)) is None:
+            entity_allowed = allowed[entity_id] = (
+                subscription.user.permissions.check_entity(entity_id, POLICY_READ)
+            )
+        return entity_allowed
+
+    @callback
+    def _async_state_changed(self, event: Event[EventStateChangedData]) -> None:
+        """Forward a state change to the interested subscriptions."""
+        entity_id = event.data["entity_id"]
+        entity_subscriptions = self._by_entity_id.get(entity_id)
+        if not self._all_entities and not entity_subscriptions:
+            return
+        for subscriptions in (self._all_entities, entity_subscriptions):
+            if not subscriptions:
+                continue
+            for subscription in subscriptions:
+                if self._is_allowed(subscription, entity_id):
+                    subscription.async_send(event)
+
+
+@callback
+def async_get_entities_hub(hass: HomeAssistant) -> EntitiesHub:
+    """Return the hub for subscribe_entities subscriptions."""
+    if (hub := hass.data.get(DATA_ENTITIES_HUB)) is None:
+        hub = hass.data[DATA_ENTITIES_HUB] = EntitiesHub(hass)
+    return hub
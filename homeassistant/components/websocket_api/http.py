@@ -9,8 +9,10 @@ import datetime as dt
 from functools import partial
 import logging
 from typing import TYPE_CHECKING, Any, Final
+import zlib
 
 from aiohttp import WSMsgType, web
+from aiohttp.http_websocket import WebSocketWriter
 
 from homeassistant.components.http import KEY_HASS, HomeAssistantView
 from homeassistant.const import EVENT_HOMEASSISTANT_STOP
@@ -21,7 +23,13 @@ from homeassistant.util.async_ import create_eager_task
 from homeassistant.util.json import json_loads
 
 from .auth import AUTH_REQUIRED_MESSAGE, AuthPhase
+from .compression import (
+    SEND_COMPRESSED_FRAME_SUPPORTED,
+    WebSocketCompressor,
+    send_compressed_frame,
+)
 from .const import (
+    DATA_COMPRESSION_LEVEL,
     DATA_CONNECTIONS,
     MAX_PENDING_MSG,
     PENDING_MSG_MAX_FORCE_READY,
@@ -32,7 +40,12 @@ from .const import (
     URL,
 )
 from .error import Disconnect
-from .messages import message_to_json_bytes
+from .messages import (
+    json_to_msgpack_bytes,
+    message_to_json_bytes,
+    message_to_msgpack_bytes,
+)
+from .msgpack import msgpack_array_header
 from .util import describe_request
 
 if TYPE_CHECKING:
@@ -41,6 +54,17 @@ if TYPE_CHECKING:
 
 _WS_LOGGER: Final = logging.getLogger(f"{__name__}.connection")
 
+# Queued messages starting with this byte are JSON and are transcoded
+# when the connection negotiated MessagePack
+_JSON_OBJECT_START: Final = ord("{")
+
+
+def _message_to_msgpack(message: bytes) -> bytes:
+    """Return a queued message as MessagePack, transcoding it if it is JSON."""
+    if message[0] == _JSON_OBJECT_START:
+        return json_to_msgpack_bytes(message)
+    return message
+
 
 class WebsocketAPIView(HomeAssistantView):
     """View to serve a websockets endpoint."""
@@ -78,6 +102,7 @@ class WebSocketHandler:
         "_logger",
         "_peak_checker_unsub",
         "_connection",
+        "_compressor",
         "_message_queue",
         "_ready_future",
         "_release_ready_queue_size",
@@ -88,7 +113,10 @@ class WebSocketHandler:
         self._hass = hass
         self._loop = hass.loop
         self._request: web.Request = request
-        self._wsock = web.WebSocketResponse(heartbeat=55)
+        self._wsock = web.WebSocketResponse(
+            heartbeat=55,
+            compress=bool(hass.data.get(DATA_COMPRESSION_LEVEL, zlib.Z_BEST_SPEED)),
+        )
         self._handle_task: asyncio.Task | None = None
         self._writer_task: asyncio.Task | None = None
         self._closing: bool = False
@@ -96,6 +124,7 @@ class WebSocketHandler:
         self._logger = WebSocketAdapter(_WS_LOGGER, {"connid": id(self)})
         self._peak_checker_unsub: Callable[[], None] | None = None
         self._connection: ActiveConnection | None = None
+        self._compressor: WebSocketCompressor | None = None
 
         # The WebSocketHandler has a single consumer and path
         # to where messages are queued. This allows the implementation
@@ -124,9 +153,16 @@ class WebSocketHandler:
         return "finished connection"
 
     async def _writer(
-        self, send_bytes_text: Callable[[bytes], Coroutine[Any, Any, None]]
+        self,
+        send_bytes_text: Callable[[bytes], Coroutine[Any, Any, None]],
+        send_bytes_binary: Callable[[bytes], Coroutine[Any, Any, None]],
+        send_compressed: Callable[[bytes, bool], Coroutine[Any, Any, None]],
     ) -> None:
-        """Write outgoing messages."""
+        """Write outgoing messages.
+
+        Once MessagePack is negotiated, messages are sent as binary frames
+        and messages that were queued as JSON are transcoded.
+        """
         # Variables are set locally to avoid lookups in the loop
         message_queue = self._message_queue
         logger = self._logger
@@ -134,7 +170,10 @@ class WebSocketHandler:
         loop = self._loop
         is_debug_log_enabled = partial(logger.isEnabledFor, logging.DEBUG)
         debug = logger.debug
+        compressor = self._compressor
         can_coalesce = self._connection and self._connection.can_coalesce
+        use_msgpack = self._connection and self._connection.msgpack
+        send_bytes = send_bytes_binary if use_msgpack else send_bytes_text
         ready_message_count = len(message_queue)
         # Exceptions if Socket disconnected or cancelled by connection handler
         try:
@@ -150,18 +189,45 @@ class WebSocketHandler:
                     # coalesce may be enabled later in the connection
                     can_coalesce = self._connection and self._connection.can_coalesce
 
+                if not use_msgpack:
+                    # MessagePack may be enabled later in the connection
+                    use_msgpack = self._connection and self._connection.msgpack
+                    send_bytes = send_bytes_binary if use_msgpack else send_bytes_text
+
                 if not can_coalesce or ready_message_count == 1:
                     message = message_queue.popleft()
+                    if use_msgpack:
+                        message = _message_to_msgpack(message)
                     if is_debug_log_enabled():
                         debug("%s: Sending %s", self.description, message)
-                    await send_bytes_text(message)
+                    if compressor is not None and (
+                        payload := compressor.compress([message])
+                    ):
+                        await send_compressed(payload, use_msgpack)
+                    else:
+                        await send_bytes(message)
                     continue
 
-                coalesced_messages = b"".join((b"[", b",".join(message_queue), b"]"))
+                if use_msgpack:
+                    parts = [
+                        msgpack_array_header(len(message_queue)),
+                        *map(_message_to_msgpack, message_queue),
+                    ]
+                elif compressor is not None:
+                    # The messages are kept apart so snapshots can be shared
+                    parts = [b"["]
+                    for message in message_queue:
+                        parts.extend((message, b","))
+                    parts[-1] = b"]"
+                else:
+                    parts = [b"[", b",".join(message_queue), b"]"]
                 message_queue.clear()
                 if is_debug_log_enabled():
-                    debug("%s: Sending %s", self.description, coalesced_messages)
-                await send_bytes_text(coalesced_messages)
+                    debug("%s: Sending %s", self.description, b"".join(parts))
+                if compressor is not None and (payload := compressor.compress(parts)):
+                    await send_compressed(payload, use_msgpack)
+                else:
+                    await send_bytes(b"".join(parts))
         except asyncio.CancelledError:
             debug("%s: Writer cancelled", self.description)
             raise
@@ -194,7 +260,10 @@ class WebSocketHandler:
 
         if type(message) is not bytes:  # noqa: E721
             if isinstance(message, dict):
-                message = message_to_json_bytes(message)
+                if (connection := self._connection) and connection.msgpack:
+                    message = message_to_msgpack_bytes(message)
+                else:
+                    message = message_to_json_bytes(message)
             elif isinstance(message, str):
                 message = message.encode("utf-8")
 
@@ -293,6 +362,24 @@ class WebSocketHandler:
         """Cancel this connection."""
         self._cancel()
 
+    @callback
+    def _async_setup_compressor(self, writer: WebSocketWriter) -> None:
+        """Compress the messages with the WebSocketCompressor if negotiated.
+
+        The WebSocketCompressor skips tiny messages and shares snapshots.
+        If the compressed frames can't be written with the installed
+        aiohttp version, the stock writer compresses the messages.
+        """
+        if not (wbits := self._wsock.compress) or not SEND_COMPRESSED_FRAME_SUPPORTED:
+            return
+        writer.compress = 0
+        self._compressor = WebSocketCompressor(
+            self._hass,
+            self._hass.data.get(DATA_COMPRESSION_LEVEL, zlib.Z_BEST_SPEED),
+            wbits,
+            writer.notakeover,
+        )
+
     async def async_handle(self) -> web.WebSocketResponse:
         """Handle a websocket response."""
         request = self._request
@@ -322,6 +409,8 @@ class WebSocketHandler:
             assert writer is not None
 
         send_bytes_text = partial(writer.send, binary=False)
+        send_bytes_binary = partial(writer.send, binary=True)
+        self._async_setup_compressor(writer)
         auth = AuthPhase(
             logger, hass, self._send_message, self._cancel, request, send_bytes_text
         )
@@ -360,7 +449,15 @@ class WebSocketHandler:
             # We only start the writer queue after the auth phase is completed
             # since there is no need to queue messages before the auth phase
             self._connection = connection
-            self._writer_task = create_eager_task(self._writer(send_bytes_text))
+            connection.queue_size = self._message_queue.__len__
+            connection.compressor = self._compressor
+            self._writer_task = create_eager_task(
+                self._writer(
+                    send_bytes_text,
+                    send_bytes_binary,
+                    partial(send_compressed_frame, writer),
+                )
+            )
             hass.data[DATA_CONNECTIONS] = hass.data.get(DATA_CONNECTIONS, 0) + 1
             async_dispatcher_send(hass, SIGNAL_WEBSOCKET_CONNECTED)
 
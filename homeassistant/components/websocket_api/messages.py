@@ -5,6 +5,7 @@ from __future__ import annotations
 from functools import lru_cache
 import logging
 from typing import Any, Final
+from weakref import WeakKeyDictionary
 
 import voluptuous as vol
 
@@ -15,16 +16,17 @@ from homeassistant.const import (
     COMPRESSED_STATE_LAST_UPDATED,
     COMPRESSED_STATE_STATE,
 )
-from homeassistant.core import CompressedState, Event, EventStateChangedData
+from homeassistant.core import CompressedState, Event, EventStateChangedData, State
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.json import (
     JSON_DUMP,
     find_paths_unserializable_data,
     json_bytes,
 )
-from homeassistant.util.json import format_unserializable_data
+from homeassistant.util.json import format_unserializable_data, json_loads
 
 from . import const
+from .msgpack import msgpack_bytes
 
 _LOGGER: Final = logging.getLogger(__name__)
 
@@ -59,6 +61,22 @@ INVALID_JSON_PARTIAL_MESSAGE = json_bytes(
     }
 )
 
+INVALID_MSGPACK_PARTIAL_MESSAGE = msgpack_bytes(
+    {
+        **BASE_ERROR_MESSAGE,
+        "error": {
+            "code": const.ERR_UNKNOWN_ERROR,
+            "message": "Invalid MessagePack in response",
+        },
+    }
+)
+
+# The packed key of the message id appended to a partial MessagePack message
+_MSGPACK_ID_KEY = msgpack_bytes("id")
+
+# The packed compressed states, kept for as long as the state exists
+_COMPRESSED_STATES_MSGPACK: WeakKeyDictionary[State, bytes] = WeakKeyDictionary()
+
 
 def result_message(iden: int, result: Any = None) -> dict[str, Any]:
     """Return a success result message."""
@@ -141,6 +159,40 @@ def _partial_cached_event_message(event: Event) -> bytes:
     )
 
 
+def cached_event_msgpack_message(message_id_as_msgpack: bytes, event: Event) -> bytes:
+    """Return an event message as MessagePack.
+
+    The MessagePack equivalent of cached_event_message, message_id_as_msgpack
+    is the packed message id.
+    """
+    return _msgpack_message_with_id(
+        _partial_cached_event_msgpack_message(event), message_id_as_msgpack
+    )
+
+
+@lru_cache(maxsize=128)
+def _partial_cached_event_msgpack_message(event: Event) -> bytes:
+    """Cache and serialize the event to MessagePack without the id."""
+    return (
+        _message_to_msgpack_bytes_or_none({"type": "event", "event": event})
+        or INVALID_MSGPACK_PARTIAL_MESSAGE
+    )
+
+
+def compressed_state_msgpack(state: State) -> bytes:
+    """Return a compressed MessagePack key value pair of a state for adds.
+
+    The MessagePack equivalent of State.as_compressed_state_json, the key and
+    value are packed without a map header.
+    """
+    if (packed := _COMPRESSED_STATES_MSGPACK.get(state)) is None:
+        packed = msgpack_bytes(state.entity_id) + msgpack_bytes(
+            state.as_compressed_state
+        )
+        _COMPRESSED_STATES_MSGPACK[state] = packed
+    return packed
+
+
 def cached_state_diff_message(
     message_id_as_bytes: bytes, event: Event[EventStateChangedData]
 ) -> bytes:
@@ -154,7 +206,7 @@ def cached_state_diff_message(
     """
     return b"".join(
         (
-            _partial_cached_state_diff_message(event)[:-1],
+            state_diff_message_without_id(event),
             b',"id":',
             message_id_as_bytes,
             b"}",
@@ -162,6 +214,14 @@ def cached_state_diff_message(
     )
 
 
+def state_diff_message_without_id(event: Event[EventStateChangedData]) -> bytes:
+    """Return an event message without the closing brace.
+
+    The message id and the closing brace are appended for each connection.
+    """
+    return _partial_cached_state_diff_message(event)[:-1]
+
+
 @lru_cache(maxsize=128)
 def _partial_cached_state_diff_message(event: Event[EventStateChangedData]) -> bytes:
     """Cache and serialize the event to json.
@@ -177,6 +237,59 @@ def _partial_cached_state_diff_message(event: Event[EventStateChangedData]) -> b
     )
 
 
+def cached_state_diff_msgpack_message(
+    message_id_as_msgpack: bytes, event: Event[EventStateChangedData]
+) -> bytes:
+    """Return a state diff event message as MessagePack.
+
+    The MessagePack equivalent of cached_state_diff_message, message_id_as_msgpack
+    is the packed message id.
+    """
+    return _msgpack_message_with_id(
+        _partial_cached_state_diff_msgpack_message(event), message_id_as_msgpack
+    )
+
+
+@lru_cache(maxsize=128)
+def _partial_cached_state_diff_msgpack_message(
+    event: Event[EventStateChangedData],
+) -> bytes:
+    """Cache and serialize the state diff to MessagePack without the id."""
+    return (
+        _message_to_msgpack_bytes_or_none(
+            {"type": "event", "event": _state_diff_event(event)}
+        )
+        or INVALID_MSGPACK_PARTIAL_MESSAGE
+    )
+
+
+def merged_state_diff_message(
+    message_id_as_bytes: bytes,
+    entity_id: str,
+    old_state: State | None,
+    new_state: State | None,
+    use_msgpack: bool = False,
+) -> bytes | None:
+    """Return an event message for the merged changes of an entity.
+
+    The diff is made between the state the client last received and the
+    latest state, None is returned if the client never received the entity.
+    """
+    if old_state is None and new_state is None:
+        return None
+    partial_message = {
+        "type": "event",
+        "event": _state_diff(entity_id, old_state, new_state),
+    }
+    if use_msgpack:
+        if (packed := _message_to_msgpack_bytes_or_none(partial_message)) is None:
+            return None
+        return _msgpack_message_with_id(packed, message_id_as_bytes)
+    if (message := _message_to_json_bytes_or_none(partial_message)) is None:
+        return None
+    return b"".join((message[:-1], b',"id":', message_id_as_bytes, b"}"))
+
+
 def _state_diff_event(
     event: Event[EventStateChangedData],
 ) -> dict[
@@ -195,9 +308,22 @@ def _state_diff_event(
         "r": [entity_id,…]
     }
     """
-    if (new_state := event.data["new_state"]) is None:
-        return {ENTITY_EVENT_REMOVE: [event.data["entity_id"]]}
-    if (old_state := event.data["old_state"]) is None:
+    data = event.data
+    return _state_diff(data["entity_id"], data["old_state"], data["new_state"])
+
+
+def _state_diff(
+    entity_id: str, old_state: State | None, new_state: State | None
+) -> dict[
+    str,
+    list[str]
+    | dict[str, CompressedState]
+    | dict[str, dict[str, dict[str, str | list[str]]]],
+]:
+    """Return the minimal version of a change from old_state to new_state."""
+    if new_state is None:
+        return {ENTITY_EVENT_REMOVE: [entity_id]}
+    if old_state is None:
         return {ENTITY_EVENT_ADD: {new_state.entity_id: new_state.as_compressed_state}}
     additions: dict[str, Any] = {}
     diff: dict[str, dict[str, Any]] = {STATE_DIFF_ADDITIONS: additions}
@@ -256,3 +382,55 @@ def message_to_json_bytes(message: dict[str, Any]) -> bytes:
             message["id"], const.ERR_UNKNOWN_ERROR, "Invalid JSON in response"
         )
     )
+
+
+def _msgpack_message_with_id(
+    partial_message: bytes, message_id_as_msgpack: bytes
+) -> bytes:
+    """Append the message id to a packed partial message.
+
+    The partial message is a map with less than 15 key value pairs so the
+    id is added by incrementing the fixmap header and appending the pair.
+    """
+    return b"".join(
+        (
+            bytes((partial_message[0] + 1,)),
+            partial_message[1:],
+            _MSGPACK_ID_KEY,
+            message_id_as_msgpack,
+        )
+    )
+
+
+def _message_to_msgpack_bytes_or_none(message: dict[str, Any]) -> bytes | None:
+    """Serialize a websocket message to MessagePack or return None."""
+    try:
+        return msgpack_bytes(message)
+    except (ValueError, TypeError):
+        _LOGGER.error(
+            "Unable to serialize to MessagePack. Bad data found at %s",
+            format_unserializable_data(
+                find_paths_unserializable_data(message, dump=JSON_DUMP)
+            ),
+        )
+    return None
+
+
+def message_to_msgpack_bytes(message: dict[str, Any]) -> bytes:
+    """Serialize a websocket message to MessagePack or return an error."""
+    return _message_to_msgpack_bytes_or_none(message) or msgpack_bytes(
+        error_message(
+            message["id"],
+            const.ERR_UNKNOWN_ERROR,
+            "Invalid MessagePack in response",
+        )
+    )
+
+
+def json_to_msgpack_bytes(message: bytes) -> bytes:
+    """Transcode a message serialized to JSON to MessagePack.
+
+    Used for the results that are serialized to JSON ahead of time. The
+    message may be a bytes subclass which orjson only accepts as memoryview.
+    """
+    return msgpack_bytes(json_loads(memoryview(message)))
@@ -0,0 +1,62 @@
+"""Helpers to encode Home Assistant objects in MessagePack for the websocket API."""
+
+from __future__ import annotations
+
+import datetime
+from functools import partial
+from pathlib import Path
+import struct
+from typing import TYPE_CHECKING, Any
+
+import ormsgpack
+
+
+def msgpack_encoder_default(obj: Any) -> Any:
+    """Convert Home Assistant objects.
+
+    Unlike json_encoder_default objects are converted with as_dict
+    since MessagePack can not embed JSON fragments.
+    """
+    if isinstance(obj, (set, tuple)):
+        return list(obj)
+    if isinstance(obj, float):
+        return float(obj)
+    if hasattr(obj, "as_dict"):
+        return obj.as_dict()
+    if isinstance(obj, Path):
+        return obj.as_posix()
+    if isinstance(obj, datetime.datetime):
+        return obj.isoformat()
+    raise TypeError
+
+
+if TYPE_CHECKING:
+
+    def msgpack_bytes(obj: Any) -> bytes:
+        """Dump MessagePack bytes."""
+
+else:
+    msgpack_bytes = partial(
+        ormsgpack.packb,
+        option=ormsgpack.OPT_NON_STR_KEYS,
+        default=msgpack_encoder_default,
+    )
+    """Dump MessagePack bytes."""
+
+
+def msgpack_map_header(length: int) -> bytes:
+    """Return the header of a map with length key value pairs."""
+    if length < 16:
+        return bytes((0x80 | length,))
+    if length < 0x10000:
+        return b"\xde" + struct.pack(">H", length)
+    return b"\xdf" + struct.pack(">I", length)
+
+
+def msgpack_array_header(length: int) -> bytes:
+    """Return the header of an array with length items."""
+    if length < 16:
+        return bytes((0x90 | length,))
+    if length < 0x10000:
+        return b"\xdc" + struct.pack(">H", length)
+    return b"\xdd" + struct.pack(">I", length)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
 import contextlib
 from contextlib import suppress
 from dataclasses import dataclass
@@ -49,6 +50,8 @@ from .usage import install_multiple_zeroconf_catcher
 
 _LOGGER = logging.getLogger(__name__)
 
+type _PatternMatcher = Callable[[str], re.Match[str] | None]
+
 DOMAIN = "zeroconf"
 
 ZEROCONF_TYPE = "_home-assistant._tcp.local."
@@ -324,13 +327,41 @@ async def _async_register_hass_zc_service(
     await aio_zc.async_register_service(info, allow_name_change=True)
 
 
-def _match_against_props(matcher: dict[str, str], props: dict[str, str | None]) -> bool:
-    """Check a matcher to ensure all values in props."""
-    for key, value in matcher.items():
-        prop_val = props.get(key)
-        if prop_val is None or not _memorized_fnmatch(prop_val.lower(), value):
+class _CompiledMatcher:
+    """A zeroconf matcher with compiled patterns."""
+
+    __slots__ = ("domain", "match_name", "match_properties")
+
+    def __init__(self, matcher: ZeroconfMatcher) -> None:
+        """Compile the patterns of the matcher."""
+        self.domain = matcher[ATTR_DOMAIN]
+        self.match_name: _PatternMatcher | None = (
+            _compile_fnmatch(matcher[ATTR_NAME]).match if ATTR_NAME in matcher else None
+        )
+        self.match_properties: list[tuple[str, _PatternMatcher]] = [
+            (key, _compile_fnmatch(value).match)
+            for key, value in matcher.get(ATTR_PROPERTIES, {}).items()
+        ]
+
+    def matches(self, name: str, props: dict[str, str | None]) -> bool:
+        """Return if a service matches."""
+        if self.match_name is not None and self.match_name(name.lower()) is None:
             return False
-    return True
+        for key, match_property in self.match_properties:
+            value = props.get(key)
+            if value is None or match_property(value.lower()) is None:
+                return False
+        return True
+
+
+def _compile_zeroconf_matchers(
+    zeroconf_types: dict[str, list[ZeroconfMatcher]],
+) -> dict[str, list[_CompiledMatcher]]:
+    """Compile the patterns of the matchers by service type."""
+    return {
+        service_type: [_CompiledMatcher(matcher) for matcher in matchers]
+        for service_type, matchers in zeroconf_types.items()
+    }
 
 
 def is_homekit_paired(props: dict[str, Any]) -> bool:
@@ -359,6 +390,7 @@ class ZeroconfDiscovery:
         self.hass = hass
         self.zeroconf = zeroconf
         self.zeroconf_types = zeroconf_types
+        self._matchers = _compile_zeroconf_matchers(zeroconf_types)
         self.homekit_model_lookups = homekit_model_lookups
         self.homekit_model_matchers = homekit_model_matchers
         self.async_service_browser: AsyncServiceBrowser | None = None
@@ -485,23 +517,16 @@ class ZeroconfDiscovery:
                 # discover it, we can stop here.
                 return
 
-        if not (matchers := self.zeroconf_types.get(service_type)):
+        if not (matchers := self._matchers.get(service_type)):
             return
 
         # Not all homekit types are currently used for discovery
         # so not all service type exist in zeroconf_types
         for matcher in matchers:
-            if len(matcher) > 1:
-                if ATTR_NAME in matcher and not _memorized_fnmatch(
-                    info.name.lower(), matcher[ATTR_NAME]
-                ):
-                    continue
-                if ATTR_PROPERTIES in matcher and not _match_against_props(
-                    matcher[ATTR_PROPERTIES], props
-                ):
-                    continue
-
-            matcher_domain = matcher[ATTR_DOMAIN]
+            if not matcher.matches(info.name, props):
+                continue
+
+            matcher_domain = matcher.domain
             context = {
                 "source": config_entries.SOURCE_ZEROCONF,
             }
@@ -618,18 +643,3 @@ def _truncate_location_name_to_valid(location_name: str) -> str:
 def _compile_fnmatch(pattern: str) -> re.Pattern:
     """Compile a fnmatch pattern."""
     return re.compile(translate(pattern))
-
-
-@lru_cache(maxsize=1024, typed=True)
-def _memorized_fnmatch(name: str, pattern: str) -> bool:
-    """Memorized version of fnmatch that has a larger lru_cache.
-
-    The default version of fnmatch only has a lru_cache of 256 entries.
-    With many devices we quickly reach that limit and end up compiling
-    the same pattern over and over again.
-
-    Zeroconf has its own memorized fnmatch with its own lru_cache
-    since the data is going to be relatively the same
-    since the devices will not change frequently
-    """
-    return bool(_compile_fnmatch(pattern).match(name))
@@ -54,6 +54,7 @@ from .const import (
     CONF_PLATFORM,
     CONF_RADIUS,
     CONF_TEMPERATURE_UNIT,
+    CONF_TEMPLATE_BYTECODE_CACHE,
     CONF_TIME_ZONE,
     CONF_TYPE,
     CONF_UNIT_SYSTEM,
@@ -63,7 +64,7 @@ from .const import (
 from .core import DOMAIN as HOMEASSISTANT_DOMAIN, ConfigSource, HomeAssistant, callback
 from .exceptions import ConfigValidationError, HomeAssistantError
 from .generated.currencies import HISTORIC_CURRENCIES
-from .helpers import config_validation as cv, issue_registry as ir
+from .helpers import config_validation as cv, issue_registry as ir, template
 from .helpers.entity_values import EntityValues
 from .helpers.translation import async_get_exception_message
 from .helpers.typing import ConfigType
@@ -361,6 +362,7 @@ CORE_CONFIG_SCHEMA = vol.All(
             vol.Optional(CONF_COUNTRY): cv.country,
             vol.Optional(CONF_LANGUAGE): cv.language,
             vol.Optional(CONF_DEBUG): cv.boolean,
+            vol.Optional(CONF_TEMPLATE_BYTECODE_CACHE): cv.boolean,
         }
     ),
     _filter_bad_internal_external_urls,
@@ -875,6 +877,9 @@ async def async_process_ha_core_config(hass: HomeAssistant, config: dict) -> Non
     if config.get(CONF_DEBUG):
         hac.debug = True
 
+    if config.get(CONF_TEMPLATE_BYTECODE_CACHE):
+        await template.async_load_bytecode_cache(hass)
+
     _raise_issue_if_historic_currency(hass, hass.config.currency)
     _raise_issue_if_no_country(hass, hass.config.country)
 
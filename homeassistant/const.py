@@ -277,6 +277,7 @@ CONF_STRUCTURE: Final = "structure"
 CONF_SWITCHES: Final = "switches"
 CONF_TARGET: Final = "target"
 CONF_TEMPERATURE_UNIT: Final = "temperature_unit"
+CONF_TEMPLATE_BYTECODE_CACHE: Final = "template_bytecode_cache"
 CONF_THEN: Final = "then"
 CONF_TIMEOUT: Final = "timeout"
 CONF_TIME_ZONE: Final = "time_zone"
@@ -1575,6 +1576,7 @@ HTTP_HEADER_X_REQUESTED_WITH: Final = "X-Requested-With"
 
 CONTENT_TYPE_JSON: Final = "application/json"
 CONTENT_TYPE_MULTIPART: Final = "multipart/x-mixed-replace; boundary={}"
+CONTENT_TYPE_NDJSON: Final = "application/x-ndjson"
 CONTENT_TYPE_TEXT_PLAIN: Final = "text/plain"
 
 # The exit code to send to request a restart
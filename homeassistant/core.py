@@ -1446,15 +1446,25 @@ def _verify_event_type_length_or_raise(event_type: EventType[_DataT] | str) -> N
 class EventBus:
     """Allow the firing of and listening for events."""
 
-    __slots__ = ("_debug", "_hass", "_listeners", "_match_all_listeners")
+    __slots__ = (
+        "_debug",
+        "_hass",
+        "_keyed_listeners",
+        "_listeners",
+        "_match_all_listeners",
+    )
 
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize a new event bus."""
-        self._listeners: defaultdict[
-            EventType[Any] | str, list[_FilterableJobType[Any]]
-        ] = defaultdict(list)
+        # The lists of listeners are replaced instead of changed in place
+        # so firing an event can iterate them without making a copy
+        self._listeners: dict[EventType[Any] | str, list[_FilterableJobType[Any]]] = {}
         self._match_all_listeners: list[_FilterableJobType[Any]] = []
         self._listeners[MATCH_ALL] = self._match_all_listeners
+        # Listeners of state events by entity_id
+        self._keyed_listeners: dict[
+            EventType[Any] | str, dict[str, list[HassJob[[Event[Any]], Any]]]
+        ] = {EVENT_STATE_CHANGED: {}, EVENT_STATE_REPORTED: {}}
         self._hass = hass
         self._async_logging_changed()
         self.async_listen(EVENT_LOGGING_CHANGED, self._async_logging_changed)
@@ -1468,9 +1478,15 @@ class EventBus:
     def async_listeners(self) -> dict[EventType[Any] | str, int]:
         """Return dictionary with events and the number of listeners.
 
+        The listeners by entity_id of an event type count as a single listener.
+
         This method must be run in the event loop.
         """
-        return {key: len(listeners) for key, listeners in self._listeners.items()}
+        counts = {key: len(listeners) for key, listeners in self._listeners.items()}
+        for event_type, keyed_listeners in self._keyed_listeners.items():
+            if keyed_listeners:
+                counts[event_type] = counts.get(event_type, 0) + 1
+        return counts
 
     @property
     def listeners(self) -> dict[EventType[Any] | str, int]:
@@ -1542,28 +1558,82 @@ class EventBus:
             match_all_listeners = EMPTY_LIST
 
         event: Event[_DataT] | None = None
-        for job, event_filter in listeners + match_all_listeners:
-            if event_filter is not None:
-                try:
-                    if event_data is None or not event_filter(event_data):
+        # Keyed jobs are dispatched before the jobs of the other listeners
+        if (
+            (keyed_listeners := self._keyed_listeners.get(event_type))
+            and event_data is not None
+            and event_data.get("entity_id") in keyed_listeners
+        ):
+            event = Event(event_type, event_data, origin, time_fired, context)
+            if event_type == EVENT_STATE_CHANGED:
+                # Dispatch soon to ensure one event loop runs before dispatch
+                self._hass.loop.call_soon(
+                    self._async_run_keyed_jobs, keyed_listeners, event
+                )
+            else:
+                self._async_run_keyed_jobs(keyed_listeners, event)
+
+        for filterable_jobs in (listeners, match_all_listeners):
+            for job, event_filter in filterable_jobs:
+                if event_filter is not None:
+                    try:
+                        if event_data is None or not event_filter(event_data):
+                            continue
+                    except Exception:
+                        _LOGGER.exception("Error in event filter")
                         continue
+
+                if not event:
+                    event = Event(
+                        event_type,
+                        event_data,
+                        origin,
+                        time_fired,
+                        context,
+                    )
+
+                try:
+                    self._hass.async_run_hass_job(job, event)
                 except Exception:
-                    _LOGGER.exception("Error in event filter")
-                    continue
-
-            if not event:
-                event = Event(
-                    event_type,
-                    event_data,
-                    origin,
-                    time_fired,
-                    context,
-                )
+                    _LOGGER.exception("Error running job: %s", job)
+
+    @callback
+    def async_has_entity_listeners_internal(
+        self, event_type: EventType[_DataT] | str, entity_id: str
+    ) -> bool:
+        """Return if firing a state event of an entity_id may run any listener.
+
+        This method is intended to only be used by core internally
+        and should not be considered a stable API.
+
+        This method must be run in the event loop.
+        """
+        return (
+            entity_id in self._keyed_listeners[event_type]
+            or event_type in self._listeners
+            or (
+                event_type not in EVENTS_EXCLUDED_FROM_MATCH_ALL
+                and bool(self._match_all_listeners)
+            )
+        )
 
+    @callback
+    def _async_run_keyed_jobs(
+        self,
+        keyed_listeners: dict[str, list[HassJob[[Event[_DataT]], Any]]],
+        event: Event[_DataT],
+    ) -> None:
+        """Run the jobs listening to the entity_id of an event."""
+        entity_id = event.data["entity_id"]
+        if not (jobs := keyed_listeners.get(entity_id)):
+            return
+        for job in jobs:
             try:
                 self._hass.async_run_hass_job(job, event)
             except Exception:
-                _LOGGER.exception("Error running job: %s", job)
+                _LOGGER.exception(
+                    "Error while dispatching event for %s to %s", entity_id, job
+                )
 
     def listen(
         self,
@@ -1635,11 +1705,66 @@ class EventBus:
         filterable_job: _FilterableJobType[_DataT],
     ) -> CALLBACK_TYPE:
         """Listen for all events or events of a specific type."""
-        self._listeners[event_type].append(filterable_job)
+        listeners = [*self._listeners.get(event_type, EMPTY_LIST), filterable_job]
+        self._listeners[event_type] = listeners
+        if event_type == MATCH_ALL:
+            self._match_all_listeners = listeners
         return functools.partial(
             self._async_remove_listener, event_type, filterable_job
         )
 
+    @callback
+    def async_listen_keyed_internal(
+        self,
+        event_type: EventType[_DataT] | str,
+        entity_ids: Iterable[str],
+        job: HassJob[[Event[_DataT]], Any],
+    ) -> CALLBACK_TYPE:
+        """Listen for state events of specific entity_ids, for internal use only.
+
+        Only EVENT_STATE_CHANGED and EVENT_STATE_REPORTED can be listened
+        to by entity_id. Firing an event only runs the jobs listening to
+        its entity_id, jobs listening to EVENT_STATE_CHANGED are run soon.
+
+        This method is intended to only be used by core internally
+        and should not be considered a stable API. It does not lowercase
+        the entity_ids.
+
+        This method must be run in the event loop.
+        """
+        if (keyed_listeners := self._keyed_listeners.get(event_type)) is None:
+            raise HomeAssistantError(
+                f"Event {event_type} can not be listened to by entity_id"
+            )
+        entity_ids = tuple(entity_ids)
+        for entity_id in entity_ids:
+            keyed_listeners[entity_id] = [
+                *keyed_listeners.get(entity_id, EMPTY_LIST),
+                job,
+            ]
+        return functools.partial(
+            self._async_remove_keyed_listener, keyed_listeners, entity_ids, job
+        )
+
+    @callback
+    def _async_remove_keyed_listener(
+        self,
+        keyed_listeners: dict[str, list[HassJob[[Event[_DataT]], Any]]],
+        entity_ids: tuple[str, ...],
+        job: HassJob[[Event[_DataT]], Any],
+    ) -> None:
+        """Remove a listener of specific entity_ids.
+
+        This method must be run in the event loop.
+        """
+        for entity_id in entity_ids:
+            jobs = keyed_listeners[entity_id].copy()
+            jobs.remove(job)
+            if jobs:
+                keyed_listeners[entity_id] = jobs
+            else:
+                del keyed_listeners[entity_id]
+
     def listen_once(
         self,
         event_type: EventType[_DataT] | str,
@@ -1716,17 +1841,23 @@ class EventBus:
         This method must be run in the event loop.
         """
         try:
-            self._listeners[event_type].remove(filterable_job)
-
-            # delete event_type list if empty
-            if not self._listeners[event_type] and event_type != MATCH_ALL:
-                self._listeners.pop(event_type)
+            listeners = self._listeners[event_type].copy()
+            listeners.remove(filterable_job)
         except (KeyError, ValueError):
             # KeyError is key event_type listener did not exist
             # ValueError if listener did not exist within event_type
             _LOGGER.exception(
                 "Unable to remove unknown job listener %s", filterable_job
             )
+            return
+
+        if event_type == MATCH_ALL:
+            self._match_all_listeners = listeners
+        elif not listeners:
+            # delete event_type list if empty
+            del self._listeners[event_type]
+            return
+        self._listeners[event_type] = listeners
 
 
 class CompressedState(TypedDict):
@@ -2037,7 +2168,14 @@ class States(UserDict[str, State]):
 class StateMachine:
     """Helper class that tracks the state of different entities."""
 
-    __slots__ = ("_states", "_states_data", "_reservations", "_bus", "_loop")
+    __slots__ = (
+        "_states",
+        "_states_data",
+        "_reservations",
+        "_bus",
+        "_loop",
+        "_last_reported_windows",
+    )
 
     def __init__(self, bus: EventBus, loop: asyncio.events.AbstractEventLoop) -> None:
         """Initialize state machine."""
@@ -2048,6 +2186,7 @@ class StateMachine:
         self._reservations: set[str] = set()
         self._bus = bus
         self._loop = loop
+        self._last_reported_windows: dict[str, float] = {}
 
     def entity_ids(self, domain_filter: str | None = None) -> list[str]:
         """List of entity ids that are being tracked."""
@@ -2127,6 +2266,33 @@ class StateMachine:
             entity_id.lower()
         )
 
+    @callback
+    def async_set_last_reported_window(
+        self, entity_id: str, window: float | None
+    ) -> None:
+        """Coalesce the last_reported updates of an entity.
+
+        Reporting the same state and attributes less than window seconds
+        after the state was last reported does not update last_reported
+        and does not fire EVENT_STATE_REPORTED. Pass None to report
+        every update again. The window is forgotten when the state of
+        the entity is removed.
+
+        This method must be run in the event loop.
+        """
+        entity_id = entity_id.lower()
+        if window:
+            self._last_reported_windows[entity_id] = window
+        else:
+            self._last_reported_windows.pop(entity_id, None)
+
+    def last_reported_window(self, entity_id: str) -> float | None:
+        """Return the window last_reported updates of an entity are coalesced in.
+
+        Async friendly.
+        """
+        return self._last_reported_windows.get(entity_id)
+
     def is_state(self, entity_id: str, state: str) -> bool:
         """Test if entity exists and is in specified state.
 
@@ -2155,6 +2321,7 @@ class StateMachine:
         entity_id = entity_id.lower()
         old_state = self._states.pop(entity_id, None)
         self._reservations.discard(entity_id)
+        self._last_reported_windows.pop(entity_id, None)
 
         if old_state is None:
             return False
@@ -2303,14 +2470,24 @@ class StateMachine:
         # https://github.com/python/cpython/blob/c90a862cdcf55dc1753c6466e5fa4a467a13ae24/Modules/_datetimemodule.c#L6323
         now = dt_util.utc_from_timestamp(timestamp)
 
-        if context is None:
-            context = Context(id=ulid_at_time(timestamp))
-
         if same_state and same_attr:
-            # mypy does not understand this is only possible if old_state is not None
-            old_last_reported = old_state.last_reported  # type: ignore[union-attr]
-            old_state.last_reported = now  # type: ignore[union-attr]
-            old_state.last_reported_timestamp = timestamp  # type: ignore[union-attr]
+            if TYPE_CHECKING:
+                assert old_state is not None
+            if (window := self._last_reported_windows.get(entity_id)) and (
+                timestamp - old_state.last_reported_timestamp < window
+            ):
+                return
+            old_last_reported = old_state.last_reported
+            old_state.last_reported = now
+            old_state.last_reported_timestamp = timestamp
+            # Most entities have no listeners for EVENT_STATE_REPORTED,
+            # avoid creating the event data and the context for them
+            if not self._bus.async_has_entity_listeners_internal(
+                EVENT_STATE_REPORTED, entity_id
+            ):
+                return
+            if context is None:
+                context = Context(id=ulid_at_time(timestamp))
             # Avoid creating an EventStateReportedData
             self._bus.async_fire_internal(  # type: ignore[misc]
                 EVENT_STATE_REPORTED,
@@ -2324,6 +2501,9 @@ class StateMachine:
             )
             return
 
+        if context is None:
+            context = Context(id=ulid_at_time(timestamp))
+
         if same_attr:
             if TYPE_CHECKING:
                 assert old_state is not None
@@ -14,6 +14,8 @@ from random import randint
 import time
 from typing import TYPE_CHECKING, Any, Concatenate, Generic, TypeVar
 
+from lru import LRU
+
 from homeassistant.const import (
     EVENT_CORE_CONFIG_UPDATE,
     EVENT_STATE_CHANGED,
@@ -57,12 +59,6 @@ from .sun import get_astral_event_next
 from .template import RenderInfo, Template, result_as_boolean
 from .typing import TemplateVarsType
 
-_TRACK_STATE_CHANGE_DATA: HassKey[_KeyedEventData[EventStateChangedData]] = HassKey(
-    "track_state_change_data"
-)
-_TRACK_STATE_REPORT_DATA: HassKey[_KeyedEventData[EventStateReportedData]] = HassKey(
-    "track_state_report_data"
-)
 _TRACK_STATE_ADDED_DOMAIN_DATA: HassKey[_KeyedEventData[EventStateChangedData]] = (
     HassKey("track_state_added_domain_data")
 )
@@ -89,6 +85,22 @@ _LOGGER = logging.getLogger(__name__)
 RANDOM_MICROSECOND_MIN = 50000
 RANDOM_MICROSECOND_MAX = 500000
 
+# State changes of entities which are not referenced by a tracked template,
+# but match the domains or all states it renders, are batched and rendered
+# once per event loop iteration within this budget
+TEMPLATE_RENDER_BUDGET = 0.05
+# Templates which take longer than this to render are hot, re-renders
+# of hot templates from batched state changes are rate limited
+HOT_TEMPLATE_RENDER_TIME = 0.05
+HOT_TEMPLATE_RATE_LIMIT = 10
+# Weight of the last render in the recent render time of a template
+RENDER_TIME_SMOOTHING = 0.2
+TEMPLATE_RENDER_STATS_SIZE = 1024
+
+_TEMPLATE_RENDER_SCHEDULER: HassKey[_TemplateRenderScheduler] = HassKey(
+    "template_render_scheduler"
+)
+
 _TypedDictT = TypeVar("_TypedDictT", bound=Mapping[str, Any])
 _StateEventDataT = TypeVar("_StateEventDataT", bound=EventStateEventData)
 
@@ -172,6 +184,34 @@ class TrackTemplateResult:
     result: Any
 
 
+@dataclass(slots=True)
+class TemplateRenderStats:
+    """Class for the render cost of a template.
+
+    recent_time is a moving average of the render time which
+    is used to find hot templates.
+    """
+
+    renders: int = 0
+    total_time: float = 0.0
+    max_time: float = 0.0
+    recent_time: float = 0.0
+    hot: bool = False
+
+    def add(self, render_time: float) -> bool:
+        """Add the time of a render, return True if the template became hot."""
+        self.renders += 1
+        self.total_time += render_time
+        self.max_time = max(self.max_time, render_time)
+        if self.renders == 1:
+            self.recent_time = render_time
+        else:
+            self.recent_time += (render_time - self.recent_time) * RENDER_TIME_SMOOTHING
+        was_hot = self.hot
+        self.hot = self.recent_time >= HOT_TEMPLATE_RENDER_TIME
+        return self.hot and not was_hot
+
+
 def threaded_listener_factory[**_P](
     async_factory: Callable[Concatenate[HomeAssistant, _P], Any],
 ) -> Callable[Concatenate[HomeAssistant, _P], CALLBACK_TYPE]:
@@ -319,8 +359,8 @@ def async_track_state_change_event(
 
     In order to avoid having to iterate a long list
     of EVENT_STATE_CHANGED and fire and create a job
-    for each one, we keep a dict of entity ids that
-    care about the state change events so we can
+    for each one, the event bus keeps a dict of entity ids
+    that care about the state change events so it can
     do a fast dict lookup to route events.
     """
     if not (entity_ids := _async_string_to_lower_list(entity_ids)):
@@ -328,54 +368,6 @@ def async_track_state_change_event(
     return _async_track_state_change_event(hass, entity_ids, action, job_type)
 
 
-@callback
-def _async_dispatch_entity_id_event_soon(
-    hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[Event[_StateEventDataT]], Any]]],
-    event: Event[_StateEventDataT],
-) -> None:
-    """Dispatch to listeners soon to ensure one event loop runs before dispatch."""
-    hass.loop.call_soon(_async_dispatch_entity_id_event, hass, callbacks, event)
-
-
-@callback
-def _async_dispatch_entity_id_event(
-    hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[Event[_StateEventDataT]], Any]]],
-    event: Event[_StateEventDataT],
-) -> None:
-    """Dispatch to listeners."""
-    if not (callbacks_list := callbacks.get(event.data["entity_id"])):
-        return
-    for job in callbacks_list.copy():
-        try:
-            hass.async_run_hass_job(job, event)
-        except Exception:
-            _LOGGER.exception(
-                "Error while dispatching event for %s to %s",
-                event.data["entity_id"],
-                job,
-            )
-
-
-@callback
-def _async_state_filter(
-    hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[Event[_StateEventDataT]], Any]]],
-    event_data: _StateEventDataT,
-) -> bool:
-    """Filter state changes by entity_id."""
-    return event_data["entity_id"] in callbacks
-
-
-_KEYED_TRACK_STATE_CHANGE = _KeyedEventTracker(
-    key=_TRACK_STATE_CHANGE_DATA,
-    event_type=EVENT_STATE_CHANGED,
-    dispatcher_callable=_async_dispatch_entity_id_event_soon,
-    filter_callable=_async_state_filter,
-)
-
-
 @bind_hass
 def _async_track_state_change_event(
     hass: HomeAssistant,
@@ -384,19 +376,11 @@ def _async_track_state_change_event(
     job_type: HassJobType | None,
 ) -> CALLBACK_TYPE:
     """async_track_state_change_event without lowercasing."""
-    return _async_track_event(
-        _KEYED_TRACK_STATE_CHANGE, hass, entity_ids, action, job_type
+    return _async_track_entity_id_event(
+        hass, EVENT_STATE_CHANGED, entity_ids, action, job_type
     )
 
 
-_KEYED_TRACK_STATE_REPORT = _KeyedEventTracker(
-    key=_TRACK_STATE_REPORT_DATA,
-    event_type=EVENT_STATE_REPORTED,
-    dispatcher_callable=_async_dispatch_entity_id_event,
-    filter_callable=_async_state_filter,
-)
-
-
 def async_track_state_report_event(
     hass: HomeAssistant,
     entity_ids: str | Iterable[str],
@@ -404,11 +388,27 @@ def async_track_state_report_event(
     job_type: HassJobType | None = None,
 ) -> CALLBACK_TYPE:
     """Track EVENT_STATE_REPORTED by entity_id without lowercasing."""
-    return _async_track_event(
-        _KEYED_TRACK_STATE_REPORT, hass, entity_ids, action, job_type
+    return _async_track_entity_id_event(
+        hass, EVENT_STATE_REPORTED, entity_ids, action, job_type
     )
 
 
+def _async_track_entity_id_event(
+    hass: HomeAssistant,
+    event_type: EventType[_StateEventDataT],
+    entity_ids: str | Iterable[str],
+    action: Callable[[Event[_StateEventDataT]], Any],
+    job_type: HassJobType | None,
+) -> CALLBACK_TYPE:
+    """Track a state event by entity_id with the keyed listeners of the bus."""
+    if not entity_ids:
+        return _remove_empty_listener
+    if isinstance(entity_ids, str):
+        entity_ids = (entity_ids,)
+    job = HassJob(action, f"track {event_type} event {entity_ids}", job_type=job_type)
+    return hass.bus.async_listen_keyed_internal(event_type, entity_ids, job)
+
+
 @callback
 def _remove_empty_listener() -> None:
     """Remove a listener that does nothing."""
@@ -962,6 +962,107 @@ def async_track_template(
 track_template = threaded_listener_factory(async_track_template)
 
 
+class _TemplateRenderScheduler:
+    """Render batched template refreshes and keep track of the render cost.
+
+    Trackers dirtied by state changes during an event loop iteration are
+    rendered once in the next iteration, the cheapest first, until the
+    render budget is used up. The remaining trackers are rendered first
+    in the following iteration.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the scheduler."""
+        self.hass = hass
+        self.stats: LRU[str, TemplateRenderStats] = LRU(TEMPLATE_RENDER_STATS_SIZE)
+        self._pending: dict[TrackTemplateResultInfo, None] = {}
+        self._deferred: set[TrackTemplateResultInfo] = set()
+        self._task: asyncio.Task[None] | None = None
+
+    @callback
+    def async_schedule(self, tracker: TrackTemplateResultInfo) -> None:
+        """Schedule rendering a tracker in the next event loop iteration."""
+        self._pending[tracker] = None
+        if self._task is None:
+            self._task = self.hass.async_create_task_internal(
+                self._async_render_pending(),
+                "template render scheduler",
+                eager_start=False,
+            )
+
+    @callback
+    def async_record(self, template: Template, render_time: float) -> None:
+        """Record the time it took to render a template."""
+        if (stats := self.stats.get(template.template)) is None:
+            stats = self.stats[template.template] = TemplateRenderStats()
+        if stats.add(render_time):
+            _LOGGER.warning(
+                (
+                    "Template %s takes %.3f seconds to render, re-renders from"
+                    " state changes of entities it does not reference are limited"
+                    " to once every %s seconds"
+                ),
+                template.template,
+                stats.recent_time,
+                HOT_TEMPLATE_RATE_LIMIT,
+            )
+
+    @callback
+    def async_is_hot(self, template: Template) -> bool:
+        """Return if a template is hot."""
+        stats = self.stats.get(template.template)
+        return stats is not None and stats.hot
+
+    @callback
+    def async_render_time(self, templates: Iterable[Template]) -> float:
+        """Return the recent time it took to render templates."""
+        return sum(
+            stats.recent_time
+            for template in templates
+            if (stats := self.stats.get(template.template)) is not None
+        )
+
+    async def _async_render_pending(self) -> None:
+        """Render the pending trackers within the render budget."""
+        self._task = None
+        deferred = self._deferred
+        self._deferred = set()
+        trackers = sorted(
+            self._pending,
+            key=lambda tracker: (tracker not in deferred, tracker.render_time),
+        )
+        self._pending = {}
+        start = time.monotonic()
+        for idx, tracker in enumerate(trackers):
+            if idx and time.monotonic() - start > TEMPLATE_RENDER_BUDGET:
+                remaining = trackers[idx:]
+                self._deferred.update(remaining)
+                for remaining_tracker in remaining:
+                    self.async_schedule(remaining_tracker)
+                return
+            tracker.async_refresh_pending()
+
+
+@callback
+def _async_get_template_render_scheduler(
+    hass: HomeAssistant,
+) -> _TemplateRenderScheduler:
+    """Return the template render scheduler."""
+    if (scheduler := hass.data.get(_TEMPLATE_RENDER_SCHEDULER)) is None:
+        scheduler = hass.data[_TEMPLATE_RENDER_SCHEDULER] = _TemplateRenderScheduler(
+            hass
+        )
+    return scheduler
+
+
+@callback
+def async_get_template_render_stats(
+    hass: HomeAssistant,
+) -> dict[str, TemplateRenderStats]:
+    """Return the render cost of tracked templates by template."""
+    return dict(_async_get_template_render_scheduler(hass).stats.items())
+
+
 class TrackTemplateResultInfo:
     """Handle removal / refresh of tracker."""
 
@@ -987,6 +1088,9 @@ class TrackTemplateResultInfo:
         self._info: dict[Template, RenderInfo] = {}
         self._track_state_changes: _TrackStateChangeFiltered | None = None
         self._time_listeners: dict[Template, Callable[[], None]] = {}
+        self._scheduler = _async_get_template_render_scheduler(hass)
+        # Batched state changes by entity_id
+        self._pending_events: dict[str, Event[EventStateChangedData]] = {}
 
     def __repr__(self) -> str:
         """Return the representation."""
@@ -1041,7 +1145,9 @@ class TrackTemplateResultInfo:
                     log_fn(logging.ERROR, str(info.exception))
 
         self._track_state_changes = async_track_state_change_filtered(
-            self.hass, _render_infos_to_track_states(self._info.values()), self._refresh
+            self.hass,
+            _render_infos_to_track_states(self._info.values()),
+            self._async_state_changed,
         )
         self._update_time_listeners()
         _LOGGER.debug(
@@ -1082,7 +1188,7 @@ class TrackTemplateResultInfo:
 
         @callback
         def _refresh_from_time(now: datetime) -> None:
-            self._refresh(None, track_templates=track_templates)
+            self._refresh((), track_templates=track_templates)
 
         self._time_listeners[template] = async_track_utc_time_change(
             self.hass, _refresh_from_time, second=0
@@ -1099,19 +1205,50 @@ class TrackTemplateResultInfo:
         assert self._track_state_changes
         self._track_state_changes.async_remove()
         self._rate_limit.async_remove()
+        self._pending_events = {}
         for template in list(self._time_listeners):
             self._time_listeners.pop(template)()
 
     @callback
     def async_refresh(self) -> None:
         """Force recalculate the template."""
-        self._refresh(None)
+        self._refresh(())
+
+    @property
+    def render_time(self) -> float:
+        """Return the recent time it took to render the templates."""
+        return self._scheduler.async_render_time(self._info)
+
+    @callback
+    def _async_state_changed(self, event: Event[EventStateChangedData]) -> None:
+        """Refresh the templates from a state change.
+
+        Changes of entities referenced by a template are rendered right
+        away. Changes which only match the domains or all states rendered
+        by the templates are batched by the template render scheduler.
+        """
+        entity_id = event.data["entity_id"]
+        if any(entity_id in info.entities for info in self._info.values()):
+            self._refresh((event,))
+            return
+        if not self._pending_events:
+            self._scheduler.async_schedule(self)
+        # Keep the latest change of each entity in the order they changed
+        self._pending_events.pop(entity_id, None)
+        self._pending_events[entity_id] = event
+
+    @callback
+    def async_refresh_pending(self) -> None:
+        """Refresh the templates from the batched state changes."""
+        if events := self._pending_events:
+            self._pending_events = {}
+            self._refresh(tuple(events.values()))
 
     def _render_template_if_ready(
         self,
         track_template_: TrackTemplate,
         now: float,
-        event: Event[EventStateChangedData] | None,
+        events: Sequence[Event[EventStateChangedData]],
     ) -> bool | TrackTemplateResult:
         """Re-render the template if conditions match.
 
@@ -1125,20 +1262,34 @@ class TrackTemplateResultInfo:
         """
         template = track_template_.template
 
-        if event:
+        if events:
             info = self._info[template]
 
-            if not _event_triggers_rerender(event, info):
+            if not (
+                triggered := [
+                    event for event in events if _event_triggers_rerender(event, info)
+                ]
+            ):
                 return False
 
+            event = triggered[-1]
+            rate_limit: float | None = None
+            # Changes of entities referenced by the template are not rate limited
+            if not any(
+                changed.data["entity_id"] in info.entities for changed in triggered
+            ):
+                rate_limit = _rate_limit_for_event(
+                    event, info, track_template_, self._scheduler.async_is_hot(template)
+                )
+
             had_timer = self._rate_limit.async_has_timer(template)
 
             if self._rate_limit.async_schedule_action(
                 template,
-                _rate_limit_for_event(event, info, track_template_),
+                rate_limit,
                 now,
                 self._refresh,
-                event,
+                (event,),
                 (track_template_,),
                 True,
             ):
@@ -1151,9 +1302,11 @@ class TrackTemplateResultInfo:
             )
 
         self._rate_limit.async_triggered(template, now)
+        start = time.monotonic()
         self._info[template] = info = template.async_render_to_info(
             track_template_.variables
         )
+        self._scheduler.async_record(template, time.monotonic() - start)
 
         try:
             result: str | TemplateError = info.result()
@@ -1200,14 +1353,14 @@ class TrackTemplateResultInfo:
     @callback
     def _refresh(
         self,
-        event: Event[EventStateChangedData] | None,
+        events: Sequence[Event[EventStateChangedData]],
         track_templates: Iterable[TrackTemplate] | None = None,
         replayed: bool | None = False,
     ) -> None:
         """Refresh the template.
 
-        The event is the state_changed event that caused the refresh
-        to be considered.
+        The events are the state_changed events that caused the refresh
+        to be considered, the listener is called with the last event.
 
         track_templates is an optional list of TrackTemplate objects
         to refresh.  If not provided, all tracked templates will be
@@ -1218,6 +1371,7 @@ class TrackTemplateResultInfo:
         """
         updates: list[TrackTemplateResult] = []
         info_changed = False
+        event = events[-1] if events else None
         now = event.time_fired_timestamp if not replayed and event else time.time()
 
         block_updates = False
@@ -1227,7 +1381,7 @@ class TrackTemplateResultInfo:
 
         # Update the super template first
         if super_template is not None:
-            update = self._render_template_if_ready(super_template, now, event)
+            update = self._render_template_if_ready(super_template, now, events)
             info_changed |= self._apply_update(updates, update, super_template.template)
 
             if isinstance(update, TrackTemplateResult):
@@ -1250,6 +1404,7 @@ class TrackTemplateResultInfo:
                 # Super template changed from not True to True, force re-render
                 # of all templates in the group
                 event = None
+                events = ()
                 track_templates = self._track_templates
 
         # Then update the remaining templates unless blocked by the super template
@@ -1258,7 +1413,7 @@ class TrackTemplateResultInfo:
                 if track_template_ == super_template:
                     continue
 
-                update = self._render_template_if_ready(track_template_, now, event)
+                update = self._render_template_if_ready(track_template_, now, events)
                 info_changed |= self._apply_update(
                     updates, update, track_template_.template
                 )
@@ -1965,6 +2120,7 @@ def _rate_limit_for_event(
     event: Event[EventStateChangedData],
     info: RenderInfo,
     track_template_: TrackTemplate,
+    hot: bool = False,
 ) -> float | None:
     """Determine the rate limit for an event."""
     # Specifically referenced entities are excluded
@@ -1972,10 +2128,13 @@ def _rate_limit_for_event(
     if event.data["entity_id"] in info.entities:
         return None
 
+    rate_limit: float | None = info.rate_limit
     if track_template_.rate_limit is not None:
-        return track_template_.rate_limit
+        rate_limit = track_template_.rate_limit
 
-    rate_limit: float | None = info.rate_limit
+    # Hot templates are rendered less often
+    if hot and (rate_limit is None or rate_limit < HOT_TEMPLATE_RATE_LIMIT):
+        return HOT_TEMPLATE_RATE_LIMIT
     return rate_limit
 
 
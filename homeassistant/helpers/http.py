@@ -3,13 +3,13 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Awaitable, Callable
+from collections.abc import Awaitable, Callable, Iterable
 from contextvars import ContextVar
 from http import HTTPStatus
 import logging
 from typing import Any, Final
 
-from aiohttp import web
+from aiohttp import hdrs, web
 from aiohttp.typedefs import LooseHeaders
 from aiohttp.web import AppKey, Request
 from aiohttp.web_exceptions import (
@@ -21,7 +21,7 @@ from aiohttp.web_urldispatcher import AbstractResource, AbstractRoute
 import voluptuous as vol
 
 from homeassistant import exceptions
-from homeassistant.const import CONTENT_TYPE_JSON
+from homeassistant.const import CONTENT_TYPE_JSON, CONTENT_TYPE_NDJSON
 from homeassistant.core import Context, HomeAssistant, is_callback
 from homeassistant.util.json import JSON_ENCODE_EXCEPTIONS, format_unserializable_data
 
@@ -36,6 +36,10 @@ KEY_ALLOW_ALL_CORS = AppKey[AllowCorsType]("allow_all_cors")
 KEY_ALLOW_CONFIGURED_CORS = AppKey[AllowCorsType]("allow_configured_cors")
 KEY_HASS: AppKey[HomeAssistant] = AppKey("hass")
 
+# Responses with more items are streamed with JSONStreamResponse
+STREAM_MIN_ITEMS: Final = 1000
+STREAM_CHUNK_SIZE: Final = 65536
+
 current_request: ContextVar[Request | None] = ContextVar(
     "current_request", default=None
 )
@@ -104,6 +108,63 @@ def request_handler_factory(
     return handle
 
 
+def accepts_ndjson(request: web.Request) -> bool:
+    """Return if the client asked for newline delimited JSON."""
+    return CONTENT_TYPE_NDJSON in request.headers.get(hdrs.ACCEPT, "")
+
+
+class JSONStreamResponse(web.StreamResponse):
+    """Stream serialized JSON items as a JSON array or as NDJSON lines.
+
+    Items are written in chunks of about STREAM_CHUNK_SIZE bytes. Writing
+    waits while the transport buffer is full and other tasks run between
+    chunks, so a large response is neither built in memory as a whole nor
+    blocks the event loop.
+    """
+
+    def __init__(self, ndjson: bool = False) -> None:
+        """Initialize the response."""
+        super().__init__(
+            headers={
+                hdrs.CONTENT_TYPE: CONTENT_TYPE_NDJSON if ndjson else CONTENT_TYPE_JSON
+            }
+        )
+        self._ndjson = ndjson
+        self._empty = True
+        self.enable_compression()
+
+    async def write_items(self, items: Iterable[bytes]) -> None:
+        """Write serialized JSON items."""
+        chunk: list[bytes] = []
+        size = 0
+        for item in items:
+            chunk.append(item)
+            size += len(item)
+            if size >= STREAM_CHUNK_SIZE:
+                await self._write_chunk(chunk)
+                chunk = []
+                size = 0
+                await asyncio.sleep(0)
+        if chunk:
+            await self._write_chunk(chunk)
+
+    async def _write_chunk(self, chunk: list[bytes]) -> None:
+        """Write a chunk of items."""
+        if self._ndjson:
+            chunk.append(b"")
+            await self.write(b"\n".join(chunk))
+            return
+        separator = b"[" if self._empty else b","
+        self._empty = False
+        await self.write(separator + b",".join(chunk))
+
+    async def write_eof(self, data: bytes = b"") -> None:
+        """Close the JSON array and finish the response."""
+        if not self._eof_sent and not self._ndjson:
+            await self.write(b"[]" if self._empty else b"]")
+        await super().write_eof(data)
+
+
 class HomeAssistantView:
     """Base view for all views."""
 
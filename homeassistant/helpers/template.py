@@ -11,8 +11,10 @@ from contextlib import AbstractContextManager
 from contextvars import ContextVar
 from datetime import date, datetime, time, timedelta
 from functools import cache, cached_property, lru_cache, partial, wraps
+from importlib.util import MAGIC_NUMBER
 import json
 import logging
+import marshal
 import math
 from operator import contains
 import pathlib
@@ -43,13 +45,16 @@ from homeassistant.const import (
     ATTR_PERSONS,
     ATTR_UNIT_OF_MEASUREMENT,
     EVENT_HOMEASSISTANT_START,
+    EVENT_HOMEASSISTANT_STARTED,
     EVENT_HOMEASSISTANT_STOP,
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
     UnitOfLength,
+    __version__ as HA_VERSION,
 )
 from homeassistant.core import (
     Context,
+    Event,
     HomeAssistant,
     State,
     callback,
@@ -81,6 +86,7 @@ from . import (
     location as loc_helper,
 )
 from .singleton import singleton
+from .storage import Store
 from .translation import async_translate_state
 from .typing import TemplateVarsType
 
@@ -98,6 +104,7 @@ _ENVIRONMENT_STRICT: HassKey[TemplateEnvironment] = HassKey(
     "template.environment_strict"
 )
 _HASS_LOADER = "template.hass_loader"
+_BYTECODE_CACHE = "template.bytecode_cache"
 
 # Match "simple" ints and floats. -1.0, 1, +5, 5.0
 _IS_NUMERIC = re.compile(r"^[+-]?(?!0\d)\d*(?:\.\d*)?$")
@@ -154,6 +161,17 @@ CACHED_TEMPLATE_LRU: LRU[State, TemplateState] = LRU(CACHED_TEMPLATE_STATES)
 CACHED_TEMPLATE_NO_COLLECT_LRU: LRU[State, TemplateState] = LRU(CACHED_TEMPLATE_STATES)
 ENTITY_COUNT_GROWTH_FACTOR = 1.2
 
+#
+# Identical templates are often used by many entities, automations
+# and scripts. The code compiled for a template only depends on the
+# source and the type of environment, so it is kept in a process wide
+# LRU and optionally stored to disk so restarts skip compiling.
+#
+COMPILED_TEMPLATE_CACHE_SIZE = 4096
+BYTECODE_CACHE_STORAGE_KEY = "template.bytecode_cache"
+BYTECODE_CACHE_STORAGE_VERSION = 1
+BYTECODE_CACHE_SAVE_DELAY = 60
+
 ORJSON_PASSTHROUGH_OPTIONS = (
     orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_PASSTHROUGH_DATETIME
 )
@@ -2690,6 +2708,107 @@ def make_logging_undefined(
     return LoggingUndefined
 
 
+class CompiledTemplateCache:
+    """A process wide LRU of compiled templates.
+
+    Templates are keyed by the source. All environments with hass compile
+    a source to the same code, the limited environment only replaces the
+    functions and filters it does not support.
+    """
+
+    def __init__(self, size: int) -> None:
+        """Initialize the cache."""
+        self.compiled: LRU[str, CodeType] = LRU(size)
+        # Set when templates were compiled since the bytecode was last stored
+        self.changed = False
+
+    def get(self, source: str) -> CodeType | None:
+        """Return the compiled template or None if it is not cached."""
+        return self.compiled.get(source)
+
+    def set(self, source: str, compiled: CodeType) -> None:
+        """Cache a compiled template."""
+        self.compiled[source] = compiled
+        self.changed = True
+
+    def clear(self) -> None:
+        """Remove all compiled templates."""
+        self.compiled.clear()
+
+    def load_bytecode(self, data: dict[str, Any]) -> int:
+        """Add the stored compiled templates and return how many were added.
+
+        The bytecode is ignored if it was stored by another version of
+        Home Assistant, Python or Jinja.
+        """
+        if data.get("key") != _bytecode_cache_key():
+            return 0
+        loaded = 0
+        # Templates are stored most recently used first
+        for item in reversed(data.get("templates", [])):
+            try:
+                source, bytecode = item
+                compiled = marshal.loads(base64.b64decode(bytecode))
+            except (EOFError, TypeError, ValueError):
+                continue
+            if isinstance(compiled, CodeType):
+                self.compiled[source] = compiled
+                loaded += 1
+        return loaded
+
+    def bytecode_data(self) -> dict[str, Any]:
+        """Return the compiled templates to store."""
+        self.changed = False
+        return {
+            "key": _bytecode_cache_key(),
+            "templates": [
+                [source, base64.b64encode(marshal.dumps(compiled)).decode()]
+                for source, compiled in self.compiled.items()
+            ],
+        }
+
+
+COMPILED_TEMPLATE_CACHE = CompiledTemplateCache(COMPILED_TEMPLATE_CACHE_SIZE)
+
+
+@cache
+def _bytecode_cache_key() -> str:
+    """Return the key which invalidates the stored bytecode."""
+    return f"{HA_VERSION}-{MAGIC_NUMBER.hex()}-{jinja2.__version__}"
+
+
+async def async_load_bytecode_cache(hass: HomeAssistant) -> None:
+    """Load the compiled templates stored on disk.
+
+    The compiled templates are stored again once Home Assistant
+    has started and when it stops.
+    """
+    if _BYTECODE_CACHE in hass.data:
+        return
+    store = hass.data[_BYTECODE_CACHE] = Store[dict[str, Any]](
+        hass,
+        BYTECODE_CACHE_STORAGE_VERSION,
+        BYTECODE_CACHE_STORAGE_KEY,
+        private=True,
+    )
+    if data := await store.async_load():
+        loaded = await hass.async_add_executor_job(
+            COMPILED_TEMPLATE_CACHE.load_bytecode, data
+        )
+        _LOGGER.debug("Loaded %s compiled templates", loaded)
+
+    @callback
+    def _async_save_bytecode(_: Event) -> None:
+        """Store the compiled templates if templates were compiled."""
+        if COMPILED_TEMPLATE_CACHE.changed:
+            store.async_delay_save(
+                COMPILED_TEMPLATE_CACHE.bytecode_data, BYTECODE_CACHE_SAVE_DELAY
+            )
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STARTED, _async_save_bytecode)
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_save_bytecode)
+
+
 async def async_load_custom_templates(hass: HomeAssistant) -> None:
     """Load all custom jinja files under 5MiB into memory."""
     custom_templates = await hass.async_add_executor_job(_load_custom_templates, hass)
@@ -2757,6 +2876,9 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
         """Initialise template environment."""
         super().__init__(undefined=make_logging_undefined(strict, log_fn))
         self.hass = hass
+        # Templates are not shared with the environment without hass
+        # since it does not have all filters, tests and globals
+        self.share_compiled = hass is not None
         self.template_cache: weakref.WeakValueDictionary[
             str | jinja2.nodes.Template, CodeType | None
         ] = weakref.WeakValueDictionary()
@@ -3110,7 +3232,11 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
                 defer_init,
             )
 
-        compiled = super().compile(source)
+        if not self.share_compiled or not isinstance(source, str):
+            compiled = super().compile(source)
+        elif (compiled := COMPILED_TEMPLATE_CACHE.get(source)) is None:
+            compiled = super().compile(source)
+            COMPILED_TEMPLATE_CACHE.set(source, compiled)
         self.template_cache[source] = compiled
         return compiled
 
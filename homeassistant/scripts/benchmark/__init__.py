@@ -9,16 +9,23 @@ from collections.abc import Callable
 from contextlib import suppress
 import json
 import logging
+import os
 from timeit import default_timer as timer
+from typing import cast
 
-from homeassistant import core
+from homeassistant import core, loader
 from homeassistant.const import EVENT_STATE_CHANGED
 from homeassistant.helpers.entityfilter import convert_include_exclude_filter
 from homeassistant.helpers.event import (
+    TrackTemplate,
     async_track_state_change,
     async_track_state_change_event,
+    async_track_state_report_event,
+    async_track_template_result,
 )
 from homeassistant.helpers.json import JSON_DUMP, JSONEncoder
+from homeassistant.helpers.template import Template
+from homeassistant.util import dt as dt_util
 
 # mypy: allow-untyped-calls, allow-untyped-defs, no-check-untyped-defs
 # mypy: no-warn-return-any
@@ -225,6 +232,405 @@ async def state_changed_event_filter_helper(hass):
     return timer() - start
 
 
+@benchmark
+async def state_changed_keyed_listeners(hass):
+    """Run 100k state changes of 10k entities through 2k keyed listeners."""
+    count = 0
+    entities = 10000
+    listeners = 2000
+    events_to_fire = 10**5
+
+    @core.callback
+    def listener(*args):
+        """Handle event."""
+        nonlocal count
+        count += 1
+
+    # Each listener tracks 5 entities, every entity has one listener
+    entity_ids = [f"sensor.benchmark_{idx}" for idx in range(entities)]
+    per_listener = entities // listeners
+    for idx in range(listeners):
+        async_track_state_change_event(
+            hass, entity_ids[idx * per_listener : (idx + 1) * per_listener], listener
+        )
+
+    events_data = [
+        {
+            "entity_id": entity_id,
+            "old_state": core.State(entity_id, "off"),
+            "new_state": core.State(entity_id, "on"),
+        }
+        for entity_id in entity_ids
+    ]
+
+    start = timer()
+
+    for idx in range(events_to_fire):
+        hass.bus.async_fire(EVENT_STATE_CHANGED, events_data[idx % entities])
+
+    await hass.async_block_till_done()
+
+    assert count == events_to_fire
+
+    return timer() - start
+
+
+@benchmark
+async def track_template_domain_states(hass):
+    """Change 1k sensors 100 times with 100 templates rendering all sensors."""
+    entities = 1000
+    templates = 100
+    rounds = 100
+
+    @core.callback
+    def listener(*args):
+        """Handle template result."""
+
+    entity_ids = [f"sensor.benchmark_{idx}" for idx in range(entities)]
+    for entity_id in entity_ids:
+        hass.states.async_set(entity_id, "0")
+    for idx in range(templates):
+        template = Template(f"{{{{ (states.sensor | count) + {idx} }}}}", hass)
+        async_track_template_result(hass, [TrackTemplate(template, None, 0)], listener)
+    await hass.async_block_till_done()
+
+    start = timer()
+
+    for round_ in range(1, rounds + 1):
+        for entity_id in entity_ids:
+            hass.states.async_set(entity_id, str(round_))
+        await hass.async_block_till_done()
+
+    return timer() - start
+
+
+async def _async_set_same_state(hass, listen: bool):
+    """Report the same state 100 times for each of 10k entities."""
+    entities = 10000
+    reports = 100
+    count = 0
+
+    @core.callback
+    def listener(event):
+        """Handle event."""
+        nonlocal count
+        count += 1
+
+    entity_ids = [f"sensor.benchmark_{idx}" for idx in range(entities)]
+    attributes = {"unit_of_measurement": "W"}
+    async_set = hass.states.async_set
+    for entity_id in entity_ids:
+        async_set(entity_id, "10", attributes)
+    if listen:
+        async_track_state_report_event(hass, entity_ids, listener)
+
+    start = timer()
+
+    for _ in range(reports):
+        for entity_id in entity_ids:
+            async_set(entity_id, "10", attributes)
+
+    runtime = timer() - start
+    await hass.async_block_till_done()
+    assert count == (entities * reports if listen else 0)
+    return runtime
+
+
+@benchmark
+async def async_set_state_reported(hass):
+    """Report unchanged states of 10k entities without state_reported listeners."""
+    return await _async_set_same_state(hass, False)
+
+
+@benchmark
+async def async_set_state_reported_with_listener(hass):
+    """Report unchanged states of 10k entities which all have a listener.
+
+    This is the cost of every report before reports without
+    listeners skipped creating the event.
+    """
+    return await _async_set_same_state(hass, True)
+
+
+@benchmark
+async def websocket_subscribe_entities(hass):
+    """Forward 10k state changes to 100 subscribe_entities clients."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.auth.models import Group, User
+    from homeassistant.components.websocket_api.entities_hub import (
+        async_get_entities_hub,
+    )
+
+    # pylint: enable=import-outside-toplevel
+
+    entities = 1000
+    changes = 10
+    hub = async_get_entities_hub(hass)
+    admin = User(name="Admin", perm_lookup=None, is_owner=True)
+    group = Group(name="Lights", policy={"entities": {"domains": {"light": True}}})
+    users = [
+        User(name=f"User {idx}", perm_lookup=None, is_active=True, groups=[group])
+        for idx in range(10)
+    ]
+    entity_ids = [
+        f"{domain}.benchmark_{idx}"
+        for idx in range(entities // 2)
+        for domain in ("light", "sensor")
+    ]
+    queues: list[collections.deque[bytes]] = []
+    for idx in range(100):
+        queues.append(queue := collections.deque())
+        if idx < 60:
+            # Dashboards of admins
+            hub.async_subscribe(queue.append, admin, str(idx).encode(), set())
+        elif idx < 90:
+            # Dashboards of users that can only read lights
+            user = users[idx % len(users)]
+            hub.async_subscribe(queue.append, user, str(idx).encode(), set())
+        else:
+            # Tablets showing a few entities
+            hub.async_subscribe(
+                queue.append,
+                admin,
+                str(idx).encode(),
+                set(entity_ids[idx::100]),
+            )
+
+    start = timer()
+    for change in range(changes):
+        for entity_id in entity_ids:
+            hass.states.async_set(entity_id, str(change))
+    await hass.async_block_till_done()
+    return timer() - start
+
+
+def _encode_websocket_entities(hass, use_msgpack: bool) -> float:
+    """Encode the subscribe_entities messages of 4000 entities."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.components.websocket_api import messages
+    from homeassistant.components.websocket_api.msgpack import (
+        msgpack_bytes,
+        msgpack_map_header,
+    )
+
+    # pylint: enable=import-outside-toplevel
+
+    entities = 4000
+    attributes = {
+        "friendly_name": "Benchmark sensor",
+        "unit_of_measurement": "W",
+        "device_class": "power",
+        "state_class": "measurement",
+        "icon": "mdi:flash",
+    }
+    events = []
+    for idx in range(entities):
+        entity_id = f"sensor.benchmark_{idx}"
+        old_state = core.State(entity_id, "1234.5", attributes)
+        new_state = core.State(entity_id, "1240.25", attributes)
+        events.append(
+            core.Event(
+                EVENT_STATE_CHANGED,
+                {
+                    "entity_id": entity_id,
+                    "old_state": old_state,
+                    "new_state": new_state,
+                },
+            )
+        )
+    states = [event.data["new_state"] for event in events]
+
+    start = timer()
+    if use_msgpack:
+        message_id = msgpack_bytes(1)
+        init = msgpack_map_header(entities) + b"".join(
+            messages.compressed_state_msgpack(state) for state in states
+        )
+        diffs = [
+            messages.cached_state_diff_msgpack_message(message_id, event)
+            for event in events
+        ]
+    else:
+        message_id = b"1"
+        init = b",".join(state.as_compressed_state_json for state in states)
+        diffs = [
+            messages.cached_state_diff_message(message_id, event) for event in events
+        ]
+    runtime = timer() - start
+    print(
+        f"Encoded entities in {len(init)} bytes"
+        f" and state diffs in {sum(len(diff) for diff in diffs)} bytes"
+    )
+    return runtime
+
+
+@benchmark
+async def websocket_encode_entities_json(hass):
+    """Encode the subscribe_entities messages of 4000 entities as JSON."""
+    return _encode_websocket_entities(hass, False)
+
+
+@benchmark
+async def websocket_encode_entities_msgpack(hass):
+    """Encode the subscribe_entities messages of 4000 entities as MessagePack."""
+    return _encode_websocket_entities(hass, True)
+
+
+@benchmark
+async def websocket_compress_entities_snapshot(hass):
+    """Compress the subscribe_entities snapshot of 4000 entities for 50 clients."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.components.websocket_api.compression import (
+        WebSocketCompressor,
+        snapshot_message,
+    )
+
+    # pylint: enable=import-outside-toplevel
+
+    attributes = {
+        "friendly_name": "Benchmark sensor",
+        "unit_of_measurement": "W",
+        "device_class": "power",
+        "state_class": "measurement",
+    }
+    shared = b"".join(
+        (
+            b'{"type":"event","event":{"a":{',
+            b",".join(
+                core.State(
+                    f"sensor.benchmark_{idx}", str(idx), attributes
+                ).as_compressed_state_json
+                for idx in range(4000)
+            ),
+            b"}}",
+        )
+    )
+    compressors = [WebSocketCompressor(hass, 1, 15, False) for _ in range(50)]
+
+    start = timer()
+    for msg_id, compressor in enumerate(compressors):
+        compressor.compress([snapshot_message(shared, b',"id":%d}' % msg_id)])
+    runtime = timer() - start
+    stats = compressors[0].stats
+    print(f"Compressed {stats['bytes_in']} bytes to {stats['bytes_out']} bytes")
+    return runtime
+
+
+def _match_mqtt_wildcard_subscriptions(subscriptions: int) -> float:
+    """Match 100k messages against wildcard subscriptions."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.mqtt.client import Subscription, SubscriptionTrie
+
+    trie = SubscriptionTrie()
+    for idx in range(subscriptions):
+        # zigbee2mqtt devices and discovery like topic filters
+        topic_filter = (
+            f"zigbee2mqtt/device_{idx}/#"
+            if idx % 2
+            else f"homeassistant/+/device_{idx}/+/config"
+        )
+        trie.add(Subscription(topic_filter, False, None, 0, None))
+    topics = [
+        f"zigbee2mqtt/device_{idx % subscriptions}/state"
+        if idx % 2
+        else f"homeassistant/sensor/device_{idx % subscriptions}/power/config"
+        for idx in range(10**5)
+    ]
+
+    start = timer()
+    for topic in topics:
+        trie.match(topic)
+    runtime = timer() - start
+    print(f"Matched {len(topics) / runtime:.0f} messages/sec")
+    return runtime
+
+
+@benchmark
+async def mqtt_match_10_wildcard_subscriptions(hass):
+    """Match 100k messages against 10 wildcard subscriptions."""
+    return _match_mqtt_wildcard_subscriptions(10)
+
+
+@benchmark
+async def mqtt_match_100_wildcard_subscriptions(hass):
+    """Match 100k messages against 100 wildcard subscriptions."""
+    return _match_mqtt_wildcard_subscriptions(100)
+
+
+@benchmark
+async def mqtt_match_1000_wildcard_subscriptions(hass):
+    """Match 100k messages against 1000 wildcard subscriptions."""
+    return _match_mqtt_wildcard_subscriptions(1000)
+
+
+@benchmark
+async def dhcp_match_generated_matchers(hass):
+    """Match 100k dhcp clients against the generated dhcp matchers."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.dhcp import async_index_integration_matchers
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.generated.dhcp import DHCP
+
+    integration_matchers = async_index_integration_matchers(
+        [cast(loader.DHCPMatcher, matcher) for matcher in DHCP]
+    )
+    ouis = [matcher["macaddress"][:6] for matcher in DHCP if "macaddress" in matcher]
+    hostnames = [
+        matcher["hostname"].replace("*", "x").replace("?", "x")
+        for matcher in DHCP
+        if "hostname" in matcher
+    ]
+    # Most clients on a busy network do not match any integration
+    clients = [
+        (
+            f"{ouis[idx % len(ouis)] if idx % 10 == 0 else 'A4C138'}{idx:06X}",
+            hostnames[idx % len(hostnames)] if idx % 10 == 1 else f"client-{idx}",
+        )
+        for idx in range(10**5)
+    ]
+    matches = 0
+
+    start = timer()
+    for mac, hostname in clients:
+        matches += len(integration_matchers.match(mac, hostname))
+    runtime = timer() - start
+    print(f"Matched {matches} of {len(clients)} clients")
+    return runtime
+
+
+@benchmark
+async def zeroconf_match_generated_matchers(hass):
+    """Match 100k zeroconf services against the generated zeroconf matchers."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.zeroconf import _compile_zeroconf_matchers
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.generated.zeroconf import ZEROCONF
+
+    matchers_by_type = _compile_zeroconf_matchers(
+        cast(dict[str, list[loader.ZeroconfMatcher]], ZEROCONF)
+    )
+    service_types = list(matchers_by_type)
+    services = [
+        (
+            service_types[idx % len(service_types)],
+            f"Device {idx}.{service_types[idx % len(service_types)]}",
+            {"manufacturer": "shelly", "model": f"model-{idx % 100}"},
+        )
+        for idx in range(10**5)
+    ]
+    matches = 0
+
+    start = timer()
+    for service_type, name, props in services:
+        for matcher in matchers_by_type[service_type]:
+            matches += matcher.matches(name, props)
+    runtime = timer() - start
+    print(f"Matched {matches} of {len(services)} services")
+    return runtime
+
+
 @benchmark
 async def filtering_entity_id(hass):
     """Run a 100k state changes through entity filter."""
@@ -312,6 +718,506 @@ async def json_serialize_states(hass):
     return timer() - start
 
 
+@benchmark
+async def hls_concurrent_players(hass):
+    """Serve LL-HLS playlists and segments to 20 players for 200 segments."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.components.camera import DynamicStreamSettings
+    from homeassistant.components.stream.core import (
+        IdleTimer,
+        Part,
+        Segment,
+        StreamSettings,
+    )
+    from homeassistant.components.stream.hls import HlsPlaylistView, HlsStreamOutput
+
+    async def _idle() -> None:
+        """Do nothing when the track is idle."""
+
+    settings = StreamSettings(
+        ll_hls=True,
+        min_segment_duration=1.5,
+        part_target_duration=0.5,
+        hls_advance_part_limit=3,
+        hls_part_timeout=1.0,
+    )
+    track = HlsStreamOutput(
+        hass, IdleTimer(hass, 300, _idle), settings, DynamicStreamSettings()
+    )
+    players = 20
+    served = 0
+
+    start = timer()
+    for sequence in range(200):
+        segment = Segment(
+            sequence=sequence,
+            init=b"\x00" * 1024,
+            stream_id=0,
+            start_time=dt_util.utcnow(),
+            _stream_outputs=[],
+        )
+        track._async_put(segment)  # noqa: SLF001
+        for part_num in range(4):
+            segment.async_add_part(
+                Part(duration=0.5, has_keyframe=part_num == 0, data=b"\x01" * 65536),
+                2.0 if part_num == 3 else 0,
+            )
+            # Each player reloads the playlist and fetches the new part
+            for _ in range(players):
+                served += len(HlsPlaylistView.render_cached(track))
+                served += len(segment.parts[part_num].data)
+        # Players without LL-HLS support fetch the whole segment
+        for _ in range(players):
+            served += len(segment.get_data())
+    runtime = timer() - start
+    track.cleanup()
+    print(f"Served {served} bytes")
+    return runtime
+
+
+@benchmark
+async def conversation_slot_lists_churn(hass):
+    """Update the slot lists of 4000 exposed entities while entities change."""
+    # pylint: disable=import-outside-toplevel
+    import tempfile
+
+    from homeassistant.components.conversation.default_agent import DefaultAgent
+    from homeassistant.components.conversation.models import ConversationInput
+    from homeassistant.components.homeassistant.const import DATA_EXPOSED_ENTITIES
+    from homeassistant.components.homeassistant.exposed_entities import ExposedEntities
+    from homeassistant.helpers import (
+        area_registry as ar,
+        device_registry as dr,
+        entity_registry as er,
+        floor_registry as fr,
+        label_registry as lr,
+    )
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass.config.config_dir = config_dir
+        hass.config.language = "en"
+        await asyncio.gather(
+            ar.async_load(hass),
+            dr.async_load(hass),
+            er.async_load(hass),
+            fr.async_load(hass),
+            lr.async_load(hass),
+        )
+        exposed_entities = ExposedEntities(hass)
+        await exposed_entities.async_initialize()
+        hass.data[DATA_EXPOSED_ENTITIES] = exposed_entities
+
+        entity_registry = er.async_get(hass)
+        area_registry = ar.async_get(hass)
+        for idx in range(50):
+            area_registry.async_create(f"Room {idx}")
+        for idx in range(4000):
+            entry = entity_registry.async_get_or_create("light", "demo", str(idx))
+            hass.states.async_set(
+                entry.entity_id, "on", {"friendly_name": f"Light {idx}"}
+            )
+
+        agent = DefaultAgent(hass, {})
+        await agent.async_get_or_load_intents("en")
+        user_input = ConversationInput(
+            text="turn on light 123",
+            context=core.Context(),
+            conversation_id=None,
+            device_id=None,
+            language="en",
+        )
+
+        start = timer()
+        agent._make_slot_lists()  # noqa: SLF001
+        print(f"Created slot lists in {timer() - start:.3f}s")
+
+        # Each change is followed by a voice command
+        start = timer()
+        for idx in range(500):
+            entity_registry.async_update_entity(
+                f"light.demo_{idx}", aliases={f"Lamp {idx}"}
+            )
+            agent._make_slot_lists()  # noqa: SLF001
+            hass.states.async_set(
+                f"light.new_{idx}", "on", {"friendly_name": f"New light {idx}"}
+            )
+            agent._make_slot_lists()  # noqa: SLF001
+        runtime = timer() - start
+
+        recognize_start = timer()
+        for idx in range(5):
+            hass.states.async_remove(f"light.new_{idx}")
+            await agent.async_recognize(user_input)
+        print(f"Recognized in {(timer() - recognize_start) / 5:.3f}s")
+
+        await hass.async_stop()
+        return runtime
+
+
+@benchmark
+async def conversation_recognize(hass):
+    """Recognize sentences sampled from the bundled intents of 3 languages."""
+    # pylint: disable=import-outside-toplevel
+    from hassil.intents import TextSlotList
+    from hassil.sample import sample_intents
+
+    from homeassistant.components.conversation.default_agent import DefaultAgent
+    from homeassistant.components.conversation.models import ConversationInput
+
+    agent = DefaultAgent(hass, {})
+    slot_lists = {
+        "area": TextSlotList.from_strings(["kitchen", "living room", "garage"]),
+        "floor": TextSlotList.from_strings(["ground floor", "first floor"]),
+        "name": TextSlotList.from_tuples(
+            [
+                (f"{name} {idx}", f"{name} {idx}", {"domain": domain})
+                for idx in range(50)
+                for name, domain in (
+                    ("lamp", "light"),
+                    ("fan", "fan"),
+                    ("blind", "cover"),
+                )
+            ]
+        ),
+    }
+
+    runtime = 0.0
+    for language in ("en", "de", "fr"):
+        lang_intents = await agent.async_get_or_load_intents(language)
+        sentences = [
+            sentence
+            for _, sentence in sample_intents(
+                lang_intents.intents,
+                slot_lists,
+                max_sentences_per_intent=2,
+                expand_ranges=False,
+            )
+        ]
+        start = timer()
+        for sentence in sentences:
+            agent._recognize(  # noqa: SLF001
+                ConversationInput(
+                    text=sentence,
+                    context=core.Context(),
+                    conversation_id=None,
+                    device_id=None,
+                    language=language,
+                ),
+                lang_intents,
+                slot_lists,
+                None,
+                language,
+            )
+        elapsed = timer() - start
+        print(
+            f"Recognized {len(sentences)} {language} sentences in"
+            f" {elapsed / len(sentences) * 1000:.1f}ms on average"
+        )
+        runtime += elapsed
+    return runtime
+
+
+@benchmark
+async def recorder_hot_tier_history(hass):
+    """Query 24 hours of history for 4000 entities from the recorder hot tier."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.recorder.db_schema import States
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.recorder.table_managers.states_hot_tier import (
+        StatesHotTier,
+    )
+
+    entities = 4000
+    changes_per_entity = 100
+    end_ts = 86400.0
+    hot_tier = StatesHotTier(end_ts, 1024**3)
+    hot_tier.start(0.0)
+    for metadata_id in range(entities):
+        for idx in range(changes_per_entity):
+            hot_tier.add_pending(
+                States(
+                    metadata_id=metadata_id,
+                    state=str(idx % 10),
+                    last_updated_ts=end_ts * idx / changes_per_entity + 1,
+                    last_changed_ts=None,
+                ),
+                '{"unit_of_measurement":"W","friendly_name":"Power"}',
+            )
+        hot_tier.post_commit_pending()
+
+    metadata_ids = list(range(entities))
+    start = timer()
+    for _ in range(10):
+        hot_tier.get_significant_states_rows(
+            metadata_ids, [], 1800.0, None, 1.0, True, True, False
+        )
+    return timer() - start
+
+
+def _insert_states(bulk: bool) -> float:
+    """Insert 50 commits of 200 states and return the time it took."""
+    # pylint: disable=import-outside-toplevel
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import Session
+
+    from homeassistant.components.recorder.db_schema import (
+        Base,
+        StateAttributes,
+        States,
+        StatesMeta,
+    )
+    from homeassistant.components.recorder.table_managers.states_bulk_insert import (
+        StatesBulkInsertManager,
+    )
+
+    # pylint: enable=import-outside-toplevel
+
+    engine = create_engine(os.environ.get("BENCHMARK_RECORDER_DB_URL", "sqlite://"))
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    bulk_insert_manager = StatesBulkInsertManager()
+    entities = 200
+    with Session(engine) as session:
+        states_meta = [
+            StatesMeta(entity_id=f"sensor.power_{idx}") for idx in range(entities)
+        ]
+        session.add_all(states_meta)
+        session.commit()
+        metadata_ids = [meta.metadata_id for meta in states_meta]
+        start = timer()
+        for commit in range(50):
+            for metadata_id in metadata_ids:
+                objs = (
+                    state_attributes := StateAttributes(
+                        hash=commit, shared_attrs=f'{{"commit":{commit}}}'
+                    ),
+                    States(
+                        state=str(commit),
+                        last_updated_ts=float(commit),
+                        metadata_id=metadata_id,
+                        state_attributes=state_attributes,
+                    ),
+                )
+                for obj in objs:
+                    if bulk:
+                        bulk_insert_manager.add(obj)
+                    else:
+                        session.add(obj)
+            if bulk:
+                bulk_insert_manager.insert_pending(session)
+            session.commit()
+            bulk_insert_manager.post_commit_pending()
+        return timer() - start
+
+
+@benchmark
+async def recorder_insert_states_orm(hass):
+    """Insert states with the ORM unit of work.
+
+    Set BENCHMARK_RECORDER_DB_URL to run against another database.
+    """
+    return await hass.async_add_executor_job(_insert_states, False)
+
+
+@benchmark
+async def recorder_insert_states_bulk(hass):
+    """Insert states with multi-row INSERT statements.
+
+    Set BENCHMARK_RECORDER_DB_URL to run against another database.
+    """
+    return await hass.async_add_executor_job(_insert_states, True)
+
+
+@benchmark
+async def sensor_statistics_accumulator(hass):
+    """Accumulate a 5 minute window for 5000 sensors and summarize it."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.sensor.statistics_accumulator import (
+        StatisticsAccumulator,
+    )
+
+    sensors = 5000
+    updates_per_sensor = 30
+    start_ts = 1_700_000_100.0
+    attributes = {"state_class": "measurement", "unit_of_measurement": "W"}
+    states = [
+        core.State(
+            f"sensor.power_{idx}",
+            str(update),
+            attributes,
+            last_updated=dt_util.utc_from_timestamp(start_ts + update * 10 + idx / 1e4),
+        )
+        for update in range(updates_per_sensor)
+        for idx in range(sensors)
+    ]
+
+    start = timer()
+    accumulator = StatisticsAccumulator(0.0, start_ts - 1, [])
+    for state in states:
+        accumulator.add(state)
+    window = accumulator.pop_window(start_ts, start_ts + 300)
+    assert window is not None
+    for idx in range(sensors):
+        window_statistics = window.get(f"sensor.power_{idx}", "measurement")
+        assert window_statistics is not None
+        window_statistics.mean(start_ts + 300)
+    return timer() - start
+
+
+@benchmark
+async def recorder_reduce_statistics_per_month(hass):
+    """Reduce a year of hourly statistics of 50 meters to months."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.recorder import statistics
+
+    meters = 50
+    start_ts = 1_672_531_200.0
+    stats = {
+        f"sensor.energy_{idx}": [
+            {
+                "start": start_ts + hour * 3600,
+                "mean": None,
+                "min": None,
+                "max": None,
+                "state": float(hour),
+                "sum": float(hour),
+            }
+            for hour in range(24 * 365)
+        ]
+        for idx in range(meters)
+    }
+
+    start = timer()
+    statistics._reduce_statistics_per_month(stats, {"state", "sum"})  # noqa: SLF001
+    return timer() - start
+
+
+def _query_monthly_energy_statistics(hass, reduce_in_database: bool) -> float:
+    """Query a year of monthly statistics of 50 meters and return the time it took."""
+    # pylint: disable=import-outside-toplevel
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import Session
+
+    from homeassistant.components.recorder import statistics
+    from homeassistant.components.recorder.db_schema import (
+        Base,
+        Statistics,
+        StatisticsMeta,
+    )
+
+    # pylint: enable=import-outside-toplevel
+
+    engine = create_engine(os.environ.get("BENCHMARK_RECORDER_DB_URL", "sqlite://"))
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    meters = 50
+    start_time = dt_util.start_of_local_day(dt_util.parse_date("2023-01-01"))
+    end_time = start_time.replace(year=2024)
+    start_ts = start_time.timestamp()
+    types = {"sum"}
+    with Session(engine) as session:
+        statistics_meta = [
+            StatisticsMeta(
+                statistic_id=f"sensor.energy_{idx}",
+                source="recorder",
+                unit_of_measurement="kWh",
+                has_mean=False,
+                has_sum=True,
+            )
+            for idx in range(meters)
+        ]
+        session.add_all(statistics_meta)
+        session.commit()
+        session.execute(
+            Statistics.__table__.insert(),
+            [
+                {
+                    "metadata_id": meta.id,
+                    "start_ts": start_ts + hour * 3600,
+                    "state": float(hour),
+                    "sum": float(hour),
+                }
+                for meta in statistics_meta
+                for hour in range(24 * 365)
+            ],
+        )
+        session.commit()
+        metadata = {
+            meta.statistic_id: (
+                meta.id,
+                {
+                    "has_mean": False,
+                    "has_sum": True,
+                    "name": None,
+                    "source": "recorder",
+                    "statistic_id": meta.statistic_id,
+                    "unit_of_measurement": "kWh",
+                },
+            )
+            for meta in statistics_meta
+        }
+        metadata_ids = [metadata_id for metadata_id, _ in metadata.values()]
+        statistic_ids = set(metadata)
+
+        start = timer()
+        if reduce_in_database:
+            _, month_start_end = statistics.reduce_month_ts_factory()
+            bounds = statistics._period_bounds(  # noqa: SLF001
+                start_ts, end_time.timestamp() - 1, month_start_end
+            )
+            stmt = statistics._generate_statistics_during_period_reduced_stmt(  # noqa: SLF001
+                bounds, metadata_ids, types
+            )
+            statistics._reduced_statistics_to_dict(  # noqa: SLF001
+                hass,
+                session.connection().execute(stmt).all(),
+                bounds,
+                statistic_ids,
+                metadata,
+                None,
+                types,
+            )
+        else:
+            stmt = statistics._generate_statistics_during_period_stmt(  # noqa: SLF001
+                start_time, end_time, metadata_ids, Statistics, types
+            )
+            result = statistics._sorted_statistics_to_dict(  # noqa: SLF001
+                hass,
+                statistics.execute_stmt_lambda_element(session, stmt, orm_rows=False),
+                statistic_ids,
+                metadata,
+                True,
+                Statistics,
+                None,
+                types,
+            )
+            statistics._reduce_statistics_per_month(result, types)  # noqa: SLF001
+        return timer() - start
+
+
+@benchmark
+async def recorder_statistics_during_period_month(hass):
+    """Query a year of monthly energy statistics reduced in Python.
+
+    Set BENCHMARK_RECORDER_DB_URL to run against another database.
+    """
+    return await hass.async_add_executor_job(
+        _query_monthly_energy_statistics, hass, False
+    )
+
+
+@benchmark
+async def recorder_statistics_during_period_month_sql(hass):
+    """Query a year of monthly energy statistics reduced in the database.
+
+    Set BENCHMARK_RECORDER_DB_URL to run against another database.
+    """
+    return await hass.async_add_executor_job(
+        _query_monthly_energy_statistics, hass, True
+    )
+
+
 def _create_state_changed_event_from_old_new(
     entity_id, event_time_fired, old_state, new_state
 ):
@@ -0,0 +1,63 @@
+"""Test the event stream hub."""
+
+from homeassistant.components.api.event_stream import (
+    POLICY_DROP,
+    POLICY_MERGE,
+    POLICY_QUEUE,
+    EventStream,
+    async_get_event_stream_hub,
+)
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.json import json_loads
+
+
+def _events(stream: EventStream) -> list[dict]:
+    """Return the queued events of a stream."""
+    return [json_loads(payload[6:]) for payload in stream.async_take()]
+
+
+async def test_event_stream_policies(hass: HomeAssistant) -> None:
+    """Test slow streams keep, drop or merge events depending on the policy."""
+    hub = async_get_event_stream_hub(hass)
+    queue = EventStream(None, None, {"light"}, POLICY_QUEUE, max_queue=2)
+    merge = EventStream(None, None, {"light"}, POLICY_MERGE, max_queue=2)
+    drop = EventStream(None, None, {"light"}, POLICY_DROP, max_queue=2)
+    removes = [hub.async_add(queue), hub.async_add(merge), hub.async_add(drop)]
+
+    hass.states.async_set("light.kitchen", "on")
+    hass.states.async_set("light.hall", "on")
+    hass.states.async_set("light.kitchen", "off")
+    hass.states.async_set("switch.fan", "on")
+    assert merge.wakeup.is_set()
+    assert merge.lag > 0
+    assert merge.as_dict()["queue_size"] == 2
+
+    def states(stream: EventStream) -> list[tuple[str, str]]:
+        return [
+            (event["data"]["entity_id"], event["data"]["new_state"]["state"])
+            for event in _events(stream)
+        ]
+
+    assert states(queue) == [
+        ("light.kitchen", "on"),
+        ("light.hall", "on"),
+        ("light.kitchen", "off"),
+    ]
+    assert (queue.merged, queue.dropped, queue.sent) == (0, 0, 3)
+    # The merged state change is written after the events before it
+    assert states(merge) == [("light.hall", "on"), ("light.kitchen", "off")]
+    assert (merge.merged, merge.dropped, merge.sent) == (1, 0, 2)
+    assert states(drop) == [("light.hall", "on"), ("light.kitchen", "off")]
+    assert (drop.merged, drop.dropped, drop.sent) == (0, 1, 2)
+    assert not merge.wakeup.is_set()
+    assert merge.lag == 0
+
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STOP)
+    assert queue.closed
+    assert merge.closed
+    assert drop.closed
+
+    for remove in removes:
+        remove()
+    assert not hub.streams
@@ -45,6 +45,35 @@ async def test_api_list_state_entities(
     assert remote_data == local_data
 
 
+async def test_api_stream_states(
+    hass: HomeAssistant, mock_api_client: TestClient
+) -> None:
+    """Test large state lists and NDJSON requests are streamed."""
+    for idx in range(1001):
+        hass.states.async_set(f"test.entity_{idx}", "on", {"idx": idx})
+    expected = [state.as_dict() for state in hass.states.async_all()]
+
+    with patch("homeassistant.helpers.http.STREAM_CHUNK_SIZE", 4096):
+        resp = await mock_api_client.get(const.URL_API_STATES)
+        assert resp.status == HTTPStatus.OK
+        assert resp.headers["Transfer-Encoding"] == "chunked"
+        assert resp.headers["Content-Type"] == const.CONTENT_TYPE_JSON
+        remote_data = [ha.State.from_dict(item).as_dict() for item in await resp.json()]
+        assert remote_data == expected
+
+        hass.states.async_remove("test.entity_0")
+        resp = await mock_api_client.get(
+            const.URL_API_STATES, headers={"Accept": const.CONTENT_TYPE_NDJSON}
+        )
+        assert resp.status == HTTPStatus.OK
+        assert resp.headers["Content-Type"] == const.CONTENT_TYPE_NDJSON
+        lines = (await resp.read()).splitlines()
+    assert len(lines) == 1000
+    assert [json.loads(line)["entity_id"] for line in lines] == [
+        state["entity_id"] for state in expected[1:]
+    ]
+
+
 async def test_api_get_state(hass: HomeAssistant, mock_api_client: TestClient) -> None:
     """Test if the debug interface allows us to get a state."""
     hass.states.async_set("hello.world", "nice", {"attr": 1})
@@ -544,6 +573,10 @@ async def test_stream(hass: HomeAssistant, mock_api_client: TestClient) -> None:
 
         assert data["event_type"] == "test_event"
 
+        # Every event is written unless a lossy policy is requested
+        metrics = await (await mock_api_client.get("/api/stream/metrics")).json()
+        assert metrics[0]["policy"] == "queue"
+
 
 async def test_stream_with_restricted(
     hass: HomeAssistant, mock_api_client: TestClient
@@ -567,6 +600,47 @@ async def test_stream_with_restricted(
         assert data["event_type"] == "test_event3"
 
 
+async def test_stream_with_filters(
+    hass: HomeAssistant, mock_api_client: TestClient
+) -> None:
+    """Test the stream with entity_id and domain filters and metrics."""
+    async with mock_api_client.get(
+        f"{const.URL_API_STREAM}?entity_id=light.kitchen&domain=switch&policy=drop"
+    ) as resp:
+        assert resp.status == HTTPStatus.OK
+
+        hass.bus.async_fire("test_event")
+        hass.states.async_set("light.hall", "on")
+        hass.states.async_set("light.kitchen", "on")
+        data = await _stream_next_event(resp.content)
+        assert data["data"]["entity_id"] == "light.kitchen"
+
+        hass.states.async_set("sensor.power", "5")
+        hass.bus.async_fire("test_event", {"entity_id": "switch.fan"})
+        data = await _stream_next_event(resp.content)
+        assert data["event_type"] == "test_event"
+        assert data["data"]["entity_id"] == "switch.fan"
+
+        metrics = await (await mock_api_client.get("/api/stream/metrics")).json()
+        assert metrics == [
+            {
+                "event_types": None,
+                "entity_ids": ["light.kitchen"],
+                "domains": ["switch"],
+                "policy": "drop",
+                "queue_size": 0,
+                "lag": 0.0,
+                "sent": 2,
+                "dropped": 0,
+                "merged": 0,
+            }
+        ]
+
+    resp = await mock_api_client.get(f"{const.URL_API_STREAM}?policy=invalid")
+    assert resp.status == HTTPStatus.BAD_REQUEST
+    assert await (await mock_api_client.get("/api/stream/metrics")).json() == []
+
+
 async def _stream_next_event(stream):
     """Read the stream for next event while ignoring ping."""
     while True:
@@ -697,6 +771,15 @@ async def test_event_stream_requires_admin(
     assert resp.status == HTTPStatus.UNAUTHORIZED
 
 
+async def test_event_stream_metrics_requires_admin(
+    hass: HomeAssistant, mock_api_client: TestClient, hass_admin_user: MockUser
+) -> None:
+    """Test user needs to be admin to access event stream metrics."""
+    hass_admin_user.groups = []
+    resp = await mock_api_client.get("/api/stream/metrics")
+    assert resp.status == HTTPStatus.UNAUTHORIZED
+
+
 async def test_states(
     hass: HomeAssistant, mock_api_client: TestClient, hass_admin_user: MockUser
 ) -> None:
@@ -1,5 +1,6 @@
 """The tests for the camera component."""
 
+import asyncio
 from collections.abc import Generator
 from http import HTTPStatus
 import io
@@ -619,6 +620,60 @@ async def test_camera_proxy_stream(hass_client: ClientSessionGenerator) -> None:
             assert response.status == HTTPStatus.BAD_GATEWAY
 
 
+@pytest.mark.usefixtures("mock_camera")
+async def test_camera_proxy_stream_shared(
+    hass: HomeAssistant,
+    hass_client: ClientSessionGenerator,
+    hass_ws_client: WebSocketGenerator,
+) -> None:
+    """Test the viewers of a camera share the fetched images and frames."""
+    images: asyncio.Queue[bytes | None] = asyncio.Queue()
+    fetched: list[bytes | None] = []
+    client = await hass_client()
+    ws_client = await hass_ws_client(hass)
+
+    async def _async_camera_image(self: camera.Camera) -> bytes | None:
+        fetched.append(await images.get())
+        return fetched[-1]
+
+    with patch(
+        "homeassistant.components.demo.camera.DemoCamera.async_camera_image",
+        _async_camera_image,
+    ):
+        responses = [
+            await client.get("/api/camera_proxy_stream/camera.demo_camera")
+            for _ in range(2)
+        ]
+        await ws_client.send_json_auto_id({"type": "camera/still_streams"})
+        msg = await ws_client.receive_json()
+        assert msg["result"] == [
+            {
+                "entity_id": "camera.demo_camera",
+                "interval": 0.5,
+                "viewers": 2,
+                "frames": 0,
+                "sent": 0,
+                "dropped": 0,
+            }
+        ]
+
+        images.put_nowait(b"image")
+        images.put_nowait(None)
+        frame = (
+            b"--frameboundary\r\nContent-Type: image/jpg\r\n"
+            b"Content-Length: 5\r\n\r\nimage\r\n"
+        )
+        for response in responses:
+            assert response.status == HTTPStatus.OK
+            # The first frame is sent twice
+            assert await response.read() == frame * 2
+
+    assert fetched == [b"image", None]
+    await ws_client.send_json_auto_id({"type": "camera/still_streams"})
+    msg = await ws_client.receive_json()
+    assert msg["result"] == []
+
+
 @pytest.mark.usefixtures("mock_camera_web_rtc")
 async def test_websocket_web_rtc_offer(
     hass: HomeAssistant, hass_ws_client: WebSocketGenerator
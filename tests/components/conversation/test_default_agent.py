@@ -1103,6 +1103,83 @@ async def test_empty_aliases(
         assert floors.values[0].text_in.text == floor_1.name
 
 
+@pytest.mark.usefixtures("init_components")
+async def test_slot_lists_updated_incrementally(
+    hass: HomeAssistant,
+    area_registry: ar.AreaRegistry,
+    entity_registry: er.EntityRegistry,
+) -> None:
+    """Test that only the slot lists affected by a change are created again."""
+    hass.states.async_set("light.kitchen", "on", {ATTR_FRIENDLY_NAME: "kitchen"})
+    area_registry.async_create("kitchen")
+
+    async def get_slot_lists() -> dict[str, Any]:
+        with patch(
+            "homeassistant.components.conversation.default_agent.DefaultAgent._recognize",
+            return_value=None,
+        ) as mock_recognize_all:
+            await conversation.async_converse(
+                hass, "turn on the kitchen", None, Context(), None
+            )
+        return mock_recognize_all.call_args[0][2]
+
+    def names(slot_list: Any) -> list[str]:
+        return [value.text_in.text for value in slot_list.values]
+
+    slot_lists = await get_slot_lists()
+    assert names(slot_lists["name"]) == ["kitchen"]
+    assert names(slot_lists["area"]) == ["kitchen"]
+
+    # Adding an entity only changes the entity names
+    hass.states.async_set("light.bedroom", "on", {ATTR_FRIENDLY_NAME: "bedroom"})
+    new_slot_lists = await get_slot_lists()
+    assert names(new_slot_lists["name"]) == ["kitchen", "bedroom"]
+    assert new_slot_lists["area"] is slot_lists["area"]
+    assert new_slot_lists["floor"] is slot_lists["floor"]
+    slot_lists = new_slot_lists
+
+    # Aliases of the entity are added
+    entity_registry.async_get_or_create("light", "demo", "1234")
+    hass.states.async_set("light.demo_1234", "on", {ATTR_FRIENDLY_NAME: "desk"})
+    entity_registry.async_update_entity("light.demo_1234", aliases={"lamp"})
+    new_slot_lists = await get_slot_lists()
+    assert names(new_slot_lists["name"]) == ["kitchen", "bedroom", "lamp", "desk"]
+    assert new_slot_lists["area"] is slot_lists["area"]
+    slot_lists = new_slot_lists
+
+    # Renaming an entity uses the friendly name it writes after the update
+    entity_registry.async_update_entity("light.demo_1234", name="reading light")
+    hass.states.async_set(
+        "light.demo_1234", "on", {ATTR_FRIENDLY_NAME: "reading light"}
+    )
+    new_slot_lists = await get_slot_lists()
+    assert names(new_slot_lists["name"]) == [
+        "kitchen",
+        "bedroom",
+        "lamp",
+        "reading light",
+    ]
+    assert new_slot_lists["area"] is slot_lists["area"]
+    slot_lists = new_slot_lists
+
+    # Adding an area only changes the area names
+    area_registry.async_create("bedroom")
+    new_slot_lists = await get_slot_lists()
+    assert names(new_slot_lists["area"]) == ["kitchen", "bedroom"]
+    assert new_slot_lists["name"] is slot_lists["name"]
+    slot_lists = new_slot_lists
+
+    # Removing an entity only changes the entity names
+    hass.states.async_remove("light.kitchen")
+    new_slot_lists = await get_slot_lists()
+    assert names(new_slot_lists["name"]) == ["bedroom", "lamp", "reading light"]
+    assert new_slot_lists["area"] is slot_lists["area"]
+
+    # Unexposing an entity
+    expose_entity(hass, "light.bedroom", False)
+    assert names((await get_slot_lists())["name"]) == ["lamp", "reading light"]
+
+
 @pytest.mark.usefixtures("init_components")
 async def test_all_domains_loaded(hass: HomeAssistant) -> None:
     """Test that sentences for all domains are always loaded."""
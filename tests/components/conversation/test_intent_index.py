@@ -0,0 +1,78 @@
+"""Test the index of the words required by sentence templates."""
+
+from hassil.intents import Intents
+import pytest
+
+from homeassistant.components.conversation.intent_index import IntentIndex
+
+INTENTS = {
+    "language": "en",
+    "intents": {
+        "TurnOn": {
+            "data": [
+                {"sentences": ["(turn|switch) on [the] {name}"]},
+                {"sentences": ["<activate> {area}"]},
+            ]
+        },
+        "TurnOff": {"data": [{"sentences": ["(turn|switch) off [the] {name}"]}]},
+        "WiFi": {"data": [{"sentences": ["[enable] wi fi guest network"]}]},
+        "Catch": {"data": [{"sentences": ["{anything}"]}]},
+    },
+    "expansion_rules": {"activate": "(activate|enable) all"},
+    "lists": {"anything": {"wildcard": True}},
+}
+
+
+def _candidates(index: IntentIndex, text: str) -> dict[str, int]:
+    """Return the number of intent data per candidate intent."""
+    return {
+        name: len(intent.data)
+        for name, intent in index.candidates(text).intents.items()
+    }
+
+
+@pytest.mark.parametrize(
+    ("text", "candidates"),
+    [
+        ("Turn ON the kitchen light", {"TurnOn": 1, "Catch": 1}),
+        ("switch off lamp!", {"TurnOff": 1, "Catch": 1}),
+        ("enable all garden", {"TurnOn": 1, "Catch": 1}),
+        ("enable wi-fi guest network", {"WiFi": 1, "Catch": 1}),
+        ("guest network", {"Catch": 1}),
+        ("wi_fi guest network?", {"WiFi": 1, "Catch": 1}),
+        ("hello", {"Catch": 1}),
+    ],
+)
+def test_candidates(text: str, candidates: dict[str, int]) -> None:
+    """Test only intent data with the required words of the text are candidates."""
+    index = IntentIndex(Intents.from_dict(INTENTS))
+    assert _candidates(index, text) == candidates
+
+
+def test_candidates_keep_intents() -> None:
+    """Test the intents are returned when all intent data are candidates."""
+    intents = Intents.from_dict(INTENTS)
+    index = IntentIndex(intents)
+    assert index.candidates("enable wi-fi guest network, turn off the light") is not (
+        intents
+    )
+    assert (
+        index.candidates("enable wi-fi guest network, turn on all and off") is intents
+    )
+
+
+def test_candidates_ignore_whitespace() -> None:
+    """Test skip words are removed when whitespace is ignored."""
+    index = IntentIndex(
+        Intents.from_dict(
+            {
+                "language": "zh-tw",
+                "settings": {"ignore_whitespace": True},
+                "intents": {"TurnOn": {"data": [{"sentences": ["打開 {name}"]}]}},
+                "skip_words": ["請"],
+            }
+        )
+    )
+    assert _candidates(index, "打 開 燈") == {"TurnOn": 1}
+    assert _candidates(index, "打請開燈") == {"TurnOn": 1}
+    assert _candidates(index, "關燈") == {}
@@ -1147,3 +1147,46 @@ async def test_aiodiscover_finds_new_hosts_after_interval(hass: HomeAssistant) -
         hostname="connect",
         macaddress="b8b7f16db533",
     )
+
+
+def test_integration_matchers_index() -> None:
+    """Test the integration matchers are indexed by OUI and hostname prefix."""
+    integration_matchers = dhcp.async_index_integration_matchers(
+        [
+            {"domain": "oui", "macaddress": "B8B7F1*"},
+            {"domain": "oui-hostname", "hostname": "connect*", "macaddress": "B8B7F1*"},
+            {"domain": "longer-mac", "macaddress": "B8B7F16*"},
+            {"domain": "hostname", "hostname": "irobot-*"},
+            {"domain": "short-hostname", "hostname": "ir*"},
+            {"domain": "wildcard-hostname", "hostname": "*-tv"},
+            {"domain": "wildcard-mac", "macaddress": "*DB533"},
+            {"domain": "registered", "registered_devices": True},
+        ]
+    )
+    assert integration_matchers.registered_devices_domains == {"registered"}
+    assert set(integration_matchers.oui) == {"B8B7F1"}
+    assert set(integration_matchers.hostname) == {"irob"}
+    assert [
+        compiled.matcher["domain"] for compiled in integration_matchers.fallback
+    ] == ["short-hostname", "wildcard-hostname", "wildcard-mac"]
+
+    def _matching_domains(mac: str, hostname: str) -> list[str]:
+        return [
+            matcher["domain"] for matcher in integration_matchers.match(mac, hostname)
+        ]
+
+    assert _matching_domains("B8B7F16DB533", "connect") == [
+        "oui",
+        "oui-hostname",
+        "longer-mac",
+        "wildcard-mac",
+    ]
+    assert _matching_domains("B8B7F12DB534", "living-room-tv") == [
+        "oui",
+        "wildcard-hostname",
+    ]
+    assert _matching_domains("50147903852C", "irobot-ae9ec12dd3b0") == [
+        "hostname",
+        "short-hostname",
+    ]
+    assert _matching_domains("50147903852C", "") == []
@@ -3,7 +3,7 @@
 from datetime import timedelta
 from http import HTTPStatus
 import json
-from unittest.mock import sentinel
+from unittest.mock import patch, sentinel
 
 from freezegun import freeze_time
 import pytest
@@ -12,7 +12,7 @@ from homeassistant.components import history
 from homeassistant.components.recorder import Recorder
 from homeassistant.components.recorder.history import get_significant_states
 from homeassistant.components.recorder.models import process_timestamp
-from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE
+from homeassistant.const import CONTENT_TYPE_NDJSON, EVENT_HOMEASSISTANT_FINAL_WRITE
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.json import JSONEncoder
 from homeassistant.setup import async_setup_component
@@ -454,6 +454,42 @@ async def test_fetch_period_api_with_minimal_response(
     ).replace('"', "")
 
 
+async def test_fetch_period_api_stream(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_client: ClientSessionGenerator
+) -> None:
+    """Test the fetch period view streams NDJSON and large responses."""
+    now = dt_util.utcnow()
+    await async_setup_component(hass, "history", {})
+    hass.states.async_set("sensor.power", 0)
+    hass.states.async_set("sensor.energy", 10)
+    await async_wait_recording_done(hass)
+    hass.states.async_set("sensor.power", 50)
+    await async_wait_recording_done(hass)
+    client = await hass_client()
+    url = (
+        f"/api/history/period/{now.isoformat()}"
+        "?filter_entity_id=sensor.power,sensor.energy&minimal_response"
+    )
+
+    response = await client.get(url, headers={"Accept": CONTENT_TYPE_NDJSON})
+    assert response.status == HTTPStatus.OK
+    assert response.headers["Content-Type"] == CONTENT_TYPE_NDJSON
+    lines = [json.loads(line) for line in (await response.read()).splitlines()]
+    assert [[state["state"] for state in states] for states in lines] == [
+        ["0", "50"],
+        ["10"],
+    ]
+
+    response = await client.get(url)
+    assert "Transfer-Encoding" not in response.headers
+    assert await response.json() == lines
+
+    with patch("homeassistant.components.history.STREAM_MIN_ITEMS", 2):
+        response = await client.get(url)
+    assert response.headers["Transfer-Encoding"] == "chunked"
+    assert await response.json() == lines
+
+
 async def test_fetch_period_api_with_no_timestamp(
     hass: HomeAssistant, recorder_mock: Recorder, hass_client: ClientSessionGenerator
 ) -> None:
@@ -12,7 +12,11 @@ import paho.mqtt.client as paho_mqtt
 import pytest
 
 from homeassistant.components import mqtt
-from homeassistant.components.mqtt.client import RECONNECT_INTERVAL_SECONDS
+from homeassistant.components.mqtt.client import (
+    RECONNECT_INTERVAL_SECONDS,
+    Subscription,
+    SubscriptionTrie,
+)
 from homeassistant.components.mqtt.models import MessageCallbackType, ReceiveMessage
 from homeassistant.config_entries import ConfigEntryDisabler, ConfigEntryState
 from homeassistant.const import (
@@ -653,6 +657,56 @@ async def test_subscribe_special_characters(
     assert recorded_calls[0].payload == payload
 
 
+def test_subscription_trie() -> None:
+    """Test the subscription trie matches topics like paho."""
+    filters = [
+        "#",
+        "+",
+        "+/+",
+        "home/#",
+        "home/+",
+        "home/+/state",
+        "home/kitchen/state",
+        "home/+/+/#",
+        "+/kitchen/#",
+        "$SYS/#",
+        "$SYS/+/uptime",
+        "home//state",
+    ]
+    topics = [
+        "home",
+        "home/",
+        "home/kitchen",
+        "home/kitchen/state",
+        "home/kitchen/light/state",
+        "home//state",
+        "/home",
+        "$SYS/broker/uptime",
+        "$SYS",
+        "zigbee2mqtt/bridge/state",
+    ]
+    trie = SubscriptionTrie()
+    subscriptions = [
+        Subscription(topic_filter, False, Mock(), 0, None) for topic_filter in filters
+    ]
+    for subscription in subscriptions:
+        trie.add(subscription)
+
+    for topic in topics:
+        assert {subscription.topic for subscription in trie.match(topic)} == {
+            topic_filter
+            for topic_filter in filters
+            if paho_mqtt.topic_matches_sub(topic_filter, topic)
+        }, topic
+
+    for subscription in subscriptions:
+        trie.remove(subscription)
+    # The unused levels are removed
+    assert trie._root.children == {}
+    with pytest.raises(KeyError):
+        trie.remove(subscriptions[0])
+
+
 async def test_subscribe_same_topic(
     hass: HomeAssistant,
     mock_debouncer: asyncio.Event,
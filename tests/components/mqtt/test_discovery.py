@@ -571,6 +571,51 @@ async def test_non_duplicate_discovery(
     assert "Component has already been discovered: binary_sensor bla" in caplog.text
 
 
+async def test_batched_discovery(
+    hass: HomeAssistant,
+    mqtt_mock_entry: MqttMockHAClientGenerator,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test the components discovered together are added per platform."""
+    await mqtt_mock_entry()
+    new_sensors: list[list[MQTTDiscoveryPayload]] = []
+    unsub = async_dispatcher_connect(
+        hass, MQTT_DISCOVERY_NEW.format("sensor", "mqtt"), new_sensors.append
+    )
+    for idx in range(3):
+        async_fire_mqtt_message(
+            hass,
+            f"homeassistant/sensor/bla{idx}/config",
+            f'{{ "name": "Beer {idx}", "state_topic": "test-topic" }}',
+        )
+    await hass.async_block_till_done()
+
+    assert [len(payloads) for payloads in new_sensors] == [3]
+    for idx in range(3):
+        assert hass.states.get(f"sensor.beer_{idx}") is not None
+
+    # The retained messages are sent again on reconnect
+    caplog.clear()
+    async_fire_mqtt_message(
+        hass,
+        "homeassistant/sensor/bla0/config",
+        '{ "name": "Beer 0", "state_topic": "test-topic" }',
+    )
+    async_fire_mqtt_message(
+        hass,
+        "homeassistant/sensor/bla1/config",
+        '{ "name": "Milk", "state_topic": "test-topic" }',
+    )
+    await hass.async_block_till_done()
+
+    assert "Ignoring unchanged discovery payload for sensor bla0" in caplog.text
+    assert "Component has already been discovered: sensor bla0" not in caplog.text
+    assert "Component has already been discovered: sensor bla1" in caplog.text
+    assert hass.states.get("sensor.beer_1").name == "Milk"
+    assert len(new_sensors) == 1
+    unsub()
+
+
 async def test_removal(
     hass: HomeAssistant, mqtt_mock_entry: MqttMockHAClientGenerator
 ) -> None:
@@ -1055,6 +1055,73 @@ async def test_mqtt_ws_subscription_not_admin(
     assert response["error"]["message"] == "Unauthorized"
 
 
+async def test_mqtt_ws_metrics(
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+    mqtt_mock_entry: MqttMockHAClientGenerator,
+    hass_read_only_access_token: str,
+) -> None:
+    """Test MQTT websocket message metrics."""
+    await mqtt_mock_entry()
+    received: list[ReceiveMessage] = []
+
+    @callback
+    def _message_received(msg: ReceiveMessage) -> None:
+        received.append(msg)
+
+    unsub = await mqtt.async_subscribe(hass, "test-topic/#", _message_received)
+
+    async_fire_mqtt_message(hass, "test-topic/1", "test1")
+    async_fire_mqtt_message(hass, "test-topic/2", "test2")
+    async_fire_mqtt_message(hass, "test-topic/1", b"\xde\xad\xbe\xef")
+    await hass.async_block_till_done()
+    assert len(received) == 2
+
+    client = await hass_ws_client(hass)
+    await client.send_json({"id": 5, "type": "mqtt/metrics"})
+    response = await client.receive_json()
+    assert response["success"]
+    metrics = response["result"]
+    assert metrics["messages"] == 3
+    # The first message is sampled
+    assert metrics["dispatch_lag"]["count"] == 1
+    assert metrics["subscriptions"] == {
+        "test-topic/#": {
+            "messages": 3,
+            "decode_failures": 1,
+            "callback_time": {
+                "count": 1,
+                "mean": ANY,
+                "max": ANY,
+                "buckets": {
+                    "0.0001": ANY,
+                    "0.0005": ANY,
+                    "0.001": ANY,
+                    "0.005": ANY,
+                    "0.01": ANY,
+                    "0.05": ANY,
+                    "0.1": ANY,
+                    "0.5": ANY,
+                    "1.0": ANY,
+                    "inf": ANY,
+                },
+            },
+        }
+    }
+
+    # The metrics of a topic are removed after unsubscribing
+    unsub()
+    await client.send_json({"id": 6, "type": "mqtt/metrics"})
+    response = await client.receive_json()
+    assert response["result"]["subscriptions"] == {}
+
+    client = await hass_ws_client(hass, access_token=hass_read_only_access_token)
+    await client.send_json({"id": 5, "type": "mqtt/metrics"})
+    response = await client.receive_json()
+    assert response["success"] is False
+    assert response["error"]["code"] == "unauthorized"
+
+
 async def test_dump_service(
     hass: HomeAssistant, mqtt_mock_entry: MqttMockHAClientGenerator
 ) -> None:
@@ -1844,6 +1911,7 @@ async def test_disabling_and_enabling_entry(
             config_alarm_control_panel,
         )
         async_fire_mqtt_message(hass, "homeassistant/light/abc/config", config_light)
+        await hass.async_block_till_done()
 
     # Disable MQTT config entry
     await hass.config_entries.async_set_disabled_by(
@@ -0,0 +1,16 @@
+"""Test the states table manager."""
+
+from homeassistant.components.recorder.table_managers.states import StatesManager
+
+
+def test_update_pending_last_reported() -> None:
+    """Test only states reported after they were last updated are written."""
+    states_manager = StatesManager()
+
+    # Not reported since the state was last updated
+    states_manager.update_pending_last_reported(1, 100.0, 100.0)
+    states_manager.update_pending_last_reported(2, 101.0, 100.0)
+    assert states_manager.get_pending_last_reported_timestamp() == {2: 101.0}
+
+    states_manager.post_commit_pending()
+    assert states_manager.get_pending_last_reported_timestamp() == {}
@@ -0,0 +1,72 @@
+"""Test the states bulk insert manager."""
+
+from itertools import count
+from typing import Any
+from unittest.mock import MagicMock, Mock
+
+from homeassistant.components.recorder.db_schema import (
+    StateAttributes,
+    States,
+    StatesMeta,
+)
+from homeassistant.components.recorder.table_managers.states_bulk_insert import (
+    StatesBulkInsertManager,
+)
+
+
+def _mock_session() -> MagicMock:
+    """Return a session which returns sequential ids for executed inserts."""
+    ids = count(1)
+
+    def _execute(statement: Any, params: list[dict[str, Any]]) -> Mock:
+        return Mock(scalars=Mock(return_value=[next(ids) for _ in params]))
+
+    return MagicMock(execute=Mock(side_effect=_execute))
+
+
+def test_insert_pending_links_states_in_the_same_commit() -> None:
+    """Test states which link to a state in the same commit are inserted later."""
+    manager = StatesBulkInsertManager()
+    states_meta = StatesMeta(entity_id="test.one")
+    state_attributes = StateAttributes(shared_attrs="{}", hash=1)
+    manager.add(states_meta)
+    manager.add(state_attributes)
+    dbstates: list[States] = []
+    old_state: States | None = None
+    for idx in range(3):
+        dbstate = States(state=f"one{idx}")
+        dbstate.states_meta_rel = states_meta
+        dbstate.state_attributes = state_attributes
+        dbstate.old_state = old_state
+        manager.add(dbstate)
+        dbstates.append(dbstate)
+        old_state = dbstate
+    other = States(state="two0")
+    other.states_meta_rel = states_meta
+    manager.add(other)
+
+    session = _mock_session()
+    manager.insert_pending(session)
+
+    # The metadata and attributes are inserted first, then
+    # one insert for each generation of linked states
+    assert [len(call.args[1]) for call in session.execute.call_args_list] == [
+        1,
+        1,
+        2,
+        1,
+        1,
+    ]
+    assert states_meta.metadata_id == 1
+    assert state_attributes.attributes_id == 2
+    assert [dbstate.state_id for dbstate in dbstates] == [3, 5, 6]
+    assert other.state_id == 4
+    assert [dbstate.old_state_id for dbstate in dbstates] == [None, 3, 5]
+    for dbstate in dbstates:
+        assert dbstate.metadata_id == 1
+        assert dbstate.attributes_id == 2
+
+    manager.post_commit_pending()
+    session.reset_mock()
+    manager.insert_pending(session)
+    session.execute.assert_not_called()
@@ -0,0 +1,184 @@
+"""Test the states hot tier."""
+
+from unittest.mock import patch
+
+from homeassistant.components.recorder.db_schema import States
+from homeassistant.components.recorder.table_managers import states_hot_tier
+from homeassistant.components.recorder.table_managers.states_hot_tier import (
+    HotTierRow,
+    StatesHotTier,
+)
+
+
+def _add_states(
+    hot_tier: StatesHotTier,
+    metadata_id: int,
+    rows: list[tuple[str | None, float, float | None, str | None]],
+) -> None:
+    """Add committed states to the hot tier."""
+    for state, last_updated_ts, last_changed_ts, shared_attrs in rows:
+        hot_tier.add_pending(
+            States(
+                metadata_id=metadata_id,
+                state=state,
+                last_updated_ts=last_updated_ts,
+                last_changed_ts=last_changed_ts,
+            ),
+            shared_attrs,
+        )
+    hot_tier.post_commit_pending()
+
+
+def _query(
+    hot_tier: StatesHotTier,
+    metadata_ids: list[int],
+    start_time_ts: float,
+    end_time_ts: float | None = None,
+    significant_changes_only: bool = True,
+    include_start_time_state: bool = True,
+    run_start_ts: float = 0.0,
+) -> list[HotTierRow] | None:
+    """Query the hot tier."""
+    return hot_tier.get_significant_states_rows(
+        metadata_ids,
+        [],
+        start_time_ts,
+        end_time_ts,
+        run_start_ts,
+        significant_changes_only,
+        include_start_time_state,
+        False,
+    )
+
+
+def test_hot_tier_not_started() -> None:
+    """Test the hot tier does not answer before it is started."""
+    hot_tier = StatesHotTier(3600, 1024**2)
+    _add_states(hot_tier, 1, [("on", 150.0, None, "{}")])
+    assert not hot_tier.active
+    assert _query(hot_tier, [1], 200.0) is None
+    assert hot_tier.get_stats() == {
+        "hits": 0,
+        "misses": 1,
+        "entities": 0,
+        "rows": 0,
+        "memory_usage": 0,
+        "covered_since": None,
+    }
+
+
+def test_hot_tier_query() -> None:
+    """Test querying the hot tier."""
+    hot_tier = StatesHotTier(3600, 1024**2)
+    hot_tier.start(100.0)
+    _add_states(
+        hot_tier,
+        1,
+        [
+            ("on", 110.0, None, '{"a":1}'),
+            ("on", 120.0, 110.0, '{"a":2}'),
+            ("off", 130.0, None, '{"a":2}'),
+        ],
+    )
+    # Added out of order
+    _add_states(hot_tier, 1, [("on", 125.0, None, '{"a":2}')])
+    _add_states(hot_tier, 2, [("5", 140.0, None, None)])
+
+    assert _query(hot_tier, [1, 2], 100.0) is None
+    assert _query(hot_tier, [1, 2], 115.0) == [
+        HotTierRow(1, "on", 0, None, '{"a":1}'),
+        HotTierRow(1, "on", 125.0, None, '{"a":2}'),
+        HotTierRow(1, "off", 130.0, None, '{"a":2}'),
+        HotTierRow(2, "5", 140.0, None, None),
+    ]
+    assert _query(hot_tier, [1], 115.0, 130.0, significant_changes_only=False) == [
+        HotTierRow(1, "on", 0, None, '{"a":1}'),
+        HotTierRow(1, "on", 120.0, 110.0, '{"a":2}'),
+        HotTierRow(1, "on", 125.0, None, '{"a":2}'),
+    ]
+    # States from before the run started are not start states
+    # when querying multiple entities
+    assert _query(hot_tier, [1, 2], 115.0, 126.0, run_start_ts=112.0) == [
+        HotTierRow(1, "on", 125.0, None, '{"a":2}'),
+    ]
+    # A single entity without a state before the start time must
+    # use the database as the start state may be from an earlier run
+    assert _query(hot_tier, [2], 115.0) is None
+    assert _query(hot_tier, [2], 115.0, include_start_time_state=False) == [
+        HotTierRow(2, "5", 140.0, None, None),
+    ]
+    stats = hot_tier.get_stats()
+    assert stats["hits"] == 4
+    assert stats["misses"] == 2
+    assert stats["entities"] == 2
+    assert stats["rows"] == 5
+
+
+def test_hot_tier_evict_expired() -> None:
+    """Test rows older than max_age are evicted but the start state is kept."""
+    hot_tier = StatesHotTier(100, 1024**2)
+    hot_tier.start(0.0)
+    _add_states(
+        hot_tier,
+        1,
+        [("a", 10.0, None, "{}"), ("b", 20.0, None, "{}"), ("c", 150.0, None, "{}")],
+    )
+    _add_states(hot_tier, 2, [("x", 10.0, None, '{"x":1}')])
+
+    hot_tier.evict_expired(130.0)
+
+    assert hot_tier.get_stats()["rows"] == 3
+    assert hot_tier.get_stats()["covered_since"] == 30.0
+    assert _query(hot_tier, [1, 2], 20.0) is None
+    assert _query(hot_tier, [1, 2], 40.0) == [
+        HotTierRow(1, "b", 0, None, "{}"),
+        HotTierRow(1, "c", 150.0, None, "{}"),
+        HotTierRow(2, "x", 0, None, '{"x":1}'),
+    ]
+
+
+def test_hot_tier_memory_limit() -> None:
+    """Test the memory limit evicts the oldest rows."""
+    hot_tier = StatesHotTier(1000, 1024**2)
+    hot_tier.start(0.0)
+    with patch.object(states_hot_tier, "EVICT_INTERVAL", 10**9):
+        _add_states(
+            hot_tier,
+            1,
+            [(str(idx), float(idx), None, None) for idx in range(100)],
+        )
+        assert hot_tier.get_stats()["rows"] == 100
+        hot_tier.memory_limit = hot_tier.memory_usage // 2
+        _add_states(hot_tier, 1, [("100", 100.0, None, None)])
+
+    stats = hot_tier.get_stats()
+    assert stats["memory_usage"] <= hot_tier.memory_limit
+    assert stats["rows"] < 101
+    assert stats["covered_since"] > 0
+
+
+def test_hot_tier_evict_purged() -> None:
+    """Test purged states are evicted from the hot tier."""
+    hot_tier = StatesHotTier(3600, 1024**2)
+    hot_tier.start(0.0)
+    _add_states(hot_tier, 1, [("a", 10.0, None, "{}"), ("b", 20.0, None, "{}")])
+    _add_states(hot_tier, 2, [("x", 10.0, None, "{}"), ("y", 30.0, None, "{}")])
+
+    hot_tier.evict_purged(15.0)
+    assert hot_tier.get_stats()["rows"] == 2
+    assert _query(hot_tier, [1, 2], 12.0) is None
+    assert _query(hot_tier, [1, 2], 25.0) == [
+        HotTierRow(1, "b", 0, None, "{}"),
+        HotTierRow(2, "y", 30.0, None, "{}"),
+    ]
+
+    with patch.object(states_hot_tier.time, "time", return_value=40.0):
+        hot_tier.evict_purged_metadata_ids([2])
+    assert hot_tier.get_stats()["rows"] == 1
+    assert _query(hot_tier, [1, 2], 25.0) is None
+    assert _query(hot_tier, [1], 25.0) is not None
+
+    hot_tier.reset()
+    assert not hot_tier.active
+    assert hot_tier.get_stats()["rows"] == 0
+    assert hot_tier.memory_usage == 0
@@ -1272,3 +1272,105 @@ async def test_get_last_state_changes_with_non_existent_entity_ids_returns_empty
 ) -> None:
     """Test get_last_state_changes returns an empty dict when entities not in the db."""
     assert history.get_last_state_changes(hass, 1, "nonexistent.entity") == {}
+
+
+def _history_as_dicts(
+    hist: dict[str, list[State | dict]],
+) -> dict[str, list[dict]]:
+    """Convert a history result to dicts so results can be compared."""
+    return {
+        entity_id: [
+            state.as_dict() if isinstance(state, State) else state for state in states
+        ]
+        for entity_id, states in hist.items()
+    }
+
+
+@pytest.mark.parametrize("recorder_config", [{"hot_tier_max_age": {"hours": 1}}])
+@pytest.mark.parametrize(
+    (
+        "significant_changes_only",
+        "minimal_response",
+        "no_attributes",
+        "compressed_state_format",
+    ),
+    [
+        (True, False, False, False),
+        (False, False, False, False),
+        (True, True, False, False),
+        (True, False, True, False),
+        (True, True, False, True),
+        (False, False, True, True),
+    ],
+)
+async def test_get_significant_states_from_hot_tier(
+    hass: HomeAssistant,
+    significant_changes_only: bool,
+    minimal_response: bool,
+    no_attributes: bool,
+    compressed_state_format: bool,
+) -> None:
+    """Test the hot tier returns the same history as the database."""
+    zero, four, states = record_states(hass)
+    await async_wait_recording_done(hass)
+    instance = get_instance(hass)
+    hot_tier = instance.states_hot_tier
+    assert hot_tier is not None
+
+    kwargs = {
+        "entity_ids": list(states),
+        "significant_changes_only": significant_changes_only,
+        "minimal_response": minimal_response,
+        "no_attributes": no_attributes,
+        "compressed_state_format": compressed_state_format,
+    }
+    for start_time, end_time in (
+        (zero, four),
+        (zero + timedelta(seconds=1.5), four),
+        (zero + timedelta(seconds=1.5), None),
+    ):
+        from_hot_tier = history.get_significant_states(
+            hass, start_time, end_time, **kwargs
+        )
+        with patch.object(instance, "states_hot_tier", None):
+            from_database = history.get_significant_states(
+                hass, start_time, end_time, **kwargs
+            )
+        assert from_hot_tier
+        assert _history_as_dicts(from_hot_tier) == _history_as_dicts(from_database)
+
+    assert hot_tier.get_stats()["hits"] == 3
+    assert hot_tier.get_stats()["misses"] == 0
+
+    # The window before the recorder started is not covered by the hot tier
+    history.get_significant_states(hass, zero - timedelta(hours=1), four, **kwargs)
+    assert hot_tier.get_stats()["misses"] == 1
+
+
+@pytest.mark.parametrize("recorder_config", [{"hot_tier_max_age": {"hours": 1}}])
+async def test_get_significant_states_hot_tier_single_entity(
+    hass: HomeAssistant,
+) -> None:
+    """Test a single entity without an earlier state in the hot tier uses the database."""
+    zero, four, states = record_states(hass)
+    await async_wait_recording_done(hass)
+    hot_tier = get_instance(hass).states_hot_tier
+    assert hot_tier is not None
+
+    hist = history.get_significant_states(
+        hass, zero, four, entity_ids=["media_player.test"]
+    )
+    assert_dict_of_states_equal_without_context_and_last_changed(
+        {"media_player.test": states["media_player.test"]}, hist
+    )
+    assert hot_tier.get_stats()["misses"] == 1
+
+    hist = history.get_significant_states(
+        hass,
+        zero + timedelta(seconds=1.5),
+        four,
+        entity_ids=["media_player.test"],
+        include_start_time_state=False,
+    )
+    assert hot_tier.get_stats()["hits"] == 1
+    assert [state.state for state in hist["media_player.test"]] == ["Netflix"]
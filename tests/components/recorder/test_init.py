@@ -385,6 +385,22 @@ async def test_saving_state_with_intermixed_time_changes(
         assert db_states[0].event_id is None
 
 
+def _patch_writing_states(hass: HomeAssistant, err: Exception) -> Any:
+    """Patch the path writing states to the database to raise err."""
+    instance = get_instance(hass)
+    if (bulk_insert_manager := instance.states_bulk_insert_manager) is not None:
+        return patch.object(bulk_insert_manager, "insert_pending", side_effect=err)
+
+    def _throw_if_state_in_session(*args, **kwargs):
+        for obj in instance.event_session:
+            if isinstance(obj, States):
+                raise err
+
+    return patch.object(
+        instance.event_session, "flush", side_effect=_throw_if_state_in_session
+    )
+
+
 async def test_saving_state_with_exception(
     hass: HomeAssistant,
     caplog: pytest.LogCaptureFixture,
@@ -395,19 +411,10 @@ async def test_saving_state_with_exception(
     state = "restoring_from_db"
     attributes = {"test_attr": 5, "test_attr_10": "nice"}
 
-    def _throw_if_state_in_session(*args, **kwargs):
-        for obj in get_instance(hass).event_session:
-            if isinstance(obj, States):
-                raise OperationalError(
-                    "insert the state", "fake params", "forced to fail"
-                )
-
     with (
         patch("time.sleep"),
-        patch.object(
-            get_instance(hass).event_session,
-            "flush",
-            side_effect=_throw_if_state_in_session,
+        _patch_writing_states(
+            hass, OperationalError("insert the state", "fake params", "forced to fail")
         ),
     ):
         hass.states.async_set(entity_id, "fail", attributes)
@@ -438,19 +445,10 @@ async def test_saving_state_with_sqlalchemy_exception(
     state = "restoring_from_db"
     attributes = {"test_attr": 5, "test_attr_10": "nice"}
 
-    def _throw_if_state_in_session(*args, **kwargs):
-        for obj in get_instance(hass).event_session:
-            if isinstance(obj, States):
-                raise SQLAlchemyError(
-                    "insert the state", "fake params", "forced to fail"
-                )
-
     with (
         patch("time.sleep"),
-        patch.object(
-            get_instance(hass).event_session,
-            "flush",
-            side_effect=_throw_if_state_in_session,
+        _patch_writing_states(
+            hass, SQLAlchemyError("insert the state", "fake params", "forced to fail")
         ),
     ):
         hass.states.async_set(entity_id, "fail", attributes)
@@ -1469,6 +1467,65 @@ async def test_saving_sets_old_state(hass: HomeAssistant, setup_recorder: None)
         assert states_by_state["s4"].old_state_id == states_by_state["s2"].state_id
 
 
+@pytest.mark.parametrize("bulk_insert", [True, False])
+async def test_saving_states_bulk_insert(
+    hass: HomeAssistant,
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    bulk_insert: bool,
+) -> None:
+    """Test saving states with and without multi-row inserts."""
+    with patch(
+        "homeassistant.components.recorder.core.dialect_supports_bulk_insert",
+        return_value=bulk_insert,
+    ):
+        instance = await async_setup_recorder_instance(hass)
+        await async_wait_recording_done(hass)
+    assert (instance.states_bulk_insert_manager is not None) is bulk_insert
+
+    for idx in range(3):
+        hass.states.async_set("test.one", f"one{idx}", {"idx": idx})
+        hass.states.async_set("test.two", f"two{idx}", {"same": True})
+    await async_wait_recording_done(hass)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        states = list(
+            session.query(
+                StatesMeta.entity_id,
+                States.state_id,
+                States.old_state_id,
+                States.state,
+                StateAttributes.shared_attrs,
+            )
+            .outerjoin(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+            .outerjoin(
+                StateAttributes, States.attributes_id == StateAttributes.attributes_id
+            )
+        )
+        assert len(states) == 6
+        assert session.query(StatesMeta).count() == 2
+        assert session.query(StateAttributes).count() == 4
+
+    states_by_state = {state.state: state for state in states}
+    for entity, attrs in (("one", None), ("two", '{"same":true}')):
+        for idx in range(3):
+            state = states_by_state[f"{entity}{idx}"]
+            assert state.entity_id == f"test.{entity}"
+            assert state.shared_attrs == (attrs or f'{{"idx":{idx}}}')
+            if idx == 0:
+                assert state.old_state_id is None
+            else:
+                assert (
+                    state.old_state_id == states_by_state[f"{entity}{idx - 1}"].state_id
+                )
+
+    # The state ids are linked to the next states after the commit
+    hass.states.async_set("test.one", "one3", {"idx": 3})
+    await async_wait_recording_done(hass)
+    with session_scope(hass=hass, read_only=True) as session:
+        state = session.query(States).filter(States.state == "one3").one()
+        assert state.old_state_id == states_by_state["one2"].state_id
+
+
 async def test_saving_state_with_serializable_data(
     hass: HomeAssistant, caplog: pytest.LogCaptureFixture, setup_recorder: None
 ) -> None:
@@ -1503,6 +1560,32 @@ async def test_has_services(hass: HomeAssistant, setup_recorder: None) -> None:
     assert hass.services.has_service(DOMAIN, SERVICE_PURGE_ENTITIES)
 
 
+async def test_events_complete_since(
+    hass: HomeAssistant,
+    setup_recorder: None,
+) -> None:
+    """Test the recorder tracks since when no events have been missed."""
+    instance = get_instance(hass)
+    hass.bus.async_fire("test_event")
+    await async_wait_recording_done(hass)
+    assert (complete_since := instance.events_complete_since) is not None
+
+    hass.bus.async_fire("test_event")
+    await async_wait_recording_done(hass)
+    assert instance.events_complete_since == complete_since
+
+    await hass.services.async_call(DOMAIN, SERVICE_DISABLE, {}, blocking=True)
+    hass.bus.async_fire("test_event")
+    await async_wait_recording_done(hass)
+    assert instance.events_complete_since is None
+
+    await hass.services.async_call(DOMAIN, SERVICE_ENABLE, {}, blocking=True)
+    hass.bus.async_fire("test_event")
+    await async_wait_recording_done(hass)
+    assert instance.events_complete_since is not None
+    assert instance.events_complete_since > complete_since
+
+
 async def test_service_disable_events_not_recording(
     hass: HomeAssistant,
     setup_recorder: None,
@@ -4,6 +4,7 @@ from collections.abc import Generator
 from datetime import datetime, timedelta
 import json
 import sqlite3
+from typing import Any
 from unittest.mock import patch
 
 from freezegun import freeze_time
@@ -26,6 +27,7 @@ from homeassistant.components.recorder.db_schema import (
 )
 from homeassistant.components.recorder.history import get_significant_states
 from homeassistant.components.recorder.purge import purge_old_data
+from homeassistant.components.recorder.purge_planner import PurgeProgress
 from homeassistant.components.recorder.queries import select_event_type_ids
 from homeassistant.components.recorder.services import (
     SERVICE_PURGE,
@@ -404,6 +406,60 @@ async def test_purge_old_statistics_runs(
         assert statistics_runs.count() == 1
 
 
+async def test_purge_progress(hass: HomeAssistant, recorder_mock: Recorder) -> None:
+    """Test the rows deleted by a purge are counted."""
+    await _add_test_states(hass)
+    await _add_test_events(hass)
+
+    purge_before = dt_util.utcnow() - timedelta(days=4)
+    recorder_mock.queue_task(PurgeTask(purge_before, repack=False, apply_filter=False))
+    await async_recorder_block_till_done(hass)
+    await async_wait_purge_done(hass)
+
+    progress = recorder_mock.purge_planner.progress
+    assert progress is not None
+    assert progress.finished is not None
+    assert progress.rows_deleted["states"] == 4
+    assert progress.rows_deleted["state_attributes"] == 2
+    assert progress.rows_deleted["events"] == 4
+    assert progress.first_oldest_ts < purge_before.timestamp()
+    assert progress.oldest_ts > purge_before.timestamp()
+    assert progress.summary()["eta"] == 0.0
+
+
+async def test_purge_resume(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+) -> None:
+    """Test an unfinished purge is resumed when the recorder starts."""
+    purge_before = dt_util.utcnow() - timedelta(days=4)
+    progress = PurgeProgress(purge_before, False, False, 1000.0, chunks=3)
+    progress.add_deleted("states", 10)
+    hass_storage["recorder.purge"] = {
+        "version": 1,
+        "key": "recorder.purge",
+        "data": progress.as_dict(),
+    }
+
+    with patch(
+        "homeassistant.components.recorder.purge.purge_old_data", return_value=True
+    ) as purge_old_data:
+        instance = await async_setup_recorder_instance(hass)
+        await hass.async_block_till_done(wait_background_tasks=True)
+        await async_wait_purge_done(hass)
+        await hass.async_block_till_done()
+
+    assert len(purge_old_data.mock_calls) == 1
+    args, _ = purge_old_data.call_args_list[0]
+    assert args[1] == purge_before
+    progress = instance.purge_planner.progress
+    assert progress is not None
+    assert progress.chunks == 4
+    assert progress.rows_deleted["states"] == 10
+    assert "recorder.purge" not in hass_storage
+
+
 @pytest.mark.parametrize("use_sqlite", [True, False], indirect=True)
 @pytest.mark.usefixtures("recorder_mock")
 async def test_purge_method(
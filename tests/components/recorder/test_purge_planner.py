@@ -0,0 +1,96 @@
+"""Test the purge planner."""
+
+from datetime import UTC, datetime
+
+import pytest
+
+from homeassistant.components.recorder.purge_planner import (
+    MAX_BATCHES_PER_CHUNK,
+    MIN_BATCHES_PER_CHUNK,
+    PurgePlanner,
+    PurgeProgress,
+)
+
+PURGE_BEFORE = datetime(2024, 1, 10, tzinfo=UTC)
+
+
+def test_planner_sizes_chunks_to_target() -> None:
+    """Test the number of batches follows the time chunks take."""
+    planner = PurgePlanner(20, 15, target_seconds=2.0)
+    progress = planner.start_chunk(PURGE_BEFORE, False, False, None)
+
+    # Too slow, the number of batches changes at most by half
+    planner.finish_chunk(10.0, False)
+    assert (planner.states_batches, planner.events_batches) == (10, 8)
+    planner.finish_chunk(2.5, False)
+    assert (planner.states_batches, planner.events_batches) == (8, 6)
+    # Too fast, the number of batches at most doubles
+    planner.finish_chunk(0.1, False)
+    assert (planner.states_batches, planner.events_batches) == (16, 12)
+
+    for _ in range(10):
+        planner.finish_chunk(0.0, False)
+    assert planner.states_batches == MAX_BATCHES_PER_CHUNK
+    for _ in range(10):
+        planner.finish_chunk(100.0, False)
+    assert planner.states_batches == MIN_BATCHES_PER_CHUNK
+
+    # The next chunk of the same purge keeps the progress
+    assert planner.start_chunk(PURGE_BEFORE, False, False, None) is progress
+    assert progress.chunks == 23
+    assert progress.active_seconds == pytest.approx(1012.6)
+
+    planner.finish_chunk(1.0, True)
+    assert progress.finished is not None
+    # A finished purge is not continued
+    assert planner.start_chunk(PURGE_BEFORE, False, False, None) is not progress
+
+
+def test_planner_resume() -> None:
+    """Test a purge is resumed from the stored progress."""
+    progress = PurgeProgress(PURGE_BEFORE, True, False, 1000.0, chunks=5)
+    progress.add_deleted("states", 100)
+    progress.add_deleted("event_data", 7)
+    progress.first_oldest_ts = PURGE_BEFORE.timestamp() - 1000
+    progress.oldest_ts = PURGE_BEFORE.timestamp() - 800
+
+    resumed = PurgeProgress.from_dict(progress.as_dict())
+    assert resumed == progress
+
+    planner = PurgePlanner(20, 15)
+    assert planner.start_chunk(PURGE_BEFORE, True, False, resumed) is resumed
+    # A new purge does not continue the progress of another purge
+    planner = PurgePlanner(20, 15)
+    other = planner.start_chunk(PURGE_BEFORE.replace(day=11), True, False, resumed)
+    assert other is not resumed
+    assert other.chunks == 0
+
+
+def test_progress_invalid_data(caplog: pytest.LogCaptureFixture) -> None:
+    """Test invalid stored progress is ignored."""
+    assert PurgeProgress.from_dict({"purge_before": "invalid"}) is None
+    assert "Ignoring invalid purge resume data" in caplog.text
+
+
+def test_progress_summary() -> None:
+    """Test the deletion rate and estimated time remaining."""
+    progress = PurgeProgress(PURGE_BEFORE, False, False, 1000.0)
+    assert progress.summary()["eta"] is None
+    assert progress.summary()["rate"] == 0.0
+
+    progress.add_deleted("states", 600)
+    progress.add_deleted("state_attributes", 100)
+    progress.add_deleted("statistics_short_term", 300)
+    progress.active_seconds = 10.0
+    progress.first_oldest_ts = PURGE_BEFORE.timestamp() - 1000
+    progress.oldest_ts = PURGE_BEFORE.timestamp() - 750
+
+    summary = progress.summary()
+    assert summary["total_rows_deleted"] == 1000
+    assert summary["rows_deleted"]["states"] == 600
+    assert summary["rate"] == 100.0
+    # A quarter of the time span was purged in 10 seconds
+    assert summary["eta"] == pytest.approx(30.0)
+
+    progress.finished = 2000.0
+    assert progress.summary()["eta"] == 0.0
@@ -2636,3 +2636,71 @@ async def test_recorder_platform_with_partial_statistics_support(
 
     for meth in supported_methods:
         getattr(recorder_platform, meth).assert_called_once()
+
+
+@pytest.mark.parametrize(
+    "timezone", ["America/Santiago", "Australia/Lord_Howe", "Europe/Vienna"]
+)
+@pytest.mark.parametrize("period", ["day", "week", "month"])
+@pytest.mark.parametrize(
+    "types",
+    [
+        {"change", "last_reset", "max", "mean", "min", "state", "sum"},
+        {"change"},
+        {"max", "min", "sum"},
+    ],
+)
+@pytest.mark.freeze_time("2024-01-01 00:00:00+00:00")
+@pytest.mark.usefixtures("setup_recorder")
+async def test_statistics_during_period_reduced_in_database(
+    hass: HomeAssistant,
+    timezone: str,
+    period: str,
+    types: set[str],
+) -> None:
+    """Test statistics reduced in the database match the Python reduction."""
+    await hass.config.async_set_time_zone(timezone)
+    await async_wait_recording_done(hass)
+
+    zero = dt_util.utcnow()
+    rows = [
+        {
+            "start": zero + timedelta(hours=7 * idx),
+            "last_reset": None,
+            "mean": idx % 17,
+            "min": idx % 17 - 1,
+            "max": idx % 17 + 1,
+            "state": idx % 100,
+            "sum": idx * 0.5,
+        }
+        for idx in range(1200)
+        # Leave gaps in the statistics
+        if idx % 200 > 20
+    ]
+    external_metadata = {
+        "has_mean": True,
+        "has_sum": True,
+        "name": "Total imported energy",
+        "source": "test",
+        "statistic_id": "test:total_energy_import",
+        "unit_of_measurement": "kWh",
+    }
+    async_add_external_statistics(hass, external_metadata, rows)
+    await async_wait_recording_done(hass)
+
+    start_time = zero + timedelta(days=40)
+    end_time = zero + timedelta(days=330)
+    stats = statistics.statistics_during_period(
+        hass, start_time, end_time, None, period, {"energy": "Wh"}, types
+    )
+    with patch.object(statistics, "_database_reduce_period_bounds", return_value=None):
+        expected = statistics.statistics_during_period(
+            hass, start_time, end_time, None, period, {"energy": "Wh"}, types
+        )
+
+    assert stats.keys() == expected.keys()
+    for statistic_id, expected_rows in expected.items():
+        assert len(stats[statistic_id]) == len(expected_rows)
+        for row, expected_row in zip(stats[statistic_id], expected_rows, strict=True):
+            # The databases calculate the mean in a different order
+            assert row == pytest.approx(expected_row)
@@ -0,0 +1,141 @@
+"""Test reducing statistics with NumPy gives the same result as in Python."""
+
+from collections.abc import Callable
+from datetime import datetime, timedelta
+import random
+from unittest.mock import patch
+
+import pytest
+
+from homeassistant.components.recorder import statistics
+from homeassistant.components.recorder.statistics import StatisticsRow
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+TYPES = {"last_reset", "max", "mean", "min", "state", "sum"}
+
+FACTORIES: dict[str, tuple[Callable, timedelta]] = {
+    "day": (statistics.reduce_day_ts_factory, timedelta(days=1)),
+    "week": (statistics.reduce_week_ts_factory, timedelta(days=7)),
+    "month": (statistics.reduce_month_ts_factory, timedelta(days=31)),
+}
+
+
+def _random_value(rng: random.Random) -> float | None:
+    """Return a random value or sometimes None."""
+    return None if rng.random() < 0.1 else rng.uniform(-100, 100)
+
+
+def _hourly_statistics(seed: int) -> dict[str, list[StatisticsRow]]:
+    """Return a year of hourly statistics with gaps and missing values."""
+    rng = random.Random(seed)
+    start_ts = datetime(2023, 1, 1, tzinfo=dt_util.UTC).timestamp()
+    stats: dict[str, list[StatisticsRow]] = {}
+    for idx in range(4):
+        rows: list[StatisticsRow] = []
+        row_ts = start_ts + rng.randint(0, 1000) * 3600
+        for _ in range(rng.randint(1, 24 * 366)):
+            if rng.random() < 0.01:
+                row_ts += rng.randint(1, 200) * 3600
+            rows.append(
+                {
+                    "start": row_ts,
+                    "mean": _random_value(rng),
+                    "min": _random_value(rng),
+                    "max": _random_value(rng),
+                    "last_reset": None if rng.random() < 0.5 else row_ts,
+                    "state": _random_value(rng),
+                    "sum": _random_value(rng),
+                }
+            )
+            row_ts += 3600
+        stats[f"sensor.test{idx}"] = rows
+    return stats
+
+
+@pytest.mark.parametrize(
+    "time_zone",
+    [
+        "UTC",
+        "Europe/Amsterdam",
+        # DST starts at midnight
+        "America/Santiago",
+        # DST changes the time by half an hour
+        "Australia/Lord_Howe",
+    ],
+)
+@pytest.mark.parametrize("period", ["day", "week", "month"])
+@pytest.mark.parametrize(
+    "types", [TYPES, {"mean"}, {"min", "max"}, {"state", "sum"}, set()]
+)
+async def test_reduce_statistics_parity(
+    hass: HomeAssistant, time_zone: str, period: str, types: set
+) -> None:
+    """Test the NumPy reduction gives the same result as the Python reduction."""
+    await hass.config.async_set_time_zone(time_zone)
+    stats = _hourly_statistics(len(types))
+    factory, period_length = FACTORIES[period]
+
+    same_period, period_start_end = factory()
+    expected = statistics._reduce_statistics(
+        stats, same_period, period_start_end, period_length, types
+    )
+    _, period_start_end = factory()
+    result = statistics._reduce_statistics_numpy(stats, period_start_end, types)
+
+    assert result.keys() == expected.keys()
+    for statistic_id, rows in expected.items():
+        assert len(result[statistic_id]) == len(rows)
+        for row, expected_row in zip(result[statistic_id], rows, strict=True):
+            assert list(row) == list(expected_row)
+            if "mean" in expected_row:
+                assert row.pop("mean") == pytest.approx(expected_row.pop("mean"))
+            assert row == expected_row
+
+
+async def test_reduce_statistics_single_row(hass: HomeAssistant) -> None:
+    """Test reducing a single row with all values missing."""
+    await hass.config.async_set_time_zone("Europe/Amsterdam")
+    start_ts = datetime(2023, 3, 26, 1, tzinfo=dt_util.UTC).timestamp()
+    stats: dict[str, list[StatisticsRow]] = {
+        "sensor.test": [
+            {"start": start_ts, "mean": None, "min": None, "max": None, "sum": 1.0}
+        ]
+    }
+    _, day_start_end = statistics.reduce_day_ts_factory()
+
+    assert statistics._reduce_statistics_numpy(
+        stats, day_start_end, {"mean", "min", "max", "sum"}
+    ) == {
+        "sensor.test": [
+            {
+                "start": datetime(2023, 3, 25, 23, tzinfo=dt_util.UTC).timestamp(),
+                # The day DST starts is 23 hours long
+                "end": datetime(2023, 3, 26, 22, tzinfo=dt_util.UTC).timestamp(),
+                "mean": None,
+                "min": None,
+                "max": None,
+                "sum": 1.0,
+            }
+        ]
+    }
+
+
+async def test_reduce_statistics_without_numpy(hass: HomeAssistant) -> None:
+    """Test statistics are reduced in Python when NumPy is not installed."""
+    stats = _hourly_statistics(0)
+    same_period, period_start_end = statistics.reduce_day_ts_factory()
+    expected = statistics._reduce_statistics(
+        stats, same_period, period_start_end, timedelta(days=1), TYPES
+    )
+
+    same_period, period_start_end = statistics.reduce_day_ts_factory()
+    with (
+        patch.object(statistics, "_numpy_installed", return_value=False),
+        patch.object(statistics, "_reduce_statistics_numpy") as reduce_numpy,
+    ):
+        result = statistics._reduce_statistics_per_period(
+            stats, same_period, period_start_end, timedelta(days=1), TYPES
+        )
+    reduce_numpy.assert_not_called()
+    assert result == expected
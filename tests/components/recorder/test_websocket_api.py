@@ -4,6 +4,7 @@ import datetime
 from datetime import timedelta
 from statistics import fmean
 import sys
+from typing import Any
 from unittest.mock import ANY, patch
 
 from freezegun import freeze_time
@@ -21,6 +22,7 @@ from homeassistant.components.recorder.statistics import (
     get_short_term_statistics_run_cache,
     list_statistic_ids,
 )
+from homeassistant.components.recorder.tasks import PurgeTask
 from homeassistant.components.recorder.util import session_scope
 from homeassistant.components.recorder.websocket_api import UNIT_SCHEMA
 from homeassistant.components.sensor import UNIT_CONVERTERS
@@ -32,6 +34,7 @@ from homeassistant.util.unit_system import METRIC_SYSTEM, US_CUSTOMARY_SYSTEM
 
 from .common import (
     async_recorder_block_till_done,
+    async_wait_purge_done,
     async_wait_recording_done,
     create_engine_test,
     do_adhoc_statistics,
@@ -1984,6 +1987,58 @@ async def test_validate_statistics(
     await assert_validation_result(client, {})
 
 
+async def test_purge_progress(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test getting the progress of a purge."""
+    client = await hass_ws_client()
+    await client.send_json_auto_id({"type": "recorder/purge_progress"})
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"] is None
+
+    hass.states.async_set("sensor.test", "10")
+    await async_wait_recording_done(hass)
+    purge_before = dt_util.utcnow()
+    recorder_mock.queue_task(PurgeTask(purge_before, repack=False, apply_filter=False))
+    await async_recorder_block_till_done(hass)
+    await async_wait_purge_done(hass)
+
+    await client.send_json_auto_id({"type": "recorder/purge_progress"})
+    response = await client.receive_json()
+    assert response["success"]
+    result = response["result"]
+    assert result["purge_before"] == purge_before.isoformat()
+    assert result["finished"] is not None
+    assert result["rows_deleted"]["states"] == 1
+    assert result["total_rows_deleted"] >= 1
+    assert result["eta"] == 0.0
+
+
+@pytest.mark.parametrize(
+    "command",
+    [
+        {"type": "recorder/purge_progress"},
+        {"type": "recorder/clear_statistics", "statistic_ids": ["sensor.test"]},
+    ],
+)
+async def test_admin_only_commands(
+    recorder_mock: Recorder,
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+    hass_read_only_access_token: str,
+    command: dict[str, Any],
+) -> None:
+    """Test purge progress and clearing statistics require an admin user."""
+    client = await hass_ws_client(hass, hass_read_only_access_token)
+    with patch.object(recorder_mock, "async_clear_statistics") as clear_statistics:
+        await client.send_json_auto_id(command)
+        response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "unauthorized"
+    clear_statistics.assert_not_called()
+
+
 async def test_clear_statistics(
     recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
 ) -> None:
@@ -2481,6 +2536,27 @@ async def test_recorder_info(
     }
 
 
+@pytest.mark.parametrize("recorder_config", [{"hot_tier_max_age": {"hours": 1}}])
+async def test_recorder_info_hot_tier(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test getting recorder status includes the hot tier counters."""
+    client = await hass_ws_client()
+    await async_wait_recording_done(hass)
+
+    await client.send_json_auto_id({"type": "recorder/info"})
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"]["hot_tier"] == {
+        "covered_since": ANY,
+        "entities": ANY,
+        "hits": 0,
+        "memory_usage": ANY,
+        "misses": 0,
+        "rows": ANY,
+    }
+
+
 async def test_recorder_info_no_recorder(
     hass: HomeAssistant, hass_ws_client: WebSocketGenerator
 ) -> None:
@@ -247,6 +247,64 @@ async def test_compile_hourly_statistics(
     assert "Error while processing event StatisticsTask" not in caplog.text
 
 
+@pytest.mark.parametrize(
+    ("state_class", "seq", "expected"),
+    [
+        (
+            "measurement",
+            [-10, 15, 30],
+            {"mean": pytest.approx(13.050847), "min": -10, "max": 30},
+        ),
+        ("total_increasing", [10, 15, 30], {"state": 30, "sum": 20}),
+    ],
+)
+async def test_compile_statistics_from_accumulated_states(
+    hass: HomeAssistant,
+    state_class: str,
+    seq: list[int],
+    expected: dict[str, Any],
+) -> None:
+    """Test compiling statistics from states accumulated on the recorder thread."""
+    await async_setup_component(hass, "sensor", {})
+    # Wait for the sensor recorder platform to be added
+    await async_recorder_block_till_done(hass)
+    # The accumulator is created when the first sensor state is recorded
+    hass.states.async_set("sensor.other", "1")
+    await async_wait_recording_done(hass)
+
+    zero = get_start_time(dt_util.utcnow()) + timedelta(minutes=10)
+    attributes = {"state_class": state_class, "unit_of_measurement": "kWh"}
+    with freeze_time(zero) as freezer:
+        four, _ = await async_record_states(
+            hass, freezer, zero, "sensor.test1", attributes, seq
+        )
+        freezer.move_to(four)
+        await async_wait_recording_done(hass)
+        with patch(
+            "homeassistant.components.sensor.recorder.history.get_full_significant_states_with_session"
+        ) as get_history_mock:
+            do_adhoc_statistics(hass, start=zero)
+            await async_wait_recording_done(hass)
+        get_history_mock.assert_not_called()
+
+    stats = statistics_during_period(hass, zero, period="5minute")
+    assert stats == {
+        "sensor.test1": [
+            {
+                "start": process_timestamp(zero).timestamp(),
+                "end": process_timestamp(zero + timedelta(minutes=5)).timestamp(),
+                "mean": None,
+                "min": None,
+                "max": None,
+                "last_reset": None,
+                "state": None,
+                "sum": None,
+            }
+            | expected
+        ]
+    }
+
+
 @pytest.mark.parametrize(
     (
         "device_class",
@@ -0,0 +1,149 @@
+"""Test the sensor statistics accumulator."""
+
+from datetime import datetime
+
+import pytest
+
+from homeassistant.components.sensor.statistics_accumulator import StatisticsAccumulator
+from homeassistant.core import State
+import homeassistant.util.dt as dt_util
+
+START_TS = 1_700_000_100.0
+END_TS = START_TS + 300
+
+
+def _state(
+    entity_id: str,
+    state: str,
+    timestamp: float,
+    state_class: str | None = "measurement",
+    unit: str = "W",
+    changed: bool = True,
+) -> State:
+    """Return a sensor state set at timestamp."""
+    attributes = {"unit_of_measurement": unit}
+    if state_class:
+        attributes["state_class"] = state_class
+    last_updated: datetime = dt_util.utc_from_timestamp(timestamp)
+    return State(
+        entity_id,
+        state,
+        attributes,
+        last_changed=last_updated if changed else last_updated.replace(year=2000),
+        last_updated=last_updated,
+    )
+
+
+def test_accumulator_measurement() -> None:
+    """Test the running mean, min and max of a measurement sensor."""
+    accumulator = StatisticsAccumulator(
+        0.0, START_TS - 100, [_state("sensor.power", "10", START_TS - 150)]
+    )
+    accumulator.add(_state("sensor.power", "20", START_TS + 100))
+    accumulator.add(_state("sensor.power", "unavailable", START_TS + 150))
+    # Attribute changes are not significant
+    accumulator.add(_state("sensor.power", "5", START_TS + 180, changed=False))
+    accumulator.add(_state("sensor.power", "-5", START_TS + 200))
+    accumulator.add(_state("sensor.power", "30", END_TS + 10))
+
+    # The window the accumulator was created in is incomplete
+    assert accumulator.pop_window(START_TS - 300, END_TS) is None
+    window = accumulator.pop_window(START_TS, END_TS + 10)
+    assert window is not None
+    assert window.get("sensor.unknown", "measurement") is None
+    assert window.get("sensor.power", "total") is None
+    statistics = window.get("sensor.power", "measurement")
+    assert statistics is not None
+    assert statistics.min == -5
+    assert statistics.max == 20
+    assert statistics.unit == "W"
+    assert statistics.unit_stable
+    assert statistics.mean(END_TS) == pytest.approx(
+        (10 * 100 + 20 * 100 - 5 * 100) / 300
+    )
+    assert accumulator.pop_window(START_TS, END_TS + 10) is None
+
+
+def test_accumulator_total() -> None:
+    """Test the float states of a total sensor are kept."""
+    accumulator = StatisticsAccumulator(0.0, START_TS - 100, [])
+    accumulator.add(_state("sensor.energy", "1", START_TS - 50, "total_increasing"))
+    accumulator.add(
+        _state("sensor.energy", "2", START_TS + 10, "total_increasing", changed=False)
+    )
+    accumulator.add(_state("sensor.energy", "x", START_TS + 20, "total_increasing"))
+    accumulator.add(_state("sensor.energy", "3", START_TS + 30, "total_increasing"))
+
+    # The window has ended and is closed when it is popped
+    window = accumulator.pop_window(START_TS, END_TS + 10)
+    assert window is not None
+    statistics = window.get("sensor.energy", "total_increasing")
+    assert statistics is not None
+    assert statistics.float_states is not None
+    assert [value for value, _ in statistics.float_states] == [1.0, 2.0, 3.0]
+
+
+def test_accumulator_unchanged_and_skipped_windows() -> None:
+    """Test sensors without state changes use the state from before the window."""
+    accumulator = StatisticsAccumulator(
+        0.0, START_TS - 100, [_state("sensor.power", "10", START_TS - 150)]
+    )
+    accumulator.add(_state("sensor.other", "1", END_TS + 610))
+
+    for start_ts in (START_TS, START_TS + 300, START_TS + 600):
+        window = accumulator.pop_window(start_ts, END_TS + 610)
+        assert window is not None
+        statistics = window.get("sensor.power", "measurement")
+        assert statistics is not None
+        assert statistics.mean(start_ts + 300) == 10
+
+    # The window has not ended yet
+    assert accumulator.pop_window(START_TS + 900, END_TS + 610) is None
+
+
+def test_accumulator_incomplete_window() -> None:
+    """Test windows with missed or out of order states are incomplete."""
+    accumulator = StatisticsAccumulator(
+        0.0,
+        START_TS - 100,
+        [
+            _state("sensor.power", "10", START_TS - 150),
+            _state("sensor.power_2", "10", START_TS - 150),
+            _state("sensor.power_3", "10", START_TS - 150, state_class=None),
+        ],
+    )
+    accumulator.add(_state("sensor.power", "20", START_TS + 100))
+    accumulator.add(_state("sensor.power", "30", START_TS + 110, unit="kW"))
+    accumulator.add(_state("sensor.power_2", "20", START_TS + 100))
+    accumulator.add(_state("sensor.power_2", "30", START_TS - 10))
+    accumulator.add(_state("sensor.power_3", "20", START_TS + 100, state_class=None))
+    accumulator.add(_state("sensor.power_3", "30", START_TS + 110))
+
+    window = accumulator.pop_window(START_TS, END_TS)
+    assert window is not None
+    statistics = window.get("sensor.power", "measurement")
+    assert statistics is not None
+    assert not statistics.unit_stable
+    assert window.get("sensor.power_2", "measurement") is None
+    assert window.get("sensor.power_3", "measurement") is None
+
+
+def test_accumulator_late_state_invalidates_closed_windows() -> None:
+    """Test a late state invalidates the closed windows since it was set."""
+    accumulator = StatisticsAccumulator(
+        0.0,
+        START_TS - 100,
+        [
+            _state("sensor.power", "10", START_TS - 150),
+            _state("sensor.power_2", "75", START_TS - 150),
+        ],
+    )
+    accumulator.add(_state("sensor.power", "20", END_TS + 310))
+    # The state was set during the first window but is added after it closed
+    accumulator.add(_state("sensor.power_2", "45", START_TS + 100))
+
+    for start_ts in (START_TS, START_TS + 300):
+        window = accumulator.pop_window(start_ts, END_TS + 310)
+        assert window is not None
+        assert window.get("sensor.power", "measurement") is not None
+        assert window.get("sensor.power_2", "measurement") is None
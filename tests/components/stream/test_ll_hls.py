@@ -327,6 +327,64 @@ async def test_ll_hls_playlist_view(
     await stream.stop()
 
 
+async def test_ll_hls_playlist_cache(
+    hass: HomeAssistant, hls_stream, stream_worker_sync
+) -> None:
+    """Test the playlist is rendered once per part of the last segment."""
+    await async_setup_component(
+        hass,
+        "stream",
+        {
+            "stream": {
+                CONF_LL_HLS: True,
+                CONF_SEGMENT_DURATION: SEGMENT_DURATION,
+                CONF_PART_DURATION: TEST_PART_DURATION,
+            }
+        },
+    )
+
+    stream = create_stream(hass, STREAM_SOURCE, {}, dynamic_stream_settings())
+    stream_worker_sync.pause()
+    hls = stream.add_provider(HLS_PROVIDER)
+
+    complete = create_segment(sequence=0)
+    hls.put(complete)
+    for part in create_parts(SEQUENCE_BYTES):
+        complete.async_add_part(part, 0)
+    complete_segment(complete)
+    segment = create_segment(sequence=1)
+    hls.put(segment)
+    parts = create_parts(SEQUENCE_BYTES)
+    segment.async_add_part(parts[0], 0)
+    await hass.async_block_till_done()
+    # The data of a complete segment is joined once
+    assert complete.get_data() is complete.get_data()
+
+    hls_client = await hls_stream(stream)
+    resp = await hls_client.get("/playlist.m3u8")
+    assert resp.status == HTTPStatus.OK
+    playlist = await resp.text()
+    cached = hls.playlist_cache
+    assert cached[1] == playlist.encode()
+    resp = await hls_client.get("/playlist.m3u8")
+    assert await resp.text() == playlist
+    assert hls.playlist_cache is cached
+
+    # A new part of the last segment is rendered
+    segment.async_add_part(parts[1], 0)
+    resp = await hls_client.get("/playlist.m3u8")
+    assert '"./segment/1.1.m4s"' in await resp.text()
+    assert hls.playlist_cache is not cached
+
+    # A new segment drops the cached playlist
+    hls.put(create_segment(sequence=2))
+    await hass.async_block_till_done()
+    assert hls.playlist_cache is None
+
+    stream_worker_sync.resume()
+    await stream.stop()
+
+
 async def test_ll_hls_msn(
     hass: HomeAssistant, hls_stream, stream_worker_sync, hls_sync
 ) -> None:
@@ -1018,6 +1018,39 @@ async def test_get_image(hass: HomeAssistant, h264_video, filename) -> None:
     await stream.stop()
 
 
+async def test_get_image_sizes(hass: HomeAssistant, h264_video, filename) -> None:
+    """Test the keyframe is decoded once and encoded once per size."""
+    await async_setup_component(hass, "stream", {"stream": {}})
+
+    # Since libjpeg-turbo is not installed on the CI runner, we use a mock
+    with patch(
+        "homeassistant.components.camera.img_util.TurboJPEGSingleton"
+    ) as mock_turbo_jpeg_singleton:
+        mock_turbo_jpeg_singleton.instance.return_value = mock_turbo_jpeg()
+        stream = create_stream(hass, h264_video, {}, dynamic_stream_settings())
+    encode = mock_turbo_jpeg_singleton.instance.return_value.encode
+
+    with patch.object(hass.config, "is_allowed_path", return_value=True):
+        await hass.async_create_task(stream.async_record(filename))
+
+    # Stop the worker so no further keyframes arrive
+    await stream.stop()
+    converter = stream._keyframe_converter
+    packet = converter._packet
+    assert await converter.async_get_image() == EMPTY_8_6_JPEG
+    assert await converter.async_get_image(width=4, height=2) == EMPTY_8_6_JPEG
+    assert await converter.async_get_image(width=4, height=2) == EMPTY_8_6_JPEG
+    assert await converter.async_get_image() == EMPTY_8_6_JPEG
+    assert encode.call_count == 2
+    assert encode.call_args_list[1][0][0].shape == (2, 4, 3)
+
+    # The images are dropped when the next keyframe is decoded
+    converter.stash_keyframe_packet(packet)
+    assert await converter.async_get_image(width=4, height=2) == EMPTY_8_6_JPEG
+    assert encode.call_count == 3
+    assert list(converter._images) == [(4, 2, Orientation.NO_TRANSFORM)]
+
+
 async def test_worker_disable_ll_hls(hass: HomeAssistant) -> None:
     """Test that the worker disables ll-hls for hls inputs."""
     stream_settings = StreamSettings(
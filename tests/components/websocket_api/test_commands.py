@@ -6,6 +6,7 @@ import logging
 from typing import Any
 from unittest.mock import ANY, AsyncMock, Mock, patch
 
+import ormsgpack
 import pytest
 import voluptuous as vol
 
@@ -17,7 +18,11 @@ from homeassistant.components.websocket_api.auth import (
     TYPE_AUTH_OK,
     TYPE_AUTH_REQUIRED,
 )
-from homeassistant.components.websocket_api.const import FEATURE_COALESCE_MESSAGES, URL
+from homeassistant.components.websocket_api.const import (
+    FEATURE_COALESCE_MESSAGES,
+    FEATURE_MSGPACK,
+    URL,
+)
 from homeassistant.config_entries import ConfigEntryState
 from homeassistant.const import SIGNAL_BOOTSTRAP_INTEGRATIONS
 from homeassistant.core import Context, HomeAssistant, State, SupportsResponse, callback
@@ -743,6 +748,117 @@ async def test_ping(websocket_client: MockHAClientWebSocket) -> None:
     assert msg["type"] == "pong"
 
 
+async def test_subscribe_entities_merge_diffs(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test subscribe entities merging diffs and the connection stats."""
+    hass.states.async_set("light.permitted", "off")
+    await websocket_client.send_json_auto_id(
+        {"type": "subscribe_entities", "merge_diffs": True, "max_latency": 0.5}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    msg = await websocket_client.receive_json()
+    assert msg["event"]["a"]["light.permitted"]["s"] == "off"
+
+    hass.states.async_set("light.permitted", "on")
+    msg = await websocket_client.receive_json()
+    assert msg["event"]["c"]["light.permitted"]["+"]["s"] == "on"
+
+    await websocket_client.send_json_auto_id({"type": "connection_stats"})
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    assert msg["result"] == {
+        "queue_size": ANY,
+        "merged_diffs": 0,
+        "compression": ANY,
+    }
+
+    await websocket_client.send_json_auto_id(
+        {"type": "subscribe_entities", "merge_diffs": True, "max_latency": 60}
+    )
+    msg = await websocket_client.receive_json()
+    assert not msg["success"]
+    assert msg["error"]["code"] == const.ERR_INVALID_FORMAT
+
+
+async def test_msgpack(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test results, events and state diffs are sent as MessagePack."""
+    hass.states.async_set("light.permitted", "off", {"color": "red"})
+    hass.states.async_set("light.other", "off")
+    await websocket_client.send_json_auto_id(
+        {"type": "supported_features", "features": {FEATURE_MSGPACK: 1}}
+    )
+    msg = ormsgpack.unpackb(await websocket_client.receive_bytes())
+    assert msg == {"id": 1, "type": "result", "success": True, "result": None}
+
+    await websocket_client.send_json_auto_id(
+        {"type": "subscribe_entities", "entity_ids": ["light.permitted"]}
+    )
+    msg = ormsgpack.unpackb(await websocket_client.receive_bytes())
+    assert msg["success"]
+    msg = ormsgpack.unpackb(await websocket_client.receive_bytes())
+    assert msg == {
+        "id": 2,
+        "type": "event",
+        "event": {
+            "a": {
+                "light.permitted": {
+                    "s": "off",
+                    "a": {"color": "red"},
+                    "c": ANY,
+                    "lc": ANY,
+                }
+            }
+        },
+    }
+
+    hass.states.async_set("light.permitted", "on", {})
+    msg = ormsgpack.unpackb(await websocket_client.receive_bytes())
+    assert msg == {
+        "id": 2,
+        "type": "event",
+        "event": {
+            "c": {
+                "light.permitted": {
+                    "+": {"s": "on", "c": ANY, "lc": ANY},
+                    "-": {"a": ["color"]},
+                }
+            }
+        },
+    }
+
+    await websocket_client.send_json_auto_id(
+        {"type": "subscribe_events", "event_type": "test_event"}
+    )
+    msg = ormsgpack.unpackb(await websocket_client.receive_bytes())
+    assert msg["success"]
+    hass.bus.async_fire("test_event", {"hello": "world"})
+    msg = ormsgpack.unpackb(await websocket_client.receive_bytes())
+    assert msg == {
+        "id": 3,
+        "type": "event",
+        "event": {
+            "event_type": "test_event",
+            "data": {"hello": "world"},
+            "origin": "LOCAL",
+            "time_fired": ANY,
+            "context": ANY,
+        },
+    }
+
+    # Results serialized to JSON ahead of time are transcoded
+    await websocket_client.send_json_auto_id({"type": "get_states"})
+    msg = ormsgpack.unpackb(await websocket_client.receive_bytes())
+    assert msg["id"] == 4
+    assert {state["entity_id"] for state in msg["result"]} == {
+        "light.permitted",
+        "light.other",
+    }
+
+
 async def test_call_service_context_with_user(
     hass: HomeAssistant,
     hass_client_no_auth: ClientSessionGenerator,
@@ -1311,6 +1427,46 @@ async def test_render_template_renders_template(
     }
 
 
+async def test_template_render_stats(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test getting the render cost of tracked templates."""
+    hass.states.async_set("light.test", "on")
+    await websocket_client.send_json_auto_id(
+        {"type": "render_template", "template": "{{ states('light.test') }}"}
+    )
+    assert (await websocket_client.receive_json())["success"]
+    assert (await websocket_client.receive_json())["event"]["result"] == "on"
+    hass.states.async_set("light.test", "off")
+    assert (await websocket_client.receive_json())["event"]["result"] == "off"
+
+    await websocket_client.send_json_auto_id({"type": "template/render_stats"})
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    assert msg["result"] == [
+        {
+            "template": "{{ states('light.test') }}",
+            "renders": 2,
+            "total_time": ANY,
+            "max_time": ANY,
+            "recent_time": ANY,
+            "hot": False,
+        }
+    ]
+
+
+async def test_template_render_stats_requires_admin(
+    websocket_client: MockHAClientWebSocket, hass_admin_user: MockUser
+) -> None:
+    """Test getting the render cost of templates without being admin."""
+    hass_admin_user.groups = []
+    await websocket_client.send_json_auto_id({"type": "template/render_stats"})
+
+    msg = await websocket_client.receive_json()
+    assert not msg["success"]
+    assert msg["error"]["code"] == const.ERR_UNAUTHORIZED
+
+
 async def test_render_template_with_timeout_and_variables(
     hass: HomeAssistant, websocket_client
 ) -> None:
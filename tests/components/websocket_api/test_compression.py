@@ -0,0 +1,154 @@
+"""Test compressing websocket messages."""
+
+from datetime import timedelta
+from unittest.mock import patch
+import zlib
+
+from aiohttp import WSMsgType
+import pytest
+
+from homeassistant.components.websocket_api.compression import (
+    WebSocketCompressor,
+    snapshot_message,
+)
+from homeassistant.components.websocket_api.const import URL
+from homeassistant.core import HomeAssistant
+from homeassistant.setup import async_setup_component
+from homeassistant.util import dt as dt_util
+
+from tests.common import async_fire_time_changed
+from tests.typing import ClientSessionGenerator
+
+TRAILER = b"\x00\x00\xff\xff"
+
+
+def _inflate(decompressobj, payload: bytes) -> bytes:
+    """Decompress a message like a client with context takeover."""
+    return decompressobj.decompress(payload + TRAILER)
+
+
+async def test_compressor_shares_snapshots(hass: HomeAssistant) -> None:
+    """Test snapshots are compressed once and inserted in the deflate streams."""
+    states = b",".join(
+        b'"light.kitchen_%d":{"s":"on","a":{"brightness":255}}' % idx
+        for idx in range(500)
+    )
+    diff = (
+        b'{"type":"event","event":{"c":{"light.kitchen_1":{"+":{"s":"off",'
+        b'"a":{"brightness":0},"c":"01J4H3ZQ2Q8X5Y3F6R3K3Y6W7C","lc":1722500000.1}}}}}'
+    )
+    compressors = [
+        WebSocketCompressor(hass, 6, 15, notakeover=False),
+        WebSocketCompressor(hass, 6, 15, notakeover=False),
+        WebSocketCompressor(hass, 6, 15, notakeover=True),
+    ]
+
+    for msg_id, compressor in enumerate(compressors):
+        decompressobj = zlib.decompressobj(-15)
+        assert compressor.compress([b'{"id":1,"type":"pong"}']) is None
+        assert _inflate(decompressobj, compressor.compress([diff])) == diff
+        snapshot = snapshot_message(
+            b'{"type":"event","event":{"a":{' + states + b"}}",
+            b',"id":%d}' % msg_id,
+        )
+        # Coalesced with other messages
+        parts = [b"[", diff, b",", snapshot, b",", diff, b"]"]
+        assert _inflate(decompressobj, compressor.compress(parts)) == b"".join(parts)
+        # The compression context continues after the snapshot
+        assert _inflate(decompressobj, compressor.compress([diff])) == diff
+
+    assert [compressor.shared_hits for compressor in compressors] == [0, 1, 1]
+    stats = compressors[0].stats
+    assert stats["bytes_in"] == 2 * len(diff) + len(b"".join(parts))
+    assert stats["bytes_saved"] == stats["bytes_in"] - stats["bytes_out"] > 0
+
+    # The shared snapshots are dropped after a second
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=1))
+
+
+async def test_negotiate_compression(
+    hass: HomeAssistant,
+    hass_client_no_auth: ClientSessionGenerator,
+    hass_access_token: str,
+) -> None:
+    """Test messages are compressed with the configured level."""
+    assert await async_setup_component(
+        hass, "websocket_api", {"websocket_api": {"compression_level": 9}}
+    )
+    for idx in range(100):
+        hass.states.async_set(f"light.kitchen_{idx}", "on", {"brightness": 255})
+    client = await hass_client_no_auth()
+
+    async with client.ws_connect(URL, compress=15) as ws:
+        assert ws.compress == 15
+        assert (await ws.receive_json())["type"] == "auth_required"
+        await ws.send_json({"type": "auth", "access_token": hass_access_token})
+        assert (await ws.receive_json())["type"] == "auth_ok"
+
+        await ws.send_json({"id": 1, "type": "subscribe_entities"})
+        assert (await ws.receive_json())["success"]
+        msg = await ws.receive_json()
+        assert msg["id"] == 1
+        assert len(msg["event"]["a"]) == 100
+
+        await ws.send_json({"id": 2, "type": "get_states"})
+        msg = await ws.receive_json()
+        assert msg["id"] == 2
+        assert len(msg["result"]) == 100
+
+        await ws.send_json({"id": 3, "type": "connection_stats"})
+        msg = await ws.receive_json()
+        compression = msg["result"]["compression"]
+        assert compression["level"] == 9
+        assert compression["bytes_saved"] > compression["bytes_out"]
+        assert compression["cpu_time"] > 0
+        assert compression["shared_hits"] == 0
+
+    async with client.ws_connect(URL) as ws:
+        assert ws.compress == 0
+        msg = await ws.receive()
+        assert msg.type is WSMsgType.TEXT
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=1))
+
+
+@pytest.mark.parametrize(
+    ("config", "compressed_frames_supported"),
+    [({"websocket_api": None}, True), ({"websocket_api": {}}, False)],
+)
+async def test_stock_compression(
+    hass: HomeAssistant,
+    hass_client_no_auth: ClientSessionGenerator,
+    hass_access_token: str,
+    config: dict[str, None],
+    compressed_frames_supported: bool,
+) -> None:
+    """Test the default level and the fallback to the stock aiohttp compression."""
+    with patch(
+        "homeassistant.components.websocket_api.http.SEND_COMPRESSED_FRAME_SUPPORTED",
+        compressed_frames_supported,
+    ):
+        assert await async_setup_component(hass, "websocket_api", config)
+        for idx in range(100):
+            hass.states.async_set(f"light.kitchen_{idx}", "on", {"brightness": 255})
+        client = await hass_client_no_auth()
+
+        async with client.ws_connect(URL, compress=15) as ws:
+            assert ws.compress == 15
+            assert (await ws.receive_json())["type"] == "auth_required"
+            await ws.send_json({"type": "auth", "access_token": hass_access_token})
+            assert (await ws.receive_json())["type"] == "auth_ok"
+
+            await ws.send_json({"id": 1, "type": "get_states"})
+            msg = await ws.receive_json()
+            assert len(msg["result"]) == 100
+
+            await ws.send_json({"id": 2, "type": "connection_stats"})
+            msg = await ws.receive_json()
+            compression = msg["result"]["compression"]
+            if compressed_frames_supported:
+                assert compression["level"] == zlib.Z_BEST_SPEED
+            else:
+                assert compression is None
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=1))
@@ -0,0 +1,170 @@
+"""Test the subscribe_entities hub."""
+
+from datetime import timedelta
+from unittest.mock import ANY, Mock, patch
+
+import ormsgpack
+
+from homeassistant.auth import EVENT_USER_UPDATED
+from homeassistant.components.websocket_api import messages
+from homeassistant.components.websocket_api.const import PENDING_MSG_MERGE
+from homeassistant.components.websocket_api.entities_hub import async_get_entities_hub
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.json import json_loads
+from homeassistant.util import dt as dt_util
+
+from tests.common import MockUser, async_fire_time_changed
+
+
+async def test_entities_hub_fan_out(hass: HomeAssistant) -> None:
+    """Test a single listener forwards state changes to the subscriptions."""
+    listeners = hass.bus.async_listeners()
+    init_count = sum(listeners.values())
+    init_state_changed = listeners.get(EVENT_STATE_CHANGED, 0)
+    hub = async_get_entities_hub(hass)
+    admin = MockUser(is_owner=True)
+    user = MockUser()
+    user.mock_policy({"entities": {"entity_ids": {"light.permitted": True}}})
+    received: dict[str, list] = {"all": [], "user": [], "kitchen": []}
+
+    unsubs = [
+        hub.async_subscribe(received["all"].append, admin, b"1", set()),
+        hub.async_subscribe(received["user"].append, user, b"2", set()),
+        hub.async_subscribe(received["kitchen"].append, admin, b"3", {"light.kitchen"}),
+    ]
+    assert hub.subscription_count == 3
+    assert hass.bus.async_listeners()[EVENT_STATE_CHANGED] == init_state_changed + 1
+
+    hass.states.async_set("light.permitted", "on")
+    hass.states.async_set("light.kitchen", "on")
+    hass.states.async_set("light.kitchen", "off")
+
+    assert [json_loads(msg)["id"] for msg in received["all"]] == [1, 1, 1]
+    # The user can only read light.permitted
+    assert [json_loads(msg)["event"] for msg in received["user"]] == [
+        {"a": {"light.permitted": ANY}}
+    ]
+    assert [json_loads(msg)["event"] for msg in received["kitchen"]] == [
+        {"a": {"light.kitchen": ANY}},
+        {"c": {"light.kitchen": ANY}},
+    ]
+    assert {json_loads(msg)["id"] for msg in received["kitchen"]} == {3}
+
+    # The cached permissions are dropped when the user changes
+    user.mock_policy({"entities": {"entity_ids": {"light.kitchen": True}}})
+    hass.bus.async_fire(EVENT_USER_UPDATED, {"user_id": user.id})
+    await hass.async_block_till_done()
+    received["user"].clear()
+    hass.states.async_set("light.permitted", "off")
+    hass.states.async_set("light.kitchen", "on")
+    assert [json_loads(msg)["event"] for msg in received["user"]] == [
+        {"c": {"light.kitchen": ANY}}
+    ]
+
+    for unsub in unsubs:
+        unsub()
+    assert hub.subscription_count == 0
+    assert sum(hass.bus.async_listeners().values()) == init_count
+
+
+async def test_entities_hub_merge_diffs(hass: HomeAssistant) -> None:
+    """Test the changes of an entity are merged while the connection is backlogged."""
+    hass.states.async_set("light.kitchen", "off", {"brightness": 5})
+    sent: list[bytes] = []
+    connection = Mock(hass=hass, user=MockUser(is_owner=True), merged_diffs=0)
+    connection.send_message = sent.append
+    connection.queue_size.return_value = PENDING_MSG_MERGE
+    unsub = async_get_entities_hub(hass).async_subscribe(
+        connection.send_message, connection.user, b"5", set(), connection, 1.0
+    )
+
+    hass.states.async_set("light.kitchen", "on", {"brightness": 5})
+    hass.states.async_set("light.kitchen", "on", {"brightness": 100})
+    hass.states.async_set("light.kitchen", "on", {"brightness": 200})
+    hass.states.async_set("light.hall", "on")
+    hass.states.async_set("light.hall", "off")
+    assert sent == []
+    assert connection.merged_diffs == 3
+
+    # The merged changes are sent after the max latency
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=1))
+    assert [json_loads(msg) for msg in sent] == [
+        {
+            "id": 5,
+            "type": "event",
+            "event": {
+                "c": {
+                    "light.kitchen": {
+                        "+": {"s": "on", "a": {"brightness": 200}, "c": ANY, "lc": ANY}
+                    }
+                }
+            },
+        },
+        {
+            "id": 5,
+            "type": "event",
+            "event": {"a": {"light.hall": {"s": "off", "a": {}, "c": ANY, "lc": ANY}}},
+        },
+    ]
+
+    # The merged changes are sent before the next change once the queue drained
+    sent.clear()
+    hass.states.async_set("light.kitchen", "off", {"brightness": 200})
+    connection.queue_size.return_value = 0
+    hass.states.async_set("light.hall", "on")
+    assert [json_loads(msg)["event"] for msg in sent] == [
+        {"c": {"light.kitchen": {"+": {"s": "off", "c": ANY, "lc": ANY}}}},
+        {"c": {"light.hall": {"+": {"s": "on", "c": ANY, "lc": ANY}}}},
+    ]
+
+    # An entity added and removed while backlogged is not sent
+    sent.clear()
+    connection.queue_size.return_value = PENDING_MSG_MERGE
+    hass.states.async_set("light.new", "on")
+    hass.states.async_remove("light.new")
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=2))
+    assert sent == []
+    assert connection.merged_diffs == 4
+    unsub()
+
+
+async def test_entities_hub_serializes_per_encoding(hass: HomeAssistant) -> None:
+    """Test the diff is only serialized in the encodings of the subscriptions."""
+    hub = async_get_entities_hub(hass)
+    admin = MockUser(is_owner=True)
+    received: list[bytes] = []
+    unsubs = [
+        hub.async_subscribe(
+            received.append, admin, ormsgpack.packb(msg_id), set(), use_msgpack=True
+        )
+        for msg_id in (1, 2)
+    ]
+
+    with (
+        patch.object(
+            messages,
+            "_message_to_json_bytes_or_none",
+            wraps=messages._message_to_json_bytes_or_none,
+        ) as to_json,
+        patch.object(
+            messages,
+            "_message_to_msgpack_bytes_or_none",
+            wraps=messages._message_to_msgpack_bytes_or_none,
+        ) as to_msgpack,
+    ):
+        hass.states.async_set("light.kitchen", "on")
+        assert [ormsgpack.unpackb(msg)["id"] for msg in received] == [1, 2]
+        assert to_json.call_count == 0
+        assert to_msgpack.call_count == 1
+
+        received.clear()
+        unsubs.append(hub.async_subscribe(received.append, admin, b"3", set()))
+        hass.states.async_set("light.kitchen", "off")
+        assert len(received) == 3
+        assert json_loads(received[2])["id"] == 3
+        assert to_json.call_count == 1
+        assert to_msgpack.call_count == 2
+
+    for unsub in unsubs:
+        unsub()
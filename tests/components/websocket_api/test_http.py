@@ -6,6 +6,7 @@ from typing import Any, cast
 from unittest.mock import patch
 
 from aiohttp import WSMsgType, WSServerHandshakeError, web
+import ormsgpack
 import pytest
 
 from homeassistant.components.websocket_api import (
@@ -433,6 +434,43 @@ async def test_enable_coalesce(
         await asyncio.gather(*send_tasks_with_close)
 
 
+async def test_enable_msgpack_coalesce(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test coalesced messages are sent as a MessagePack array."""
+    websocket_client = await hass_ws_client(hass)
+
+    await websocket_client.send_json(
+        {
+            "id": 1,
+            "type": "supported_features",
+            "features": {
+                const.FEATURE_COALESCE_MESSAGES: 1,
+                const.FEATURE_MSGPACK: 1,
+            },
+        }
+    )
+    msg = ormsgpack.unpackb(await websocket_client.receive_bytes())
+    assert msg["id"] == 1
+    assert msg["success"] is True
+
+    # Queue JSON serialized results and dicts in the same batch
+    await websocket_client.send_json(
+        [{"id": id_, "type": "ping"} for id_ in range(2, 12)]
+        + [{"id": 12, "type": "get_states"}]
+    )
+    returned_ids: set[int] = set()
+    while len(returned_ids) < 11:
+        msg = await websocket_client.receive()
+        assert msg.type is WSMsgType.BINARY
+        payload = ormsgpack.unpackb(msg.data)
+        for message in payload if isinstance(payload, list) else [payload]:
+            returned_ids.add(message["id"])
+            assert message["type"] == ("result" if message["id"] == 12 else "pong")
+
+    assert returned_ids == set(range(2, 13))
+
+
 async def test_binary_message(
     hass: HomeAssistant, websocket_client, caplog: pytest.LogCaptureFixture
 ) -> None:
@@ -1,15 +1,23 @@
 """Test Websocket API messages module."""
 
+from datetime import datetime
+import gc
+
+import ormsgpack
 import pytest
 
 from homeassistant.components.websocket_api.messages import (
+    _COMPRESSED_STATES_MSGPACK,
     _partial_cached_event_message as lru_event_cache,
     _state_diff_event,
     cached_event_message,
+    compressed_state_msgpack,
     message_to_json_bytes,
 )
+from homeassistant.components.websocket_api.msgpack import msgpack_map_header
 from homeassistant.const import EVENT_STATE_CHANGED
 from homeassistant.core import Context, Event, HomeAssistant, State, callback
+from homeassistant.util import dt as dt_util
 
 from tests.common import async_capture_events
 
@@ -299,3 +307,33 @@ async def test_message_to_json_bytes(caplog: pytest.LogCaptureFixture) -> None:
 
 class _Unserializeable:
     """A class that cannot be serialized."""
+
+
+def test_compressed_state_msgpack() -> None:
+    """Test a State as a MessagePack compressed state."""
+    last_time = datetime(1984, 12, 8, 12, 0, 0, tzinfo=dt_util.UTC)
+    state = State(
+        "happy.happy",
+        "on",
+        {"pig": "dog"},
+        last_updated=last_time,
+        last_changed=last_time,
+        context=Context(id="01H0D6H5K3SZJ3XGDHED1TJ79N"),
+    )
+    as_compressed_state = compressed_state_msgpack(state)
+    assert ormsgpack.unpackb(msgpack_map_header(1) + as_compressed_state) == {
+        "happy.happy": {
+            "s": "on",
+            "a": {"pig": "dog"},
+            "c": "01H0D6H5K3SZJ3XGDHED1TJ79N",
+            "lc": 471355200.0,
+        }
+    }
+    # 2nd time to verify cache
+    assert compressed_state_msgpack(state) is as_compressed_state
+
+    # The cached state is released with the state
+    entries = len(_COMPRESSED_STATES_MSGPACK)
+    del state
+    gc.collect()
+    assert len(_COMPRESSED_STATES_MSGPACK) == entries - 1
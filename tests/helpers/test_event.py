@@ -26,10 +26,13 @@ from homeassistant.exceptions import TemplateError
 from homeassistant.helpers.device_registry import EVENT_DEVICE_REGISTRY_UPDATED
 from homeassistant.helpers.entity_registry import EVENT_ENTITY_REGISTRY_UPDATED
 from homeassistant.helpers.event import (
+    HOT_TEMPLATE_RENDER_TIME,
+    TemplateRenderStats,
     TrackStates,
     TrackTemplate,
     TrackTemplateResult,
     async_call_later,
+    async_get_template_render_stats,
     async_track_device_registry_updated_event,
     async_track_entity_registry_updated_event,
     async_track_point_in_time,
@@ -2925,6 +2928,63 @@ async def test_track_template_unavailable_states_has_default_rate_limit(
     info.async_remove()
 
 
+async def test_track_template_result_batches_state_changes(
+    hass: HomeAssistant,
+) -> None:
+    """Test state changes only matching domains are rendered once per batch."""
+    template_count = Template("{{ states.sensor | count }}", hass)
+    template_all = Template("{{ states | count }}", hass)
+    refresh_runs = []
+
+    @ha.callback
+    def refresh_listener(
+        event: Event[EventStateChangedData] | None,
+        updates: list[TrackTemplateResult],
+    ) -> None:
+        assert event is not None
+        refresh_runs.extend(
+            (event.data["entity_id"], update.result) for update in updates
+        )
+
+    info_count = async_track_template_result(
+        hass, [TrackTemplate(template_count, None)], refresh_listener
+    )
+    info_all = async_track_template_result(
+        hass, [TrackTemplate(template_all, None)], refresh_listener
+    )
+    await hass.async_block_till_done()
+
+    # Only one tracker is rendered in each batch
+    with patch("homeassistant.helpers.event.TEMPLATE_RENDER_BUDGET", -1):
+        hass.states.async_set("sensor.one", "on")
+        hass.states.async_set("sensor.two", "on")
+        await hass.async_block_till_done()
+
+    assert sorted(refresh_runs) == [("sensor.two", 2), ("sensor.two", 2)]
+    stats = async_get_template_render_stats(hass)
+    assert stats[template_count.template].renders == 1
+    assert stats[template_all.template].renders == 1
+
+    info_count.async_remove()
+    info_all.async_remove()
+
+
+def test_template_render_stats() -> None:
+    """Test templates which render slowly are hot."""
+    stats = TemplateRenderStats()
+    assert stats.add(0.0) is False
+    assert stats.add(HOT_TEMPLATE_RENDER_TIME * 10) is True
+    assert stats.hot
+    # A template only becomes hot once
+    assert stats.add(HOT_TEMPLATE_RENDER_TIME * 10) is False
+    assert stats.renders == 3
+    assert stats.max_time == HOT_TEMPLATE_RENDER_TIME * 10
+
+    for _ in range(20):
+        stats.add(0.0)
+    assert not stats.hot
+
+
 async def test_specifically_referenced_entity_is_not_rate_limited(
     hass: HomeAssistant,
 ) -> None:
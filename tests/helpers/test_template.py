@@ -21,6 +21,7 @@ from homeassistant import config_entries
 from homeassistant.components import group
 from homeassistant.const import (
     ATTR_UNIT_OF_MEASUREMENT,
+    EVENT_HOMEASSISTANT_STARTED,
     STATE_ON,
     STATE_UNAVAILABLE,
     UnitOfLength,
@@ -5169,6 +5170,67 @@ async def test_cache_garbage_collection() -> None:
     assert not template._NO_HASS_ENV.template_cache.get(template_string)
 
 
+async def test_compiled_template_cache(hass: HomeAssistant) -> None:
+    """Test compiled templates are shared by templates with the same source."""
+    template.COMPILED_TEMPLATE_CACHE.clear()
+    template_string = "{{ 1 + 1 }}"
+    tpl = template.Template(template_string, hass)
+    tpl.ensure_valid()
+    compiled = template.COMPILED_TEMPLATE_CACHE.get(template_string)
+    assert compiled is not None
+
+    # A template rendered with a custom log function uses its own environment
+    tpl2 = template.Template(template_string, hass)
+    assert tpl2.async_render(log_fn=lambda level, msg: None) == 2
+    assert tpl2._compiled_code is compiled
+
+    # The compiled code is the same for limited and strict templates
+    tpl3 = template.Template(template_string, hass)
+    assert tpl3.async_render(limited=True) == 2
+    assert tpl3._compiled_code is compiled
+    tpl4 = template.Template(template_string, hass)
+    assert tpl4.async_render(strict=True) == 2
+    assert tpl4._compiled_code is compiled
+    assert len(template.COMPILED_TEMPLATE_CACHE.compiled) == 1
+
+    # Templates without hass are not shared
+    tpl5 = template.Template("{{ 1 + 3 }}")
+    tpl5.ensure_valid()
+    assert template.COMPILED_TEMPLATE_CACHE.get("{{ 1 + 3 }}") is None
+
+
+async def test_bytecode_cache(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test compiled templates are stored and loaded again."""
+    template.COMPILED_TEMPLATE_CACHE.clear()
+    await template.async_load_bytecode_cache(hass)
+    template_string = "{{ 1 + 2 }}"
+    assert template.Template(template_string, hass).async_render() == 3
+
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STARTED)
+    await hass.async_block_till_done()
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=template.BYTECODE_CACHE_SAVE_DELAY)
+    )
+    await hass.async_block_till_done()
+    data = hass_storage[template.BYTECODE_CACHE_STORAGE_KEY]["data"]
+    assert [item[0] for item in data["templates"]] == [template_string]
+    assert not template.COMPILED_TEMPLATE_CACHE.changed
+
+    template.COMPILED_TEMPLATE_CACHE.clear()
+    assert template.COMPILED_TEMPLATE_CACHE.load_bytecode(data) == 1
+    assert template.COMPILED_TEMPLATE_CACHE.get(template_string)
+    assert template.Template(template_string, hass).async_render() == 3
+
+    # Bytecode stored by other versions or invalid bytecode is ignored
+    template.COMPILED_TEMPLATE_CACHE.clear()
+    assert template.COMPILED_TEMPLATE_CACHE.load_bytecode({**data, "key": "other"}) == 0
+    invalid = {**data, "templates": [[template_string, "invalid"]]}
+    assert template.COMPILED_TEMPLATE_CACHE.load_bytecode(invalid) == 0
+    assert template.COMPILED_TEMPLATE_CACHE.get(template_string) is None
+
+
 def test_is_template_string() -> None:
     """Test is template string."""
     assert template.is_template_string("{{ x }}") is True
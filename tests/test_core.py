@@ -1169,6 +1169,92 @@ async def test_eventbus_filtered_listener(hass: HomeAssistant) -> None:
     unsub()
 
 
+async def test_eventbus_keyed_listener(hass: HomeAssistant) -> None:
+    """Test listening to state events by entity_id."""
+    changed = []
+    reported = []
+
+    @ha.callback
+    def changed_listener(event):
+        """Mock listener."""
+        changed.append(event)
+
+    @ha.callback
+    def reported_listener(event):
+        """Mock listener."""
+        reported.append(event)
+
+    old_count = hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0)
+    unsub_changed = hass.bus.async_listen_keyed_internal(
+        EVENT_STATE_CHANGED, ["light.kitchen", "light.hall"], HassJob(changed_listener)
+    )
+    unsub_reported = hass.bus.async_listen_keyed_internal(
+        EVENT_STATE_REPORTED, ["light.kitchen"], HassJob(reported_listener)
+    )
+    # The keyed listeners of an event type count as one listener
+    assert hass.bus.async_listeners()[EVENT_STATE_CHANGED] == old_count + 1
+    assert hass.bus.async_listeners()[EVENT_STATE_REPORTED] == 1
+
+    hass.bus.async_fire(EVENT_STATE_CHANGED, {"entity_id": "light.other"})
+    hass.bus.async_fire(EVENT_STATE_CHANGED, {"entity_id": "light.hall"})
+    # State changed listeners are run soon
+    assert len(changed) == 0
+    await hass.async_block_till_done()
+    assert [event.data["entity_id"] for event in changed] == ["light.hall"]
+
+    hass.bus.async_fire(EVENT_STATE_REPORTED, {"entity_id": "light.kitchen"})
+    hass.bus.async_fire(EVENT_STATE_REPORTED, {"entity_id": "light.hall"})
+    assert [event.data["entity_id"] for event in reported] == ["light.kitchen"]
+
+    # State events without an entity_id are not dispatched to keyed listeners
+    hass.bus.async_fire(EVENT_STATE_CHANGED, {})
+    hass.bus.async_fire(EVENT_STATE_REPORTED, {})
+    await hass.async_block_till_done()
+    assert len(changed) == 1
+    assert len(reported) == 1
+
+    unsub_changed()
+    unsub_reported()
+    assert hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0) == old_count
+    assert EVENT_STATE_REPORTED not in hass.bus.async_listeners()
+
+    hass.bus.async_fire(EVENT_STATE_CHANGED, {"entity_id": "light.kitchen"})
+    await hass.async_block_till_done()
+    assert len(changed) == 1
+
+    with pytest.raises(HomeAssistantError):
+        hass.bus.async_listen_keyed_internal(
+            "test", ["light.kitchen"], HassJob(changed_listener)
+        )
+
+
+async def test_eventbus_remove_listener_while_firing(hass: HomeAssistant) -> None:
+    """Test removing listeners while an event is fired does not skip listeners."""
+    calls = []
+
+    @ha.callback
+    def listener_1(event):
+        """Mock listener that removes itself."""
+        calls.append(1)
+        unsub_1()
+
+    @ha.callback
+    def listener_2(event):
+        """Mock listener."""
+        calls.append(2)
+
+    unsub_1 = hass.bus.async_listen("test", listener_1)
+    unsub_2 = hass.bus.async_listen("test", listener_2)
+
+    hass.bus.async_fire("test")
+    hass.bus.async_fire("test")
+    await hass.async_block_till_done()
+    assert calls == [1, 2, 2]
+
+    unsub_2()
+    assert "test" not in hass.bus.async_listeners()
+
+
 async def test_eventbus_run_immediately_callback(hass: HomeAssistant) -> None:
     """Test we can call events immediately with a callback."""
     calls = []
@@ -3415,6 +3501,61 @@ async def test_statemachine_report_state(hass: HomeAssistant) -> None:
     assert len(state_reported_events) == 1
 
 
+async def test_statemachine_report_state_without_listeners(
+    hass: HomeAssistant,
+) -> None:
+    """Test reporting a state without listeners does not create an event."""
+    hass.states.async_set("light.bowl", "on", {}, timestamp=1000.0)
+
+    with (
+        patch("homeassistant.core.ulid_at_time") as mock_ulid,
+        patch("homeassistant.core.Event") as mock_event,
+    ):
+        hass.states.async_set("light.bowl", "on", {}, timestamp=1001.0)
+    mock_ulid.assert_not_called()
+    mock_event.assert_not_called()
+
+    state = hass.states.get("light.bowl")
+    assert state.last_reported_timestamp == 1001.0
+    assert state.last_reported == dt_util.utc_from_timestamp(1001.0)
+    assert state.last_updated_timestamp == 1000.0
+
+
+async def test_statemachine_last_reported_window(hass: HomeAssistant) -> None:
+    """Test last_reported updates are coalesced in the window of an entity."""
+    reported = []
+
+    @callback
+    def listener(event: ha.Event) -> None:
+        reported.append(event.data["new_state"].last_reported_timestamp)
+
+    hass.states.async_set_last_reported_window("light.Bowl", 10)
+    assert hass.states.last_reported_window("light.bowl") == 10
+    hass.bus.async_listen_keyed_internal(
+        EVENT_STATE_REPORTED, ["light.bowl"], HassJob(listener)
+    )
+
+    hass.states.async_set("light.bowl", "on", {}, timestamp=1000.0)
+    for timestamp in (1005.0, 1010.0, 1015.0, 1019.0, 1020.0):
+        hass.states.async_set("light.bowl", "on", {}, timestamp=timestamp)
+    assert reported == [1010.0, 1020.0]
+    assert hass.states.get("light.bowl").last_reported_timestamp == 1020.0
+
+    # State changes are never coalesced
+    hass.states.async_set("light.bowl", "off", {}, timestamp=1021.0)
+    assert hass.states.get("light.bowl").state == "off"
+
+    hass.states.async_set_last_reported_window("light.bowl", None)
+    assert hass.states.last_reported_window("light.bowl") is None
+    hass.states.async_set("light.bowl", "off", {}, timestamp=1022.0)
+    assert reported == [1010.0, 1020.0, 1022.0]
+
+    # The window is forgotten when the entity is removed
+    hass.states.async_set_last_reported_window("light.bowl", 10)
+    hass.states.async_remove("light.bowl")
+    assert hass.states.last_reported_window("light.bowl") is None
+
+
 async def test_report_state_listener_restrictions(hass: HomeAssistant) -> None:
     """Test we enforce requirements for EVENT_STATE_REPORTED listeners."""
 